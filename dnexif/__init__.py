@@ -20,47 +20,68 @@ Copyright 2025 DNAi inc.
 __version__ = "0.1.3"
 __author__ = "DNAi inc."
 
-from dnexif.core import DNExif
 from dnexif.exceptions import DNExifError, MetadataReadError, MetadataWriteError
-from dnexif.metadata_normalizer import (
-    PriorityConfig,
-    choose_best_timestamps,
-    unify_date_fields,
-    resolve_priority,
-    normalize_metadata,
-    parse_date_string,
-)
-from dnexif.metadata_stripper import (
-    PrivacyConfig,
-    PrivacyPreset,
-    strip_metadata,
-    strip_by_groups,
-    strip_by_tags,
-    PIIDetector,
-    get_stripped_count,
-)
-from dnexif.metadata_diff import (
-    diff_metadata,
-    diff_files,
-    format_diff_result,
-    DiffResult,
-    MetadataDiff,
-    DiffType,
-)
-from dnexif.image_hash_calculator import (
-    calculate_image_data_hash,
-    add_image_data_hash_to_metadata,
-    ImageHashCalculator,
-)
-from dnexif.metadata_utils import (
-    batch_read_metadata,
-    batch_write_metadata,
-    copy_metadata,
-    filter_metadata_by_groups,
-    merge_metadata,
-    get_metadata_summary,
-    has_metadata,
-)
+
+# Public names and the modules that define them. These are imported on first
+# access (PEP 562), so "import dnexif" stays cheap and a program only loads
+# the parts of the library it uses.
+_LAZY_ATTRIBUTES = {
+    "DNExif": "dnexif.core",
+    "PriorityConfig": "dnexif.metadata_normalizer",
+    "choose_best_timestamps": "dnexif.metadata_normalizer",
+    "unify_date_fields": "dnexif.metadata_normalizer",
+    "resolve_priority": "dnexif.metadata_normalizer",
+    "normalize_metadata": "dnexif.metadata_normalizer",
+    "parse_date_string": "dnexif.metadata_normalizer",
+    "PrivacyConfig": "dnexif.metadata_stripper",
+    "PrivacyPreset": "dnexif.metadata_stripper",
+    "strip_metadata": "dnexif.metadata_stripper",
+    "strip_by_groups": "dnexif.metadata_stripper",
+    "strip_by_tags": "dnexif.metadata_stripper",
+    "PIIDetector": "dnexif.metadata_stripper",
+    "get_stripped_count": "dnexif.metadata_stripper",
+    "diff_metadata": "dnexif.metadata_diff",
+    "diff_files": "dnexif.metadata_diff",
+    "format_diff_result": "dnexif.metadata_diff",
+    "DiffResult": "dnexif.metadata_diff",
+    "MetadataDiff": "dnexif.metadata_diff",
+    "DiffType": "dnexif.metadata_diff",
+    "calculate_image_data_hash": "dnexif.image_hash_calculator",
+    "calculate_image_data_hashes": "dnexif.image_hash_calculator",
+    "calculate_image_data_tree_hash": "dnexif.image_hash_calculator",
+    "calculate_image_data_hash_tree": "dnexif.image_hash_calculator",
+    "verify_hash_tree_leaves": "dnexif.image_hash_calculator",
+    "add_image_data_hash_to_metadata": "dnexif.image_hash_calculator",
+    "ImageHashCalculator": "dnexif.image_hash_calculator",
+    "build_dicom_index": "dnexif.dicom_index",
+    "read_dicomdir": "dnexif.dicom_index",
+    "DICOMIndex": "dnexif.dicom_index",
+    "MetadataCache": "dnexif.metadata_cache",
+    "batch_read_metadata": "dnexif.metadata_utils",
+    "iter_batch_read_metadata": "dnexif.metadata_utils",
+    "batch_write_metadata": "dnexif.metadata_utils",
+    "copy_metadata": "dnexif.metadata_utils",
+    "filter_metadata_by_groups": "dnexif.metadata_utils",
+    "merge_metadata": "dnexif.metadata_utils",
+    "get_metadata_summary": "dnexif.metadata_utils",
+    "has_metadata": "dnexif.metadata_utils",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups are plain attribute accesses
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
     "DNExif",
@@ -87,14 +108,23 @@ __all__ = [
     "MetadataDiff",
     "DiffType",
     "calculate_image_data_hash",
+    "calculate_image_data_hashes",
+    "calculate_image_data_tree_hash",
+    "calculate_image_data_hash_tree",
+    "verify_hash_tree_leaves",
     "add_image_data_hash_to_metadata",
     "ImageHashCalculator",
+    "build_dicom_index",
+    "read_dicomdir",
+    "DICOMIndex",
     "batch_read_metadata",
+    "iter_batch_read_metadata",
     "batch_write_metadata",
     "copy_metadata",
     "filter_metadata_by_groups",
     "merge_metadata",
     "get_metadata_summary",
     "has_metadata",
+    "MetadataCache",
 ]
 
@@ -16,8 +16,11 @@ Copyright 2025 DNAi inc.
 from typing import Dict, Any, List, Optional, Union
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
+from concurrent.futures import Executor
+from functools import partial
 import re
 from dnexif import DNExif
+from dnexif.metadata_utils import _run_batch
 from dnexif.exceptions import MetadataReadError, MetadataWriteError
 
 
@@ -91,6 +94,9 @@ class AdvancedFeatures:
     def batch_process(
         file_paths: List[Union[str, Path]],
         operation: callable,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        use_threads: bool = False,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -98,7 +104,11 @@ class AdvancedFeatures:
         
         Args:
             file_paths: List of file paths to process
-            operation: Function to apply to each file
+            operation: Function to apply to each file (must be picklable when
+                      running in worker processes, i.e. not a lambda)
+            workers: Number of parallel workers (None or 1 = serial)
+            executor: Optional existing concurrent.futures Executor to use
+            use_threads: If True, use threads instead of processes when creating a pool
             **kwargs: Additional arguments for operation
             
         Returns:
@@ -111,18 +121,18 @@ class AdvancedFeatures:
             'errors': []
         }
         
-        for file_path in file_paths:
-            try:
-                operation(file_path, **kwargs)
+        task = partial(operation, **kwargs) if kwargs else operation
+        for file_path, _, error in _run_batch(task, file_paths, workers=workers,
+                                              executor=executor, use_threads=use_threads):
+            if error is None:
                 results['success'] += 1
-            except Exception as e:
+            else:
                 results['failed'] += 1
                 results['errors'].append({
                     'file': str(file_path),
-                    'error': str(e)
+                    'error': str(error)
                 })
-            finally:
-                results['processed'] += 1
+            results['processed'] += 1
         
         return results
     
@@ -331,6 +341,53 @@ class AdvancedFeatures:
             tag_names
         )
     
+    @staticmethod
+    def gps_position_tags(
+        latitude: float,
+        longitude: float,
+        altitude: Optional[float] = None
+    ) -> Dict[str, str]:
+        """
+        Build the GPS position tags for a coordinate.
+        
+        Args:
+            latitude: Latitude in degrees (-90 to 90)
+            longitude: Longitude in degrees (-180 to 180)
+            altitude: Optional altitude in meters
+            
+        Returns:
+            Dictionary mapping GPS tag names to values
+        """
+        if not (-90 <= latitude <= 90):
+            raise ValueError("Latitude must be between -90 and 90")
+        if not (-180 <= longitude <= 180):
+            raise ValueError("Longitude must be between -180 and 180")
+        
+        # Convert to EXIF GPS format (degrees, minutes, seconds)
+        lat_ref = 'N' if latitude >= 0 else 'S'
+        lon_ref = 'E' if longitude >= 0 else 'W'
+        
+        lat_abs = abs(latitude)
+        lat_deg = int(lat_abs)
+        lat_min = int((lat_abs - lat_deg) * 60)
+        lat_sec = ((lat_abs - lat_deg) * 60 - lat_min) * 60
+        
+        lon_abs = abs(longitude)
+        lon_deg = int(lon_abs)
+        lon_min = int((lon_abs - lon_deg) * 60)
+        lon_sec = ((lon_abs - lon_deg) * 60 - lon_min) * 60
+        
+        gps_tags = {
+            'GPS:GPSLatitudeRef': lat_ref,
+            'GPS:GPSLatitude': f"{lat_deg}/1 {lat_min}/1 {lat_sec}/100",
+            'GPS:GPSLongitudeRef': lon_ref,
+            'GPS:GPSLongitude': f"{lon_deg}/1 {lon_min}/1 {lon_sec}/100",
+        }
+        if altitude is not None:
+            gps_tags['GPS:GPSAltitudeRef'] = '0' if altitude >= 0 else '1'
+            gps_tags['GPS:GPSAltitude'] = f"{abs(altitude)}/1"
+        return gps_tags
+    
     @staticmethod
     def geotag(
         file_path: Union[str, Path],
@@ -350,37 +407,14 @@ class AdvancedFeatures:
         Returns:
             Dictionary with operation results
         """
-        if not (-90 <= latitude <= 90):
-            raise ValueError("Latitude must be between -90 and 90")
-        if not (-180 <= longitude <= 180):
-            raise ValueError("Longitude must be between -180 and 180")
+        gps_tags = AdvancedFeatures.gps_position_tags(latitude, longitude, altitude)
         
         try:
             manager = DNExif(file_path)
             
-            # Convert to EXIF GPS format (degrees, minutes, seconds)
-            lat_ref = 'N' if latitude >= 0 else 'S'
-            lon_ref = 'E' if longitude >= 0 else 'W'
-            
-            lat_abs = abs(latitude)
-            lat_deg = int(lat_abs)
-            lat_min = int((lat_abs - lat_deg) * 60)
-            lat_sec = ((lat_abs - lat_deg) * 60 - lat_min) * 60
-            
-            lon_abs = abs(longitude)
-            lon_deg = int(lon_abs)
-            lon_min = int((lon_abs - lon_deg) * 60)
-            lon_sec = ((lon_abs - lon_deg) * 60 - lon_min) * 60
-            
             # Set GPS tags
-            manager.set_tag('GPS:GPSLatitudeRef', lat_ref)
-            manager.set_tag('GPS:GPSLatitude', f"{lat_deg}/1 {lat_min}/1 {lat_sec}/100")
-            manager.set_tag('GPS:GPSLongitudeRef', lon_ref)
-            manager.set_tag('GPS:GPSLongitude', f"{lon_deg}/1 {lon_min}/1 {lon_sec}/100")
-            
-            if altitude is not None:
-                manager.set_tag('GPS:GPSAltitudeRef', '0' if altitude >= 0 else '1')
-                manager.set_tag('GPS:GPSAltitude', f"{abs(altitude)}/1")
+            for tag_name, value in gps_tags.items():
+                manager.set_tag(tag_name, value)
             
             manager.save()
             
@@ -13,11 +13,13 @@ Audio formats use various metadata standards (ID3, RIFF INFO, Vorbis comments).
 Copyright 2025 DNAi inc.
 """
 
+import os
 import struct
-from typing import Dict, Any, Optional, List
+from typing import BinaryIO, Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
 from dnexif.exceptions import MetadataWriteError
+from dnexif.stream_copy import atomic_output, copy_range
 
 
 def _build_ogg_crc_table() -> List[int]:
@@ -121,14 +123,6 @@ class AudioWriter:
         if not title_value and not artist_value:
             raise MetadataWriteError("No supported MP3 metadata fields provided (expected XMP:Title or EXIF:Artist)")
         
-        with open(file_path, 'rb') as f:
-            original_data = f.read()
-        
-        if len(original_data) < 10:
-            raise MetadataWriteError("Invalid MP3 file")
-        
-        audio_payload = self._strip_existing_id3v2(original_data)
-        
         # Build ID3v2.3 tag with TIT2/TPE1 frames
         frames = []
         if title_value:
@@ -142,8 +136,16 @@ class AudioWriter:
         tag_header = b'ID3' + bytes([3, 0, 0]) + self._int_to_synchsafe(tag_size)
         tag_data = tag_header + frame_body
         
-        with open(output_path, 'wb') as f:
-            f.write(tag_data + audio_payload)
+        with atomic_output(output_path) as output:
+            with open(file_path, 'rb') as source:
+                file_size = source.seek(0, os.SEEK_END)
+                if file_size < 10:
+                    raise MetadataWriteError("Invalid MP3 file")
+                source.seek(0)
+                audio_start = self._find_id3v2_end(source.read(10), file_size)
+                
+                output.write(tag_data)
+                copy_range(source, output, audio_start)
     
     def _write_wav(
         self,
@@ -169,12 +171,6 @@ class AudioWriter:
         if not title_value and not artist_value:
             raise MetadataWriteError("No supported WAV metadata fields provided (expected XMP:Title or EXIF:Artist)")
         
-        with open(file_path, 'rb') as f:
-            original_data = f.read()
-        
-        if len(original_data) < 12 or original_data[:4] != b'RIFF' or original_data[8:12] != b'WAVE':
-            raise MetadataWriteError("Invalid WAV file (missing RIFF/WAVE headers)")
-        
         # Build INFO entries
         def _build_info_entry(tag: bytes, value: str) -> bytes:
             text_bytes = value.encode('utf-8')
@@ -195,38 +191,38 @@ class AudioWriter:
         if len(info_payload) % 2:
             info_chunk += b'\x00'
         
-        # Rebuild RIFF chunks, removing any existing INFO LIST
-        chunks = []
-        offset = 12  # Skip RIFF header
-        data_len = len(original_data)
-        while offset + 8 <= data_len:
-            chunk_id = original_data[offset:offset+4]
-            chunk_size = struct.unpack('<I', original_data[offset+4:offset+8])[0]
-            chunk_total = 8 + chunk_size
-            if chunk_size % 2:
-                chunk_total += 1  # Account for padding byte
-            
-            chunk_bytes = original_data[offset:offset+chunk_total]
-            
-            if chunk_id == b'LIST' and chunk_total >= 12:
-                list_type = chunk_bytes[8:12]
-                if list_type == b'INFO':
+        with atomic_output(output_path) as output:
+            with open(file_path, 'rb') as source:
+                header = source.read(12)
+                if len(header) < 12 or header[:4] != b'RIFF' or header[8:12] != b'WAVE':
+                    raise MetadataWriteError("Invalid WAV file (missing RIFF/WAVE headers)")
+                
+                # Locate RIFF chunks, skipping any existing INFO LIST
+                data_len = source.seek(0, os.SEEK_END)
+                chunks = []
+                offset = 12  # Skip RIFF header
+                while offset + 8 <= data_len:
+                    source.seek(offset)
+                    chunk_header = source.read(12)
+                    chunk_id = chunk_header[:4]
+                    chunk_size = struct.unpack('<I', chunk_header[4:8])[0]
+                    chunk_total = 8 + chunk_size
+                    if chunk_size % 2:
+                        chunk_total += 1  # Account for padding byte
+                    
+                    if chunk_id == b'LIST' and chunk_total >= 12 and chunk_header[8:12] == b'INFO':
+                        offset += chunk_total
+                        continue  # Skip existing INFO chunk
+                    
+                    # The last chunk may be truncated
+                    chunks.append((offset, min(chunk_total, data_len - offset)))
                     offset += chunk_total
-                    continue  # Skip existing INFO chunk
-            
-            chunks.append(chunk_bytes)
-            offset += chunk_total
-        
-        chunks.append(info_chunk)
-        riff_body = b''.join(chunks)
-        final_data = bytearray(12 + len(riff_body))
-        final_data[:12] = original_data[:12]
-        final_data[12:] = riff_body
-        final_size = len(final_data) - 8
-        final_data[4:8] = struct.pack('<I', final_size)
-        
-        with open(output_path, 'wb') as f:
-            f.write(final_data)
+                
+                riff_size = 4 + sum(length for _, length in chunks) + len(info_chunk)
+                output.write(b'RIFF' + struct.pack('<I', riff_size) + b'WAVE')
+                for chunk_offset, chunk_length in chunks:
+                    copy_range(source, output, chunk_offset, chunk_length)
+                output.write(info_chunk)
     
     def _write_flac(
         self,
@@ -258,10 +254,6 @@ class AudioWriter:
         if not title_value and not artist_value:
             raise MetadataWriteError("No supported FLAC metadata fields provided (expected XMP:Title or EXIF:Artist)")
         
-        original_data = Path(file_path).read_bytes()
-        if not original_data.startswith(b'fLaC'):
-            raise MetadataWriteError("Invalid FLAC file")
-        
         vorbis_fields = {}
         if title_value:
             vorbis_fields['TITLE'] = title_value
@@ -269,24 +261,55 @@ class AudioWriter:
             vorbis_fields['ARTIST'] = str(artist_value)
         vorbis_block = self._build_vorbis_comment_block(vorbis_fields)
         
-        # Parse metadata blocks
+        with atomic_output(output_path) as output:
+            with open(file_path, 'rb') as source:
+                if source.read(4) != b'fLaC':
+                    raise MetadataWriteError("Invalid FLAC file")
+                blocks, audio_start = self._read_flac_metadata_blocks(source)
+                output.write(self._build_flac_metadata(blocks, vorbis_block))
+                if audio_start is not None:
+                    copy_range(source, output, audio_start)
+    
+    def _read_flac_metadata_blocks(self, source: BinaryIO) -> Tuple[List[Tuple[int, bytes]], Optional[int]]:
+        """
+        Read the metadata blocks that follow the fLaC marker.
+        
+        Args:
+            source: FLAC file object positioned just after the fLaC marker
+            
+        Returns:
+            Tuple of ((block_type, block_data) list, offset of the audio
+            frames or None if no block is flagged as the last one)
+        """
         offset = 4
         blocks = []
-        audio_start = len(original_data)
-        found = False
-        
-        while offset < len(original_data):
-            header = original_data[offset]
-            block_type = header & 0x7F
-            is_last = bool(header & 0x80)
-            block_length = int.from_bytes(original_data[offset + 1:offset + 4], 'big')
-            block_data = original_data[offset + 4:offset + 4 + block_length]
+        
+        while True:
+            header = source.read(4)
+            if not header:
+                break
+            block_type = header[0] & 0x7F
+            is_last = bool(header[0] & 0x80)
+            block_length = int.from_bytes(header[1:4], 'big')
+            block_data = source.read(block_length)
             blocks.append((block_type, block_data))
             offset += 4 + block_length
             if is_last:
-                audio_start = offset
-                break
+                return blocks, offset
         
+        return blocks, None
+    
+    def _build_flac_metadata(self, blocks: List[Tuple[int, bytes]], vorbis_block: bytes) -> bytes:
+        """
+        Build the fLaC marker and metadata blocks with the Vorbis comment replaced.
+        
+        Args:
+            blocks: Original (block_type, block_data) list
+            vorbis_block: New Vorbis comment block data
+            
+        Returns:
+            Marker and metadata blocks as bytes
+        """
         new_blocks = []
         replaced = False
         for block_type, block_data in blocks:
@@ -307,10 +330,7 @@ class AudioWriter:
             rebuilt.extend(len(block_data).to_bytes(3, 'big'))
             rebuilt.extend(block_data)
         
-        rebuilt.extend(original_data[audio_start:])
-        
-        with open(output_path, 'wb') as f:
-            f.write(rebuilt)
+        return bytes(rebuilt)
     
     def _write_aac_m4a(
         self,
@@ -365,40 +385,51 @@ class AudioWriter:
         if not title_value and not artist_value:
             raise MetadataWriteError("No supported OGG/Opus metadata fields provided (expected XMP:Title or EXIF:Artist)")
         
-        original_data = Path(file_path).read_bytes()
-        if not original_data.startswith(b'OggS'):
-            raise MetadataWriteError("Invalid OGG/Opus file (missing OggS capture pattern)")
-        
-        header_window = original_data[:4096]
-        is_opus = b'OpusHead' in header_window or file_path.lower().endswith('.opus')
-        signature = b'OpusTags' if is_opus else b'\x03vorbis'
-        
         vorbis_fields = {}
         if title_value:
             vorbis_fields['TITLE'] = title_value
         if artist_value:
             vorbis_fields['ARTIST'] = str(artist_value)
-        vorbis_block = self._build_vorbis_comment_block(
-            vorbis_fields,
-            include_framing=not is_opus
-        )
-        comment_packet = signature + vorbis_block
         
-        updated_data = self._replace_ogg_comment_page(original_data, signature, comment_packet)
-        
-        with open(output_path, 'wb') as f:
-            f.write(updated_data)
+        with atomic_output(output_path) as output:
+            with open(file_path, 'rb') as source:
+                header_window = source.read(4096)
+                if not header_window.startswith(b'OggS'):
+                    raise MetadataWriteError("Invalid OGG/Opus file (missing OggS capture pattern)")
+                
+                is_opus = b'OpusHead' in header_window or file_path.lower().endswith('.opus')
+                signature = b'OpusTags' if is_opus else b'\x03vorbis'
+                
+                vorbis_block = self._build_vorbis_comment_block(
+                    vorbis_fields,
+                    include_framing=not is_opus
+                )
+                comment_packet = signature + vorbis_block
+                
+                page_start, rebuilt_page, page_end = self._replace_ogg_comment_page(
+                    source, signature, comment_packet
+                )
+                copy_range(source, output, 0, page_start)
+                output.write(rebuilt_page)
+                copy_range(source, output, page_end)
 
-    def _strip_existing_id3v2(self, data: bytes) -> bytes:
+    def _find_id3v2_end(self, header: bytes, file_size: int) -> int:
         """
-        Remove existing ID3v2 tag (if present) and return the remaining audio payload.
+        Return the offset of the audio payload after any existing ID3v2 tag.
+        
+        Args:
+            header: First 10 bytes of the file
+            file_size: Total file size
+            
+        Returns:
+            Offset just past the ID3v2 tag, or 0 if there is no usable tag
         """
-        if len(data) >= 10 and data.startswith(b'ID3'):
-            tag_size = self._synchsafe_to_int(data[6:10])
+        if len(header) >= 10 and header.startswith(b'ID3'):
+            tag_size = self._synchsafe_to_int(header[6:10])
             cutoff = 10 + tag_size
-            if cutoff < len(data):
-                return data[cutoff:]
-        return data
+            if cutoff < file_size:
+                return cutoff
+        return 0
 
     def _build_text_frame_payload(self, text: str) -> bytes:
         """
@@ -487,30 +518,42 @@ class AudioWriter:
             crc = ((crc << 8) & 0xFFFFFFFF) ^ OGG_CRC_TABLE[index]
         return crc & 0xFFFFFFFF
 
-    def _replace_ogg_comment_page(self, data: bytes, signature: bytes, comment_packet: bytes) -> bytes:
+    def _replace_ogg_comment_page(
+        self,
+        source: BinaryIO,
+        signature: bytes,
+        comment_packet: bytes
+    ) -> Tuple[int, bytes, int]:
         """
-        Replace the Vorbis/Opus comment packet page with updated metadata.
+        Rebuild the Vorbis/Opus comment packet page with updated metadata.
+        
+        Pages are read one at a time until the comment page is found.
+        
+        Returns:
+            Tuple of (page start offset, rebuilt page, page end offset); the
+            rebuilt page replaces the original range
         """
         offset = 0
-        data_len = len(data)
+        data_len = source.seek(0, os.SEEK_END)
         
         while offset + 27 <= data_len:
-            if data[offset:offset+4] != b'OggS':
+            source.seek(offset)
+            header = bytearray(source.read(27))
+            if header[0:4] != b'OggS':
                 break
             
-            header = bytearray(data[offset:offset+27])
             seg_count = header[26]
             seg_table_start = offset + 27
             seg_table_end = seg_table_start + seg_count
             if seg_table_end > data_len:
                 break
-            lacing_vals = list(data[seg_table_start:seg_table_end])
+            lacing_vals = list(source.read(seg_count))
             payload_len = sum(lacing_vals)
             payload_start = seg_table_end
             payload_end = payload_start + payload_len
             if payload_end > data_len:
                 break
-            payload = data[payload_start:payload_end]
+            payload = source.read(payload_len)
             
             if payload.startswith(signature):
                 # Determine how many lacing entries belong to the comment packet
@@ -549,7 +592,7 @@ class AudioWriter:
                 header[22:26] = crc.to_bytes(4, 'little')
                 rebuilt_page = bytes(header) + segment_table + new_payload
                 
-                return data[:offset] + rebuilt_page + data[payload_end:]
+                return offset, rebuilt_page, payload_end
             
             offset = payload_end
         
@@ -587,8 +630,15 @@ class AudioWriter:
             raise MetadataWriteError("No supported WMA metadata fields provided (expected XMP:Title or EXIF:Artist)")
         
         try:
+            # Only the ASF Header Object is loaded; the data and index
+            # objects after it are copied from the original file
             with open(file_path, 'rb') as f:
-                original_data = f.read()
+                file_size = f.seek(0, os.SEEK_END)
+                f.seek(16)
+                size_field = f.read(8)
+                header_size = struct.unpack('<Q', size_field)[0] if len(size_field) == 8 else 0
+                f.seek(0)
+                original_data = f.read(header_size if 32 <= header_size <= file_size else 32)
             
             # Verify ASF Header Object
             asf_header_guid = bytes.fromhex('3026b2758e66cf11a6d900aa0062ce6c')
@@ -714,10 +764,11 @@ class AudioWriter:
                 reserved +
                 new_header_objects
             )
-            new_data = bytearray(new_header + original_data[header_size:])
             
-            with open(output_path, 'wb') as f:
-                f.write(new_data)
+            with atomic_output(output_path) as output:
+                with open(file_path, 'rb') as source:
+                    output.write(new_header)
+                    copy_range(source, output, header_size)
                 
         except Exception as e:
             if isinstance(e, MetadataWriteError):
@@ -18,6 +18,7 @@ from typing import Dict, Any
 from pathlib import Path
 
 from dnexif.exceptions import MetadataWriteError
+from dnexif.stream_copy import atomic_write
 
 
 class BMPWriter:
@@ -98,12 +99,10 @@ class BMPWriter:
                         new_bmp[30:34] = struct.pack('<I', compression)
                 
                 # Write output file
-                with open(output_path, 'wb') as f:
-                    f.write(bytes(new_bmp))
+                atomic_write(output_path, bytes(new_bmp))
             else:
                 # File too short, just copy
-                with open(output_path, 'wb') as f:
-                    f.write(bmp_data)
+                atomic_write(output_path, bmp_data)
                 
         except Exception as e:
             raise MetadataWriteError(f"Failed to write BMP metadata: {str(e)}")
@@ -16,6 +16,7 @@ from pathlib import Path
 import struct
 
 from dnexif.exceptions import MetadataWriteError
+from dnexif.stream_copy import atomic_write
 
 
 class C2PAWriter:
@@ -125,8 +126,7 @@ class C2PAWriter:
             
             # Write output if path provided
             if output_path:
-                with open(output_path, 'wb') as f:
-                    f.write(file_data)
+                atomic_write(output_path, file_data)
             
             return bytes(file_data)
             
@@ -18,11 +18,11 @@ import sys
 import json
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from datetime import datetime, timedelta
 import os
-import shutil
 import glob
+import itertools
 import math
 
 from dnexif.core import DNExif
@@ -34,6 +34,7 @@ from dnexif.tag_operations import TagOperations
 from dnexif.tag_lister import TagLister
 from dnexif.tag_filter import TagFilter
 from dnexif.format_detector import FormatDetector
+from dnexif.stream_copy import clone_file
 from dnexif.value_formatter import format_exif_value
 import stat
 import mimetypes
@@ -2151,7 +2152,7 @@ def format_output(
         return output
 
 
-def collect_files(
+def iter_files(
     paths: List[str],
     recursive: bool = False,
     extension: Optional[str] = None,
@@ -2159,9 +2160,15 @@ def collect_files(
     include_hidden: bool = False,
     include_no_ext: bool = False,
     ignore_hidden_files: bool = False
-) -> List[Path]:
+) -> Iterator[Path]:
     """
-    Collect files to process based on options.
+    Yield the files to process based on options, as they are found.
+    
+    Directories are walked with the concurrent scandir walker: ignored and
+    hidden directories are skipped before they are entered, and files are
+    yielded while the walk is still running. Paths are yielded in the order
+    given; the files of a directory come depth first, in name order, so the
+    output order does not depend on how the concurrent scans finish.
     
     Args:
         paths: List of file/directory paths
@@ -2172,86 +2179,72 @@ def collect_files(
         include_no_ext: Whether to include files without extension (for -ext+)
         ignore_hidden_files: Whether to ignore files starting with "." (for -i HIDDEN)
         
-    Returns:
-        List of file paths to process
+    Yields:
+        File paths to process
     """
-    files = []
-    ignore_dirs = ignore_dirs or []
+    from dnexif.file_walker import walk_files
+    
+    ignore_dirs = set(ignore_dirs or [])
+    if extension and not extension.startswith('.'):
+        extension = '.' + extension
+    extension = extension.lower() if extension else None
+    
+    def include_file(name: str, in_tree: bool) -> bool:
+        # Hidden files below a recursed directory follow the -r. setting
+        if name.startswith('.') and (ignore_hidden_files or (in_tree and not include_hidden)):
+            return False
+        if extension is None or name.lower().endswith(extension):
+            return True
+        return include_no_ext and not Path(name).suffix
+    
+    def include_dir(name: str) -> bool:
+        if name in ignore_dirs:
+            return False
+        return include_hidden or not name.startswith('.')
     
     for path_str in paths:
         path = Path(path_str)
         
         if path.is_file():
-            # Check if hidden file should be ignored
-            if ignore_hidden_files and path.name.startswith('.'):
-                continue
-            
-            if extension is None:
-                files.append(path)
-            elif path.suffix.lower() == extension.lower():
-                files.append(path)
-            elif include_no_ext and not path.suffix:
-                files.append(path)
+            if include_file(path.name, False):
+                yield path
         elif path.is_dir():
-            if recursive:
-                # Use glob with appropriate pattern
-                if extension:
-                    pattern = f"**/*{extension}"
-                else:
-                    pattern = "**/*"
-                
-                for file_path in path.glob(pattern):
-                    if file_path.is_file():
-                        # Check if hidden file should be ignored
-                        if ignore_hidden_files and file_path.name.startswith('.'):
-                            continue
-                        
-                        # Check if in ignored directory
-                        if any(ignore_dir in file_path.parts for ignore_dir in ignore_dirs):
-                            continue
-                        # Check if hidden directory (unless include_hidden)
-                        if not include_hidden:
-                            if any(part.startswith('.') for part in file_path.parts[1:]):
-                                continue
-                        files.append(file_path)
-                
-                # Also include files without extension if -ext+ was used
-                if include_no_ext and extension:
-                    for file_path in path.glob("**/*"):
-                        if file_path.is_file() and not file_path.suffix:
-                            # Check if hidden file should be ignored
-                            if ignore_hidden_files and file_path.name.startswith('.'):
-                                continue
-                            
-                            if any(ignore_dir in file_path.parts for ignore_dir in ignore_dirs):
-                                continue
-                            if not include_hidden:
-                                if any(part.startswith('.') for part in file_path.parts[1:]):
-                                    continue
-                            files.append(file_path)
-            else:
-                # Non-recursive: just files in directory
-                if extension:
-                    pattern = f"*{extension}"
-                else:
-                    pattern = "*"
-                for file_path in path.glob(pattern):
-                    if file_path.is_file():
-                        # Check if hidden file should be ignored
-                        if ignore_hidden_files and file_path.name.startswith('.'):
-                            continue
-                        files.append(file_path)
-                
-                # Also include files without extension if -ext+ was used
-                if include_no_ext and extension:
-                    for file_path in path.glob("*"):
-                        if file_path.is_file() and not file_path.suffix:
-                            # Check if hidden file should be ignored
-                            if ignore_hidden_files and file_path.name.startswith('.'):
-                                continue
-                            files.append(file_path)
+            yield from walk_files(
+                path,
+                include_file=lambda name: include_file(name, recursive),
+                include_dir=include_dir,
+                recursive=recursive
+            )
+
+
+def collect_files(
+    paths: List[str],
+    recursive: bool = False,
+    extension: Optional[str] = None,
+    ignore_dirs: Optional[List[str]] = None,
+    include_hidden: bool = False,
+    include_no_ext: bool = False,
+    ignore_hidden_files: bool = False
+) -> List[Path]:
+    """
+    Collect files to process based on options.
     
-    return files
+    Args:
+        paths: List of file/directory paths
+        recursive: Whether to recurse into directories
+        extension: Optional file extension filter (e.g., '.jpg')
+        ignore_dirs: Optional list of directory names to ignore
+        include_hidden: Whether to include hidden directories (for -r.)
+        include_no_ext: Whether to include files without extension (for -ext+)
+        ignore_hidden_files: Whether to ignore files starting with "." (for -i HIDDEN)
+        
+    Returns:
+        List of file paths to process
+    """
+    return list(iter_files(
+        paths, recursive, extension, ignore_dirs,
+        include_hidden, include_no_ext, ignore_hidden_files
+    ))
 
 
 def apply_tag_operation(
@@ -2664,7 +2657,7 @@ def process_file(
                     if not overwrite_in_place:
                         # Create backup
                         backup_path = Path(str(file_path) + "_original")
-                        shutil.copy2(file_path, backup_path)
+                        clone_file(file_path, backup_path)
                     save_path = file_path
                 else:
                     save_path = file_path
@@ -4162,7 +4155,7 @@ Examples:
     )
     
     # File selection options
-    parser.add_argument('files', nargs='+', help='File(s) or directory(ies) to process')
+    parser.add_argument('files', nargs='*', help='File(s) or directory(ies) to process (required except with -stay_open True)')
     parser.add_argument('-r', '--recurse', type=str, nargs='?', const='', help='Recursively process directories (-r. to include hidden directories)')
     parser.add_argument('-ext', type=str, nargs='?', const='', help='Process only files with specified extension (-ext+ to also process files without extension)')
     parser.add_argument('-extension', type=str, nargs='?', const='', help='Alias for -ext option')
@@ -4293,6 +4286,8 @@ Examples:
     parser.add_argument('-file4', type=str, dest='file4', help='Load tags from alternate file (file4)')
     parser.add_argument('-common_args', type=str, nargs='*', help='Define common arguments to apply to all files')
     parser.add_argument('-stay_open', type=str, nargs='?', const='', help='Keep reading -@ argfile even after EOF (for API mode)')
+    parser.add_argument('-stay_open_socket', type=str, help='With -stay_open True, serve commands on a Unix domain socket at this path instead of -@')
+    parser.add_argument('-stay_open_nul', action='store_true', help='With -stay_open True, read NUL-terminated arguments instead of one per line')
     parser.add_argument('-api', type=str, action='append', help='Set standard format API option (format: OPT=VAL or OPT^=VAL)')
     parser.add_argument('-config', type=str, help='Specify configuration file name')
     parser.add_argument('-use', type=str, help='Add features from plug-in module')
@@ -4301,6 +4296,11 @@ Examples:
     # Parse arguments (argparse automatically handles -- as end of options)
     args, remaining = parser.parse_known_args()
     
+    # Files are required unless a -stay_open server reads the commands
+    stay_open_server = args.stay_open is not None and args.stay_open.lower() not in ('false', '0')
+    if not args.files and not stay_open_server:
+        parser.error('the following arguments are required: files')
+    
     # Handle -z alias for -d (date format, not ZIP)
     if args.z and not args.dateFormat:
         args.dateFormat = args.z
@@ -4442,7 +4442,7 @@ Examples:
                 backup_path = Path(str(file_path) + "_original")
                 if backup_path.exists():
                     try:
-                        shutil.copy2(backup_path, file_path)
+                        clone_file(backup_path, file_path)
                         if not args.quiet:
                             print(f"Restored from backup: {file_path}")
                     except Exception as e:
@@ -4759,64 +4759,32 @@ Examples:
     
     # Handle argument file (-@)
     # Handle -@ argfile with -stay_open support
-    stay_open_mode = hasattr(args, 'stay_open') and args.stay_open is not None
+    if stay_open_server:
+        # Server mode: run each command in this process until the session is closed
+        from dnexif.cli_server import serve_argfile, serve_socket
+        if args.stay_open_socket:
+            serve_socket(args.stay_open_socket, nul_delimited=args.stay_open_nul)
+        else:
+            serve_argfile(args.argfile, nul_delimited=args.stay_open_nul)
+        return
     if hasattr(args, 'argfile') and args.argfile:
         arg_file = Path(args.argfile)
-        if arg_file.exists() or stay_open_mode:
-            # In stay_open mode, keep reading from argfile even after EOF
-            if stay_open_mode:
-                # API mode: keep reading from argfile
-                while True:
-                    try:
-                        with open(arg_file, 'r') as f:
-                            arg_lines = f.readlines()
-                        if not arg_lines:
-                            # Wait for more input (in real API mode, this would block)
-                            import time
-                            time.sleep(0.1)
-                            continue
-                        
-                        # Parse arguments from file
-                        for line in arg_lines:
-                            line = line.strip()
-                            if not line:
-                                continue
-                            # Handle "#[CSTR]" directive - constant string
-                            if line.startswith('#[CSTR]'):
-                                # Extract string after "#[CSTR]" and add as-is
-                                cstr_value = line[7:].strip()  # Remove "#[CSTR]" prefix
-                                if cstr_value:
-                                    remaining.append(cstr_value)
-                            elif not line.startswith('#'):
-                                remaining.append(line)
-                        
-                        # Process files with these arguments
-                        # (In full API mode, this would be in a loop)
-                        break
-                    except (FileNotFoundError, IOError):
-                        if stay_open_mode:
-                            # Keep waiting for file
-                            import time
-                            time.sleep(0.1)
-                            continue
-                        break
-            else:
-                # Normal mode: read once
-                with open(arg_file, 'r') as f:
-                    arg_lines = f.readlines()
-                    # Parse arguments from file and add to remaining
-                    for line in arg_lines:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        # Handle "#[CSTR]" directive - constant string
-                        if line.startswith('#[CSTR]'):
-                            # Extract string after "#[CSTR]" and add as-is
-                            cstr_value = line[7:].strip()  # Remove "#[CSTR]" prefix
-                            if cstr_value:
-                                remaining.append(cstr_value)
-                        elif not line.startswith('#'):
-                            remaining.append(line)
+        if arg_file.exists():
+            with open(arg_file, 'r') as f:
+                arg_lines = f.readlines()
+                # Parse arguments from file and add to remaining
+                for line in arg_lines:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    # Handle "#[CSTR]" directive - constant string
+                    if line.startswith('#[CSTR]'):
+                        # Extract string after "#[CSTR]" and add as-is
+                        cstr_value = line[7:].strip()  # Remove "#[CSTR]" prefix
+                        if cstr_value:
+                            remaining.append(cstr_value)
+                    elif not line.startswith('#'):
+                        remaining.append(line)
     
     # Handle recursive flag (-r or -r. for hidden directories)
     recursive = args.recurse is not None
@@ -4856,7 +4824,9 @@ Examples:
     # Handle -suffix option
     suffix = args.suffix if hasattr(args, 'suffix') and args.suffix else None
     
-    collected_files = collect_files(
+    # Files are streamed from the directory walker into processing; the
+    # options below that need the whole list collect it first
+    collected_files = iter_files(
         args.files,
         recursive=recursive,
         extension=extension,
@@ -4868,7 +4838,7 @@ Examples:
     
     # Apply suffix filter if specified
     if suffix:
-        files = [f for f in collected_files if str(f).endswith(suffix)]
+        files = (f for f in collected_files if str(f).endswith(suffix))
     else:
         files = collected_files
     
@@ -4892,6 +4862,7 @@ Examples:
     if hasattr(args, 'fileOrderList') and args.fileOrderList:
         # Process files in specified order
         order_list = [f.strip() for f in args.fileOrderList.split(',')]
+        files = list(files)
         ordered_files = []
         for ordered_file in order_list:
             ordered_path = Path(ordered_file)
@@ -4933,12 +4904,18 @@ Examples:
         
         files = sorted(files, key=get_tag_value_for_sort, reverse=file_order_reverse)
     elif hasattr(args, 'fileOrder') and args.fileOrder:
-        # Process files in natural order (already sorted by collect_files)
-        pass
-    
-    if not files:
+        # Process files sorted by path (across all the paths given)
+        files = sorted(files)
+    
+    # Peek at the first two files: whether there are several decides the
+    # output layout, and is known before the walk has finished
+    files = iter(files)
+    first_files = list(itertools.islice(files, 2))
+    if not first_files:
         print("No files found to process", file=sys.stderr)
         return
+    multiple_files = len(first_files) > 1
+    files = itertools.chain(first_files, files)
     
     # Handle GPX/KML generation from all files (must be done before individual file processing)
     if hasattr(args, 'gpx') and args.gpx:
@@ -4963,7 +4940,11 @@ Examples:
     
     # Show progress if requested
     show_progress = args.progress
-    total_files = len(files)
+    total_files = None
+    if args.progress is not None:
+        # The progress messages show the total, so finish the walk first
+        files = list(files)
+        total_files = len(files)
     
     # Parse tag assignments, deletions, and redirections
     write_tags = {}
@@ -5115,6 +5096,18 @@ Examples:
                 elif not args.quiet:
                     print(f"Warning: Alternate file {i} not found: {file_path_str}", file=sys.stderr)
     
+    # Commands that write files (edited images, backups, text output) must not
+    # come across their own output in a directory that is still being walked,
+    # so they list the whole tree before processing it
+    writes_files = (
+        write_tags or tag_operations or delete_tags or redirections or group_deletions
+        or getattr(args, 'delete_all', False) or getattr(args, 'all', False)
+        or args.output or args.textOut or args.tagOut or args.tagsFromFile or args.srcfile
+        or args.geotag
+    )
+    if writes_files and not isinstance(files, list):
+        files = list(files)
+    
     # Process files
     error_files = []
     error_count = 0
@@ -5445,7 +5438,7 @@ Examples:
         tag_out_file = None
         if args.tagOut:
             tag_out_file = Path(args.tagOut)
-            if len(files) > 1:
+            if multiple_files:
                 # For multiple files, create per-file output
                 tag_out_file = tag_out_file.parent / f"{tag_out_file.stem}_{file_path.stem}{tag_out_file.suffix}"
             else:
@@ -5943,7 +5936,7 @@ Examples:
             # Handle JSON/CSV file writing
             if format_options.get('json_file'):
                 json_output_file = Path(format_options['json_file'])
-                if len(files) > 1:
+                if multiple_files:
                     json_output_file = json_output_file.parent / f"{json_output_file.stem}_{file_path.stem}{json_output_file.suffix}"
                 with open(json_output_file, 'w', encoding='utf-8') as f:
                     f.write(result)
@@ -5952,7 +5945,7 @@ Examples:
             
             if format_options.get('csv_file'):
                 csv_output_file = Path(format_options['csv_file'])
-                if len(files) > 1:
+                if multiple_files:
                     csv_output_file = csv_output_file.parent / f"{csv_output_file.stem}_{file_path.stem}{csv_output_file.suffix}"
                 with open(csv_output_file, 'w', encoding='utf-8') as f:
                     f.write(result)
@@ -5973,7 +5966,7 @@ Examples:
                     output_file_str = output_file_str[1:]
                 
                 output_file = Path(output_file_str)
-                if len(files) > 1:
+                if multiple_files:
                     # Multiple files: append with filename
                     output_file = output_file.parent / f"{output_file.stem}_{file_path.stem}{output_file.suffix}"
                 
@@ -6016,7 +6009,7 @@ Examples:
                     
                     print(f"\n=== {file_path} ===")
                     print(result)
-                    if len(files) > 1:
+                    if multiple_files:
                         print()
     
     # Write error file if requested
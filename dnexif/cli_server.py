@@ -0,0 +1,262 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Persistent CLI server (-stay_open)
+
+This module runs CLI commands in a long-lived process, so that each request
+only pays for the work it does: the interpreter, the parser and writer
+modules and their tables are loaded once and stay warm between commands.
+
+It speaks the standard -stay_open protocol. Arguments are sent one per line
+(or NUL-terminated, for file names that may contain newlines). A command is
+run when an "-execute[NUM]" argument is read, and its output is followed by
+a "{ready[NUM]}" line. The arguments "-stay_open" "False" end the session.
+Commands are read from an argument file, from stdin ("-@ -") or from the
+connections to a Unix domain socket.
+
+Example:
+    $ python -m dnexif -stay_open True -@ -
+    -EXIF:Make
+    image.jpg
+    -execute
+    ...
+    {ready}
+
+Copyright 2025 DNAi inc.
+"""
+
+import os
+import re
+import socket
+import sys
+import time
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator, List, Optional, TextIO, Union
+
+
+READ_SIZE = 64 * 1024
+FOLLOW_INTERVAL = 0.1  # Seconds between checks for new data in a regular argfile
+
+EXECUTE_PATTERN = re.compile(r'-execute(\d*)')
+
+# Runs one command: (arguments, stdout, stderr) -> exit status
+CommandRunner = Callable[[List[str], TextIO, TextIO], int]
+
+
+def run_command(arguments: List[str], stdout: TextIO, stderr: TextIO) -> int:
+    """
+    Run one CLI command in this process.
+
+    Args:
+        arguments: Command line arguments (without the program name)
+        stdout: Stream receiving the command's standard output
+        stderr: Stream receiving the command's error output
+
+    Returns:
+        Exit status of the command
+    """
+    from dnexif.cli_enhanced import main
+
+    saved_argv = sys.argv
+    sys.argv = [saved_argv[0] if saved_argv else 'dnexif'] + arguments
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            main()
+        return 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=stderr)
+        return 1
+    except Exception as e:
+        # One failing command must not take down the server
+        print(f"Error: {e}", file=stderr)
+        return 1
+    finally:
+        sys.argv = saved_argv
+
+
+def iter_arguments(
+    stream: BinaryIO,
+    nul_delimited: bool = False,
+    follow: bool = False
+) -> Iterator[str]:
+    """
+    Read arguments from a stream as they arrive.
+
+    In line mode, surrounding whitespace is removed, blank lines and "#"
+    comment lines are skipped and "#[CSTR]" lines give their text as-is, as
+    in an argument file. In NUL mode every NUL-terminated string is an
+    argument.
+
+    Args:
+        stream: Binary stream to read (a pipe, socket or file)
+        nul_delimited: True if arguments are NUL-terminated instead of
+                       newline-terminated
+        follow: If True, keep waiting for data to be appended at end of
+                file (for regular argument files) instead of stopping
+
+    Yields:
+        Arguments, in order
+    """
+    delimiter = b'\0' if nul_delimited else b'\n'
+    read = getattr(stream, 'read1', stream.read)
+    buffer = b''
+    while True:
+        chunk = read(READ_SIZE)
+        if not chunk:
+            if follow:
+                time.sleep(FOLLOW_INTERVAL)
+                continue
+            break
+        buffer += chunk
+        *items, buffer = buffer.split(delimiter)
+        for item in items:
+            argument = _decode_argument(item, nul_delimited)
+            if argument is not None:
+                yield argument
+    if buffer:
+        argument = _decode_argument(buffer, nul_delimited)
+        if argument is not None:
+            yield argument
+
+
+def _decode_argument(item: bytes, nul_delimited: bool) -> Optional[str]:
+    """Decode one raw argument; None if it is a blank or comment line."""
+    argument = item.decode('utf-8', errors='surrogateescape')
+    if nul_delimited:
+        return argument
+    argument = argument.strip()
+    if argument.startswith('#[CSTR]'):
+        return argument[7:].strip() or None
+    if not argument or argument.startswith('#'):
+        return None
+    return argument
+
+
+def serve_stream(
+    stream: BinaryIO,
+    stdout: TextIO,
+    stderr: TextIO,
+    nul_delimited: bool = False,
+    follow: bool = False,
+    runner: CommandRunner = run_command
+) -> bool:
+    """
+    Run the commands read from a stream until it ends or the session is closed.
+
+    Args:
+        stream: Binary stream of arguments
+        stdout: Stream receiving command output and the {ready} markers
+        stderr: Stream receiving error output
+        nul_delimited: True if arguments are NUL-terminated
+        follow: True to keep reading past end of file (regular argfiles)
+        runner: Function used to run each command
+
+    Returns:
+        True if the session was closed with "-stay_open False", False if the
+        stream ended
+    """
+    arguments: List[str] = []
+    stay_open_value = False
+    for argument in iter_arguments(stream, nul_delimited, follow):
+        if stay_open_value:
+            stay_open_value = False
+            if argument.lower() in ('false', '0'):
+                return True
+            continue
+        if argument == '-stay_open':
+            stay_open_value = True
+            continue
+        match = EXECUTE_PATTERN.fullmatch(argument)
+        if match is None:
+            arguments.append(argument)
+            continue
+        runner(arguments, stdout, stderr)
+        arguments = []
+        stdout.write(f"{{ready{match.group(1)}}}\n")
+        stdout.flush()
+        stderr.flush()
+    return False
+
+
+def serve_argfile(
+    argfile: Optional[Union[str, Path]],
+    nul_delimited: bool = False,
+    runner: CommandRunner = run_command
+) -> None:
+    """
+    Serve commands read from an argument file, or from stdin.
+
+    A regular argument file is followed like "tail -f" until the session is
+    closed; pipes and stdin are read until they are closed.
+
+    Args:
+        argfile: Path to the argument file, or None or "-" for stdin
+        nul_delimited: True if arguments are NUL-terminated
+        runner: Function used to run each command
+    """
+    if argfile is None or str(argfile) == '-':
+        serve_stream(sys.stdin.buffer, sys.stdout, sys.stderr, nul_delimited, runner=runner)
+        return
+    with open(argfile, 'rb') as stream:
+        follow = os.path.isfile(argfile)
+        serve_stream(stream, sys.stdout, sys.stderr, nul_delimited, follow, runner)
+
+
+def serve_socket(
+    socket_path: Union[str, Path],
+    nul_delimited: bool = False,
+    runner: CommandRunner = run_command
+) -> None:
+    """
+    Serve commands sent over a Unix domain socket.
+
+    Each connection is a session: its commands are run in order and their
+    output (including errors) is sent back on the same connection.
+    Connections are served one at a time, and "-stay_open False" from any
+    of them stops the server.
+
+    Args:
+        socket_path: Filesystem path to listen on (a stale socket is replaced).
+            The socket is only accessible to the current user.
+        nul_delimited: True if arguments are NUL-terminated
+        runner: Function used to run each command
+
+    Raises:
+        FileExistsError: If socket_path exists and is not a socket
+    """
+    socket_path = Path(socket_path)
+    if socket_path.is_socket():
+        socket_path.unlink()
+    elif os.path.lexists(socket_path):
+        raise FileExistsError(f"Refusing to replace {socket_path}: not a socket")
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        # Commands run with this user's rights, so nobody else may connect
+        old_umask = os.umask(0o077)
+        try:
+            server.bind(str(socket_path))
+        finally:
+            os.umask(old_umask)
+        server.listen()
+        closed = False
+        while not closed:
+            connection, _ = server.accept()
+            try:
+                with connection, connection.makefile('rb') as stream, \
+                        connection.makefile('w', encoding='utf-8', newline='\n') as output:
+                    closed = serve_stream(stream, output, output, nul_delimited, runner=runner)
+            except (BrokenPipeError, ConnectionResetError):
+                # The client went away; wait for the next one
+                pass
+    finally:
+        server.close()
+        if socket_path.is_socket():
+            socket_path.unlink()
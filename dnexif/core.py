@@ -15,43 +15,21 @@ This is a 100% pure Python implementation - no external standard format dependen
 Copyright 2025 DNAi inc.
 """
 
-from typing import Dict, Any, Optional, Union, List, Callable
+from typing import TYPE_CHECKING, Dict, Any, Optional, Union, List, Callable, Set, Iterable, Tuple
 from pathlib import Path
-import tempfile
 import struct
 import sys
 import os
+import time
 
-from dnexif.exif_parser import ExifParser
-from dnexif.exif_writer import EXIFWriter
+from dnexif.exif_parser import ExifParser, KNOWN_EXIF_TAG_NAMES, DERIVED_TAG_SOURCES
 from dnexif.iptc_parser import IPTCParser
-from dnexif.iptc_writer import IPTCWriter
 from dnexif.xmp_parser import XMPParser
-from dnexif.xmp_writer import XMPWriter
-from dnexif.raw_parser import RAWParser
-from dnexif.tiff_writer import TIFFWriter
-from dnexif.png_writer import PNGWriter
-from dnexif.webp_writer import WebPWriter
-from dnexif.webp_parser import WebPParser
-from dnexif.gif_writer import GIFWriter
-from dnexif.raw_writer import RAWWriter
-from dnexif.video_writer import VideoWriter
-from dnexif.audio_writer import AudioWriter
-from dnexif.pdf_writer import PDFWriter
-from dnexif.heic_writer import HEICWriter
-from dnexif.bmp_writer import BMPWriter
-from dnexif.svg_writer import SVGWriter
-from dnexif.psd_writer import PSDWriter
-from dnexif.metadata_standards_writer import MetadataStandardsWriter
-from dnexif.jpeg_modifier import JPEGModifier
+from dnexif.jpeg_modifier import JPEGSegmentRewriter
+from dnexif.file_view import FileView
 from dnexif.format_detector import FormatDetector
-from dnexif.video_parser import VideoParser
-from dnexif.document_parser import DocumentParser
-from dnexif.audio_parser import AudioParser
-from dnexif.ico_parser import ICOParser
-from dnexif.pcx_parser import PCXParser
-from dnexif.tga_parser import TGAParser
-from dnexif.tga_writer import TGAWriter
+from dnexif.format_registry import FormatHandler
+from dnexif.stream_copy import atomic_write
 from dnexif.exceptions import (
     DNExifError,
     MetadataReadError,
@@ -60,7 +38,6 @@ from dnexif.exceptions import (
     InvalidTagError,
 )
 from dnexif.value_formatter import format_exif_value
-from dnexif.image_hash_calculator import calculate_image_data_hash, add_image_data_hash_to_metadata
 try:
     from dnexif.exif_tags import EXIF_TAG_NAMES
 except ImportError:
@@ -69,11 +46,31 @@ try:
     from dnexif.iptc_tags import IPTC_TAG_NAMES
 except ImportError:
     IPTC_TAG_NAMES = {}
+if TYPE_CHECKING:
+    from dnexif.metadata_cache import MetadataCache
 import os
 import stat
 from datetime import datetime, timedelta, timezone
 
 
+def _alias_source_groups(*alias_tables: Iterable[Tuple[str, str]]) -> Dict[str, Tuple[str, ...]]:
+    """
+    Map alias tag names to the groups of the tags they are copied from.
+    
+    Args:
+        alias_tables: (source tag, alias name) pairs, e.g. ('XMP:CreateDate', 'CreateDate')
+        
+    Returns:
+        Dictionary mapping alias names to source groups, in first-seen order
+    """
+    source_groups: Dict[str, Dict[str, None]] = {}
+    for table in alias_tables:
+        for source_tag, alias_name in table:
+            if ':' in source_tag:
+                source_groups.setdefault(alias_name, {})[source_tag.split(':', 1)[0]] = None
+    return {alias_name: tuple(groups) for alias_name, groups in source_groups.items()}
+
+
 class DNExif:
     """
     Main class for reading and writing metadata from image files.
@@ -159,6 +156,257 @@ class DNExif:
         '.json', '.xml', '.pgm', '.pnm', '.ppm', '.pcd', '.pes', '.picon', '.pict', '.ras', '.sfw', '.sgi', '.wbmp', '.xbm', '.xcf', '.xpm', '.xwd', '.mng'
     }
     
+    # Embedded metadata loading stages for image/RAW formats, in load order
+    EMBEDDED_METADATA_STAGES = ('EXIF', 'IPTC', 'XMP', 'SEAL', 'C2PA', 'Standards')
+    
+    # Tag group -> loading stage that produces it (groups=/lazy loading).
+    # Groups not listed here (e.g. Composite) require all stages.
+    METADATA_GROUP_STAGES = {
+        'EXIF': 'EXIF', 'IFD0': 'EXIF', 'IFD1': 'EXIF', 'ExifIFD': 'EXIF',
+        'SubIFD': 'EXIF', 'InteropIFD': 'EXIF', 'GPS': 'EXIF',
+        'MakerNote': 'EXIF', 'MakerNotes': 'EXIF', 'PanasonicRaw': 'EXIF',
+        'DNG': 'EXIF', 'PNG': 'EXIF',
+        'Canon': 'EXIF', 'Nikon': 'EXIF', 'Sony': 'EXIF', 'Olympus': 'EXIF',
+        'Pentax': 'EXIF', 'Fujifilm': 'EXIF', 'FujiFilm': 'EXIF', 'Panasonic': 'EXIF',
+        'Samsung': 'EXIF', 'Minolta': 'EXIF', 'Kodak': 'EXIF', 'Leica': 'EXIF',
+        'Sigma': 'EXIF', 'Ricoh': 'EXIF', 'Casio': 'EXIF', 'Apple': 'EXIF', 'DJI': 'EXIF',
+        'IPTC': 'IPTC',
+        'XMP': 'XMP',
+        'SEAL': 'SEAL',
+        'C2PA': 'C2PA',
+        'JFIF': 'Standards', 'ICC_Profile': 'Standards', 'ICC': 'Standards',
+        'Photoshop': 'Standards', 'FlashPix': 'Standards', 'AFCP': 'Standards',
+        'MPF': 'Standards', 'APP6': 'Standards', 'GoPro': 'Standards',
+        'AROT': 'Standards', 'APP10': 'Standards', 'DICOM': 'Standards',
+    }
+    _GROUP_STAGES_UPPER = {group.upper(): stage for group, stage in METADATA_GROUP_STAGES.items()}
+    
+    # Aliases added by _add_composite_tags: tags are copied to these names
+    # (and from there into EXIF: by COMMON_EXIF_ALIASES) when they are missing
+    COMPOSITE_ALIASES = {
+        'Composite:Aperture': 'Aperture',
+        'Composite:ApertureValue': 'ApertureValue',
+        'Composite:BlueBalance': 'BlueBalance',
+        'Composite:RedBalance': 'RedBalance',
+        'Composite:ShutterSpeed': 'ShutterSpeed',
+        'Composite:ISO': 'ISO',
+        'Composite:FocalLength': 'FocalLength',
+        'Composite:FocalLength35efl': 'FocalLength35efl',
+        'Composite:ImageSize': 'ImageSize',
+        'Composite:ImageWidth': 'ImageWidth',
+        'Composite:ImageHeight': 'ImageHeight',
+        'Composite:Megapixels': 'Megapixels',
+        'Composite:GPSPosition': 'GPSPosition',
+        'Composite:GPSLatitude': 'GPSLatitude',
+        'Composite:GPSLongitude': 'GPSLongitude',
+        'Composite:Duration': 'Duration',
+        'Composite:Rotation': 'Rotation',
+        'Composite:Model2': 'Model2',
+        'Composite:ScaleFactor35efl': 'ScaleFactor35efl',
+        'Composite:CircleOfConfusion': 'CircleOfConfusion',
+        'Composite:FOV': 'FOV',
+        'Composite:DOF': 'DOF',
+        'Composite:HyperfocalDistance': 'HyperfocalDistance',
+        'Composite:LightValue': 'LightValue',
+        'Composite:Lens': 'Lens',
+        'Composite:LensID': 'LensID',
+        'Composite:LensSpec': 'LensSpec',
+        'Composite:AdvancedSceneMode': 'AdvancedSceneMode',
+        'Composite:DateTimeOriginal': 'DateTimeOriginal',
+        'Composite:CreateDate': 'CreateDate',
+        'Composite:ModifyDate': 'ModifyDate',
+        'Composite:DateTime': 'DateTime',
+        'Composite:GPSDateTime': 'GPSDateTime',
+        'Composite:DigitalCreationDateTime': 'DigitalCreationDateTime',
+        'Composite:SubSecCreateDate': 'SubSecCreateDate',
+        'Composite:SubSecDateTimeOriginal': 'SubSecDateTimeOriginal',
+        'Composite:SubSecModifyDate': 'SubSecModifyDate',
+        'Composite:Flash': 'Flash',
+        'Composite:FlashFired': 'FlashFired',
+        'Composite:FlashReturn': 'FlashReturn',
+        'Composite:FlashMode': 'FlashMode',
+        'Composite:FlashFunction': 'FlashFunction',
+        'Composite:FlashRedEyeMode': 'FlashRedEyeMode',
+        'Composite:CFAPattern': 'CFAPattern',
+    }
+    
+    # Composite tags that are also shown under a second name
+    COMPOSITE_EXTRA_ALIASES = (
+        ('Composite:Aperture', 'ApertureValue'),
+        ('Composite:Aperture', 'FNumber'),
+        ('Composite:ShutterSpeed', 'ExposureTime'),
+    )
+    
+    # Tags EXIF:Artist is copied from when the EXIF block has no Artist, in order
+    ARTIST_SOURCE_TAGS = (
+        'Artist',
+        'XMP:Creator',
+        'XMP:Artist',
+        'XMP-dc:Creator',
+        'XMP-dc:Artist',
+        'PDF:Author',
+        'Document:PDF:Author',
+        'Audio:MP3:Artist',
+        'Audio:WAV:Artist',
+        'Audio:FLAC:Artist',
+        'Audio:OGG:Artist',
+        'Audio:OPUS:Artist',
+        'Audio:WMA:Artist',
+        'ID3:Artist',
+        'RIFF:ID3:Artist',
+        'Video:AVI:Artist',
+        'Video:Matroska:Artist',
+        'Video:Artist',
+    )
+    
+    # XMP dates promoted into EXIF dates that are missing, in order
+    XMP_DATE_SOURCES = (
+        ('EXIF:CreateDate', ('XMP:CreateDate',)),
+        ('EXIF:ModifyDate', ('XMP:ModifyDate', 'XMP:MetadataDate')),
+        ('EXIF:DateTimeOriginal', ('XMP:DateTimeOriginal', 'XMP:CreateDate')),
+    )
+    
+    # EXIF tags shown both with and without the EXIF: prefix
+    COMMON_EXIF_ALIASES = {
+        'EXIF:Make': 'Make',
+        'EXIF:Model': 'Model',
+        'EXIF:Software': 'Software',
+        'EXIF:Artist': 'Artist',
+        'EXIF:Copyright': 'Copyright',
+        'EXIF:DateTime': 'DateTime',
+        'EXIF:ModifyDate': 'ModifyDate',
+        'EXIF:CreateDate': 'CreateDate',
+        'EXIF:DateTimeDigitized': 'DateTimeDigitized',
+        'EXIF:ISO': 'ISO',
+        'EXIF:ImageWidth': 'ImageWidth',
+        'EXIF:ImageHeight': 'ImageHeight',
+        'EXIF:ExifImageWidth': 'ExifImageWidth',
+        'EXIF:ExifImageHeight': 'ExifImageHeight',
+        'EXIF:Orientation': 'Orientation',
+        'EXIF:XResolution': 'XResolution',
+        'EXIF:YResolution': 'YResolution',
+        'EXIF:ResolutionUnit': 'ResolutionUnit',
+        'EXIF:YCbCrPositioning': 'YCbCrPositioning',
+        'EXIF:YCbCrSubSampling': 'YCbCrSubSampling',
+        'EXIF:ColorSpace': 'ColorSpace',
+        'EXIF:ExifVersion': 'ExifVersion',
+        'EXIF:FlashpixVersion': 'FlashpixVersion',
+        'EXIF:ComponentsConfiguration': 'ComponentsConfiguration',
+        'EXIF:CompressedBitsPerPixel': 'CompressedBitsPerPixel',
+        'EXIF:BrightnessValue': 'BrightnessValue',
+        'EXIF:ExposureBiasValue': 'ExposureBiasValue',
+        'EXIF:MaxApertureValue': 'MaxApertureValue',
+        'EXIF:SubjectDistance': 'SubjectDistance',
+        'EXIF:MeteringMode': 'MeteringMode',
+        'EXIF:LightSource': 'LightSource',
+        'EXIF:Flash': 'Flash',
+        'EXIF:WhiteBalance': 'WhiteBalance',
+        'EXIF:DigitalZoomRatio': 'DigitalZoomRatio',
+        'EXIF:FocalLengthIn35mmFilm': 'FocalLengthIn35mmFilm',
+        'EXIF:SceneCaptureType': 'SceneCaptureType',
+        'EXIF:GainControl': 'GainControl',
+        'EXIF:Contrast': 'Contrast',
+        'EXIF:Saturation': 'Saturation',
+        'EXIF:Sharpness': 'Sharpness',
+        'EXIF:SubjectDistanceRange': 'SubjectDistanceRange',
+        'EXIF:ImageDescription': 'ImageDescription',
+        'EXIF:UserComment': 'UserComment',
+        'EXIF:ExposureProgram': 'ExposureProgram',
+        'EXIF:ISOSpeedRatings': 'ISOSpeedRatings',
+        'EXIF:ExposureMode': 'ExposureMode',
+        'EXIF:ExposureCompensation': 'ExposureCompensation',
+        'EXIF:ShutterSpeedValue': 'ShutterSpeedValue',
+        'EXIF:ExposureTime': 'ExposureTime',
+        'EXIF:FNumber': 'FNumber',
+        'EXIF:FocalLength': 'FocalLength',
+        'EXIF:ExifImageWidth': 'ExifImageWidth',
+        'EXIF:ExifImageHeight': 'ExifImageHeight',
+        'EXIF:BodySerialNumber': 'BodySerialNumber',
+        'EXIF:CustomRendered': 'CustomRendered',
+        'EXIF:DeviceSettingDescription': 'DeviceSettingDescription',
+    }
+    
+    # XMP tags also shown without a prefix
+    COMMON_XMP_ALIASES = {
+        'XMP:Title': 'Title',
+        'XMP:Creator': 'Creator',
+        'XMP:Description': 'Description',
+        'XMP:Subject': 'Subject',
+        'XMP:Keywords': 'Keywords',
+        'XMP:Rating': 'Rating',
+        'XMP:CreateDate': 'CreateDate',
+        'XMP:ModifyDate': 'ModifyDate',
+        'XMP:MetadataDate': 'MetadataDate',
+        'XMP:Orientation': 'Orientation',
+        'XMP:Format': 'Format',
+        'XMP:InstanceID': 'InstanceID',
+        'XMP:DocumentID': 'DocumentID',
+        'XMP:OriginalDocumentID': 'OriginalDocumentID',
+        'XMP-dc:Title': 'Title',
+        'XMP-dc:Creator': 'Creator',
+        'XMP-dc:Description': 'Description',
+        'XMP-dc:Subject': 'Subject',
+        'XMP-xmp:CreateDate': 'CreateDate',
+        'XMP-xmp:ModifyDate': 'ModifyDate',
+        'XMP-xmp:MetadataDate': 'MetadataDate',
+        'XMP-tiff:Orientation': 'Orientation',
+    }
+    
+    # MPF tags also shown without a prefix
+    COMMON_MPF_ALIASES = {
+        'MPF:MPImageType': 'MPImageType',
+        'MPF:MPImageFlags': 'MPImageFlags',
+        'MPF:MPImageFormat': 'MPImageFormat',
+        'MPF:MPImageLength': 'MPImageLength',
+        'MPF:MPImageStart': 'MPImageStart',
+        'MPF:Version': 'Version',
+        'MPF:NumberOfImages': 'NumberOfImages',
+        'MPF:MPEntry': 'MPEntry',
+    }
+    
+    # IPTC tags also shown without a prefix
+    COMMON_IPTC_ALIASES = {
+        'IPTC:ObjectName': 'ObjectName',
+        'IPTC:Keywords': 'Keywords',
+        'IPTC:Caption': 'Caption',
+        'IPTC:Headline': 'Headline',
+        'IPTC:Byline': 'Byline',
+        'IPTC:BylineTitle': 'BylineTitle',
+        'IPTC:Credit': 'Credit',
+        'IPTC:Source': 'Source',
+        'IPTC:Copyright': 'Copyright',
+        'IPTC:Contact': 'Contact',
+        'IPTC:City': 'City',
+        'IPTC:State': 'State',
+        'IPTC:Country': 'Country',
+        'IPTC:DateCreated': 'DateCreated',
+        'IPTC:TimeCreated': 'TimeCreated',
+        'IPTC:DateSent': 'DateSent',
+        'IPTC:TimeSent': 'TimeSent',
+        'IPTC:DigitalCreationDate': 'DigitalCreationDate',
+        'IPTC:DigitalCreationTime': 'DigitalCreationTime',
+        'IPTC:OriginatingProgram': 'OriginatingProgram',
+        'IPTC:ProgramVersion': 'ProgramVersion',
+        'IPTC:ObjectCycle': 'ObjectCycle',
+        'IPTC:BylineTitle': 'BylineTitle',
+        'IPTC:ImageType': 'ImageType',
+        'IPTC:ImageOrientation': 'ImageOrientation',
+    }
+    
+    # Unprefixed tag name -> groups of the tags it may be copied from. EXIF
+    # tags missing from the EXIF block are filled from their unprefixed alias,
+    # so a request for an EXIF or unprefixed tag needs these groups' stages.
+    ALIAS_SOURCE_GROUPS = _alias_source_groups(
+        COMPOSITE_ALIASES.items(),
+        COMPOSITE_EXTRA_ALIASES,
+        ((tag, 'Artist') for tag in ARTIST_SOURCE_TAGS),
+        ((xmp_tag, exif_tag.split(':', 1)[1])
+         for exif_tag, xmp_tags in XMP_DATE_SOURCES for xmp_tag in xmp_tags),
+        COMMON_XMP_ALIASES.items(),
+        COMMON_MPF_ALIASES.items(),
+        COMMON_IPTC_ALIASES.items(),
+    )
+    
     def __init__(
         self,
         file_path: Union[str, Path],
@@ -166,7 +414,12 @@ class DNExif:
         fast_mode: bool = False,
         scan_for_xmp: bool = False,
         ignore_minor_errors: bool = False,
-        length: Optional[int] = None
+        length: Optional[int] = None,
+        use_mmap: bool = False,
+        cache: Optional[Union['MetadataCache', str, Path]] = None,
+        groups: Optional[List[str]] = None,
+        lazy: bool = False,
+        tags: Optional[List[str]] = None
     ):
         """
         Initialize DNExif with an image file.
@@ -180,6 +433,22 @@ class DNExif:
             length: Optional maximum number of bytes to read from file for optimization.
                    Metadata is typically in the first 128KB of files. If None, reads entire file.
                    Note: May miss metadata in unusual locations if length is too small.
+            use_mmap: If True, memory-map the file instead of reading it into memory.
+                   Parsers then index the mapped file directly, so large RAW, video
+                   and DICOM files do not need to fit in memory (default: False)
+            cache: Optional MetadataCache (or path to a cache database). For read-only
+                   instances, metadata of unchanged files is served from the cache and
+                   parsing is skipped entirely. Entries are invalidated by save().
+            groups: Optional list of tag groups to load up front (e.g. ['EXIF', 'XMP']).
+                   Metadata blocks that cannot contain these groups are not parsed
+                   until a tag outside them is requested.
+            lazy: If True, defer parsing of embedded metadata blocks (EXIF, IPTC, XMP,
+                   ...) until a tag is first requested, then parse only the block that
+                   holds it (default: False)
+            tags: Optional list of tags to extract (e.g. ['EXIF:DateTimeOriginal',
+                   'GPS:GPSLatitude']). Only the metadata blocks holding these tags are
+                   parsed, and the EXIF parser skips all other IFD entries and stops
+                   once the tags are found. Other tags may be missing from the result.
             
         Raises:
             FileNotFoundError: If the file does not exist
@@ -203,6 +472,12 @@ class DNExif:
         self.scan_for_xmp = scan_for_xmp
         self.ignore_minor_errors = ignore_minor_errors
         self.length = length  # Maximum bytes to read for optimization
+        self.use_mmap = use_mmap  # Memory-map the file instead of reading it
+        if cache is not None:
+            from dnexif.metadata_cache import MetadataCache
+            if not isinstance(cache, MetadataCache):
+                cache = MetadataCache(cache)
+        self.cache: Optional['MetadataCache'] = cache
         self.metadata: Dict[str, Any] = {}
         self.modified_tags: Dict[str, Any] = {}
         self._exif_parser: Optional[ExifParser] = None
@@ -211,16 +486,226 @@ class DNExif:
         self.alternate_files: Dict[int, Path] = {}  # Dictionary mapping index to alternate file paths
         self._cached_file_data: Optional[bytes] = None  # Cached file data (can be cleared to save memory)
         
+        # Lazy / group-restricted loading state
+        self.groups = list(groups) if groups else None
+        self.lazy = lazy
+        self.tags = list(tags) if tags else None
+        self._loaded_stages: Set[str] = set()
+        self._embedded_metadata_deferrable = False  # True once the generic image/RAW path ran
+        self._derived_tags: Set[str] = set()  # Tags added by _finalize_embedded_metadata
+        
         # Initialize API options with defaults
         self.options: Dict[str, Any] = {}
         self._initialize_default_options()
         
+        # Shared read-once view of the file, handed to every parser in _load_metadata
+        self._file_view = FileView(self._get_file_path_string(), use_mmap=use_mmap)
+        
         # Apply FastScan option to fast_mode if set
         if self.get_option('FastScan', False):
             self.fast_mode = True
         
-        # Load metadata
-        self._load_metadata()
+        # Load metadata (from the persistent cache when possible)
+        if not self._load_cached_metadata():
+            self._load_metadata()
+            self._store_cached_metadata()
+        
+        # Metadata is extracted - drop the shared file buffer (re-read on demand)
+        self._file_view.release()
+    
+    def _cache_variant(self) -> str:
+        """
+        Build the cache key component describing how metadata was parsed.
+        
+        Returns:
+            String identifying the library version and parse settings
+        """
+        from dnexif import __version__
+        return (f"{__version__}|fast={self.fast_mode}|xmp={self.scan_for_xmp}|"
+                f"minor={self.ignore_minor_errors}|length={self.length}")
+    
+    def _load_cached_metadata(self) -> bool:
+        """
+        Load metadata from the persistent cache.
+        
+        Only read-only instances use cached metadata, since writing relies on
+        parser state (byte order, EXIF version) that is not cached.
+        
+        Returns:
+            True if metadata was loaded from the cache
+        """
+        if self.cache is None or not self.read_only:
+            return False
+        cached = self.cache.get(self.file_path, self._cache_variant())
+        if cached is None:
+            return False
+        # Cached entries are always complete, so nothing is left to load lazily
+        self.metadata = cached
+        return True
+    
+    def _store_cached_metadata(self) -> None:
+        """Store freshly parsed metadata in the persistent cache."""
+        if (self.cache is not None and self.read_only and not self.tags
+                and not self._pending_stages()):
+            self.cache.put(self.file_path, self.metadata, self._cache_variant())
+    
+    def _stages_for_groups(self, groups: List[str]) -> Set[str]:
+        """
+        Map tag groups to the embedded metadata stages that produce them.
+        
+        Args:
+            groups: Tag group names (e.g. 'EXIF', 'XMP-dc', 'MakerNotes')
+            
+        Returns:
+            Set of stage names; all stages if any group is unknown
+        """
+        stages = set()
+        for group in groups:
+            group = group.rstrip(':').upper()
+            stage = self._GROUP_STAGES_UPPER.get(group)
+            if stage is None and group.startswith('XMP-'):
+                stage = 'XMP'
+            if stage is None:
+                # Unknown or derived group (e.g. Composite) - needs everything
+                return set(self.EMBEDDED_METADATA_STAGES)
+            stages.add(stage)
+        return stages
+    
+    def _requested_stages(self) -> Set[str]:
+        """
+        Get the embedded metadata stages to load during initialization.
+        
+        Returns:
+            All stages by default, only those needed for self.groups when set,
+            or none in lazy mode without groups
+        """
+        if self.groups:
+            return self._stages_for_groups(self.groups)
+        if self.tags:
+            stages = set()
+            for tag in self.tags:
+                stages |= self._tag_stages(self._tag_group(tag), tag)
+            return stages
+        if self.lazy:
+            return set()
+        return set(self.EMBEDDED_METADATA_STAGES)
+    
+    @staticmethod
+    def _tag_group(tag_name: str) -> str:
+        """
+        Get the group of a tag name.
+        
+        Unprefixed names are EXIF tags if ExifParser can target them; any
+        other unprefixed name may come from any block and gets no group.
+        """
+        if ':' in tag_name:
+            return tag_name.split(':', 1)[0]
+        if tag_name in KNOWN_EXIF_TAG_NAMES or tag_name in DERIVED_TAG_SOURCES:
+            return 'EXIF'
+        return ''
+    
+    def _tag_stages(self, group: str, tag_name: str) -> Set[str]:
+        """
+        Get the embedded metadata stages needed to answer a tag request.
+        
+        EXIF and unprefixed tags missing from the EXIF block are copied from
+        other blocks (see ALIAS_SOURCE_GROUPS), so the stages producing those
+        blocks are needed as well; a tag copied from a Composite tag needs
+        every stage.
+        
+        Args:
+            group: Group of the requested tag ('' if it has none)
+            tag_name: Requested tag name (e.g. 'EXIF:CreateDate')
+            
+        Returns:
+            Set of stage names
+        """
+        stages = self._stages_for_groups([group])
+        if group not in ('', 'EXIF'):
+            return stages
+        for source_group in self.ALIAS_SOURCE_GROUPS.get(tag_name.rsplit(':', 1)[-1], ()):
+            upper = source_group.upper()
+            if upper == 'COMPOSITE':
+                return set(self.EMBEDDED_METADATA_STAGES)
+            stage = self._GROUP_STAGES_UPPER.get(upper)
+            if stage is None and upper.startswith('XMP-'):
+                stage = 'XMP'
+            # Other groups (File, ID3, ...) are not deferred
+            if stage is not None:
+                stages.add(stage)
+        return stages
+    
+    def _exif_tag_filter(self) -> Optional[List[str]]:
+        """
+        Get the tags to pass to ExifParser for tag-targeted extraction.
+        
+        Returns:
+            The requested EXIF-stage tags, or None to extract all EXIF tags
+            (no tags requested, or a requested tag needs every stage)
+        """
+        if not self.tags:
+            return None
+        exif_tags = []
+        for tag in self.tags:
+            stages = self._tag_stages(self._tag_group(tag), tag)
+            if len(stages) > 1:
+                return None
+            if 'EXIF' in stages:
+                exif_tags.append(tag)
+        return exif_tags
+    
+    def _pending_stages(self) -> Set[str]:
+        """Get the embedded metadata stages that have been deferred and not loaded yet."""
+        if not self._embedded_metadata_deferrable:
+            return set()
+        return set(self.EMBEDDED_METADATA_STAGES) - self._loaded_stages
+    
+    def _ensure_metadata_loaded(self, tag_name: Optional[str] = None, group: Optional[str] = None) -> None:
+        """
+        Load deferred embedded metadata needed to answer a request.
+        
+        Called by the accessors when the instance was created with groups= or
+        lazy=True. Only the stage holding the requested tag or group is loaded;
+        with neither given, all pending stages are loaded.
+        
+        Args:
+            tag_name: Requested tag name (e.g. 'EXIF:Make'), if any
+            group: Requested tag group (e.g. 'XMP'), if any
+            
+        Raises:
+            MetadataReadError: If deferred metadata cannot be read
+        """
+        pending = self._pending_stages()
+        if not pending:
+            return
+        if group is not None:
+            pending &= self._stages_for_groups([group])
+        elif tag_name is not None:
+            # Unprefixed tag names are EXIF aliases
+            tag_group = tag_name.split(':', 1)[0] if ':' in tag_name else 'EXIF'
+            pending &= self._tag_stages(tag_group, tag_name)
+        if not pending:
+            return
+        
+        file_ext = self.file_path.suffix.lower()
+        try:
+            # Drop tags derived from the previously loaded blocks so they are
+            # recomputed from the complete data
+            for key in self._derived_tags:
+                self.metadata.pop(key, None)
+            self._load_embedded_metadata(file_ext, pending)
+            self._finalize_embedded_metadata(file_ext)
+        except Exception as e:
+            if isinstance(e, MetadataReadError):
+                raise
+            raise MetadataReadError(
+                f"Failed to load metadata from {self.file_path.name}: {str(e)}"
+            ) from e
+        finally:
+            self._file_view.release()
+        
+        if not self._pending_stages():
+            self._store_cached_metadata()
     
     def _initialize_default_options(self) -> None:
         """
@@ -1008,35 +1493,75 @@ class DNExif:
         
         return tag_name
     
-    def calculate_image_data_hash(self) -> Optional[str]:
+    def calculate_image_data_hash(self) -> Optional[Union[str, Dict[str, str]]]:
         """
         Calculate hash of image data (excluding metadata) using ImageHashType option.
         
         This method uses the ImageHashType option to determine which hash algorithm
-        to use (MD5, SHA1, SHA256). The hash is calculated from image pixel data only,
-        excluding all metadata segments.
+        to use (MD5, SHA1, SHA256, SHA512, BLAKE2B, ...). The hash is calculated from
+        image pixel data only, excluding all metadata segments. Several algorithms
+        can be given separated by commas (e.g. "MD5,SHA256"); they are computed in
+        a single pass over the file.
         
         Returns:
-            Hexadecimal hash string or None if calculation fails
+            Hexadecimal hash string (a dict of them by lowercase algorithm name if
+            several algorithms were given) or None if calculation fails
             
         Examples:
             >>> exif = DNExif('image.jpg')
             >>> exif.set_option('ImageHashType', 'SHA256')
             >>> hash_value = exif.calculate_image_data_hash()
+            >>> exif.set_option('ImageHashType', 'MD5,SHA256')
+            >>> hashes = exif.calculate_image_data_hash()
         """
-        hash_type = self.get_option('ImageHashType', 'MD5').upper()
-        # Normalize hash type (MD5 -> md5, SHA1 -> sha1, SHA256 -> sha256)
-        if hash_type == 'MD5':
-            hash_type = 'md5'
-        elif hash_type == 'SHA1':
-            hash_type = 'sha1'
-        elif hash_type == 'SHA256':
-            hash_type = 'sha256'
-        else:
-            # Default to md5 if unknown type
+        from dnexif.image_hash_calculator import (
+            HASHLIB_ALGORITHMS, XXHASH_ALGORITHMS, calculate_image_data_hash
+        )
+        
+        # Normalize hash types (MD5 -> md5, SHA256 -> sha256); unknown types
+        # default to md5
+        hash_types = []
+        for name in str(self.get_option('ImageHashType', 'MD5')).split(','):
+            name = name.strip().lower()
+            if name not in HASHLIB_ALGORITHMS and name not in XXHASH_ALGORITHMS:
+                name = 'md5'
+            if name not in hash_types:
+                hash_types.append(name)
+        hash_type = hash_types if len(hash_types) > 1 else hash_types[0]
+        
+        return calculate_image_data_hash(self.file_path, hash_type=hash_type, use_mmap=self.use_mmap)
+    
+    def calculate_image_data_tree_hash(self) -> Optional[str]:
+        """
+        Calculate a Merkle tree hash of image data (Composite:ImageDataTreeHash).
+        
+        The strips, tiles and media data chunks are hashed in parallel threads
+        and combined into a tree, using the first ImageHashType algorithm. This
+        is faster than calculate_image_data_hash() on large RAW and video files,
+        but gives a different value. The result is stored as
+        Composite:ImageDataTreeHash; as it reads all of the image data, the tag
+        is only calculated by this method or when get_tag() asks for it.
+        
+        Returns:
+            Hexadecimal root hash or None if calculation fails
+            
+        Example:
+            >>> exif = DNExif('image.dng')
+            >>> exif.set_option('ImageHashType', 'SHA256')
+            >>> tree_hash = exif.calculate_image_data_tree_hash()
+        """
+        from dnexif.image_hash_calculator import (
+            HASHLIB_ALGORITHMS, XXHASH_ALGORITHMS, calculate_image_data_tree_hash
+        )
+        
+        hash_type = str(self.get_option('ImageHashType', 'MD5')).split(',')[0].strip().lower()
+        if hash_type not in HASHLIB_ALGORITHMS and hash_type not in XXHASH_ALGORITHMS:
             hash_type = 'md5'
         
-        return calculate_image_data_hash(self.file_path, hash_type=hash_type)
+        tree_hash = calculate_image_data_tree_hash(self.file_path, hash_type)
+        if tree_hash:
+            self.metadata['Composite:ImageDataTreeHash'] = tree_hash
+        return tree_hash
     
     def _get_file_path_string(self, file_path: Optional[Union[str, Path]] = None) -> str:
         """
@@ -1097,9 +1622,8 @@ class DNExif:
         """
         Read file data, optionally limiting to specified length for optimization.
         
-        Uses buffered reading for large files (>10MB) to reduce memory usage.
-        If LargeFileSupport option is enabled, ensures proper handling of files >2GB.
-        Python 3 handles large files natively, but this option serves as a compatibility flag.
+        Data is served from the instance's shared FileView, so the file is read
+        from disk at most once no matter how many parsers request it.
         
         Args:
             max_length: Optional maximum length to read (overrides self.length if provided)
@@ -1107,54 +1631,9 @@ class DNExif:
         Returns:
             File data as bytes, limited to max_length or self.length if specified
         """
-        # Check LargeFileSupport option (Python 3 handles large files natively)
-        large_file_support = self.get_option('LargeFileSupport', True)
-        
-        # Use WindowsLongPath-aware path conversion
-        file_path_str = self._get_file_path_string()
-        
         # Determine read length
         read_length = max_length if max_length is not None else self.length
-        
-        # Get file size to determine if buffered reading should be used
-        file_size = self.file_path.stat().st_size
-        
-        # Use buffered reading for large files (>10MB) to reduce memory usage
-        # This is especially important when reading entire file
-        BUFFER_SIZE = 1024 * 1024  # 1MB buffer
-        LARGE_FILE_THRESHOLD = 10 * 1024 * 1024  # 10MB threshold
-        
-        with open(file_path_str, 'rb', buffering=BUFFER_SIZE) as f:
-            if read_length is not None:
-                # Read specific length (optimized for small reads)
-                if read_length <= BUFFER_SIZE:
-                    return f.read(read_length)
-                else:
-                    # For larger reads, use buffered reading
-                    data = bytearray()
-                    remaining = read_length
-                    while remaining > 0:
-                        chunk_size = min(BUFFER_SIZE, remaining)
-                        chunk = f.read(chunk_size)
-                        if not chunk:
-                            break
-                        data.extend(chunk)
-                        remaining -= len(chunk)
-                    return bytes(data)
-            else:
-                # Read entire file
-                if file_size <= LARGE_FILE_THRESHOLD:
-                    # Small files: read all at once (faster)
-                    return f.read()
-                else:
-                    # Large files: use buffered reading to reduce memory usage
-                    data = bytearray()
-                    while True:
-                        chunk = f.read(BUFFER_SIZE)
-                        if not chunk:
-                            break
-                        data.extend(chunk)
-                    return bytes(data)
+        return self._file_view.read(read_length)
     
     def _parse_jpeg_dimensions(self) -> tuple:
         """
@@ -1164,8 +1643,7 @@ class DNExif:
             Tuple of (width, height) or (None, None) if not found
         """
         try:
-            with open(str(self.file_path), 'rb') as f:
-                file_data = f.read(65536)  # Read first 64KB
+            file_data = self._file_view.read(65536)  # Read first 64KB
             
             if not file_data.startswith(b'\xff\xd8'):
                 return (None, None)
@@ -1205,8 +1683,7 @@ class DNExif:
         """
         metadata = {}
         try:
-            with open(str(self.file_path), 'rb') as f:
-                file_data = f.read(33)  # Read enough for PNG signature + IHDR chunk
+            file_data = self._file_view.read(33)  # Read enough for PNG signature + IHDR chunk
             
             # Check PNG signature
             if file_data[:8] != b'\x89PNG\r\n\x1a\n':
@@ -1279,8 +1756,7 @@ class DNExif:
         """
         metadata = {}
         try:
-            with open(str(self.file_path), 'rb') as f:
-                file_data = f.read()
+            file_data = self._file_view.data
             
             # Check PNG signature
             if file_data[:8] != b'\x89PNG\r\n\x1a\n':
@@ -1450,14 +1926,14 @@ class DNExif:
             
             # File:FileSize (store as bytes, will be formatted by value_formatter)
             try:
-                file_size = self.file_path.stat().st_size
+                file_size = self._file_view.stat().st_size
                 self.metadata['File:FileSize'] = file_size
             except OSError:
                 pass
             
             # File:FileModifyDate
             try:
-                mtime = self.file_path.stat().st_mtime
+                mtime = self._file_view.stat().st_mtime
                 # Use localtime to get correct timezone (handles DST)
                 import time
                 local_time = time.localtime(mtime)
@@ -1477,7 +1953,7 @@ class DNExif:
             
             # File:FileAccessDate
             try:
-                atime = self.file_path.stat().st_atime
+                atime = self._file_view.stat().st_atime
                 import time
                 local_time = time.localtime(atime)
                 if local_time.tm_isdst:
@@ -1494,7 +1970,7 @@ class DNExif:
             
             # File:FileInodeChangeDate
             try:
-                ctime = self.file_path.stat().st_ctime
+                ctime = self._file_view.stat().st_ctime
                 import time
                 local_time = time.localtime(ctime)
                 if local_time.tm_isdst:
@@ -1511,7 +1987,7 @@ class DNExif:
             
             # File:FilePermissions
             try:
-                file_stat = self.file_path.stat()
+                file_stat = self._file_view.stat()
                 # Use stat.filemode to get string representation like standard format
                 perms = stat.filemode(file_stat.st_mode)
                 self.metadata['File:FilePermissions'] = perms
@@ -1603,11 +2079,10 @@ class DNExif:
                     elif ext_lower == 'aac':
                         # Check if file has QuickTime structure (ftyp atom)
                         try:
-                            with open(str(self.file_path), 'rb') as f:
-                                file_data = f.read(20)
-                                if len(file_data) >= 12 and file_data[4:8] == b'ftyp':
-                                    # Has QuickTime container, use m4a extension
-                                    ext_lower = 'm4a'
+                            file_data = self._file_view.read(20)
+                            if len(file_data) >= 12 and file_data[4:8] == b'ftyp':
+                                # Has QuickTime container, use m4a extension
+                                ext_lower = 'm4a'
                                 # If not QuickTime container, keep as 'aac'
                         except Exception:
                             # Default to m4a for AAC files (most use QuickTime container)
@@ -1796,8 +2271,7 @@ class DNExif:
             elif file_ext == '.png':
                 # Parse from PNG header
                 try:
-                    with open(str(self.file_path), 'rb') as f:
-                        file_data = f.read(24)
+                    file_data = self._file_view.read(24)
                     if file_data[:8] == b'\x89PNG\r\n\x1a\n' and len(file_data) >= 24:
                         width = struct.unpack('>I', file_data[16:20])[0]
                         height = struct.unpack('>I', file_data[20:24])[0]
@@ -1808,8 +2282,7 @@ class DNExif:
             elif file_ext == '.gif':
                 # Parse from GIF header
                 try:
-                    with open(str(self.file_path), 'rb') as f:
-                        file_data = f.read(10)
+                    file_data = self._file_view.read(10)
                     if (file_data[:6] == b'GIF87a' or file_data[:6] == b'GIF89a') and len(file_data) >= 10:
                         width = struct.unpack('<H', file_data[6:8])[0]
                         height = struct.unpack('<H', file_data[8:10])[0]
@@ -1820,8 +2293,7 @@ class DNExif:
             elif file_ext == '.bmp':
                 # Parse from BMP header
                 try:
-                    with open(str(self.file_path), 'rb') as f:
-                        file_data = f.read(26)
+                    file_data = self._file_view.read(26)
                     if file_data[:2] == b'BM' and len(file_data) >= 26:
                         width = abs(struct.unpack('<i', file_data[18:22])[0])
                         height = abs(struct.unpack('<i', file_data[22:26])[0])
@@ -2021,6 +2493,7 @@ class DNExif:
             if file_ext in video_formats:
                 # Use video parser for video files
                 try:
+                    from dnexif.video_parser import VideoParser
                     if self.fast_mode or self.length is not None or file_ext in ('.m4a', '.aac'):
                         max_len = self.length if self.length is not None else 1024 * 1024
                         video_data_bytes = self._read_file_data(max_length=max_len)
@@ -2030,7 +2503,7 @@ class DNExif:
                             fast_scan=True
                         )
                     else:
-                        video_parser = VideoParser(file_path=str(self.file_path))
+                        video_parser = VideoParser(file_path=str(self.file_path), use_mmap=self.use_mmap)
                     video_data = video_parser.parse()
                     self.metadata.update(video_data)
                 except Exception as e:
@@ -2116,48 +2589,10 @@ class DNExif:
             
             # Read file data for signature checks
             try:
-                with open(str(self.file_path), 'rb') as f:
-                    file_data = f.read(1024)  # Read first 1KB for signature checks
+                file_data = self._file_view.read(1024)  # Read first 1KB for signature checks
             except Exception:
                 file_data = b''
             
-            # Check if it's a RAR archive file
-            if file_ext == '.rar' or (len(file_data) >= 8 and (
-                file_data.startswith(b'Rar!\x1A\x07\x01\x00') or  # RAR v5.0
-                file_data.startswith(b'Rar!\x1A\x07\x00')  # RAR v4.x
-            )):
-                try:
-                    from dnexif.rar_parser import RARParser
-                    rar_parser = RARParser(file_path=str(self.file_path))
-                    rar_data = rar_parser.parse()
-                    if rar_data:
-                        self.metadata.update(rar_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse RAR metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # RAR files handled separately
-            
-            # Check if it's a 7z archive file
-            if file_ext == '.7z' or (len(file_data) >= 6 and file_data.startswith(b'7z\xBC\xAF\x27\x1C')):
-                try:
-                    from dnexif.sevenz_parser import SevenZParser
-                    sevenz_parser = SevenZParser(file_path=str(self.file_path))
-                    sevenz_data = sevenz_parser.parse()
-                    if sevenz_data:
-                        self.metadata.update(sevenz_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse 7z metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # 7z files handled separately
-            
             # Check if it's a ZIP file
             if file_ext == '.zip' or (len(file_data) >= 2 and file_data.startswith(b'PK')):
                 try:
@@ -2170,181 +2605,13 @@ class DNExif:
                     # ZIP parsing is optional
                     pass
             
-            # Check if it's an AAE file (Apple Adjustments)
-            if file_ext == '.aae':
-                try:
-                    from dnexif.aae_parser import AAParser
-                    aae_parser = AAParser(file_path=str(self.file_path))
-                    aae_data = aae_parser.parse()
-                    self.metadata.update(aae_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse AAE metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # AAE files handled separately
-            
-            # Check if it's a Nikon adjustment file
-            if file_ext in ('.nka', '.nxd'):
-                try:
-                    from dnexif.nikon_adjustment_parser import NikonAdjustmentParser
-                    nikon_parser = NikonAdjustmentParser(file_path=str(self.file_path))
-                    nikon_data = nikon_parser.parse()
-                    self.metadata.update(nikon_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse Nikon adjustment metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # Nikon adjustment files handled separately
-            
-            # Check if it's an XISF file
-            if file_ext == '.xisf':
-                try:
-                    from dnexif.xisf_parser import XISFParser
-                    xisf_parser = XISFParser(file_path=str(self.file_path))
-                    xisf_data = xisf_parser.parse()
-                    self.metadata.update(xisf_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse XISF metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # XISF files handled separately
-            
-            # Check if it's a GPX file
-            if file_ext == '.gpx':
-                try:
-                    from dnexif.gpx_parser import GPXParser
-                    gpx_parser = GPXParser(file_path=str(self.file_path))
-                    gpx_data = gpx_parser.parse()
-                    self.metadata.update(gpx_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse GPX metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # GPX files handled separately
-            
-            # Check if it's a KML file
-            if file_ext == '.kml':
-                try:
-                    from dnexif.kml_parser import KMLParser
-                    kml_parser = KMLParser(file_path=str(self.file_path))
-                    kml_data = kml_parser.parse()
-                    self.metadata.update(kml_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse KML metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # KML files handled separately
-            
-            # Check if it's a CSV file
-            if file_ext == '.csv':
-                try:
-                    from dnexif.csv_parser import CSVParser
-                    csv_parser = CSVParser(file_path=str(self.file_path))
-                    csv_data = csv_parser.parse()
-                    self.metadata.update(csv_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse CSV metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # CSV files handled separately
-            
-            # Check if it's a PFM file
-            if file_ext == '.pfm':
-                try:
-                    from dnexif.pfm_parser import PFMParser
-                    pfm_parser = PFMParser(file_path=str(self.file_path))
-                    pfm_data = pfm_parser.parse()
-                    self.metadata.update(pfm_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse PFM metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # PFM files handled separately
-            
-            # Check if it's a CUBE file
-            if file_ext == '.cube':
-                try:
-                    from dnexif.cube_parser import CUBEParser
-                    cube_parser = CUBEParser(file_path=str(self.file_path))
-                    cube_data = cube_parser.parse()
-                    self.metadata.update(cube_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse CUBE metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # CUBE files handled separately
-            
-            # Check if it's a text file
-            if file_ext in {'.txt', '.log'}:
-                try:
-                    from dnexif.text_parser import TextParser
-                    text_parser = TextParser(file_path=str(self.file_path))
-                    text_data = text_parser.parse()
-                    self.metadata.update(text_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse text file metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # Text files handled separately
-            
-            # Check if it's a JSON file
-            if file_ext == '.json':
-                try:
-                    from dnexif.json_parser import JSONParser
-                    json_parser = JSONParser(file_path=str(self.file_path))
-                    json_data = json_parser.parse()
-                    self.metadata.update(json_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse JSON file metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # JSON files handled separately
-            
-            # Check if it's an XML file
-            if file_ext == '.xml':
-                try:
-                    from dnexif.xml_parser import XMLParser
-                    xml_parser = XMLParser(file_path=str(self.file_path))
-                    xml_data = xml_parser.parse()
-                    self.metadata.update(xml_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse XML file metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
+            # Formats read by a single standalone parser: select the handler by
+            # magic bytes, file name or extension in one lookup
+            handler = FormatDetector.detect_handler(str(self.file_path), file_data)
+            if handler is not None:
+                self._parse_with_handler(handler)
                 self._add_composite_tags()
-                return  # XML files handled separately
+                return
             
             # Check if it's an InfiRay IJPEG file
             if file_ext == '.ijpeg':
@@ -2392,8 +2659,7 @@ class DNExif:
                     # Try to detect DJI RJPEG images by checking file data
                     # Read first 50KB for pattern detection
                     try:
-                        with open(self.file_path, 'rb') as f:
-                            file_data_preview = f.read(50000)
+                        file_data_preview = self._file_view.read(50000)
                     except Exception:
                         file_data_preview = None
                     if file_data_preview:
@@ -2475,59 +2741,12 @@ class DNExif:
                     pass
                 # Don't return here - continue to JPEG parsing for full metadata
             
-            # Check if it's an MRC file
-            if file_ext == '.mrc':
-                try:
-                    from dnexif.mrc_parser import MRCParser
-                    mrc_parser = MRCParser(file_path=str(self.file_path))
-                    mrc_data = mrc_parser.parse()
-                    self.metadata.update(mrc_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse MRC metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # MRC files handled separately
-            
-            # Check if it's a MacOS AppleDouble sidecar file (._filename)
-            if self.file_path and self.file_path.name.startswith('._'):
-                try:
-                    from dnexif.appledouble_parser import AppleDoubleParser
-                    appledouble_parser = AppleDoubleParser(file_path=str(self.file_path))
-                    appledouble_data = appledouble_parser.parse()
-                    self.metadata.update(appledouble_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse AppleDouble metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # AppleDouble files handled separately
-            
-            # Check if it's an ON1 preset file
-            if file_ext == '.onp':
-                try:
-                    from dnexif.on1_parser import ON1Parser
-                    on1_parser = ON1Parser(file_path=str(self.file_path))
-                    on1_data = on1_parser.parse()
-                    self.metadata.update(on1_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse ON1 preset metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # ON1 preset files handled separately
-            
             # Check if it's a document format
             document_formats = {'.pdf'}
             if file_ext in document_formats:
                 # Use document parser for document files
                 try:
+                    from dnexif.document_parser import DocumentParser
                     document_parser = DocumentParser(file_path=str(self.file_path))
                     document_data = document_parser.parse()
                     self.metadata.update(document_data)
@@ -2544,9 +2763,8 @@ class DNExif:
             if file_ext in ('.tnef', '.dat'):
                 # Check if it's a TNEF file (winmail.dat)
                 try:
-                    # Read first 4 bytes to check signature
-                    with open(self.file_path, 'rb') as f:
-                        signature_bytes = f.read(4)
+                    # Check the signature in the first 4 bytes
+                    signature_bytes = file_data[:4]
                     if len(signature_bytes) == 4:
                         signature = struct.unpack('<I', signature_bytes)[0]
                         if signature == 0x223E9F78:  # TNEF signature
@@ -2589,418 +2807,35 @@ class DNExif:
                 self._add_composite_tags()
                 return  # PCAP/CAP files handled separately
             
-            # Check if it's a WOFF or WOFF2 font file
-            if file_ext == '.woff':
+            # Check if it's a Win32 PE format file (EXE, DLL, SYS, OCX, DRV, SCR, CPL)
+            if file_ext in ('.exe', '.dll', '.sys', '.ocx', '.drv', '.scr', '.cpl'):
                 try:
-                    from dnexif.woff_parser import WOFFParser
-                    woff_parser = WOFFParser(file_path=str(self.file_path))
-                    woff_data = woff_parser.parse()
-                    self.metadata.update(woff_data)
+                    from dnexif.exe_parser import EXEParser
+                    exe_parser = EXEParser(file_path=str(self.file_path))
+                    exe_data = exe_parser.parse()
+                    self.metadata.update(exe_data)
+                    # Set file type based on extension
+                    file_type_map = {
+                        '.dll': ('DLL', 'dll', 'application/x-msdownload'),
+                        '.sys': ('SYS', 'sys', 'application/x-msdownload'),
+                        '.ocx': ('OCX', 'ocx', 'application/x-msdownload'),
+                        '.drv': ('DRV', 'drv', 'application/x-msdownload'),
+                        '.scr': ('SCR', 'scr', 'application/x-msdownload'),
+                        '.cpl': ('CPL', 'cpl', 'application/x-msdownload'),
+                    }
+                    if file_ext in file_type_map:
+                        file_type, ext, mime = file_type_map[file_ext]
+                        self.metadata['File:FileType'] = file_type
+                        self.metadata['File:FileTypeExtension'] = ext
+                        self.metadata['File:MIMEType'] = mime
                 except Exception as e:
                     if not self.ignore_minor_errors:
                         raise MetadataReadError(
-                            f"Failed to parse WOFF metadata from {self.file_path.name}: {str(e)}"
+                            f"Failed to parse .{file_ext.upper()} metadata from {self.file_path.name}: {str(e)}"
                         ) from e
                     pass
                 self._add_composite_tags()
-                return  # WOFF files handled separately
-            
-            if file_ext == '.woff2':
-                try:
-                    from dnexif.woff2_parser import WOFF2Parser
-                    woff2_parser = WOFF2Parser(file_path=str(self.file_path))
-                    woff2_data = woff2_parser.parse()
-                    self.metadata.update(woff2_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse WOFF2 metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # WOFF2 files handled separately
-            
-            # Legacy WOFF check (kept for backward compatibility)
-            if file_ext == '.woff':
-                try:
-                    from dnexif.woff_parser import WOFFParser
-                    woff_parser = WOFFParser(file_path=str(self.file_path))
-                    woff_data = woff_parser.parse()
-                    self.metadata.update(woff_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse WOFF metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # WOFF files handled separately
-            
-            # Check if it's a Windows .URL file
-            if file_ext == '.url':
-                try:
-                    from dnexif.url_parser import URLParser
-                    url_parser = URLParser(file_path=str(self.file_path))
-                    url_data = url_parser.parse()
-                    self.metadata.update(url_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse .URL metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # .URL files handled separately
-            
-            # Check if it's a Windows .LNK file
-            if file_ext == '.lnk':
-                try:
-                    from dnexif.lnk_parser import LNKParser
-                    lnk_parser = LNKParser(file_path=str(self.file_path))
-                    lnk_data = lnk_parser.parse()
-                    self.metadata.update(lnk_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse .LNK metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # .LNK files handled separately
-            
-            # Check if it's a Win32 PE format file (EXE, DLL, SYS, OCX, DRV, SCR, CPL)
-            if file_ext in ('.exe', '.dll', '.sys', '.ocx', '.drv', '.scr', '.cpl'):
-                try:
-                    from dnexif.exe_parser import EXEParser
-                    exe_parser = EXEParser(file_path=str(self.file_path))
-                    exe_data = exe_parser.parse()
-                    self.metadata.update(exe_data)
-                    # Set file type based on extension
-                    file_type_map = {
-                        '.dll': ('DLL', 'dll', 'application/x-msdownload'),
-                        '.sys': ('SYS', 'sys', 'application/x-msdownload'),
-                        '.ocx': ('OCX', 'ocx', 'application/x-msdownload'),
-                        '.drv': ('DRV', 'drv', 'application/x-msdownload'),
-                        '.scr': ('SCR', 'scr', 'application/x-msdownload'),
-                        '.cpl': ('CPL', 'cpl', 'application/x-msdownload'),
-                    }
-                    if file_ext in file_type_map:
-                        file_type, ext, mime = file_type_map[file_ext]
-                        self.metadata['File:FileType'] = file_type
-                        self.metadata['File:FileTypeExtension'] = ext
-                        self.metadata['File:MIMEType'] = mime
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse .{file_ext.upper()} metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # PE format files handled separately
-            
-            # Check if it's an iWork file
-            if file_ext in ('.pages', '.numbers', '.key'):
-                try:
-                    from dnexif.iwork_parser import IWorkParser
-                    iwork_parser = IWorkParser(file_path=str(self.file_path))
-                    iwork_data = iwork_parser.parse()
-                    self.metadata.update(iwork_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse iWork metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # iWork files handled separately
-            
-            # Check if it's a FITS file
-            if file_ext in ('.fits', '.fit', '.fts'):
-                try:
-                    from dnexif.fits_parser import FITSParser
-                    fits_parser = FITSParser(file_path=str(self.file_path))
-                    fits_data = fits_parser.parse()
-                    self.metadata.update(fits_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse FITS metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # FITS files handled separately
-            
-            # Check if it's a Netpbm file (PAM, PBM, PGM, PPM, PNM)
-            if file_ext in ('.pam', '.pbm', '.pgm', '.ppm', '.pnm'):
-                try:
-                    from dnexif.netpbm_parser import NetPBMParser
-                    netpbm_parser = NetPBMParser(file_path=str(self.file_path))
-                    netpbm_data = netpbm_parser.parse()
-                    self.metadata.update(netpbm_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse Netpbm metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # Netpbm files handled separately
-            
-            # Check if it's an HDR file
-            if file_ext == '.hdr':
-                try:
-                    from dnexif.hdr_parser import HDRParser
-                    hdr_parser = HDRParser(file_path=str(self.file_path))
-                    hdr_data = hdr_parser.parse()
-                    self.metadata.update(hdr_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse HDR metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # HDR files handled separately
-            
-            # Check if it's a DDS file
-            if file_ext == '.dds':
-                try:
-                    from dnexif.dds_parser import DDSParser
-                    dds_parser = DDSParser(file_path=str(self.file_path))
-                    dds_data = dds_parser.parse()
-                    self.metadata.update(dds_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse DDS metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # DDS files handled separately
-            
-            # Check if it's an EXR file
-            if file_ext == '.exr':
-                try:
-                    from dnexif.exr_parser import EXRParser
-                    exr_parser = EXRParser(file_path=str(self.file_path))
-                    exr_data = exr_parser.parse()
-                    self.metadata.update(exr_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse EXR metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # EXR files handled separately
-            
-            # Check if it's a WBMP file
-            if file_ext == '.wbmp':
-                try:
-                    from dnexif.wbmp_parser import WBMPParser
-                    wbmp_parser = WBMPParser(file_path=str(self.file_path))
-                    wbmp_data = wbmp_parser.parse()
-                    self.metadata.update(wbmp_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse WBMP metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # WBMP files handled separately
-            
-            # Check if it's an XBM file
-            if file_ext == '.xbm':
-                try:
-                    from dnexif.xbm_parser import XBMParser
-                    xbm_parser = XBMParser(file_path=str(self.file_path))
-                    xbm_data = xbm_parser.parse()
-                    self.metadata.update(xbm_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse XBM metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # XBM files handled separately
-            
-            # Check if it's an XPM file
-            if file_ext == '.xpm':
-                try:
-                    from dnexif.xpm_parser import XPMParser
-                    xpm_parser = XPMParser(file_path=str(self.file_path))
-                    xpm_data = xpm_parser.parse()
-                    self.metadata.update(xpm_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse XPM metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # XPM files handled separately
-            
-            # Check if it's a RAS file
-            if file_ext == '.ras':
-                try:
-                    from dnexif.ras_parser import RASParser
-                    ras_parser = RASParser(file_path=str(self.file_path))
-                    ras_data = ras_parser.parse()
-                    self.metadata.update(ras_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse RAS metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # RAS files handled separately
-            
-            # Check if it's an SGI file
-            if file_ext == '.sgi':
-                try:
-                    from dnexif.sgi_parser import SGIParser
-                    sgi_parser = SGIParser(file_path=str(self.file_path))
-                    sgi_data = sgi_parser.parse()
-                    self.metadata.update(sgi_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse SGI metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # SGI files handled separately
-            
-            # Check if it's a PCD file
-            if file_ext == '.pcd':
-                try:
-                    from dnexif.pcd_parser import PCDParser
-                    pcd_parser = PCDParser(file_path=str(self.file_path))
-                    pcd_data = pcd_parser.parse()
-                    self.metadata.update(pcd_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse PCD metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # PCD files handled separately
-            
-            # Check if it's a PICON file
-            if file_ext == '.picon':
-                try:
-                    from dnexif.picon_parser import PICONParser
-                    picon_parser = PICONParser(file_path=str(self.file_path))
-                    picon_data = picon_parser.parse()
-                    self.metadata.update(picon_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse PICON metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # PICON files handled separately
-            
-            # Check if it's an MNG file
-            if file_ext == '.mng':
-                try:
-                    from dnexif.mng_parser import MNGParser
-                    mng_parser = MNGParser(file_path=str(self.file_path))
-                    mng_data = mng_parser.parse()
-                    self.metadata.update(mng_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse MNG metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # MNG files handled separately
-            
-            # Check if it's an XWD file
-            if file_ext == '.xwd':
-                try:
-                    from dnexif.xwd_parser import XWDParser
-                    xwd_parser = XWDParser(file_path=str(self.file_path))
-                    xwd_data = xwd_parser.parse()
-                    self.metadata.update(xwd_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse XWD metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # XWD files handled separately
-            
-            # Check if it's an SFW file
-            if file_ext == '.sfw':
-                try:
-                    from dnexif.sfw_parser import SFWParser
-                    sfw_parser = SFWParser(file_path=str(self.file_path))
-                    sfw_data = sfw_parser.parse()
-                    self.metadata.update(sfw_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse SFW metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # SFW files handled separately
-            
-            # Check if it's a PES file
-            if file_ext == '.pes':
-                try:
-                    from dnexif.pes_parser import PESParser
-                    pes_parser = PESParser(file_path=str(self.file_path))
-                    pes_data = pes_parser.parse()
-                    self.metadata.update(pes_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse PES metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # PES files handled separately
-            
-            # Check if it's a PICT file
-            if file_ext == '.pict':
-                try:
-                    from dnexif.pict_parser import PICTParser
-                    pict_parser = PICTParser(file_path=str(self.file_path))
-                    pict_data = pict_parser.parse()
-                    self.metadata.update(pict_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse PICT metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # PICT files handled separately
-            
-            # Check if it's an XCF file
-            if file_ext == '.xcf':
-                try:
-                    from dnexif.xcf_parser import XCFParser
-                    xcf_parser = XCFParser(file_path=str(self.file_path))
-                    xcf_data = xcf_parser.parse()
-                    self.metadata.update(xcf_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse XCF metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # XCF files handled separately
+                return  # PE format files handled separately
             
             # Check if it's a JP2 file (JPEG 2000)
             if file_ext == '.jp2':
@@ -3013,10 +2848,6 @@ class DNExif:
                     metadata['File:FileTypeExtension'] = 'jp2'
                     metadata['File:MIMEType'] = 'image/jp2'
                     # JP2 files start with JPEG 2000 signature
-                    # Read file data
-                    with open(self.file_path, 'rb') as f:
-                        file_data = f.read(100)
-                    
                     if len(file_data) >= 12:
                         if file_data[:4] == b'\x00\x00\x00\x0c' and file_data[4:12] == b'jP  \r\n\x87\n':
                             metadata['JP2:HasSignature'] = True
@@ -3031,22 +2862,6 @@ class DNExif:
                 self._add_composite_tags()
                 return  # JP2 files handled separately
             
-            # Check if it's an SVG file
-            if file_ext == '.svg':
-                try:
-                    from dnexif.svg_parser import SVGParser
-                    svg_parser = SVGParser(file_path=str(self.file_path))
-                    svg_data = svg_parser.parse()
-                    self.metadata.update(svg_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse SVG metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # SVG files handled separately
-            
             # Check if it's a BMP file
             if file_ext in {'.bmp', '.dib'}:
                 try:
@@ -3069,176 +2884,68 @@ class DNExif:
                     psd_data = psd_parser.parse()
                     self.metadata.update(psd_data)
                     
-                    # PSD files may also contain EXIF, IPTC, and XMP in image resources
-                    # These are already parsed by the PSD parser
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse PSD metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # PSD files handled separately
-            
-            # Check for ICO/CUR files
-            if file_ext in ('.ico', '.cur'):
-                try:
-                    ico_parser = ICOParser(file_path=str(self.file_path))
-                    ico_data = ico_parser.parse()
-                    self.metadata.update(ico_data)
-                except Exception as e:
-                    # ICO/CUR parsing errors are non-critical, silently continue
-                    if not self.ignore_minor_errors:
-                        # Log but don't fail for ICO/CUR parsing issues
-                        pass
-                    pass
-                # Continue parsing to allow XMP/metadata extraction for ICO/CUR files.
-            
-            # Check for PCX files
-            if file_ext == '.pcx':
-                try:
-                    pcx_parser = PCXParser(file_path=str(self.file_path))
-                    pcx_data = pcx_parser.parse()
-                    self.metadata.update(pcx_data)
-                except Exception as e:
-                    # PCX parsing errors are non-critical, silently continue
-                    if not self.ignore_minor_errors:
-                        # Log but don't fail for PCX parsing issues
-                        pass
-                    pass
-                self._add_composite_tags()
-                return  # PCX files handled separately
-            
-            # Check for TGA files
-            if file_ext in ('.tga', '.targa'):
-                try:
-                    tga_parser = TGAParser(file_path=str(self.file_path))
-                    tga_data = tga_parser.parse()
-                    self.metadata.update(tga_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse TGA metadata from {self.file_path}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return
-            
-            # Check for WPG files
-            if file_ext == '.wpg':
-                try:
-                    from dnexif.wpg_parser import WGPParser
-                    wpg_parser = WGPParser(file_path=str(self.file_path))
-                    wpg_data = wpg_parser.parse()
-                    self.metadata.update(wpg_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse WPG metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # WPG files handled separately
-            
-            # Check for VNT files
-            if file_ext == '.vnt':
-                try:
-                    from dnexif.vnt_parser import VNTParser
-                    vnt_parser = VNTParser(file_path=str(self.file_path))
-                    vnt_data = vnt_parser.parse()
-                    self.metadata.update(vnt_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse VNT metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # VNT files handled separately
-            
-            # Check for Leica LIF files
-            if file_ext == '.lif':
-                try:
-                    from dnexif.lif_parser import LIFParser
-                    lif_parser = LIFParser(file_path=str(self.file_path))
-                    lif_data = lif_parser.parse()
-                    self.metadata.update(lif_data)
-                except Exception as e:
-                    if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse LIF metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
-                    pass
-                self._add_composite_tags()
-                return  # LIF files handled separately
-            
-            # Check for Leica LIFEXT files
-            if file_ext == '.lifext':
-                try:
-                    from dnexif.lifext_parser import LIFEXTParser
-                    lifext_parser = LIFEXTParser(file_path=str(self.file_path))
-                    lifext_data = lifext_parser.parse()
-                    self.metadata.update(lifext_data)
+                    # PSD files may also contain EXIF, IPTC, and XMP in image resources
+                    # These are already parsed by the PSD parser
                 except Exception as e:
                     if not self.ignore_minor_errors:
                         raise MetadataReadError(
-                            f"Failed to parse LIFEXT metadata from {self.file_path.name}: {str(e)}"
+                            f"Failed to parse PSD metadata from {self.file_path.name}: {str(e)}"
                         ) from e
                     pass
                 self._add_composite_tags()
-                return  # LIFEXT files handled separately
+                return  # PSD files handled separately
             
-            # Check for macOS DS_Store files (can be .DS_Store or .ds_store extension, or filename .DS_Store)
-            if file_ext == '.ds_store' or (self.file_path and self.file_path.name == '.DS_Store'):
+            # Check for ICO/CUR files
+            if file_ext in ('.ico', '.cur'):
                 try:
-                    from dnexif.ds_store_parser import DSStoreParser
-                    ds_store_parser = DSStoreParser(file_path=str(self.file_path))
-                    ds_store_data = ds_store_parser.parse()
-                    self.metadata.update(ds_store_data)
+                    from dnexif.ico_parser import ICOParser
+                    ico_parser = ICOParser(file_path=str(self.file_path))
+                    ico_data = ico_parser.parse()
+                    self.metadata.update(ico_data)
                 except Exception as e:
+                    # ICO/CUR parsing errors are non-critical, silently continue
                     if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse DS_Store metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
+                        # Log but don't fail for ICO/CUR parsing issues
+                        pass
                     pass
-                self._add_composite_tags()
-                return  # DS_Store files handled separately
+                # Continue parsing to allow XMP/metadata extraction for ICO/CUR files.
             
-            # Check for Zeiss CZI files
-            if file_ext == '.czi':
+            # Check for PCX files
+            if file_ext == '.pcx':
                 try:
-                    from dnexif.czi_parser import CZIParser
-                    czi_parser = CZIParser(file_path=str(self.file_path))
-                    czi_data = czi_parser.parse()
-                    self.metadata.update(czi_data)
+                    from dnexif.pcx_parser import PCXParser
+                    pcx_parser = PCXParser(file_path=str(self.file_path))
+                    pcx_data = pcx_parser.parse()
+                    self.metadata.update(pcx_data)
                 except Exception as e:
+                    # PCX parsing errors are non-critical, silently continue
                     if not self.ignore_minor_errors:
-                        raise MetadataReadError(
-                            f"Failed to parse CZI metadata from {self.file_path.name}: {str(e)}"
-                        ) from e
+                        # Log but don't fail for PCX parsing issues
+                        pass
                     pass
                 self._add_composite_tags()
-                return  # CZI files handled separately
+                return  # PCX files handled separately
             
-            # Check if it's a GIF file
-            if file_ext == '.gif':
+            # Check for TGA files
+            if file_ext in ('.tga', '.targa'):
                 try:
-                    from dnexif.gif_parser import GIFParser
-                    gif_parser = GIFParser(file_path=str(self.file_path))
-                    gif_data = gif_parser.parse()
-                    self.metadata.update(gif_data)
+                    from dnexif.tga_parser import TGAParser
+                    tga_parser = TGAParser(file_path=str(self.file_path))
+                    tga_data = tga_parser.parse()
+                    self.metadata.update(tga_data)
                 except Exception as e:
                     if not self.ignore_minor_errors:
                         raise MetadataReadError(
-                            f"Failed to parse GIF metadata from {self.file_path.name}: {str(e)}"
+                            f"Failed to parse TGA metadata from {self.file_path}: {str(e)}"
                         ) from e
                     pass
                 self._add_composite_tags()
-                return  # GIF files handled separately
-
+                return
+            
             # Check if it's a WebP file
             if file_ext == '.webp':
                 try:
+                    from dnexif.webp_parser import WebPParser
                     webp_parser = WebPParser(file_path=str(self.file_path))
                     webp_data = webp_parser.parse()
                     self.metadata.update(webp_data)
@@ -3256,7 +2963,12 @@ class DNExif:
             if file_ext in {'.dcm', '.dicom'}:
                 try:
                     from dnexif.dicom_parser import DICOMParser
-                    dicom_parser = DICOMParser(file_path=str(self.file_path))
+                    # In fast mode, stop at the pixel data instead of reading it
+                    dicom_parser = DICOMParser(
+                        file_path=str(self.file_path),
+                        use_mmap=self.use_mmap,
+                        stop_before_pixels=self.fast_mode
+                    )
                     dicom_data = dicom_parser.parse()
                     self.metadata.update(dicom_data)
                 except Exception as e:
@@ -3366,6 +3078,7 @@ class DNExif:
             if file_ext in audio_formats:
                 # Use audio parser for audio files
                 try:
+                    from dnexif.audio_parser import AudioParser
                     audio_parser = AudioParser(file_path=str(self.file_path))
                     audio_data = audio_parser.parse()
                     self.metadata.update(audio_data)
@@ -3389,356 +3102,412 @@ class DNExif:
                 
                 return  # Audio files handled separately for now
             
-            # Check if it's a RAW format
-            # Note: CR3 and HIF are handled separately as they may use ISO BMFF container
-            raw_formats = {'.cr2', '.cr3', '.crw', '.nef', '.arw', '.dng', 
-                          '.orf', '.raf', '.rw2', '.srw', '.pef', '.x3f',
-                          '.3fr', '.ari', '.bay', '.cap', '.dcs', '.dcr',
-                          '.drf', '.eip', '.erf', '.fff', '.iiq', '.mef',
-                          '.mos', '.mrw', '.mdc', '.nrw', '.rwl', '.srf', '.hif', '.raw'}
+            # Load embedded metadata blocks - all of them, or only the stages
+            # requested up front (groups=) with the rest deferred (lazy=True)
+            self._embedded_metadata_deferrable = True
+            self._load_embedded_metadata(file_ext, self._requested_stages())
+            self._finalize_embedded_metadata(file_ext)
             
-            if file_ext in raw_formats:
-                # Use RAW parser for complete metadata extraction
+            
+        except Exception as e:
+            if isinstance(e, MetadataReadError):
+                raise
+            raise MetadataReadError(
+                f"Failed to load metadata from {self.file_path.name}: {str(e)}"
+            ) from e
+    
+    def _parse_with_handler(self, handler: FormatHandler) -> None:
+        """
+        Read the metadata of a file with its registered format handler.
+        
+        Set DNEXIF_PARSE_TIMING=1 to print the time spent in each parser.
+        
+        Args:
+            handler: Format handler selected for the file
+        """
+        timing = os.getenv('DNEXIF_PARSE_TIMING') == '1'
+        if timing:
+            start = time.perf_counter()
+        try:
+            parser = handler.load_parser()(file_path=str(self.file_path))
+            data = parser.parse()
+            if data:
+                self.metadata.update(data)
+        except Exception as e:
+            if not self.ignore_minor_errors:
+                raise MetadataReadError(
+                    f"Failed to parse {handler.name} metadata from {self.file_path.name}: {str(e)}"
+                ) from e
+        if timing:
+            print(f"[PARSE TIMING] {handler.name} {self.file_path.name} in {time.perf_counter() - start:.3f}s",
+                  file=sys.stderr)
+    
+    def _load_embedded_metadata(self, file_ext: str, stages: Set[str]) -> None:
+        """
+        Load embedded metadata blocks for generic image/RAW formats.
+        
+        Each block is a loading stage (see EMBEDDED_METADATA_STAGES) so that lazy
+        and group-restricted instances can load only what is needed.
+        
+        Args:
+            file_ext: Lowercase file extension
+            stages: Stages to load (EXIF, IPTC, XMP, SEAL, C2PA, Standards)
+        """
+        # Check if it's a RAW format
+        # Note: CR3 and HIF are handled separately as they may use ISO BMFF container
+        raw_formats = {'.cr2', '.cr3', '.crw', '.nef', '.arw', '.dng', 
+                      '.orf', '.raf', '.rw2', '.srw', '.pef', '.x3f',
+                      '.3fr', '.ari', '.bay', '.cap', '.dcs', '.dcr',
+                      '.drf', '.eip', '.erf', '.fff', '.iiq', '.mef',
+                      '.mos', '.mrw', '.mdc', '.nrw', '.rwl', '.srf', '.hif', '.raw'}
+        
+        if 'EXIF' not in stages:
+            # EXIF/MakerNotes not requested
+            pass
+        elif file_ext in raw_formats:
+            # Use RAW parser for complete metadata extraction
+            try:
+                from dnexif.raw_parser import RAWParser
+                raw_parser = RAWParser(file_path=str(self.file_path))
+                raw_data = raw_parser.parse()
+                self.metadata.update(raw_data)
+                raw_fast_scan = getattr(raw_parser, 'fast_scan', False)
+            except Exception as raw_e:
+                # RAW parsing errors are non-critical, continue with EXIF parser
+                if not self.ignore_minor_errors:
+                    # Log but don't fail for RAW parsing issues
+                    pass
+                raw_fast_scan = False
+            
+            # Also try standard EXIF parser (RAW files often have EXIF)
+            # IMPROVEMENT (Build 1489): Skip ExifParser for MOS files to prevent timeout
+            # MOS parser already handles metadata extraction and ExifParser causes timeout issues
+            if file_ext != '.mos' and not raw_fast_scan:
                 try:
-                    raw_parser = RAWParser(file_path=str(self.file_path))
-                    raw_data = raw_parser.parse()
-                    self.metadata.update(raw_data)
-                    raw_fast_scan = getattr(raw_parser, 'fast_scan', False)
-                except Exception as raw_e:
-                    # RAW parsing errors are non-critical, continue with EXIF parser
-                    if not self.ignore_minor_errors:
-                        # Log but don't fail for RAW parsing issues
-                        pass
-                    raw_fast_scan = False
-                
-                # Also try standard EXIF parser (RAW files often have EXIF)
-                # IMPROVEMENT (Build 1489): Skip ExifParser for MOS files to prevent timeout
-                # MOS parser already handles metadata extraction and ExifParser causes timeout issues
-                if file_ext != '.mos' and not raw_fast_scan:
-                    try:
-                        exif_parser = ExifParser(file_path=str(self.file_path))
-                        self._exif_parser = exif_parser  # Store for File:ExifByteOrder extraction
-                        exif_data = exif_parser.read()
-                        # Add tags with proper prefixes
-                        # Canon/Nikon/Sony/Olympus/Pentax/Fujifilm/Panasonic/MakerNote tags should not have EXIF prefix
-                        for k, v in exif_data.items():
-                            if (k.startswith('Canon') or k.startswith('Nikon') or k.startswith('Sony') or 
-                                k.startswith('Olympus') or k.startswith('Pentax') or k.startswith('Fujifilm') or 
-                                k.startswith('Panasonic') or k.startswith('MakerNote:') or k.startswith('MakerNotes:')):
-                                # Manufacturer tags should be used as-is (already formatted correctly)
-                                self.metadata[k] = v
-                            elif k.startswith('EXIF:') or k.startswith('GPS:') or k.startswith('IFD'):
-                                # Already has proper prefix
-                                if k not in self.metadata or (self.metadata[k] in (None, "") and v not in (None, "")):
-                                    self.metadata[k] = v
-                            elif k in ('ImageWidth', 'ImageHeight', 'ImageLength'):
-                                # Keep ImageWidth/ImageHeight/ImageLength without prefix (used by standard format)
-                                self.metadata[k] = v
-                            elif k in ('Make', 'Model', 'Software', 'DateTime', 'DateTimeOriginal', 'Artist', 'Copyright'):
-                                prefixed_key = f"EXIF:{k}"
-                                if prefixed_key not in self.metadata or (self.metadata[prefixed_key] in (None, "") and v not in (None, "")):
-                                    self.metadata[prefixed_key] = v
-                            else:
-                                # Add EXIF prefix for standard EXIF tags
-                                prefixed_key = f"EXIF:{k}"
-                                if prefixed_key not in self.metadata or (self.metadata[prefixed_key] in (None, "") and v not in (None, "")):
-                                    self.metadata[prefixed_key] = v
-                        
-                        # Special handling for Sony ARW and similar formats:
-                        # If EXIF:SubfileType exists and is "Full-resolution image", use it as SubfileType
-                        # This standard format behavior where SubIFD's SubfileType takes precedence
-                        if 'EXIF:SubfileType' in self.metadata:
-                            exif_subfile_type = self.metadata.get('EXIF:SubfileType')
-                            if (exif_subfile_type == 0 or 
-                                exif_subfile_type == 'Full-resolution image' or
-                                str(exif_subfile_type).strip() == '0' or
-                                (isinstance(exif_subfile_type, str) and 'Full-resolution' in exif_subfile_type)):
-                                from dnexif.value_formatter import format_exif_value
-                                self.metadata['SubfileType'] = format_exif_value('SubfileType', 0)
-                    except Exception as exif_e:
-                        # EXIF extraction from RAW is optional
-                        pass
-                elif raw_fast_scan and file_ext == '.cr2':
-                    # Try a lightweight EXIF scan from the file head to recover basic tags.
-                    try:
-                        head_data = self._read_file_data(max_length=1024 * 1024)
-                        exif_parser = ExifParser(file_data=head_data)
-                        self._exif_parser = exif_parser
-                        exif_data = exif_parser.read()
-                        for k, v in exif_data.items():
-                            if (k.startswith('Canon') or k.startswith('Nikon') or k.startswith('Sony') or 
-                                k.startswith('Olympus') or k.startswith('Pentax') or k.startswith('Fujifilm') or 
-                                k.startswith('Panasonic') or k.startswith('MakerNote:') or k.startswith('MakerNotes:')):
-                                self.metadata[k] = v
-                            elif k.startswith('EXIF:') or k.startswith('GPS:') or k.startswith('IFD'):
-                                self.metadata[k] = v
-                            elif k in ('ImageWidth', 'ImageHeight', 'ImageLength'):
+                    exif_parser = ExifParser(file_path=str(self.file_path))
+                    self._exif_parser = exif_parser  # Store for File:ExifByteOrder extraction
+                    exif_data = exif_parser.read()
+                    # Add tags with proper prefixes
+                    # Canon/Nikon/Sony/Olympus/Pentax/Fujifilm/Panasonic/MakerNote tags should not have EXIF prefix
+                    for k, v in exif_data.items():
+                        if (k.startswith('Canon') or k.startswith('Nikon') or k.startswith('Sony') or 
+                            k.startswith('Olympus') or k.startswith('Pentax') or k.startswith('Fujifilm') or 
+                            k.startswith('Panasonic') or k.startswith('MakerNote:') or k.startswith('MakerNotes:')):
+                            # Manufacturer tags should be used as-is (already formatted correctly)
+                            self.metadata[k] = v
+                        elif k.startswith('EXIF:') or k.startswith('GPS:') or k.startswith('IFD'):
+                            # Already has proper prefix
+                            if k not in self.metadata or (self.metadata[k] in (None, "") and v not in (None, "")):
                                 self.metadata[k] = v
-                            else:
-                                self.metadata[f"EXIF:{k}"] = v
-                        self.metadata['RAW:FastExifScan'] = True
-                    except Exception:
-                        pass
-                elif raw_fast_scan and file_ext == '.nef':
-                    # NEF fast-scan: parse minimal IFD0 tags to avoid heavy EXIF walks.
-                    try:
-                        head_data = self._read_file_data(max_length=1024 * 1024)
-                        if len(head_data) >= 8 and head_data[:2] in (b'II', b'MM'):
-                            endian = '<' if head_data[:2] == b'II' else '>'
-                            magic = struct.unpack(f'{endian}H', head_data[2:4])[0]
-                            if magic == 42:
-                                ifd_offset = struct.unpack(f'{endian}I', head_data[4:8])[0]
-                                if ifd_offset + 2 <= len(head_data):
-                                    num_entries = struct.unpack(
-                                        f'{endian}H', head_data[ifd_offset:ifd_offset + 2]
-                                    )[0]
-                                    entry_offset = ifd_offset + 2
-                                    for _ in range(min(num_entries, 128)):
-                                        if entry_offset + 12 > len(head_data):
-                                            break
-                                        tag_id, tag_type, count = struct.unpack(
-                                            f'{endian}HHI', head_data[entry_offset:entry_offset + 8]
-                                        )
-                                        value_bytes = head_data[entry_offset + 8:entry_offset + 12]
-                                        entry_offset += 12
-                                        if tag_id not in (0x010F, 0x0110, 0x013B, 0x8298):
-                                            continue
-                                        if tag_type != 2 or count == 0:
-                                            continue
-                                        value_size = count
-                                        if value_size <= 4:
-                                            raw_value = value_bytes[:value_size]
-                                        else:
-                                            value_offset = struct.unpack(f'{endian}I', value_bytes)[0]
-                                            if value_offset + value_size > len(head_data):
-                                                continue
-                                            raw_value = head_data[value_offset:value_offset + value_size]
-                                        text_value = raw_value.split(b'\x00', 1)[0].decode('ascii', errors='replace')
-                                        if tag_id == 0x010F:
-                                            self.metadata['EXIF:Make'] = text_value
-                                        elif tag_id == 0x0110:
-                                            self.metadata['EXIF:Model'] = text_value
-                                        elif tag_id == 0x013B:
-                                            self.metadata['EXIF:Artist'] = text_value
-                                        elif tag_id == 0x8298:
-                                            self.metadata['EXIF:Copyright'] = text_value
-                                    self.metadata['RAW:FastExifScan'] = True
-                    except Exception:
-                        pass
-                elif raw_fast_scan and file_ext == '.dcr':
-                    # DCR fast-scan: only parse minimal IFD0 tags to avoid long EXIF walks.
-                    try:
-                        head_data = self._read_file_data(max_length=1024 * 1024)
-                        if len(head_data) >= 8 and head_data[:2] in (b'II', b'MM'):
-                            endian = '<' if head_data[:2] == b'II' else '>'
-                            magic = struct.unpack(f'{endian}H', head_data[2:4])[0]
-                            if magic == 42:
-                                ifd_offset = struct.unpack(f'{endian}I', head_data[4:8])[0]
-                                if ifd_offset + 2 <= len(head_data):
-                                    num_entries = struct.unpack(
-                                        f'{endian}H', head_data[ifd_offset:ifd_offset + 2]
-                                    )[0]
-                                    entry_offset = ifd_offset + 2
-                                    for _ in range(min(num_entries, 128)):
-                                        if entry_offset + 12 > len(head_data):
-                                            break
-                                        tag_id, tag_type, count = struct.unpack(
-                                            f'{endian}HHI', head_data[entry_offset:entry_offset + 8]
-                                        )
-                                        value_bytes = head_data[entry_offset + 8:entry_offset + 12]
-                                        entry_offset += 12
-                                        if tag_id not in (0x013B, 0x8298):
+                        elif k in ('ImageWidth', 'ImageHeight', 'ImageLength'):
+                            # Keep ImageWidth/ImageHeight/ImageLength without prefix (used by standard format)
+                            self.metadata[k] = v
+                        elif k in ('Make', 'Model', 'Software', 'DateTime', 'DateTimeOriginal', 'Artist', 'Copyright'):
+                            prefixed_key = f"EXIF:{k}"
+                            if prefixed_key not in self.metadata or (self.metadata[prefixed_key] in (None, "") and v not in (None, "")):
+                                self.metadata[prefixed_key] = v
+                        else:
+                            # Add EXIF prefix for standard EXIF tags
+                            prefixed_key = f"EXIF:{k}"
+                            if prefixed_key not in self.metadata or (self.metadata[prefixed_key] in (None, "") and v not in (None, "")):
+                                self.metadata[prefixed_key] = v
+                    
+                    # Special handling for Sony ARW and similar formats:
+                    # If EXIF:SubfileType exists and is "Full-resolution image", use it as SubfileType
+                    # This standard format behavior where SubIFD's SubfileType takes precedence
+                    if 'EXIF:SubfileType' in self.metadata:
+                        exif_subfile_type = self.metadata.get('EXIF:SubfileType')
+                        if (exif_subfile_type == 0 or 
+                            exif_subfile_type == 'Full-resolution image' or
+                            str(exif_subfile_type).strip() == '0' or
+                            (isinstance(exif_subfile_type, str) and 'Full-resolution' in exif_subfile_type)):
+                            from dnexif.value_formatter import format_exif_value
+                            self.metadata['SubfileType'] = format_exif_value('SubfileType', 0)
+                except Exception as exif_e:
+                    # EXIF extraction from RAW is optional
+                    pass
+            elif raw_fast_scan and file_ext == '.cr2':
+                # Try a lightweight EXIF scan from the file head to recover basic tags.
+                try:
+                    head_data = self._read_file_data(max_length=1024 * 1024)
+                    exif_parser = ExifParser(file_data=head_data)
+                    self._exif_parser = exif_parser
+                    exif_data = exif_parser.read()
+                    for k, v in exif_data.items():
+                        if (k.startswith('Canon') or k.startswith('Nikon') or k.startswith('Sony') or 
+                            k.startswith('Olympus') or k.startswith('Pentax') or k.startswith('Fujifilm') or 
+                            k.startswith('Panasonic') or k.startswith('MakerNote:') or k.startswith('MakerNotes:')):
+                            self.metadata[k] = v
+                        elif k.startswith('EXIF:') or k.startswith('GPS:') or k.startswith('IFD'):
+                            self.metadata[k] = v
+                        elif k in ('ImageWidth', 'ImageHeight', 'ImageLength'):
+                            self.metadata[k] = v
+                        else:
+                            self.metadata[f"EXIF:{k}"] = v
+                    self.metadata['RAW:FastExifScan'] = True
+                except Exception:
+                    pass
+            elif raw_fast_scan and file_ext == '.nef':
+                # NEF fast-scan: parse minimal IFD0 tags to avoid heavy EXIF walks.
+                try:
+                    head_data = self._read_file_data(max_length=1024 * 1024)
+                    if len(head_data) >= 8 and head_data[:2] in (b'II', b'MM'):
+                        endian = '<' if head_data[:2] == b'II' else '>'
+                        magic = struct.unpack(f'{endian}H', head_data[2:4])[0]
+                        if magic == 42:
+                            ifd_offset = struct.unpack(f'{endian}I', head_data[4:8])[0]
+                            if ifd_offset + 2 <= len(head_data):
+                                num_entries = struct.unpack(
+                                    f'{endian}H', head_data[ifd_offset:ifd_offset + 2]
+                                )[0]
+                                entry_offset = ifd_offset + 2
+                                for _ in range(min(num_entries, 128)):
+                                    if entry_offset + 12 > len(head_data):
+                                        break
+                                    tag_id, tag_type, count = struct.unpack(
+                                        f'{endian}HHI', head_data[entry_offset:entry_offset + 8]
+                                    )
+                                    value_bytes = head_data[entry_offset + 8:entry_offset + 12]
+                                    entry_offset += 12
+                                    if tag_id not in (0x010F, 0x0110, 0x013B, 0x8298):
+                                        continue
+                                    if tag_type != 2 or count == 0:
+                                        continue
+                                    value_size = count
+                                    if value_size <= 4:
+                                        raw_value = value_bytes[:value_size]
+                                    else:
+                                        value_offset = struct.unpack(f'{endian}I', value_bytes)[0]
+                                        if value_offset + value_size > len(head_data):
                                             continue
-                                        if tag_type != 2 or count == 0:
+                                        raw_value = head_data[value_offset:value_offset + value_size]
+                                    text_value = raw_value.split(b'\x00', 1)[0].decode('ascii', errors='replace')
+                                    if tag_id == 0x010F:
+                                        self.metadata['EXIF:Make'] = text_value
+                                    elif tag_id == 0x0110:
+                                        self.metadata['EXIF:Model'] = text_value
+                                    elif tag_id == 0x013B:
+                                        self.metadata['EXIF:Artist'] = text_value
+                                    elif tag_id == 0x8298:
+                                        self.metadata['EXIF:Copyright'] = text_value
+                                self.metadata['RAW:FastExifScan'] = True
+                except Exception:
+                    pass
+            elif raw_fast_scan and file_ext == '.dcr':
+                # DCR fast-scan: only parse minimal IFD0 tags to avoid long EXIF walks.
+                try:
+                    head_data = self._read_file_data(max_length=1024 * 1024)
+                    if len(head_data) >= 8 and head_data[:2] in (b'II', b'MM'):
+                        endian = '<' if head_data[:2] == b'II' else '>'
+                        magic = struct.unpack(f'{endian}H', head_data[2:4])[0]
+                        if magic == 42:
+                            ifd_offset = struct.unpack(f'{endian}I', head_data[4:8])[0]
+                            if ifd_offset + 2 <= len(head_data):
+                                num_entries = struct.unpack(
+                                    f'{endian}H', head_data[ifd_offset:ifd_offset + 2]
+                                )[0]
+                                entry_offset = ifd_offset + 2
+                                for _ in range(min(num_entries, 128)):
+                                    if entry_offset + 12 > len(head_data):
+                                        break
+                                    tag_id, tag_type, count = struct.unpack(
+                                        f'{endian}HHI', head_data[entry_offset:entry_offset + 8]
+                                    )
+                                    value_bytes = head_data[entry_offset + 8:entry_offset + 12]
+                                    entry_offset += 12
+                                    if tag_id not in (0x013B, 0x8298):
+                                        continue
+                                    if tag_type != 2 or count == 0:
+                                        continue
+                                    value_size = count
+                                    if value_size <= 4:
+                                        raw_value = value_bytes[:value_size]
+                                    else:
+                                        value_offset = struct.unpack(f'{endian}I', value_bytes)[0]
+                                        if value_offset + value_size > len(head_data):
                                             continue
-                                        value_size = count
-                                        if value_size <= 4:
-                                            raw_value = value_bytes[:value_size]
-                                        else:
-                                            value_offset = struct.unpack(f'{endian}I', value_bytes)[0]
-                                            if value_offset + value_size > len(head_data):
-                                                continue
-                                            raw_value = head_data[value_offset:value_offset + value_size]
-                                        text_value = raw_value.split(b'\x00', 1)[0].decode('ascii', errors='replace')
-                                        if tag_id == 0x013B:
-                                            self.metadata['EXIF:Artist'] = text_value
-                                        elif tag_id == 0x8298:
-                                            self.metadata['EXIF:Copyright'] = text_value
-                                    self.metadata['RAW:FastExifScan'] = True
-                    except Exception:
-                        pass
-                
-                # Cleanup: Remove EXIF/IFD prefixes from MakerNote tags (should be "MakerNotes:" not "EXIF:MakerNotes:" or "IFD1:MakerNotes:")
-                # This fixes any tags that incorrectly got EXIF/IFD prefix added
-                tags_to_fix = {}
-                for k, v in list(self.metadata.items()):
-                    # Check for EXIF:MakerNotes: or EXIF:MakerNote:
-                    if k.startswith('EXIF:MakerNotes:') or k.startswith('EXIF:MakerNote:'):
-                        # Remove EXIF prefix - keep only "MakerNotes:" or "MakerNote:"
-                        new_key = k.replace('EXIF:', '', 1)  # Remove first occurrence only
-                        tags_to_fix[new_key] = v
-                        # Remove old key with EXIF prefix
-                        del self.metadata[k]
-                    # Check for IFD1:MakerNotes: or IFD1:MakerNote: (from thumbnail IFD)
-                    elif k.startswith('IFD1:MakerNotes:') or k.startswith('IFD1:MakerNote:'):
-                        # Remove IFD1 prefix - keep only "MakerNotes:" or "MakerNote:"
-                        new_key = k.replace('IFD1:', '', 1)  # Remove first occurrence only
-                        tags_to_fix[new_key] = v
-                        # Remove old key with IFD1 prefix
-                        del self.metadata[k]
-                    # Check for IFD0:MakerNotes: or IFD0:MakerNote: (from main IFD)
-                    elif k.startswith('IFD0:MakerNotes:') or k.startswith('IFD0:MakerNote:'):
-                        # Remove IFD0 prefix - keep only "MakerNotes:" or "MakerNote:"
-                        new_key = k.replace('IFD0:', '', 1)  # Remove first occurrence only
-                        tags_to_fix[new_key] = v
-                        # Remove old key with IFD0 prefix
-                        del self.metadata[k]
-                # Add corrected tags
-                self.metadata.update(tags_to_fix)
-                
-                # Detect DNG 1.7.0.0 version for DNG files
-                if file_ext == '.dng':
-                    try:
-                        # Check for DNGVersion tag (formatted as "1.7.0.0" for DNG 1.7.0.0)
-                        dng_version = None
-                        for tag_key in ['DNGVersion', 'EXIF:DNGVersion', 'DNG:DNGVersion']:
-                            if tag_key in self.metadata:
-                                dng_version = self.metadata[tag_key]
-                                break
-                        
-                        if dng_version:
-                            # DNGVersion is formatted as "X.Y.Z.W" (e.g., "1.7.0.0")
-                            if isinstance(dng_version, str):
-                                version_parts = dng_version.split('.')
-                                if len(version_parts) >= 2:
-                                    try:
-                                        major = int(version_parts[0])
-                                        minor = int(version_parts[1])
-                                        # DNG 1.7.0.0 has major=1, minor=7
-                                        if major == 1 and minor >= 7:
-                                            self.metadata['DNG:DNG1.7.0.0'] = True
-                                            self.metadata['DNG:DNGStandard'] = 'DNG 1.7.0.0'
-                                            
-                                            # Check for DNG 1.7.1 (minor version 7, patch >= 1)
-                                            if len(version_parts) >= 3:
-                                                try:
-                                                    patch = int(version_parts[2])
-                                                    if patch >= 1:
-                                                        self.metadata['DNG:DNG1.7.1'] = True
-                                                        self.metadata['DNG:DNGStandard'] = 'DNG 1.7.1'
-                                                except (ValueError, IndexError):
-                                                    pass
-                                    except (ValueError, IndexError):
-                                        pass
-                            elif isinstance(dng_version, (list, tuple)) and len(dng_version) >= 2:
-                                # DNGVersion might be raw array [1, 7, 0, 0] or [1, 7, 1, 0]
+                                        raw_value = head_data[value_offset:value_offset + value_size]
+                                    text_value = raw_value.split(b'\x00', 1)[0].decode('ascii', errors='replace')
+                                    if tag_id == 0x013B:
+                                        self.metadata['EXIF:Artist'] = text_value
+                                    elif tag_id == 0x8298:
+                                        self.metadata['EXIF:Copyright'] = text_value
+                                self.metadata['RAW:FastExifScan'] = True
+                except Exception:
+                    pass
+            
+            # Cleanup: Remove EXIF/IFD prefixes from MakerNote tags (should be "MakerNotes:" not "EXIF:MakerNotes:" or "IFD1:MakerNotes:")
+            # This fixes any tags that incorrectly got EXIF/IFD prefix added
+            tags_to_fix = {}
+            for k, v in list(self.metadata.items()):
+                # Check for EXIF:MakerNotes: or EXIF:MakerNote:
+                if k.startswith('EXIF:MakerNotes:') or k.startswith('EXIF:MakerNote:'):
+                    # Remove EXIF prefix - keep only "MakerNotes:" or "MakerNote:"
+                    new_key = k.replace('EXIF:', '', 1)  # Remove first occurrence only
+                    tags_to_fix[new_key] = v
+                    # Remove old key with EXIF prefix
+                    del self.metadata[k]
+                # Check for IFD1:MakerNotes: or IFD1:MakerNote: (from thumbnail IFD)
+                elif k.startswith('IFD1:MakerNotes:') or k.startswith('IFD1:MakerNote:'):
+                    # Remove IFD1 prefix - keep only "MakerNotes:" or "MakerNote:"
+                    new_key = k.replace('IFD1:', '', 1)  # Remove first occurrence only
+                    tags_to_fix[new_key] = v
+                    # Remove old key with IFD1 prefix
+                    del self.metadata[k]
+                # Check for IFD0:MakerNotes: or IFD0:MakerNote: (from main IFD)
+                elif k.startswith('IFD0:MakerNotes:') or k.startswith('IFD0:MakerNote:'):
+                    # Remove IFD0 prefix - keep only "MakerNotes:" or "MakerNote:"
+                    new_key = k.replace('IFD0:', '', 1)  # Remove first occurrence only
+                    tags_to_fix[new_key] = v
+                    # Remove old key with IFD0 prefix
+                    del self.metadata[k]
+            # Add corrected tags
+            self.metadata.update(tags_to_fix)
+            
+            # Detect DNG 1.7.0.0 version for DNG files
+            if file_ext == '.dng':
+                try:
+                    # Check for DNGVersion tag (formatted as "1.7.0.0" for DNG 1.7.0.0)
+                    dng_version = None
+                    for tag_key in ['DNGVersion', 'EXIF:DNGVersion', 'DNG:DNGVersion']:
+                        if tag_key in self.metadata:
+                            dng_version = self.metadata[tag_key]
+                            break
+                    
+                    if dng_version:
+                        # DNGVersion is formatted as "X.Y.Z.W" (e.g., "1.7.0.0")
+                        if isinstance(dng_version, str):
+                            version_parts = dng_version.split('.')
+                            if len(version_parts) >= 2:
                                 try:
-                                    major = int(dng_version[0])
-                                    minor = int(dng_version[1])
+                                    major = int(version_parts[0])
+                                    minor = int(version_parts[1])
+                                    # DNG 1.7.0.0 has major=1, minor=7
                                     if major == 1 and minor >= 7:
                                         self.metadata['DNG:DNG1.7.0.0'] = True
                                         self.metadata['DNG:DNGStandard'] = 'DNG 1.7.0.0'
                                         
-                                        # Check for DNG 1.7.1 (patch version >= 1)
-                                        if len(dng_version) >= 3:
+                                        # Check for DNG 1.7.1 (minor version 7, patch >= 1)
+                                        if len(version_parts) >= 3:
                                             try:
-                                                patch = int(dng_version[2])
+                                                patch = int(version_parts[2])
                                                 if patch >= 1:
                                                     self.metadata['DNG:DNG1.7.1'] = True
                                                     self.metadata['DNG:DNGStandard'] = 'DNG 1.7.1'
-                                            except (ValueError, IndexError, TypeError):
+                                            except (ValueError, IndexError):
                                                 pass
-                                except (ValueError, IndexError, TypeError):
+                                except (ValueError, IndexError):
                                     pass
-                    except Exception:
-                        # DNG version detection is optional
-                        pass
-            elif file_ext in ('.png',):
-                # PNG files - parse PNG header (IHDR chunk), EXIF (eXIf chunks), and text chunks
-                try:
-                    # Parse PNG header for basic image properties
-                    png_header_data = self._parse_png_header()
-                    self.metadata.update(png_header_data)
-                    
-                    # Parse PNG text chunks (tEXt, zTXt) including Stable Diffusion metadata
-                    png_text_data = self._parse_png_text_chunks()
-                    self.metadata.update(png_text_data)
-                    
-                    # Try EXIF parser (supports eXIf chunks)
-                    self._exif_parser = ExifParser(file_path=str(self.file_path))
-                    exif_data = self._exif_parser.read()
-                    # Filter out empty EXIF tags
-                    exif_prefixed = {f"EXIF:{k}": v for k, v in exif_data.items() 
-                                   if not k.startswith('EXIF:') and v and str(v).strip()}
-                    self.metadata.update(exif_prefixed)
-                except Exception as png_e:
-                    # PNG EXIF extraction is optional
+                        elif isinstance(dng_version, (list, tuple)) and len(dng_version) >= 2:
+                            # DNGVersion might be raw array [1, 7, 0, 0] or [1, 7, 1, 0]
+                            try:
+                                major = int(dng_version[0])
+                                minor = int(dng_version[1])
+                                if major == 1 and minor >= 7:
+                                    self.metadata['DNG:DNG1.7.0.0'] = True
+                                    self.metadata['DNG:DNGStandard'] = 'DNG 1.7.0.0'
+                                    
+                                    # Check for DNG 1.7.1 (patch version >= 1)
+                                    if len(dng_version) >= 3:
+                                        try:
+                                            patch = int(dng_version[2])
+                                            if patch >= 1:
+                                                self.metadata['DNG:DNG1.7.1'] = True
+                                                self.metadata['DNG:DNGStandard'] = 'DNG 1.7.1'
+                                        except (ValueError, IndexError, TypeError):
+                                            pass
+                            except (ValueError, IndexError, TypeError):
+                                pass
+                except Exception:
+                    # DNG version detection is optional
                     pass
-            elif file_ext in ('.ico', '.cur'):
-                # ICO/CUR files don't support standard EXIF blocks; skip EXIF parsing.
-                pass
-            else:
-                # Load EXIF metadata (JPEG, TIFF, etc.)
-                self._exif_parser = ExifParser(file_path=str(self.file_path))
-                exif_data = self._exif_parser.read()
-                
-                # Process EXIF data - handle tags that already have EXIF: prefix separately
-                # Optimized: batch updates and reduce redundant string operations
-                double_prefixed_fix = {}  # Collect double-prefixed tags for batch fix
-                batch_updates = {}  # Batch dictionary updates for better performance
+        elif file_ext in ('.png',):
+            # PNG files - parse PNG header (IHDR chunk), EXIF (eXIf chunks), and text chunks
+            try:
+                # Parse PNG header for basic image properties
+                png_header_data = self._parse_png_header()
+                self.metadata.update(png_header_data)
                 
-                for k, v in exif_data.items():
-                    # Fix double-prefixed tags (EXIF:EXIF:...) - optimized check
-                    if k.startswith('EXIF:EXIF:'):
-                        # Remove double prefix and collect for batch fix
-                        single_key = k[5:]  # Remove first "EXIF:"
-                        double_prefixed_fix[single_key] = (k, v)
-                        k = single_key
-                    
-                    # Optimized: cache prefix checks to avoid redundant string operations
-                    has_exif_prefix = k.startswith('EXIF:')
-                    has_makernote_prefix = k.startswith('MakerNote:') or k.startswith('MakerNotes:')
-                    has_panasonic_prefix = k.startswith('PanasonicRaw:')
-                    
-                    if has_exif_prefix:
-                        # Tags that already have EXIF: prefix - use as-is (don't double-prefix)
-                        batch_updates[k] = v
-                    elif has_makernote_prefix:
-                        # MakerNote tags - use as-is
-                        batch_updates[k] = v
-                    elif has_panasonic_prefix:
-                        # PanasonicRaw tags - use as-is (don't add MakerNote prefix)
-                        batch_updates[k] = v
-                    else:
-                        # Tags without prefix - add EXIF: prefix
-                        batch_updates[f"EXIF:{k}"] = v
-                        # Also add without prefix for backward compatibility
-                        batch_updates[k] = v
+                # Parse PNG text chunks (tEXt, zTXt) including Stable Diffusion metadata
+                png_text_data = self._parse_png_text_chunks()
+                self.metadata.update(png_text_data)
                 
-                # Batch update metadata dictionary (more efficient than individual assignments)
-                self.metadata.update(batch_updates)
+                # Try EXIF parser (supports eXIf chunks)
+                self._exif_parser = ExifParser(file_data=self._file_view.data)
+                exif_data = self._exif_parser.read()
+                # Filter out empty EXIF tags
+                exif_prefixed = {f"EXIF:{k}": v for k, v in exif_data.items() 
+                               if not k.startswith('EXIF:') and v and str(v).strip()}
+                self.metadata.update(exif_prefixed)
+            except Exception as png_e:
+                # PNG EXIF extraction is optional
+                pass
+        elif file_ext in ('.ico', '.cur'):
+            # ICO/CUR files don't support standard EXIF blocks; skip EXIF parsing.
+            pass
+        else:
+            # Load EXIF metadata (JPEG, TIFF, etc.)
+            self._exif_parser = ExifParser(file_data=self._file_view.data, tags=self._exif_tag_filter())
+            exif_data = self._exif_parser.read()
+            
+            # Process EXIF data - handle tags that already have EXIF: prefix separately
+            # Optimized: batch updates and reduce redundant string operations
+            double_prefixed_fix = {}  # Collect double-prefixed tags for batch fix
+            batch_updates = {}  # Batch dictionary updates for better performance
+            
+            for k, v in exif_data.items():
+                # Fix double-prefixed tags (EXIF:EXIF:...) - optimized check
+                if k.startswith('EXIF:EXIF:'):
+                    # Remove double prefix and collect for batch fix
+                    single_key = k[5:]  # Remove first "EXIF:"
+                    double_prefixed_fix[single_key] = (k, v)
+                    k = single_key
                 
-                # Fix double-prefixed tags in batch
-                for single_key, (double_key, double_value) in double_prefixed_fix.items():
-                    if single_key not in self.metadata:
-                        self.metadata[single_key] = double_value
-                    # Remove double-prefixed version if it exists
-                    if double_key in self.metadata:
-                        del self.metadata[double_key]
+                # Optimized: cache prefix checks to avoid redundant string operations
+                has_exif_prefix = k.startswith('EXIF:')
+                has_makernote_prefix = k.startswith('MakerNote:') or k.startswith('MakerNotes:')
+                has_panasonic_prefix = k.startswith('PanasonicRaw:')
                 
-                # Clean up any remaining double-prefixed tags that might have been added
-                # Optimized: use list comprehension for faster iteration
-                double_prefixed_keys = [k for k in self.metadata.keys() if k.startswith('EXIF:EXIF:')]
-                for double_key in double_prefixed_keys:
-                    single_key = double_key[5:]  # Remove first "EXIF:"
-                    if single_key not in self.metadata:
-                        self.metadata[single_key] = self.metadata[double_key]
-                    # Remove double-prefixed version
+                if has_exif_prefix:
+                    # Tags that already have EXIF: prefix - use as-is (don't double-prefix)
+                    batch_updates[k] = v
+                elif has_makernote_prefix:
+                    # MakerNote tags - use as-is
+                    batch_updates[k] = v
+                elif has_panasonic_prefix:
+                    # PanasonicRaw tags - use as-is (don't add MakerNote prefix)
+                    batch_updates[k] = v
+                else:
+                    # Tags without prefix - add EXIF: prefix
+                    batch_updates[f"EXIF:{k}"] = v
+                    # Also add without prefix for backward compatibility
+                    batch_updates[k] = v
+            
+            # Batch update metadata dictionary (more efficient than individual assignments)
+            self.metadata.update(batch_updates)
+            
+            # Fix double-prefixed tags in batch
+            for single_key, (double_key, double_value) in double_prefixed_fix.items():
+                if single_key not in self.metadata:
+                    self.metadata[single_key] = double_value
+                # Remove double-prefixed version if it exists
+                if double_key in self.metadata:
                     del self.metadata[double_key]
             
-            # Load IPTC metadata (works for JPEG and some RAW)
+            # Clean up any remaining double-prefixed tags that might have been added
+            # Optimized: use list comprehension for faster iteration
+            double_prefixed_keys = [k for k in self.metadata.keys() if k.startswith('EXIF:EXIF:')]
+            for double_key in double_prefixed_keys:
+                single_key = double_key[5:]  # Remove first "EXIF:"
+                if single_key not in self.metadata:
+                    self.metadata[single_key] = self.metadata[double_key]
+                # Remove double-prefixed version
+                del self.metadata[double_key]
+        
+        # Load IPTC metadata (works for JPEG and some RAW)
+        if 'IPTC' in stages:
             try:
-                self._iptc_parser = IPTCParser(file_path=str(self.file_path))
+                self._iptc_parser = IPTCParser(file_data=self._file_view.data)
                 iptc_data = self._iptc_parser.read()
                 iptc_prefixed = {f"IPTC:{k}": v for k, v in iptc_data.items()}
                 self.metadata.update(iptc_prefixed)
@@ -3748,12 +3517,13 @@ class DNExif:
                         f"Failed to parse IPTC metadata from {self.file_path.name}: {str(e)}"
                     ) from e
                 pass  # IPTC is optional
-            
-            # Load XMP metadata (works for JPEG, PNG, and RAW)
-            # For RAW files (and some other formats like PNG), enable full file scanning by default
-            # since XMP may be stored throughout the file or in non-standard locations.
+        
+        # Load XMP metadata (works for JPEG, PNG, and RAW)
+        # For RAW files (and some other formats like PNG), enable full file scanning by default
+        # since XMP may be stored throughout the file or in non-standard locations.
+        if 'XMP' in stages:
             try:
-                self._xmp_parser = XMPParser(file_path=str(self.file_path))
+                self._xmp_parser = XMPParser(file_data=self._file_view.data)
                 # For RAW formats and PNG, scan entire file for XMP (many formats store XMP throughout the file)
                 if self.scan_for_xmp or file_ext in raw_formats or file_ext == '.png':
                     # Scan entire file for XMP (slower but more thorough)
@@ -3767,47 +3537,49 @@ class DNExif:
                         f"Failed to parse XMP metadata from {self.file_path.name}: {str(e)}"
                     ) from e
                 pass  # XMP is optional
-            
-            # Load SEAL metadata (works for JPEG, TIFF, PNG, WEBP, HEIC, MOV, MP4, PDF, MKV, WAV, etc.)
+        
+        # Load SEAL metadata (works for JPEG, TIFF, PNG, WEBP, HEIC, MOV, MP4, PDF, MKV, WAV, etc.)
+        if 'SEAL' in stages:
             try:
                 from dnexif.seal_parser import SEALParser
-                seal_parser = SEALParser(file_path=str(self.file_path))
+                seal_parser = SEALParser(file_path=str(self.file_path), file_data=self._file_view.data)
                 seal_data = seal_parser.parse()
                 if seal_data and seal_data.get('SEAL:HasSEALMetadata'):
                     self.metadata.update(seal_data)
             except Exception as e:
                 # SEAL parsing is optional - don't raise error if SEAL not found
                 pass
-            
-            # Load C2PA JUMBF metadata (works for PNG, JPEG, TIFF, MP4, MOV, WebP, etc.)
+        
+        # Load C2PA JUMBF metadata (works for PNG, JPEG, TIFF, MP4, MOV, WebP, etc.)
+        if 'C2PA' in stages:
             try:
                 from dnexif.c2pa_parser import C2PAParser
-                c2pa_parser = C2PAParser(file_path=str(self.file_path))
+                c2pa_parser = C2PAParser(file_path=str(self.file_path), file_data=self._file_view.data)
                 c2pa_data = c2pa_parser.parse()
                 if c2pa_data and c2pa_data.get('C2PA:HasC2PAMetadata'):
                     self.metadata.update(c2pa_data)
             except Exception as e:
                 # C2PA parsing is optional - don't raise error if C2PA not found
                 pass
-            
-            # Load additional metadata standards (JFIF, ICC, Photoshop IRB, FlashPix)
+        
+        # Load additional metadata standards (JFIF, ICC, Photoshop IRB, FlashPix)
+        if 'Standards' in stages:
             try:
                 from dnexif.metadata_standards import MetadataStandards
-                with open(self.file_path, 'rb') as f:
-                    file_data = f.read()
-                
+                file_data = self._file_view.data
+            
                 # Parse JFIF
                 jfif_data = MetadataStandards.parse_jfif(file_data)
                 self.metadata.update(jfif_data)
-                
+            
                 # Parse ICC profile
                 icc_data = MetadataStandards.parse_icc_profile(file_data)
                 self.metadata.update(icc_data)
-                
+            
                 # Parse Photoshop IRB
                 ps_irb_data = MetadataStandards.parse_photoshop_irb(file_data)
                 self.metadata.update(ps_irb_data)
-                
+            
                 # Parse FlashPix
                 try:
                     from dnexif.flashpix_parser import FlashPixParser
@@ -3817,7 +3589,7 @@ class DNExif:
                 except Exception as flashpix_e:
                     # FlashPix is optional
                     pass
-                
+            
                 # Parse AFCP
                 try:
                     from dnexif.afcp_parser import AFCPParser
@@ -3827,7 +3599,7 @@ class DNExif:
                 except Exception as afcp_e:
                     # AFCP is optional
                     pass
-                
+            
                 # Parse MPF (Multi-picture Format) metadata
                 if file_ext in {'.jpg', '.jpeg'}:
                     try:
@@ -3838,7 +3610,7 @@ class DNExif:
                     except Exception as mpf_e:
                         # MPF is optional
                         pass
-                
+            
                     # Parse APP6 (GoPro) metadata
                     try:
                         from dnexif.app6_parser import APP6Parser
@@ -3848,7 +3620,7 @@ class DNExif:
                     except Exception as app6_e:
                         # APP6 is optional
                         pass
-                    
+                
                     # Parse APP10 (AROT - Adobe Rotation) metadata
                     try:
                         app10_metadata = self._parse_app10_arot(file_data)
@@ -3857,7 +3629,7 @@ class DNExif:
                     except Exception as app10_e:
                         # APP10 is optional
                         pass
-                
+            
                 # Parse DICOM (if file is DICOM format)
                 # Only parse DICOM for actual DICOM files, not for all files
                 file_ext = self.file_path.suffix.lower()
@@ -3874,33 +3646,39 @@ class DNExif:
             except Exception as standards_e:
                 # Additional standards are optional
                 pass
-            
-            # Add File tags derived from EXIF data
-            # NOTE: Must be called BEFORE _clear_parser_cache() so _exif_parser is still available
-            self._add_file_tags_from_exif()
-            
-            # Map EXIF:ImageLength to EXIF:ImageHeight (they're the same in TIFF/EXIF)
-            if 'EXIF:ImageLength' in self.metadata and 'EXIF:ImageHeight' not in self.metadata:
-                self.metadata['EXIF:ImageHeight'] = self.metadata['EXIF:ImageLength']
-            
-            # Clear cached file data from parsers to reduce memory usage
-            # This is safe because metadata has already been extracted
-            # NOTE: _add_file_tags_from_exif() must be called before this to access _exif_parser
-            self._clear_parser_cache()
-            
-            # Calculate Composite tags (ImageSize, Megapixels, etc.)
-            self._add_composite_tags()
-            
-            # Add Canon-specific composite tags for CR2 and CRW files
-            if file_ext in ('.cr2', '.crw'):
-                self._add_canon_composite_tags()
-            
-        except Exception as e:
-            if isinstance(e, MetadataReadError):
-                raise
-            raise MetadataReadError(
-                f"Failed to load metadata from {self.file_path.name}: {str(e)}"
-            ) from e
+        
+        self._loaded_stages.update(stages)
+    
+    def _finalize_embedded_metadata(self, file_ext: str) -> None:
+        """
+        Derive File and Composite tags after embedded metadata has been loaded.
+        
+        Args:
+            file_ext: Lowercase file extension
+        """
+        existing_tags = set(self.metadata)
+        
+        # Add File tags derived from EXIF data
+        # NOTE: Must be called BEFORE _clear_parser_cache() so _exif_parser is still available
+        self._add_file_tags_from_exif()
+        
+        # Map EXIF:ImageLength to EXIF:ImageHeight (they're the same in TIFF/EXIF)
+        if 'EXIF:ImageLength' in self.metadata and 'EXIF:ImageHeight' not in self.metadata:
+            self.metadata['EXIF:ImageHeight'] = self.metadata['EXIF:ImageLength']
+        
+        # Clear cached file data from parsers to reduce memory usage
+        # This is safe because metadata has already been extracted
+        # NOTE: _add_file_tags_from_exif() must be called before this to access _exif_parser
+        self._clear_parser_cache()
+        
+        # Calculate Composite tags (ImageSize, Megapixels, etc.)
+        self._add_composite_tags()
+        
+        # Add Canon-specific composite tags for CR2 and CRW files
+        if file_ext in ('.cr2', '.crw'):
+            self._add_canon_composite_tags()
+        
+        self._derived_tags = set(self.metadata) - existing_tags
     
     def _extract_hif_jpeg_previews(self) -> Dict[str, Any]:
         """
@@ -4331,12 +4109,11 @@ class DNExif:
                 # Final fallback: Try to read from file if file_path is available
                 elif self.file_path:
                     try:
-                        with open(self.file_path, 'rb') as f:
-                            header = f.read(2)
-                            if header == b'II':
-                                self.metadata['File:ExifByteOrder'] = 'Little-endian (Intel, II)'
-                            elif header == b'MM':
-                                self.metadata['File:ExifByteOrder'] = 'Big-endian (Motorola, MM)'
+                        header = self._file_view.read(2)
+                        if header == b'II':
+                            self.metadata['File:ExifByteOrder'] = 'Little-endian (Intel, II)'
+                        elif header == b'MM':
+                            self.metadata['File:ExifByteOrder'] = 'Big-endian (Motorola, MM)'
                     except:
                         pass
             
@@ -5609,11 +5386,7 @@ class DNExif:
             # Promote XMP core date tags into EXIF when EXIF dates are missing
             # This helps align with standard behavior (which often reflects XMP
             # dates in EXIF:CreateDate/EXIF:DateTimeOriginal for DNG and other files)
-            for exif_tag, xmp_candidates in [
-                ('EXIF:CreateDate', ['XMP:CreateDate']),
-                ('EXIF:ModifyDate', ['XMP:ModifyDate', 'XMP:MetadataDate']),
-                ('EXIF:DateTimeOriginal', ['XMP:DateTimeOriginal', 'XMP:CreateDate']),
-            ]:
+            for exif_tag, xmp_candidates in self.XMP_DATE_SOURCES:
                 if exif_tag not in self.metadata:
                     for xmp_tag in xmp_candidates:
                         value = self.metadata.get(xmp_tag)
@@ -6195,56 +5968,54 @@ class DNExif:
                 # Fallback: search for VendorID in stsd atom directly from file
                 if 'QuickTime:HandlerVendorID' not in self.metadata and self.file_path:
                     try:
-                        with open(str(self.file_path), 'rb') as f:
-                            file_data = f.read()
-                            # Find stsd atom
-                            stsd_idx = file_data.find(b'stsd')
-                            if stsd_idx >= 0 and stsd_idx >= 4:
-                                stsd_size = int.from_bytes(file_data[stsd_idx-4:stsd_idx], 'big')
-                                # Look for 'appl' (Apple) in stsd data (VendorID for Apple)
-                                if stsd_idx + stsd_size <= len(file_data):
-                                    stsd_data = file_data[stsd_idx+8:stsd_idx+stsd_size]
-                                    appl_idx = stsd_data.find(b'appl')
-                                    if appl_idx >= 0 and appl_idx < len(stsd_data) - 4:
-                                        vendor_bytes = stsd_data[appl_idx:appl_idx+4]
-                                        if vendor_bytes == b'appl':
-                                            self.metadata['QuickTime:HandlerVendorID'] = 'Apple'
-                                            self.metadata['QuickTime:VendorID'] = 'Apple'
+                        file_data = self._file_view.data
+                        # Find stsd atom
+                        stsd_idx = file_data.find(b'stsd')
+                        if stsd_idx >= 0 and stsd_idx >= 4:
+                            stsd_size = int.from_bytes(file_data[stsd_idx-4:stsd_idx], 'big')
+                            # Look for 'appl' (Apple) in stsd data (VendorID for Apple)
+                            if stsd_idx + stsd_size <= len(file_data):
+                                stsd_data = file_data[stsd_idx+8:stsd_idx+stsd_size]
+                                appl_idx = stsd_data.find(b'appl')
+                                if appl_idx >= 0 and appl_idx < len(stsd_data) - 4:
+                                    vendor_bytes = stsd_data[appl_idx:appl_idx+4]
+                                    if vendor_bytes == b'appl':
+                                        self.metadata['QuickTime:HandlerVendorID'] = 'Apple'
+                                        self.metadata['QuickTime:VendorID'] = 'Apple'
                     except Exception:
                         pass
             
             # QuickTime:Encoder (extract from ©too atom if not set)
             if 'QuickTime:Encoder' not in self.metadata and self.file_path:
                 try:
-                    with open(str(self.file_path), 'rb') as f:
-                        file_data = f.read()
-                        # Find ©too atom (copyright-tool)
-                        too_idx = file_data.find(b'\xa9too')
-                        if too_idx >= 0:
-                            if too_idx >= 4:
-                                too_size = int.from_bytes(file_data[too_idx-4:too_idx], 'big')
-                                # Atom size includes the 8-byte header, so payload is too_size - 8
-                                # Check if we can read at least the header + some payload
-                                if too_idx + 8 < len(file_data):
-                                    # Read available payload (may be less than too_size - 8 if file is truncated)
-                                    payload_size = min(too_size - 8, len(file_data) - (too_idx + 8))
-                                    if payload_size > 0:
-                                        too_data = file_data[too_idx+8:too_idx+8+payload_size]
-                                        # Look for encoder strings (Lavf, FFmpeg, etc.)
-                                        # Encoder might be after 'data' atom header (12 bytes: size(4) + 'data'(4) + version(1) + flags(3) + locale(4))
-                                        for enc_prefix in [b'Lavf', b'FFmpeg', b'x264', b'libx264']:
-                                            enc_idx = too_data.find(enc_prefix)
-                                            if enc_idx >= 0:
-                                                # Extract string from this position
-                                                remaining = too_data[enc_idx:]
-                                                null_pos = remaining.find(b'\x00')
-                                                if null_pos > 0:
-                                                    encoder_str = remaining[:null_pos].decode('utf-8', errors='ignore').strip()
-                                                else:
-                                                    encoder_str = remaining[:50].decode('utf-8', errors='ignore').strip('\x00').strip()
-                                                if encoder_str and len(encoder_str) > 3 and len(encoder_str) < 100:
-                                                    self.metadata['QuickTime:Encoder'] = encoder_str
-                                                    break
+                    file_data = self._file_view.data
+                    # Find ©too atom (copyright-tool)
+                    too_idx = file_data.find(b'\xa9too')
+                    if too_idx >= 0:
+                        if too_idx >= 4:
+                            too_size = int.from_bytes(file_data[too_idx-4:too_idx], 'big')
+                            # Atom size includes the 8-byte header, so payload is too_size - 8
+                            # Check if we can read at least the header + some payload
+                            if too_idx + 8 < len(file_data):
+                                # Read available payload (may be less than too_size - 8 if file is truncated)
+                                payload_size = min(too_size - 8, len(file_data) - (too_idx + 8))
+                                if payload_size > 0:
+                                    too_data = file_data[too_idx+8:too_idx+8+payload_size]
+                                    # Look for encoder strings (Lavf, FFmpeg, etc.)
+                                    # Encoder might be after 'data' atom header (12 bytes: size(4) + 'data'(4) + version(1) + flags(3) + locale(4))
+                                    for enc_prefix in [b'Lavf', b'FFmpeg', b'x264', b'libx264']:
+                                        enc_idx = too_data.find(enc_prefix)
+                                        if enc_idx >= 0:
+                                            # Extract string from this position
+                                            remaining = too_data[enc_idx:]
+                                            null_pos = remaining.find(b'\x00')
+                                            if null_pos > 0:
+                                                encoder_str = remaining[:null_pos].decode('utf-8', errors='ignore').strip()
+                                            else:
+                                                encoder_str = remaining[:50].decode('utf-8', errors='ignore').strip('\x00').strip()
+                                            if encoder_str and len(encoder_str) > 3 and len(encoder_str) < 100:
+                                                self.metadata['QuickTime:Encoder'] = encoder_str
+                                                break
                 except Exception:
                     pass
             
@@ -6256,27 +6027,26 @@ class DNExif:
                 # Fallback: search for VendorID in stsd atom directly from file
                 if 'QuickTime:HandlerVendorID' not in self.metadata and self.file_path:
                     try:
-                        with open(str(self.file_path), 'rb') as f:
-                            file_data = f.read()
-                            # Find stsd atom
-                            stsd_idx = file_data.find(b'stsd')
-                            if stsd_idx >= 0 and stsd_idx >= 4:
-                                stsd_size = int.from_bytes(file_data[stsd_idx-4:stsd_idx], 'big')
-                                # stsd payload: version(1) + flags(3) + entry_count(4) + entries
-                                # First entry: size(4) + format(4) + reserved(6) + data_ref(2) + version(2) + revision(2) + vendor(4)
-                                # VendorID is at offset 8 (entry header) + 20 (audio sample desc fields) = 28 from stsd start
-                                # But stsd_data from _find_atom starts after 8-byte header, so offset is 28-8 = 20
-                                # Actually, let's search for 'appl' (Apple) in stsd
-                                if stsd_idx + stsd_size <= len(file_data):
-                                    stsd_data = file_data[stsd_idx+8:stsd_idx+stsd_size]
-                                    # Look for 'appl' in stsd data (VendorID for Apple)
-                                    appl_idx = stsd_data.find(b'appl')
-                                    if appl_idx >= 0 and appl_idx < len(stsd_data) - 4:
-                                        # Check if it's a valid VendorID (4 bytes, might be followed by other data)
-                                        vendor_bytes = stsd_data[appl_idx:appl_idx+4]
-                                        if vendor_bytes == b'appl':
-                                            self.metadata['QuickTime:HandlerVendorID'] = 'Apple'
-                                            self.metadata['QuickTime:VendorID'] = 'Apple'
+                        file_data = self._file_view.data
+                        # Find stsd atom
+                        stsd_idx = file_data.find(b'stsd')
+                        if stsd_idx >= 0 and stsd_idx >= 4:
+                            stsd_size = int.from_bytes(file_data[stsd_idx-4:stsd_idx], 'big')
+                            # stsd payload: version(1) + flags(3) + entry_count(4) + entries
+                            # First entry: size(4) + format(4) + reserved(6) + data_ref(2) + version(2) + revision(2) + vendor(4)
+                            # VendorID is at offset 8 (entry header) + 20 (audio sample desc fields) = 28 from stsd start
+                            # But stsd_data from _find_atom starts after 8-byte header, so offset is 28-8 = 20
+                            # Actually, let's search for 'appl' (Apple) in stsd
+                            if stsd_idx + stsd_size <= len(file_data):
+                                stsd_data = file_data[stsd_idx+8:stsd_idx+stsd_size]
+                                # Look for 'appl' in stsd data (VendorID for Apple)
+                                appl_idx = stsd_data.find(b'appl')
+                                if appl_idx >= 0 and appl_idx < len(stsd_data) - 4:
+                                    # Check if it's a valid VendorID (4 bytes, might be followed by other data)
+                                    vendor_bytes = stsd_data[appl_idx:appl_idx+4]
+                                    if vendor_bytes == b'appl':
+                                        self.metadata['QuickTime:HandlerVendorID'] = 'Apple'
+                                        self.metadata['QuickTime:VendorID'] = 'Apple'
                     except Exception:
                         pass
             
@@ -7133,66 +6903,14 @@ class DNExif:
             
             # Add aliases for composite tags without Composite: prefix (Standard format shows these both ways)
             # This standard format's behavior where composite tags are available with and without prefix
-            composite_aliases = {
-                'Composite:Aperture': 'Aperture',
-                'Composite:ApertureValue': 'ApertureValue',
-                'Composite:BlueBalance': 'BlueBalance',
-                'Composite:RedBalance': 'RedBalance',
-                'Composite:ShutterSpeed': 'ShutterSpeed',
-                'Composite:ISO': 'ISO',
-                'Composite:FocalLength': 'FocalLength',
-                'Composite:FocalLength35efl': 'FocalLength35efl',
-                'Composite:ImageSize': 'ImageSize',
-                'Composite:ImageWidth': 'ImageWidth',
-                'Composite:ImageHeight': 'ImageHeight',
-                'Composite:Megapixels': 'Megapixels',
-                'Composite:GPSPosition': 'GPSPosition',
-                'Composite:GPSLatitude': 'GPSLatitude',
-                'Composite:GPSLongitude': 'GPSLongitude',
-                'Composite:Duration': 'Duration',
-                'Composite:Rotation': 'Rotation',
-                'Composite:Model2': 'Model2',
-                'Composite:ScaleFactor35efl': 'ScaleFactor35efl',
-                'Composite:CircleOfConfusion': 'CircleOfConfusion',
-                'Composite:FOV': 'FOV',
-                'Composite:DOF': 'DOF',
-                'Composite:HyperfocalDistance': 'HyperfocalDistance',
-                'Composite:LightValue': 'LightValue',
-                'Composite:Lens': 'Lens',
-                'Composite:LensID': 'LensID',
-                'Composite:LensSpec': 'LensSpec',
-                'Composite:AdvancedSceneMode': 'AdvancedSceneMode',
-                'Composite:DateTimeOriginal': 'DateTimeOriginal',
-                'Composite:CreateDate': 'CreateDate',
-                'Composite:ModifyDate': 'ModifyDate',
-                'Composite:DateTime': 'DateTime',
-                'Composite:GPSDateTime': 'GPSDateTime',
-                'Composite:DigitalCreationDateTime': 'DigitalCreationDateTime',
-                'Composite:SubSecCreateDate': 'SubSecCreateDate',
-                'Composite:SubSecDateTimeOriginal': 'SubSecDateTimeOriginal',
-                'Composite:SubSecModifyDate': 'SubSecModifyDate',
-                'Composite:Flash': 'Flash',
-                'Composite:FlashFired': 'FlashFired',
-                'Composite:FlashReturn': 'FlashReturn',
-                'Composite:FlashMode': 'FlashMode',
-                'Composite:FlashFunction': 'FlashFunction',
-                'Composite:FlashRedEyeMode': 'FlashRedEyeMode',
-                'Composite:CFAPattern': 'CFAPattern',
-            }
-            for composite_key, alias_key in composite_aliases.items():
+            for composite_key, alias_key in self.COMPOSITE_ALIASES.items():
                 if composite_key in self.metadata and alias_key not in self.metadata:
                     self.metadata[alias_key] = self.metadata[composite_key]
             
             # Add additional aliases that Standard format shows (some composite tags have multiple aliases)
-            # ApertureValue is an alias for Aperture (same value)
-            if 'Composite:Aperture' in self.metadata and 'ApertureValue' not in self.metadata:
-                self.metadata['ApertureValue'] = self.metadata['Composite:Aperture']
-            # FNumber is an alias for Aperture (same value)
-            if 'Composite:Aperture' in self.metadata and 'FNumber' not in self.metadata:
-                self.metadata['FNumber'] = self.metadata['Composite:Aperture']
-            # ExposureTime is an alias for ShutterSpeed (same value)
-            if 'Composite:ShutterSpeed' in self.metadata and 'ExposureTime' not in self.metadata:
-                self.metadata['ExposureTime'] = self.metadata['Composite:ShutterSpeed']
+            for composite_key, alias_key in self.COMPOSITE_EXTRA_ALIASES:
+                if composite_key in self.metadata and alias_key not in self.metadata:
+                    self.metadata[alias_key] = self.metadata[composite_key]
             # FocalLength from EXIF:FocalLength if Composite:FocalLength doesn't exist
             if 'Composite:FocalLength' not in self.metadata:
                 focal_length = self.metadata.get('EXIF:FocalLength')
@@ -7243,28 +6961,8 @@ class DNExif:
             # Common tags that Standard format shows without prefix: Make, Model, Software, Artist, Copyright, DateTime, etc.
             # Also add reverse aliases: if tag exists without prefix, ensure EXIF: version exists too
             if 'EXIF:Artist' not in self.metadata:
-                artist_candidates = [
-                    'Artist',
-                    'XMP:Creator',
-                    'XMP:Artist',
-                    'XMP-dc:Creator',
-                    'XMP-dc:Artist',
-                    'PDF:Author',
-                    'Document:PDF:Author',
-                    'Audio:MP3:Artist',
-                    'Audio:WAV:Artist',
-                    'Audio:FLAC:Artist',
-                    'Audio:OGG:Artist',
-                    'Audio:OPUS:Artist',
-                    'Audio:WMA:Artist',
-                    'ID3:Artist',
-                    'RIFF:ID3:Artist',
-                    'Video:AVI:Artist',
-                    'Video:Matroska:Artist',
-                    'Video:Artist',
-                ]
                 artist_value = None
-                for key in artist_candidates:
+                for key in self.ARTIST_SOURCE_TAGS:
                     if key in self.metadata and self.metadata[key]:
                         candidate = self.metadata[key]
                         if isinstance(candidate, (list, tuple)):
@@ -7280,65 +6978,7 @@ class DNExif:
                     self.metadata['EXIF:Artist'] = artist_value
                     self.metadata.setdefault('Artist', artist_value)
 
-            common_exif_aliases = {
-                'EXIF:Make': 'Make',
-                'EXIF:Model': 'Model',
-                'EXIF:Software': 'Software',
-                'EXIF:Artist': 'Artist',
-                'EXIF:Copyright': 'Copyright',
-                'EXIF:DateTime': 'DateTime',
-                'EXIF:ModifyDate': 'ModifyDate',
-                'EXIF:CreateDate': 'CreateDate',
-                'EXIF:DateTimeDigitized': 'DateTimeDigitized',
-                'EXIF:ISO': 'ISO',
-                'EXIF:ImageWidth': 'ImageWidth',
-                'EXIF:ImageHeight': 'ImageHeight',
-                'EXIF:ExifImageWidth': 'ExifImageWidth',
-                'EXIF:ExifImageHeight': 'ExifImageHeight',
-                'EXIF:Orientation': 'Orientation',
-                'EXIF:XResolution': 'XResolution',
-                'EXIF:YResolution': 'YResolution',
-                'EXIF:ResolutionUnit': 'ResolutionUnit',
-                'EXIF:YCbCrPositioning': 'YCbCrPositioning',
-                'EXIF:YCbCrSubSampling': 'YCbCrSubSampling',
-                'EXIF:ColorSpace': 'ColorSpace',
-                'EXIF:ExifVersion': 'ExifVersion',
-                'EXIF:FlashpixVersion': 'FlashpixVersion',
-                'EXIF:ComponentsConfiguration': 'ComponentsConfiguration',
-                'EXIF:CompressedBitsPerPixel': 'CompressedBitsPerPixel',
-                'EXIF:BrightnessValue': 'BrightnessValue',
-                'EXIF:ExposureBiasValue': 'ExposureBiasValue',
-                'EXIF:MaxApertureValue': 'MaxApertureValue',
-                'EXIF:SubjectDistance': 'SubjectDistance',
-                'EXIF:MeteringMode': 'MeteringMode',
-                'EXIF:LightSource': 'LightSource',
-                'EXIF:Flash': 'Flash',
-                'EXIF:WhiteBalance': 'WhiteBalance',
-                'EXIF:DigitalZoomRatio': 'DigitalZoomRatio',
-                'EXIF:FocalLengthIn35mmFilm': 'FocalLengthIn35mmFilm',
-                'EXIF:SceneCaptureType': 'SceneCaptureType',
-                'EXIF:GainControl': 'GainControl',
-                'EXIF:Contrast': 'Contrast',
-                'EXIF:Saturation': 'Saturation',
-                'EXIF:Sharpness': 'Sharpness',
-                'EXIF:SubjectDistanceRange': 'SubjectDistanceRange',
-                'EXIF:ImageDescription': 'ImageDescription',
-                'EXIF:UserComment': 'UserComment',
-                'EXIF:ExposureProgram': 'ExposureProgram',
-                'EXIF:ISOSpeedRatings': 'ISOSpeedRatings',
-                'EXIF:ExposureMode': 'ExposureMode',
-                'EXIF:ExposureCompensation': 'ExposureCompensation',
-                'EXIF:ShutterSpeedValue': 'ShutterSpeedValue',
-                'EXIF:ExposureTime': 'ExposureTime',
-                'EXIF:FNumber': 'FNumber',
-                'EXIF:FocalLength': 'FocalLength',
-                'EXIF:ExifImageWidth': 'ExifImageWidth',
-                'EXIF:ExifImageHeight': 'ExifImageHeight',
-                'EXIF:BodySerialNumber': 'BodySerialNumber',
-                'EXIF:CustomRendered': 'CustomRendered',
-                'EXIF:DeviceSettingDescription': 'DeviceSettingDescription',
-            }
-            for exif_key, alias_key in common_exif_aliases.items():
+            for exif_key, alias_key in self.COMMON_EXIF_ALIASES.items():
                 if exif_key in self.metadata and alias_key not in self.metadata:
                     self.metadata[alias_key] = self.metadata[exif_key]
                 # Reverse: if alias exists but EXIF: version doesn't, create it
@@ -7405,31 +7045,7 @@ class DNExif:
             
             # Add aliases for common XMP tags without XMP: prefix (Standard format shows some XMP tags without prefix)
             # Common XMP tags that Standard format shows without prefix: Title, Creator, Description, Subject, Keywords, Rating, etc.
-            common_xmp_aliases = {
-                'XMP:Title': 'Title',
-                'XMP:Creator': 'Creator',
-                'XMP:Description': 'Description',
-                'XMP:Subject': 'Subject',
-                'XMP:Keywords': 'Keywords',
-                'XMP:Rating': 'Rating',
-                'XMP:CreateDate': 'CreateDate',
-                'XMP:ModifyDate': 'ModifyDate',
-                'XMP:MetadataDate': 'MetadataDate',
-                'XMP:Orientation': 'Orientation',
-                'XMP:Format': 'Format',
-                'XMP:InstanceID': 'InstanceID',
-                'XMP:DocumentID': 'DocumentID',
-                'XMP:OriginalDocumentID': 'OriginalDocumentID',
-                'XMP-dc:Title': 'Title',
-                'XMP-dc:Creator': 'Creator',
-                'XMP-dc:Description': 'Description',
-                'XMP-dc:Subject': 'Subject',
-                'XMP-xmp:CreateDate': 'CreateDate',
-                'XMP-xmp:ModifyDate': 'ModifyDate',
-                'XMP-xmp:MetadataDate': 'MetadataDate',
-                'XMP-tiff:Orientation': 'Orientation',
-            }
-            for xmp_key, alias_key in common_xmp_aliases.items():
+            for xmp_key, alias_key in self.COMMON_XMP_ALIASES.items():
                 if xmp_key in self.metadata and alias_key not in self.metadata:
                     self.metadata[alias_key] = self.metadata[xmp_key]
             
@@ -7654,17 +7270,7 @@ class DNExif:
             
             # Add aliases for common MPF tags without MPF: prefix (Standard format shows some MPF tags without prefix)
             # Common MPF tags that Standard format shows without prefix: MPImageType, MPImageFlags, MPImageFormat, etc.
-            common_mpf_aliases = {
-                'MPF:MPImageType': 'MPImageType',
-                'MPF:MPImageFlags': 'MPImageFlags',
-                'MPF:MPImageFormat': 'MPImageFormat',
-                'MPF:MPImageLength': 'MPImageLength',
-                'MPF:MPImageStart': 'MPImageStart',
-                'MPF:Version': 'Version',
-                'MPF:NumberOfImages': 'NumberOfImages',
-                'MPF:MPEntry': 'MPEntry',
-            }
-            for mpf_key, alias_key in common_mpf_aliases.items():
+            for mpf_key, alias_key in self.COMMON_MPF_ALIASES.items():
                 if mpf_key in self.metadata and alias_key not in self.metadata:
                     self.metadata[alias_key] = self.metadata[mpf_key]
             
@@ -7701,34 +7307,7 @@ class DNExif:
             
             # Add aliases for common IPTC tags without IPTC: prefix (Standard format shows some IPTC tags without prefix)
             # Common IPTC tags that Standard format shows without prefix: ObjectName, Keywords, Caption, Headline, Byline, etc.
-            common_iptc_aliases = {
-                'IPTC:ObjectName': 'ObjectName',
-                'IPTC:Keywords': 'Keywords',
-                'IPTC:Caption': 'Caption',
-                'IPTC:Headline': 'Headline',
-                'IPTC:Byline': 'Byline',
-                'IPTC:BylineTitle': 'BylineTitle',
-                'IPTC:Credit': 'Credit',
-                'IPTC:Source': 'Source',
-                'IPTC:Copyright': 'Copyright',
-                'IPTC:Contact': 'Contact',
-                'IPTC:City': 'City',
-                'IPTC:State': 'State',
-                'IPTC:Country': 'Country',
-                'IPTC:DateCreated': 'DateCreated',
-                'IPTC:TimeCreated': 'TimeCreated',
-                'IPTC:DateSent': 'DateSent',
-                'IPTC:TimeSent': 'TimeSent',
-                'IPTC:DigitalCreationDate': 'DigitalCreationDate',
-                'IPTC:DigitalCreationTime': 'DigitalCreationTime',
-                'IPTC:OriginatingProgram': 'OriginatingProgram',
-                'IPTC:ProgramVersion': 'ProgramVersion',
-                'IPTC:ObjectCycle': 'ObjectCycle',
-                'IPTC:BylineTitle': 'BylineTitle',
-                'IPTC:ImageType': 'ImageType',
-                'IPTC:ImageOrientation': 'ImageOrientation',
-            }
-            for iptc_key, alias_key in common_iptc_aliases.items():
+            for iptc_key, alias_key in self.COMMON_IPTC_ALIASES.items():
                 if iptc_key in self.metadata and alias_key not in self.metadata:
                     self.metadata[alias_key] = self.metadata[iptc_key]
             
@@ -8285,6 +7864,7 @@ class DNExif:
         Returns:
             Dictionary containing all metadata tags and values (excluding ignored tags)
         """
+        self._ensure_metadata_loaded()
         result = self.metadata.copy()
         # Include modified tags (overwriting existing values)
         for tag_name, value in self.modified_tags.items():
@@ -8359,6 +7939,7 @@ class DNExif:
             ...     if exif.has_metadata_group('IPTC'):
             ...         print("File contains IPTC metadata")
         """
+        self._ensure_metadata_loaded(group=group)
         group_upper = group.upper()
         group_prefix = f"{group_upper}:"
         
@@ -8390,6 +7971,7 @@ class DNExif:
             ...     iptc_count = exif.get_metadata_count_by_group('IPTC')
             ...     print(f"File contains {iptc_count} IPTC tags")
         """
+        self._ensure_metadata_loaded(group=group)
         group_upper = group.upper()
         group_prefix = f"{group_upper}:"
         
@@ -8426,6 +8008,7 @@ class DNExif:
             ...     print(f"Total tags: {summary['total_tags']}")
             ...     print(f"EXIF tags: {summary['groups'].get('EXIF', 0)}")
         """
+        self._ensure_metadata_loaded()
         summary = {
             'total_tags': len(self.metadata),
             'has_exif': self.has_metadata_group('EXIF'),
@@ -8467,6 +8050,7 @@ class DNExif:
             ...     exif_tags = exif.get_tag_names('EXIF')
             ...     print(f"EXIF tags: {exif_tags}")
         """
+        self._ensure_metadata_loaded(group=group)
         if group is None:
             # Return all tag names
             return list(self.metadata.keys())
@@ -8503,6 +8087,7 @@ class DNExif:
             ...     # Search for tags containing "Date" (case-insensitive)
             ...     date_tags = exif.search_tags('Date')
         """
+        self._ensure_metadata_loaded()
         matching_tags = {}
         pattern_lower = pattern.lower() if not case_sensitive else pattern
         
@@ -8535,6 +8120,7 @@ class DNExif:
             ...     # Get all tags except IPTC
             ...     no_iptc = exif.filter_metadata_by_groups(['IPTC'], include=False)
         """
+        self._ensure_metadata_loaded()
         filtered = {}
         
         for tag_name, value in self.metadata.items():
@@ -8569,6 +8155,7 @@ class DNExif:
             ...         make = exif.get_tag('EXIF:Make')
             ...         print(f"Camera: {make}")
         """
+        self._ensure_metadata_loaded(tag_name)
         # Check modified tags first (including None values which indicate deletion)
         if tag_name in self.modified_tags:
             # If value is None, tag is marked for deletion, so it doesn't exist
@@ -9686,6 +9273,7 @@ class DNExif:
         Returns:
             Tag value or default if not found
         """
+        self._ensure_metadata_loaded(tag_name)
         # Check modified tags first
         if tag_name in self.modified_tags:
             return self.modified_tags[tag_name]
@@ -9695,6 +9283,11 @@ class DNExif:
             if value is not None:
                 return value
 
+        if tag_name == 'Composite:ImageDataTreeHash':
+            # Calculated on request only (it reads all of the image data)
+            tree_hash = self.calculate_image_data_tree_hash()
+            return tree_hash if tree_hash is not None else default
+
         if ':' in tag_name:
             namespace, name = tag_name.split(':', 1)
             if namespace == 'EXIF':
@@ -9728,6 +9321,7 @@ class DNExif:
             ...     print(f"Orientation: {orientation}")
             ...     # Returns: "Orientation: Normal" (formatted string)
         """
+        self._ensure_metadata_loaded(tag_name)
         from dnexif.value_formatter import format_exif_value
         
         # Get raw tag value
@@ -10146,7 +9740,7 @@ class DNExif:
                 'supported': True
             },
             'ImageHashType': {
-                'description': 'Hash algorithm for image data (MD5, SHA1, SHA256)',
+                'description': 'Hash algorithm(s) for image data (MD5, SHA1, SHA256, ...; comma-separated for several)',
                 'type': 'str',
                 'default': 'MD5',
                 'supported': True
@@ -11166,13 +10760,13 @@ class DNExif:
             
             try:
                 # Build XMP packet
+                from dnexif.xmp_writer import XMPWriter
                 xmp_writer = XMPWriter()
                 xmp_packet = xmp_writer.build_xmp_packet(xmp_metadata)
                 
                 if xmp_packet:
                     # Write XMP sidecar file
-                    with open(sidecar_path, 'wb') as f:
-                        f.write(xmp_packet)
+                    atomic_write(sidecar_path, xmp_packet)
                     
                     # Add sidecar file info to metadata
                     self.metadata['Sidecar:XMP:SidecarFile'] = str(sidecar_path)
@@ -11204,6 +10798,7 @@ class DNExif:
                 if 'EXIF:ExifVersion' in metadata:
                     exif_version = str(metadata['EXIF:ExifVersion'])
                 
+                from dnexif.exif_writer import EXIFWriter
                 exif_writer = EXIFWriter(endian=endian, exif_version=exif_version)
                 
                 # Build EXIF segment (contains TIFF structure)
@@ -11221,8 +10816,7 @@ class DNExif:
                             tiff_data = exif_segment[exif_start + 6:]
                             
                             # Write EXIF sidecar file (as TIFF)
-                            with open(sidecar_path, 'wb') as f:
-                                f.write(tiff_data)
+                            atomic_write(sidecar_path, tiff_data)
                             
                             # Add sidecar file info to metadata
                             self.metadata['Sidecar:EXIF:SidecarFile'] = str(sidecar_path)
@@ -11244,13 +10838,13 @@ class DNExif:
             
             try:
                 # Build IPTC data
+                from dnexif.iptc_writer import IPTCWriter
                 iptc_writer = IPTCWriter()
                 iptc_data = iptc_writer.build_iptc_data(iptc_metadata)
                 
                 if iptc_data:
                     # Write IPTC sidecar file
-                    with open(sidecar_path, 'wb') as f:
-                        f.write(iptc_data)
+                    atomic_write(sidecar_path, iptc_data)
                     
                     # Add sidecar file info to metadata
                     self.metadata['Sidecar:IPTC:SidecarFile'] = str(sidecar_path)
@@ -11295,6 +10889,9 @@ class DNExif:
         if not self.modified_tags:
             return  # No changes to save
         
+        # Writers merge with the existing metadata, so load any deferred blocks
+        self._ensure_metadata_loaded()
+        
         # Apply SavePath option if set
         save_path_option = self.get_option('SavePath', '')
         if save_path_option and not output_path:
@@ -11396,6 +10993,12 @@ class DNExif:
         # Write sidecar files if needed (for formats that don't support embedded metadata)
         self._write_sidecar_files(merged_metadata, output)
         
+        # The file on disk may have changed - drop any buffered contents
+        self._file_view.invalidate()
+        if self.cache is not None:
+            self.cache.invalidate(self.file_path)
+            self.cache.invalidate(output)
+        
         # Update internal state
         self.metadata = merged_metadata
         self.modified_tags.clear()
@@ -11404,16 +11007,15 @@ class DNExif:
         """
         Save metadata to a JPEG file.
         
+        All new metadata segments are built first and then written in a
+        single pass over the file.
+        
         Args:
             metadata: Complete metadata dictionary
             output_path: Output file path
         """
-        # Read original file
-        with open(self.file_path, 'rb') as f:
-            file_data = f.read()
-        
-        jpeg_modifier = JPEGModifier(file_data)
-        modified_data = file_data
+        # Segment kind -> new segment bytes (empty bytes remove the segment)
+        replacements = {}
         
         # Handle EXIF tags
         exif_metadata = {
@@ -11435,31 +11037,18 @@ class DNExif:
             elif 'IFD0:ExifVersion' in metadata:
                 exif_version = str(metadata['IFD0:ExifVersion'])
             
+            from dnexif.exif_writer import EXIFWriter
             exif_writer = EXIFWriter(endian=endian, exif_version=exif_version)
-            new_exif_segment = exif_writer.build_exif_segment(exif_metadata)
-            
-            # Modify JPEG file
-            if new_exif_segment:
-                if any(marker == JPEGModifier.APP1 for marker, _, _ in jpeg_modifier.segments):
-                    modified_data = jpeg_modifier.replace_app1_segment(new_exif_segment)
-                else:
-                    modified_data = jpeg_modifier.add_app1_segment(new_exif_segment)
-                jpeg_modifier = JPEGModifier(modified_data)  # Re-parse after modification
-            else:
-                # No EXIF data, remove APP1 if it exists
-                modified_data = jpeg_modifier.remove_app1_segment()
-                jpeg_modifier = JPEGModifier(modified_data)
+            # An empty segment removes the existing EXIF APP1
+            replacements[JPEGSegmentRewriter.EXIF] = exif_writer.build_exif_segment(exif_metadata) or b''
         else:
-            # Check if we need to remove EXIF
-            if any(marker == JPEGModifier.APP1 for marker, _, _ in jpeg_modifier.segments):
-                # Check if EXIF should be removed (all EXIF tags deleted)
-                has_exif_tags = any(
-                    k.startswith('EXIF:') or k.startswith('IFD0:') or k.startswith('GPS:')
-                    for k in self.metadata.keys()
-                )
-                if not has_exif_tags:
-                    modified_data = jpeg_modifier.remove_app1_segment()
-                    jpeg_modifier = JPEGModifier(modified_data)
+            # Check if EXIF should be removed (all EXIF tags deleted)
+            has_exif_tags = any(
+                k.startswith('EXIF:') or k.startswith('IFD0:') or k.startswith('GPS:')
+                for k in self.metadata.keys()
+            )
+            if not has_exif_tags:
+                replacements[JPEGSegmentRewriter.EXIF] = b''
         
         # Handle IPTC tags
         iptc_metadata = {
@@ -11469,23 +11058,18 @@ class DNExif:
         
         if iptc_metadata:
             # Build IPTC segment
+            from dnexif.iptc_writer import IPTCWriter
             iptc_writer = IPTCWriter()
             iptc_data = iptc_writer.build_iptc_data(iptc_metadata)
             if iptc_data:
                 new_app13_segment = iptc_writer.build_photoshop_app13_segment(iptc_data)
                 if new_app13_segment:
-                    if any(marker == JPEGModifier.APP13 for marker, _, _ in jpeg_modifier.segments):
-                        modified_data = jpeg_modifier.replace_app13_segment(new_app13_segment)
-                    else:
-                        modified_data = jpeg_modifier.add_app13_segment(new_app13_segment)
-                    jpeg_modifier = JPEGModifier(modified_data)
+                    replacements[JPEGSegmentRewriter.PHOTOSHOP] = new_app13_segment
         else:
-            # Check if IPTC should be removed
+            # Remove APP13 if no IPTC tags remain
             has_iptc_tags = any(k.startswith('IPTC:') for k in self.metadata.keys())
-            if not has_iptc_tags and any(marker == JPEGModifier.APP13 for marker, _, _ in jpeg_modifier.segments):
-                # Remove APP13 if no IPTC tags remain
-                modified_data = jpeg_modifier.replace_app13_segment(b'')
-                jpeg_modifier = JPEGModifier(modified_data)
+            if not has_iptc_tags:
+                replacements[JPEGSegmentRewriter.PHOTOSHOP] = b''
         
         # Handle XMP tags
         xmp_metadata = {
@@ -11494,66 +11078,45 @@ class DNExif:
         }
         
         if xmp_metadata:
-            # Build XMP segment
+            # Build XMP segment (an APP1 separate from the EXIF APP1)
+            from dnexif.xmp_writer import XMPWriter
             xmp_writer = XMPWriter()
             xmp_packet = xmp_writer.build_xmp_packet(xmp_metadata)
             if xmp_packet:
                 new_xmp_segment = xmp_writer.build_app1_xmp_segment(xmp_packet)
                 if new_xmp_segment:
-                    # XMP is in APP1 (separate from EXIF APP1)
-                    # Use is_xmp=True to distinguish XMP APP1 from EXIF APP1
-                    modified_data = jpeg_modifier.add_app1_segment(new_xmp_segment, is_xmp=True)
-                    jpeg_modifier = JPEGModifier(modified_data)
+                    replacements[JPEGSegmentRewriter.XMP] = new_xmp_segment
         
         # Handle additional metadata standards (JFIF, ICC, Photoshop IRB, AFCP)
+        from dnexif.metadata_standards_writer import MetadataStandardsWriter
         standards_writer = MetadataStandardsWriter()
-
-        def _apply_standards_writer(write_func, *writer_args):
-            """
-            Run a standards writer using the current in-memory JPEG data as input.
-            """
-            nonlocal modified_data, jpeg_modifier
-
-            with tempfile.NamedTemporaryFile(delete=False, suffix=output_path.suffix) as temp_input:
-                temp_input.write(modified_data)
-                temp_input_path = Path(temp_input.name)
-
-            temp_output_path = output_path.parent / f"{output_path.stem}_temp{output_path.suffix}"
-            try:
-                write_func(str(temp_input_path), *writer_args, str(temp_output_path))
-                if temp_output_path.exists():
-                    with open(temp_output_path, 'rb') as f:
-                        modified_data = f.read()
-                    temp_output_path.unlink()
-                    jpeg_modifier = JPEGModifier(modified_data)
-            finally:
-                if temp_input_path.exists():
-                    temp_input_path.unlink()
-        
-        # Check for JFIF metadata
-        jfif_metadata = {k: v for k, v in metadata.items() if k.startswith('JFIF:')}
-        if jfif_metadata:
-            _apply_standards_writer(standards_writer.write_jfif, jfif_metadata)
+        
+        # Check for JFIF metadata. Parsed metadata carries JFIF: tags even for
+        # files without a JFIF APP0 (e.g. from an embedded thumbnail), so the
+        # segment is only written when JFIF tags were set by the caller
+        if any(k.startswith('JFIF:') for k in self.modified_tags):
+            jfif_segment = standards_writer.build_jfif_segment(metadata)
+            if jfif_segment:
+                replacements[JPEGSegmentRewriter.JFIF] = jfif_segment
         
         # Check for ICC profile
         if 'ICC:ProfileData' in metadata:
             icc_data = metadata['ICC:ProfileData']
-            if isinstance(icc_data, bytes):
-                _apply_standards_writer(standards_writer.write_icc_profile, icc_data)
+            if isinstance(icc_data, bytes) and icc_data:
+                replacements[JPEGSegmentRewriter.ICC] = standards_writer.build_icc_segments(icc_data)
         
-        # Check for Photoshop IRB metadata
+        # Check for Photoshop IRB metadata (shares the APP13 segment with IPTC)
         ps_irb_metadata = {k: v for k, v in metadata.items() if k.startswith('PS:')}
         if ps_irb_metadata:
-            _apply_standards_writer(standards_writer.write_photoshop_irb, ps_irb_metadata)
+            replacements[JPEGSegmentRewriter.PHOTOSHOP] = standards_writer.build_photoshop_irb_segment(ps_irb_metadata)
         
         # Check for AFCP metadata
-        afcp_metadata = {k: v for k, v in metadata.items() if k.startswith('AFCP:')}
-        if afcp_metadata:
-            _apply_standards_writer(standards_writer.write_afcp, afcp_metadata)
+        afcp_segment = standards_writer.build_afcp_segment(metadata)
+        if afcp_segment:
+            replacements[JPEGSegmentRewriter.AFCP] = afcp_segment
         
         # Write modified file
-        with open(output_path, 'wb') as f:
-            f.write(modified_data)
+        JPEGSegmentRewriter.rewrite_file(self.file_path, output_path, replacements)
     
     def _save_png(self, metadata: Dict[str, Any], output_path: Path) -> None:
         """
@@ -11563,13 +11126,10 @@ class DNExif:
             metadata: Complete metadata dictionary
             output_path: Output file path
         """
-        # Read original file
-        with open(self.file_path, 'rb') as f:
-            file_data = f.read()
-        
-        # Use PNG writer
+        # Use PNG writer; image chunks are copied from the original file
+        from dnexif.png_writer import PNGWriter
         png_writer = PNGWriter()
-        png_writer.write_png(file_data, metadata, str(output_path))
+        png_writer.write_png_file(str(self.file_path), metadata, str(output_path))
     
     def _save_webp(self, metadata: Dict[str, Any], output_path: Path) -> None:
         """
@@ -11579,13 +11139,10 @@ class DNExif:
             metadata: Complete metadata dictionary
             output_path: Output file path
         """
-        # Read original file
-        with open(self.file_path, 'rb') as f:
-            file_data = f.read()
-        
-        # Use WebP writer
+        # Use WebP writer; image chunks are copied from the original file
+        from dnexif.webp_writer import WebPWriter
         webp_writer = WebPWriter()
-        webp_writer.write_webp(file_data, metadata, str(output_path))
+        webp_writer.write_webp_file(str(self.file_path), metadata, str(output_path))
     
     def _save_gif(self, metadata: Dict[str, Any], output_path: Path) -> None:
         """
@@ -11595,13 +11152,10 @@ class DNExif:
             metadata: Complete metadata dictionary
             output_path: Output file path
         """
-        # Read original file
-        with open(self.file_path, 'rb') as f:
-            file_data = f.read()
-        
-        # Use GIF writer
+        # Use GIF writer; image data is copied from the original file
+        from dnexif.gif_writer import GIFWriter
         gif_writer = GIFWriter()
-        gif_writer.write_gif(file_data, metadata, str(output_path))
+        gif_writer.write_gif_file(str(self.file_path), metadata, str(output_path))
     
     def _save_raw(self, metadata: Dict[str, Any], output_path: Path) -> None:
         """
@@ -11612,6 +11166,7 @@ class DNExif:
             output_path: Output file path
         """
         # Use RAW writer
+        from dnexif.raw_writer import RAWWriter
         raw_writer = RAWWriter()
         raw_writer.write_raw(str(self.file_path), metadata, str(output_path))
     
@@ -11624,6 +11179,7 @@ class DNExif:
             output_path: Output file path
         """
         # Use video writer
+        from dnexif.video_writer import VideoWriter
         video_writer = VideoWriter()
         # Pass QuickTimePad option to video writer
         quicktime_pad = self.get_option('QuickTimePad', 0)
@@ -11642,6 +11198,7 @@ class DNExif:
             output_path: Output file path
         """
         # Use audio writer
+        from dnexif.audio_writer import AudioWriter
         audio_writer = AudioWriter()
         audio_writer.write_audio(str(self.file_path), metadata, str(output_path))
     
@@ -11653,6 +11210,7 @@ class DNExif:
             metadata: Complete metadata dictionary
             output_path: Output file path
         """
+        from dnexif.pdf_writer import PDFWriter
         writer = PDFWriter()
         writer.write_pdf(str(self.file_path), metadata, str(output_path))
     
@@ -11675,6 +11233,7 @@ class DNExif:
         if not isinstance(exif_version, str):
             exif_version = str(exif_version)
         
+        from dnexif.heic_writer import HEICWriter
         writer = HEICWriter(exif_version=exif_version)
         writer.write_heic(str(self.file_path), metadata, str(output_path))
     
@@ -11686,6 +11245,7 @@ class DNExif:
             metadata: Complete metadata dictionary
             output_path: Output file path
         """
+        from dnexif.bmp_writer import BMPWriter
         writer = BMPWriter()
         writer.write_bmp(str(self.file_path), metadata, str(output_path))
     
@@ -11697,6 +11257,7 @@ class DNExif:
             metadata: Complete metadata dictionary
             output_path: Output file path
         """
+        from dnexif.svg_writer import SVGWriter
         writer = SVGWriter()
         writer.write_svg(str(self.file_path), metadata, str(output_path))
     
@@ -11707,6 +11268,7 @@ class DNExif:
         with open(self.file_path, 'rb') as f:
             file_data = f.read()
         
+        from dnexif.tga_writer import TGAWriter
         writer = TGAWriter()
         writer.write_tga(file_data, metadata, str(output_path))
     
@@ -11723,6 +11285,7 @@ class DNExif:
         if hasattr(self, '_exif_parser') and self._exif_parser:
             exif_version = getattr(self._exif_parser, 'exif_version', '0300')
         
+        from dnexif.psd_writer import PSDWriter
         writer = PSDWriter(exif_version=exif_version)
         writer.write_psd(str(self.file_path), metadata, str(output_path))
     
@@ -11749,15 +11312,15 @@ class DNExif:
             metadata: Complete metadata dictionary
             output_path: Output file path
         """
-        # Read original file
+        # Read the byte order; the TIFF writer reads the rest on demand
         with open(self.file_path, 'rb') as f:
-            file_data = f.read()
+            byte_order = f.read(2)
         
         # Determine endianness
         endian = '<'
-        if file_data[:2] == b'MM':
+        if byte_order == b'MM':
             endian = '>'
-        elif file_data[:2] != b'II':
+        elif byte_order != b'II':
             raise MetadataWriteError(
                 f"Invalid TIFF file '{self.file_path}': Missing TIFF header signature. "
                 "Expected 'II' (little-endian) or 'MM' (big-endian) at offset 0."
@@ -11770,11 +11333,13 @@ class DNExif:
         elif 'IFD0:ExifVersion' in metadata:
             exif_version = str(metadata['IFD0:ExifVersion'])
         
-        # Use TIFF writer
+        # Use TIFF writer; strips and tiles are copied from the original file
+        from dnexif.exif_writer import EXIFWriter
+        from dnexif.tiff_writer import TIFFWriter
         tiff_writer = TIFFWriter(endian=endian)
         # Update EXIFWriter in TIFFWriter to use correct EXIF version
         tiff_writer.exif_writer = EXIFWriter(endian=endian, exif_version=exif_version)
-        tiff_writer.write_tiff(file_data, metadata, str(output_path))
+        tiff_writer.write_tiff_file(str(self.file_path), metadata, str(output_path))
     
     def _save_dicom(self, metadata: Dict[str, Any], output_path: Path) -> None:
         """
@@ -12190,6 +11755,7 @@ class DNExif:
             >>> exif.set_option('BlockExtract', True)
             >>> blocks = exif.extract_binary_blocks()
         """
+        self._ensure_metadata_loaded()
         block_extract = self.get_option('BlockExtract', False)
         
         if not block_extract:
@@ -12288,6 +11854,7 @@ class DNExif:
             >>> exif.set_option('ExtractEmbedded', True)
             >>> embedded = exif.extract_embedded()
         """
+        self._ensure_metadata_loaded()
         extract_embedded = self.get_option('ExtractEmbedded', False)
         
         if not extract_embedded:
@@ -0,0 +1,431 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Bulk DICOM study/series indexer
+
+This module indexes the DICOM files of a directory tree (or of a DICOMDIR)
+by study and series. Headers are read with DICOMParser directly in
+stop_before_pixels mode, so each file costs a few kilobytes of reads rather
+than a full DNExif instantiation that reads the pixel data, and files are
+parsed in parallel across processes.
+
+The index is columnar: for each series it keeps the SOP Instance UIDs and
+paths of its instances, and one column per requested keyword. Elements with
+the same value in every instance of a series (PatientID, Modality, Rows,
+...) are stored once per series instead of once per slice.
+
+Example:
+    >>> index = build_dicom_index('/data/pacs', ['Modality', 'SliceLocation'], workers=8)
+    >>> for series in index.series.values():
+    ...     print(series.series_instance_uid, len(series), series.constants.get('Modality'))
+
+Copyright 2025 DNAi inc.
+"""
+
+import struct
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from dnexif.dicom_data_elements import get_dicom_element_by_keyword
+from dnexif.dicom_parser import DICOMParser
+from dnexif.exceptions import MetadataReadError
+from dnexif.file_walker import walk_files
+from dnexif.metadata_utils import _run_batch
+
+
+# UIDs every instance is indexed by
+STUDY_UID_KEYWORD = 'StudyInstanceUID'
+SERIES_UID_KEYWORD = 'SeriesInstanceUID'
+SOP_UID_KEYWORD = 'SOPInstanceUID'
+
+# Keywords indexed when none are given
+DEFAULT_INDEX_KEYWORDS = (
+    'PatientID', 'StudyDate', 'Modality', 'SeriesNumber', 'InstanceNumber',
+    'Rows', 'Columns', 'SliceLocation', 'ImagePositionPatient',
+)
+
+# Media Storage SOP Class UID of a DICOMDIR (Media Storage Directory Storage)
+DICOMDIR_SOP_CLASS_UID = '1.2.840.10008.1.3.10'
+
+# Bytes read to find the Media Storage SOP Class UID in the File Meta Information
+_FILE_META_READ_SIZE = 1024
+
+# Tag of ReferencedFileID (0004,1500), little-endian as in every DICOMDIR
+_REFERENCED_FILE_ID_TAG = b'\x04\x00\x00\x15'
+
+
+@dataclass
+class DICOMSeriesIndex:
+    """
+    Index of the instances of one series.
+
+    A keyword is in constants while all instances have the same value for
+    it; as soon as an instance differs it moves to columns, which hold one
+    value per instance in the order of sop_instance_uids and paths.
+    """
+    study_instance_uid: str
+    series_instance_uid: str
+    sop_instance_uids: List[str] = field(default_factory=list)
+    paths: List[str] = field(default_factory=list)
+    constants: Dict[str, Any] = field(default_factory=dict)
+    columns: Dict[str, List[Any]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.sop_instance_uids)
+
+    def add(self, path: str, sop_instance_uid: str, values: Dict[str, Any]) -> None:
+        """
+        Add an instance to the series.
+
+        Args:
+            path: Path of the instance file
+            sop_instance_uid: SOP Instance UID of the instance
+            values: Values of the indexed keywords (missing ones are None)
+        """
+        count = len(self.sop_instance_uids)
+        for keyword, value in values.items():
+            column = self.columns.get(keyword)
+            if column is not None:
+                column.append(value)
+            elif count == 0:
+                self.constants[keyword] = value
+            elif self.constants.get(keyword) != value:
+                # First instance that differs: expand to a column
+                self.columns[keyword] = [self.constants.pop(keyword, None)] * count + [value]
+        self.sop_instance_uids.append(sop_instance_uid)
+        self.paths.append(path)
+
+    def get(self, keyword: str, position: int) -> Any:
+        """
+        Get the value of a keyword for one instance.
+
+        Args:
+            keyword: Indexed keyword
+            position: Position of the instance in the series
+
+        Returns:
+            Value of the keyword (None if it is not indexed or not present)
+        """
+        column = self.columns.get(keyword)
+        if column is not None:
+            return column[position]
+        return self.constants.get(keyword)
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield one dictionary per instance with all of its indexed values.
+
+        Yields:
+            Dictionaries with the UIDs, 'Path' and the indexed keywords
+        """
+        for position, sop_instance_uid in enumerate(self.sop_instance_uids):
+            row = {
+                STUDY_UID_KEYWORD: self.study_instance_uid,
+                SERIES_UID_KEYWORD: self.series_instance_uid,
+                SOP_UID_KEYWORD: sop_instance_uid,
+                'Path': self.paths[position],
+            }
+            row.update(self.constants)
+            for keyword, column in self.columns.items():
+                row[keyword] = column[position]
+            yield row
+
+
+@dataclass
+class DICOMIndex:
+    """Index of DICOM instances, grouped by series (see build_dicom_index)."""
+    keywords: List[str]
+    series: Dict[str, DICOMSeriesIndex] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return sum(len(series) for series in self.series.values())
+
+    def add(self, path: str, values: Dict[str, Any]) -> None:
+        """
+        Add an instance to the index.
+
+        Args:
+            path: Path of the instance file
+            values: Values of the UIDs and indexed keywords of the instance
+        """
+        values = dict(values)
+        study_uid = str(values.pop(STUDY_UID_KEYWORD, None) or '')
+        series_uid = str(values.pop(SERIES_UID_KEYWORD, None) or '')
+        sop_uid = str(values.pop(SOP_UID_KEYWORD, None) or '')
+        series = self.series.get(series_uid)
+        if series is None:
+            series = self.series[series_uid] = DICOMSeriesIndex(study_uid, series_uid)
+        series.add(path, sop_uid, values)
+
+    def studies(self) -> Dict[str, List[str]]:
+        """
+        Group the indexed series by study.
+
+        Returns:
+            Dictionary mapping Study Instance UIDs to their Series Instance UIDs
+        """
+        studies: Dict[str, List[str]] = {}
+        for series in self.series.values():
+            studies.setdefault(series.study_instance_uid, []).append(series.series_instance_uid)
+        return studies
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield one dictionary per indexed instance, series by series.
+
+        Yields:
+            Dictionaries with the UIDs, 'Path' and the indexed keywords
+        """
+        for series in self.series.values():
+            yield from series.rows()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the index to plain dictionaries and lists (e.g. for JSON).
+
+        Returns:
+            Dictionary with 'keywords', 'series' (one entry per series, in
+            columnar form) and 'errors'
+        """
+        return {
+            'keywords': list(self.keywords),
+            'series': [
+                {
+                    STUDY_UID_KEYWORD: series.study_instance_uid,
+                    SERIES_UID_KEYWORD: series.series_instance_uid,
+                    SOP_UID_KEYWORD: list(series.sop_instance_uids),
+                    'Path': list(series.paths),
+                    'constants': dict(series.constants),
+                    'columns': {keyword: list(column) for keyword, column in series.columns.items()},
+                }
+                for series in self.series.values()
+            ],
+            'errors': dict(self.errors),
+        }
+
+
+def read_dicomdir(dicomdir_path: Union[str, Path]) -> List[Path]:
+    """
+    List the files referenced by a DICOMDIR.
+
+    The ReferencedFileID elements of the directory records are read;
+    their path components are relative to the directory of the DICOMDIR.
+
+    Args:
+        dicomdir_path: Path to the DICOMDIR file
+
+    Returns:
+        Paths of the referenced files, in record order without duplicates
+    """
+    dicomdir_path = Path(dicomdir_path)
+    with open(dicomdir_path, 'rb') as f:
+        data = f.read()
+
+    files: Dict[Path, None] = {}
+    offset = data.find(_REFERENCED_FILE_ID_TAG)
+    while offset != -1:
+        if data[offset + 4:offset + 6] == b'CS':
+            # Explicit VR: 16-bit length
+            length = int.from_bytes(data[offset + 6:offset + 8], 'little')
+            value_start = offset + 8
+        else:
+            # Implicit VR: 32-bit length
+            length = int.from_bytes(data[offset + 4:offset + 8], 'little')
+            value_start = offset + 8
+        value = data[value_start:value_start + length].decode('ascii', errors='ignore')
+        components = [part for part in value.strip('\x00 ').split('\\') if part]
+        if components:
+            files[dicomdir_path.parent.joinpath(*components)] = None
+        offset = data.find(_REFERENCED_FILE_ID_TAG, max(value_start + length, offset + 4))
+    return list(files)
+
+
+def is_dicomdir(path: Union[str, Path]) -> bool:
+    """
+    Check whether a file is a DICOMDIR.
+
+    A file is a DICOMDIR if it is named DICOMDIR or if the Media Storage
+    SOP Class UID of its File Meta Information is that of a DICOMDIR.
+
+    Args:
+        path: File path
+
+    Returns:
+        True if the file is a DICOMDIR
+    """
+    path = Path(path)
+    if path.name.upper() == 'DICOMDIR':
+        return True
+    try:
+        with open(path, 'rb') as f:
+            data = f.read(_FILE_META_READ_SIZE)
+    except OSError:
+        return False
+    offset = DICOMParser.DICOM_PREAMBLE_LENGTH
+    if data[offset:offset + 4] != DICOMParser.DICOM_SIGNATURE:
+        return False
+    offset += 4
+    # File Meta Information is always explicit VR little-endian
+    while offset + 8 <= len(data):
+        group, element = struct.unpack('<HH', data[offset:offset + 4])
+        if group != 0x0002 or element > 0x0002:
+            break
+        vr = data[offset + 4:offset + 6]
+        if vr in (b'OB', b'OW', b'OF', b'SQ', b'UT', b'UN'):
+            if offset + 12 > len(data):
+                break
+            length = struct.unpack('<I', data[offset + 8:offset + 12])[0]
+            value_start = offset + 12
+        else:
+            length = struct.unpack('<H', data[offset + 6:offset + 8])[0]
+            value_start = offset + 8
+        if element == 0x0002:
+            value = data[value_start:value_start + length].decode('ascii', errors='ignore')
+            return value.strip('\x00 ') == DICOMDIR_SOP_CLASS_UID
+        offset = value_start + length
+    return False
+
+
+def iter_dicom_files(source: Union[str, Path], recursive: bool = True) -> Iterator[Path]:
+    """
+    List the candidate DICOM files of a directory tree or DICOMDIR.
+
+    Files in a directory are listed whatever their extension (DICOM files
+    often have none); DICOMDIR files themselves are left out. A file source
+    that is not a DICOMDIR is listed on its own.
+
+    Args:
+        source: Directory to walk, path to a DICOMDIR, or path to a single file
+        recursive: If False, only the files directly in the directory are listed
+
+    Yields:
+        File paths
+    """
+    source = Path(source)
+    if source.is_file():
+        if is_dicomdir(source):
+            yield from read_dicomdir(source)
+        else:
+            yield source
+        return
+    yield from walk_files(
+        source,
+        include_file=lambda name: name.upper() != 'DICOMDIR',
+        recursive=recursive
+    )
+
+
+class _HeaderReader:
+    """Picklable callable reading the indexed values of one DICOM file."""
+
+    def __init__(self, tags: Dict[str, Tuple[int, int]]):
+        """
+        Initialize the reader.
+
+        Args:
+            tags: (group, element) tags by keyword
+        """
+        self.tags = tags
+
+    def __call__(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Read the header of one file.
+
+        Args:
+            path: File path
+
+        Returns:
+            Values of the indexed keywords, or None for files that are not
+            DICOM files
+
+        Raises:
+            MetadataReadError: If the file cannot be parsed or has no SOP
+                               Instance UID
+        """
+        with open(path, 'rb') as f:
+            preamble = f.read(DICOMParser.DICOM_PREAMBLE_LENGTH + 4)
+        if preamble[DICOMParser.DICOM_PREAMBLE_LENGTH:] != DICOMParser.DICOM_SIGNATURE:
+            return None
+        parser = DICOMParser(file_path=path, stop_before_pixels=True)
+        metadata = parser.parse()
+        if 'DICOM:ParseError' in metadata:
+            raise MetadataReadError(metadata['DICOM:ParseError'])
+        values = {
+            keyword: metadata.get(f"DICOM:{parser.get_tag_name(*tag)}")
+            for keyword, tag in self.tags.items()
+        }
+        if not values[SOP_UID_KEYWORD]:
+            raise MetadataReadError("Not a DICOM instance: no SOP Instance UID")
+        return values
+
+
+def build_dicom_index(
+    source: Union[str, Path],
+    keywords: Sequence[str] = DEFAULT_INDEX_KEYWORDS,
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    use_threads: bool = False,
+    recursive: bool = True,
+    error_handler: Optional[Callable[[Path, Exception], None]] = None
+) -> DICOMIndex:
+    """
+    Index the DICOM files of a directory tree or DICOMDIR by study and series.
+
+    Only the headers are read: parsing stops at the pixel data. Files
+    without the DICM signature after the 128-byte preamble are skipped;
+    files that cannot be parsed or have no SOP Instance UID are errors.
+
+    Args:
+        source: Directory to walk, path to a DICOMDIR, or path to a single file
+        keywords: DICOM keywords to index besides the study, series and SOP
+                  Instance UIDs (e.g. 'Modality', 'SliceLocation')
+        workers: Number of worker processes (None or 1 = serial)
+        executor: Optional existing concurrent.futures Executor to use
+        use_threads: If True, use threads instead of processes when creating a pool
+        recursive: If False, only index the files directly in the directory
+        error_handler: Optional callback for files that fail to parse
+                       (path, exception); without one, errors are recorded
+                       in the index's errors
+
+    Returns:
+        DICOMIndex of the files
+
+    Raises:
+        ValueError: If a keyword is not a DICOM keyword
+    """
+    tags: Dict[str, Tuple[int, int]] = {}
+    for keyword in (STUDY_UID_KEYWORD, SERIES_UID_KEYWORD, SOP_UID_KEYWORD, *keywords):
+        element = get_dicom_element_by_keyword(keyword)
+        if element is None:
+            raise ValueError(f"Unknown DICOM keyword: {keyword}")
+        tags[keyword] = (element[0], element[1])
+
+    index = DICOMIndex([keyword for keyword in tags if keyword not in
+                        (STUDY_UID_KEYWORD, SERIES_UID_KEYWORD, SOP_UID_KEYWORD)])
+    # Paths are handed to the workers as the walk finds them
+    paths = (str(path) for path in iter_dicom_files(source, recursive))
+    results = _run_batch(
+        _HeaderReader(tags),
+        paths,
+        workers=workers,
+        executor=executor,
+        use_threads=use_threads,
+        ordered=False
+    )
+    for path, values, error in results:
+        if error is not None:
+            if error_handler:
+                error_handler(Path(path), error)
+            else:
+                index.errors[path] = str(error)
+        elif values is not None:
+            index.add(path, values)
+
+    return index
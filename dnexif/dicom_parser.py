@@ -10,6 +10,10 @@ DICOM (Digital Imaging and Communications in Medicine) metadata parser
 This module handles reading metadata from DICOM files.
 DICOM is a standard for medical imaging and related information.
 
+With stop_before_pixels the file is read on demand and parsing stops at the
+PixelData element, whose position is recorded so the pixel data (often
+hundreds of MB) can be read later only if it is needed.
+
 Copyright 2025 DNAi inc.
 """
 
@@ -21,6 +25,7 @@ from typing import Dict, Any, Optional
 from pathlib import Path
 
 from dnexif.exceptions import MetadataReadError
+from dnexif.file_view import RangedFile, close_buffer, map_file
 from dnexif.dicom_data_elements import (
     DICOM_DATA_ELEMENTS,
     get_dicom_element_info,
@@ -638,14 +643,28 @@ class DICOMParser:
     DICOM_SIGNATURE = b'DICM'
     DICOM_PREAMBLE_LENGTH = 128
     
-    def __init__(self, file_path: Optional[str] = None, file_data: Optional[bytes] = None):
+    # PixelData element (7FE0,0010)
+    PIXEL_DATA_TAG = (0x7FE0, 0x0010)
+    
+    def __init__(self, file_path: Optional[str] = None, file_data: Optional[bytes] = None,
+                 use_mmap: bool = False, stop_before_pixels: bool = False):
         """
         Initialize DICOM parser.
         
         Args:
             file_path: Path to DICOM file
             file_data: DICOM file data bytes
+            use_mmap: If True, memory-map file_path instead of reading it into memory
+            stop_before_pixels: If True, read the file on demand and stop parsing at
+                                the PixelData element, recording its offset and length
+                                (see read_pixel_data()); elements after it are not read
         """
+        self.use_mmap = use_mmap
+        self.stop_before_pixels = stop_before_pixels
+        # Location of the PixelData value, set by parse() with stop_before_pixels
+        # (length is None for encapsulated pixel data of undefined length)
+        self.pixel_data_offset: Optional[int] = None
+        self.pixel_data_length: Optional[int] = None
         if file_path:
             self.file_path = Path(file_path)
             self.file_data = None
@@ -662,6 +681,9 @@ class DICOMParser:
         Returns:
             Dictionary of DICOM metadata
         """
+        file_data = None
+        self.pixel_data_offset = None
+        self.pixel_data_length = None
         try:
             timing = os.getenv('DNEXIF_DICOM_TIMING') == '1'
             t_start = time.perf_counter()
@@ -670,8 +692,14 @@ class DICOMParser:
                 print(f"[DICOM TIMING] parse start: {src}", file=sys.stderr)
             # Read file data
             if self.file_data is None:
-                with open(self.file_path, 'rb') as f:
-                    file_data = f.read()
+                if self.stop_before_pixels:
+                    # Read only the blocks the header elements are in
+                    file_data = RangedFile(self.file_path)
+                elif self.use_mmap:
+                    file_data = map_file(self.file_path)
+                else:
+                    with open(self.file_path, 'rb') as f:
+                        file_data = f.read()
             else:
                 file_data = self.file_data
             if timing:
@@ -744,6 +772,61 @@ class DICOMParser:
         
         except Exception as e:
             raise MetadataReadError(f"Failed to parse DICOM metadata: {str(e)}")
+        
+        finally:
+            if isinstance(file_data, RangedFile):
+                file_data.close()
+            elif file_data is not self.file_data:
+                # Map created above (or bytes, for which this is a no-op)
+                close_buffer(file_data)
+    
+    def read_pixel_data(self) -> Optional[bytes]:
+        """
+        Read the PixelData value located by a stop_before_pixels parse.
+        
+        Encapsulated (compressed) pixel data of undefined length is returned
+        as its fragment items, up to the sequence delimiter.
+        
+        Returns:
+            Pixel data bytes, or None if no PixelData element was found
+        """
+        if self.pixel_data_offset is None:
+            return None
+        
+        if self.file_data is not None:
+            data = self.file_data
+        else:
+            data = RangedFile(self.file_path)
+        try:
+            start = self.pixel_data_offset
+            if self.pixel_data_length is not None:
+                return bytes(data[start:start + self.pixel_data_length])
+            
+            # Walk the fragment items (always little-endian) to the
+            # sequence delimiter (FFFE,E0DD)
+            offset = start
+            while offset + 8 <= len(data):
+                group, element, length = struct.unpack('<HHI', data[offset:offset + 8])
+                if group != 0xFFFE or element != 0xE000:
+                    break
+                offset += 8 + length
+            return bytes(data[start:min(offset, len(data))])
+        finally:
+            if isinstance(data, RangedFile):
+                data.close()
+    
+    def get_tag_name(self, group: int, element: int) -> str:
+        """
+        Get the name a DICOM tag is reported under (as "DICOM:<name>").
+        
+        Args:
+            group: Group number
+            element: Element number
+        
+        Returns:
+            Tag name (Tag_GGGG_EEEE for unknown tags)
+        """
+        return self._get_tag_name(group, element)
     
     def _parse_file_meta_info(self, data: bytes, offset: int, timing: bool = False) -> Dict[str, Any]:
         """
@@ -835,7 +918,8 @@ class DICOMParser:
         offset: int,
         is_big_endian: bool = False,
         timing: bool = False,
-        timing_start: Optional[float] = None
+        timing_start: Optional[float] = None,
+        nested: bool = False
     ) -> Dict[str, Any]:
         """
         Parse DICOM data elements.
@@ -843,6 +927,9 @@ class DICOMParser:
         Args:
             data: DICOM file data
             offset: Starting offset
+            nested: True for sequence items, which are parsed from a copy of
+                    the item (offsets are not file offsets) and never stop
+                    at PixelData
             
         Returns:
             Dictionary of parsed DICOM elements
@@ -966,6 +1053,31 @@ class DICOMParser:
                     offset += 4
                     vr = 'UN'  # Unknown
                 
+                # PixelData of the top-level data set carries no metadata: record
+                # where its value is and stop, without reading it
+                if self.stop_before_pixels and not nested and (group, element) == self.PIXEL_DATA_TAG:
+                    self.pixel_data_offset = offset
+                    available_length = max(0, len(data) - offset)
+                    if value_length == 0xFFFFFFFF:
+                        # Encapsulated pixel data (undefined length)
+                        value_size = available_length
+                    else:
+                        self.pixel_data_length = value_length
+                        value_size = min(value_length, available_length)
+                    tag_name = self._get_tag_name(group, element)
+                    if tag_name:
+                        if value_size == 0:
+                            metadata[f"DICOM:{tag_name}"] = ""
+                        else:
+                            # Same value as a full parse gives, without reading
+                            # large pixel data
+                            if value_size <= 64:
+                                decoded_value = self._decode_value(data[offset:offset+value_size], vr, group, element)
+                            else:
+                                decoded_value = f"<Binary data {value_size} bytes>"
+                            metadata[f"DICOM:{tag_name}"] = self._format_tag_value(tag_name, decoded_value, vr)
+                    break
+                
                 # Handle sequences (SQ) - parse nested items
                 if vr == 'SQ' and value_length > 0:
                     tag_name = self._get_tag_name(group, element)
@@ -1440,7 +1552,7 @@ class DICOMParser:
                                 endofitems_metadata = {'DICOM:EndOfItems': ''}
                                 current_offset += 8
                                 # Parse item data
-                                item_metadata = self._parse_data_elements(item_data, 0, is_big_endian=is_big_endian)
+                                item_metadata = self._parse_data_elements(item_data, 0, is_big_endian=is_big_endian, nested=True)
                                 if item_metadata:
                                     # Add StartOfItem to this item's metadata
                                     if item_startofitem_data:
@@ -1471,7 +1583,7 @@ class DICOMParser:
                             if startofitem_data is None and item_startofitem_data:
                                 startofitem_data = item_startofitem_data
                         # Parse item data
-                        item_metadata = self._parse_data_elements(item_data, 0, is_big_endian=is_big_endian)
+                        item_metadata = self._parse_data_elements(item_data, 0, is_big_endian=is_big_endian, nested=True)
                         if item_metadata:
                             # Add StartOfItem to this item's metadata
                             if item_startofitem_data:
@@ -1495,7 +1607,7 @@ class DICOMParser:
                         if startofitem_data is None:  # Capture first StartOfItem for sequence
                             startofitem_data = item_startofitem_data
                         # Parse item data
-                        item_metadata = self._parse_data_elements(item_data, 0, is_big_endian=is_big_endian)
+                        item_metadata = self._parse_data_elements(item_data, 0, is_big_endian=is_big_endian, nested=True)
                         if item_metadata:
                             # Add StartOfItem to this item's metadata
                             if isinstance(item_startofitem_data, bytes):
@@ -1626,7 +1738,7 @@ class DICOMParser:
                             item_data += data[offset:offset+1]
                             offset += 1
                         # Parse item data
-                        item_metadata = self._parse_data_elements(item_data, 0, is_big_endian=is_big_endian)
+                        item_metadata = self._parse_data_elements(item_data, 0, is_big_endian=is_big_endian, nested=True)
                         if item_metadata:
                             items.append(item_metadata)
                     elif item_length > 0 and offset + item_length <= len(data):
@@ -1651,7 +1763,7 @@ class DICOMParser:
                             else:
                                 startofitem_data = cleaned
                         # Parse item data
-                        item_metadata = self._parse_data_elements(item_data, 0, is_big_endian=is_big_endian)
+                        item_metadata = self._parse_data_elements(item_data, 0, is_big_endian=is_big_endian, nested=True)
                         if item_metadata:
                             items.append(item_metadata)
                         offset += item_length
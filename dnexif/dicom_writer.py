@@ -19,6 +19,7 @@ from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
 from dnexif.exceptions import MetadataWriteError
+from dnexif.stream_copy import atomic_write
 from dnexif.dicom_parser import DICOMParser
 from dnexif.dicom_data_elements import (
     DICOM_DATA_ELEMENTS,
@@ -128,8 +129,7 @@ class DICOMWriter:
             )
             
             # Write output file
-            with open(output_path, 'wb') as f:
-                f.write(new_dicom_data)
+            atomic_write(output_path, new_dicom_data)
                 
         except Exception as e:
             if isinstance(e, MetadataWriteError):
@@ -14,12 +14,15 @@ Copyright 2025 DNAi inc.
 """
 
 import struct
-from typing import Dict, Any, Optional, Tuple, List
+import sys
+from array import array
+from typing import Dict, Any, Optional, Tuple, List, Iterable, Set
 from enum import IntEnum
 import io
 import zlib
 
 from dnexif.exceptions import MetadataReadError, MetadataWriteError
+from dnexif.file_view import close_buffer, map_file, read_header_window, RangedFile
 from dnexif.makernote_parser import MakerNoteParser
 
 
@@ -53,9 +56,81 @@ TAG_SIZES = {
     ExifTagType.IFD8: 8,  # BigTIFF IFD8 is 8 bytes (64-bit IFD offset)
 }
 
+# Tag type code -> (ExifTagType, size in bytes), so the enum is not built per tag
+TAG_TYPE_INFO = {tag_type.value: (tag_type, size) for tag_type, size in TAG_SIZES.items()}
+
+# Precompiled structs for IFD decoding, keyed by byte order ('<' or '>')
+IFD_ENTRY_STRUCTS = {endian: struct.Struct(f'{endian}HHI4s') for endian in '<>'}
+UINT16_STRUCTS = {endian: struct.Struct(f'{endian}H') for endian in '<>'}
+UINT32_STRUCTS = {endian: struct.Struct(f'{endian}I') for endian in '<>'}
+SINT32_STRUCTS = {endian: struct.Struct(f'{endian}i') for endian in '<>'}
+UINT64_STRUCTS = {endian: struct.Struct(f'{endian}Q') for endian in '<>'}
+SINT64_STRUCTS = {endian: struct.Struct(f'{endian}q') for endian in '<>'}
+UINT32_PAIR_STRUCTS = {endian: struct.Struct(f'{endian}II') for endian in '<>'}
+SINT32_PAIR_STRUCTS = {endian: struct.Struct(f'{endian}ii') for endian in '<>'}
+
+# array typecodes for bulk decoding of multi-value tags
+ARRAY_UINT32 = 'I' if array('I').itemsize == 4 else 'L'
+ARRAY_SINT32 = 'i' if array('i').itemsize == 4 else 'l'
+NATIVE_ENDIAN = '<' if sys.byteorder == 'little' else '>'
+
 # Import comprehensive tag definitions
 from dnexif.exif_tags import EXIF_TAG_NAMES
 
+# Leaf tag (0x8000-0x8070) names -> tag ID, for reverse lookups in Leaf MakerNote IFDs
+LEAF_TAG_IDS_BY_NAME: Dict[str, int] = {}
+for _tag_id, _tag_name in EXIF_TAG_NAMES.items():
+    if 0x8000 <= _tag_id <= 0x8070:
+        LEAF_TAG_IDS_BY_NAME.setdefault(_tag_name, _tag_id)
+del _tag_id, _tag_name
+
+# Tag groups that can be targeted with ExifParser(tags=...). Groups other than
+# the plain EXIF/IFD0 ones are reached through a pointer tag and are followed
+# only when one of their tags is requested.
+TARGETED_NAME_GROUPS = {'', 'EXIF', 'IFD0', 'ExifIFD'}
+TARGETED_POINTER_GROUPS = {
+    'GPS': 'GPS',
+    'Interop': 'Interop', 'InteropIFD': 'Interop',
+    'IFD1': 'IFD1',
+    'SubIFD': 'SubIFD',
+    'Leaf': 'Leaf',
+    'MakerNotes': 'MakerNotes', 'MakerNote': 'MakerNotes',
+    'Canon': 'MakerNotes', 'Nikon': 'MakerNotes', 'Sony': 'MakerNotes',
+    'Olympus': 'MakerNotes', 'Pentax': 'MakerNotes', 'Fujifilm': 'MakerNotes',
+    'FujiFilm': 'MakerNotes', 'Panasonic': 'MakerNotes', 'PanasonicRaw': 'MakerNotes',
+}
+
+# Tag names that can be targeted as they are: the raw IFD entry names.
+# SubfileType is filled in by the main image selection of the full walk.
+KNOWN_EXIF_TAG_NAMES = frozenset(EXIF_TAG_NAMES.values()) - {'SubfileType'}
+
+# Entries of the GPS and Interoperability IFDs are named from the same table;
+# requesting one without its group follows both pointers
+POINTER_IFD_ENTRY_NAMES = frozenset(
+    name for tag_id, name in EXIF_TAG_NAMES.items()
+    if tag_id < 0x0020 or 0x1000 <= tag_id <= 0x1002
+)
+
+# Pointer entries, mapped to the group of the IFD they lead to
+POINTER_TAG_GROUPS = {'GPSInfo': 'GPS', 'InteroperabilityIFD': 'Interop',
+                      'SubIFDs': 'SubIFD', 'MakerNote': 'MakerNotes'}
+
+# Aliases that DNExif derives from EXIF entries after parsing, mapped to the
+# entries they are derived from. Other names that are not raw entry names
+# cannot be targeted and disable the filter.
+DERIVED_TAG_SOURCES = {
+    'ISO': ('ISOSpeedRatings',),
+    'ImageHeight': ('ImageLength',),
+    'ModifyDate': ('DateTime',),
+    'ExifImageWidth': ('PixelXDimension',),
+    'ExifImageHeight': ('PixelYDimension',),
+    'ExposureCompensation': ('ExposureBiasValue',),
+}
+
+# Tags recovered by the ExifIFD fallback scan for DCR and similar files
+CRITICAL_EXIF_IFD_TAGS = {'FocalPlaneXResolution', 'FocalPlaneYResolution',
+                          'FocalPlaneResolutionUnit', 'BatteryLevel'}
+
 
 class ExifParser:
     """
@@ -68,20 +143,134 @@ class ExifParser:
     text fields, allowing international character sets.
     """
     
-    def __init__(self, file_path: Optional[str] = None, file_data: Optional[bytes] = None):
+    def __init__(self, file_path: Optional[str] = None, file_data: Optional[bytes] = None,
+                 use_mmap: bool = False, tags: Optional[Iterable[str]] = None):
         """
         Initialize the EXIF parser.
         
         Args:
             file_path: Path to the image file
             file_data: Raw file data (alternative to file_path)
+            use_mmap: If True, memory-map file_path instead of reading it into memory
+            tags: Optional tags to extract (e.g. ['EXIF:DateTimeOriginal', 'GPS:GPSLatitude']).
+                  Other entries are skipped without decoding their values, MakerNotes and
+                  sub-IFDs are only followed when requested, and IFD traversal stops once
+                  all requested tags are found. If None, all tags are extracted.
         """
         self.file_path = file_path
         self.file_data = file_data
+        self.use_mmap = use_mmap
         self.metadata: Dict[str, Any] = {}
         self.endian = '<'  # Default to little-endian
         self.exif_version: Optional[str] = None  # EXIF version (e.g., "0230" for 2.30, "0300" for 3.0)
         self.supports_utf8: bool = False  # Whether EXIF 3.0 UTF-8 is supported
+        self._wanted_tags: Optional[Set[str]] = None  # Targeted tag names (None = all)
+        self._wanted_groups: Set[str] = set()  # Targeted pointer groups (GPS, MakerNotes, ...)
+        self._visited_ifds: Set[Tuple[int, int]] = set()  # (offset, base) walked under the current top-level IFD
+        self._ifd_depth = 0  # _parse_ifd recursion depth
+        if tags is not None:
+            self._set_tag_filter(tags)
+    
+    def _makernote_file_data(self):
+        """
+        Get file data for MakerNoteParser.
+        
+        MakerNote parsers index the data with absolute offsets and may need
+        the buffer protocol, so a ranged view is materialized (once) here.
+        
+        Returns:
+            File data as bytes or a memory map
+        """
+        if isinstance(self.file_data, RangedFile):
+            self.file_data = self.file_data[:]
+        return self.file_data
+    
+    def _set_tag_filter(self, tags: Iterable[str]) -> None:
+        """
+        Configure tag-targeted extraction.
+        
+        Aliases are replaced by the entries they are derived from (see
+        DERIVED_TAG_SOURCES). Tags from groups the IFD walk cannot target
+        (e.g. Composite) and names that are neither entry names nor known
+        aliases disable the filter, so that everything is extracted.
+        
+        Args:
+            tags: Requested tag names, with or without group prefix
+        """
+        names = set()
+        groups = set()
+        for tag in tags:
+            group, _, name = tag.rpartition(':')
+            if group in TARGETED_NAME_GROUPS:
+                if name in KNOWN_EXIF_TAG_NAMES:
+                    names.add(name)
+                    if name in POINTER_IFD_ENTRY_NAMES:
+                        groups.update(('GPS', 'Interop'))
+                    if name in POINTER_TAG_GROUPS:
+                        groups.add(POINTER_TAG_GROUPS[name])
+                elif name in DERIVED_TAG_SOURCES:
+                    names.update(DERIVED_TAG_SOURCES[name])
+                else:
+                    self._wanted_tags = None
+                    self._wanted_groups = set()
+                    return
+            elif group in TARGETED_POINTER_GROUPS:
+                groups.add(TARGETED_POINTER_GROUPS[group])
+                names.add(name)
+            else:
+                self._wanted_tags = None
+                self._wanted_groups = set()
+                return
+        if 'MakerNotes' in groups:
+            # MakerNote decoding depends on the camera make and model
+            names.update(('Make', 'Model'))
+        self._wanted_tags = names
+        self._wanted_groups = groups
+    
+    def _is_wanted_entry(self, tag_id: int) -> bool:
+        """
+        Check whether an IFD entry is needed for tag-targeted extraction.
+        
+        Args:
+            tag_id: IFD entry tag ID
+            
+        Returns:
+            True if the entry must be decoded (or its sub-IFD followed)
+        """
+        groups = self._wanted_groups
+        if tag_id == 0x8769:  # EXIF IFD pointer
+            return True
+        if tag_id == 0x8825:  # GPS IFD pointer
+            return 'GPS' in groups
+        if tag_id == 0xA005:  # Interoperability IFD pointer
+            return 'Interop' in groups
+        if tag_id == 0x014A:  # SubIFDs
+            return 'SubIFD' in groups
+        if tag_id == 0x927C:  # MakerNote
+            return 'MakerNotes' in groups
+        if tag_id in (0x83BB, 0x8606) or 0x8000 <= tag_id <= 0x8070:  # Leaf MakerNote/LeafData/Leaf tags
+            return 'Leaf' in groups
+        if tag_id < 0x0020 or 0x1000 <= tag_id <= 0x1002:
+            # Entries of the GPS and Interoperability IFDs
+            return 'GPS' in groups or 'Interop' in groups
+        return EXIF_TAG_NAMES.get(tag_id) in self._wanted_tags
+    
+    def _targeted_tags_complete(self, metadata: Dict[str, Any]) -> bool:
+        """
+        Check whether tag-targeted extraction has found every requested tag.
+        
+        Pointer groups (GPS, MakerNotes, ...) have no known tag list, so
+        extraction never completes early when one is requested.
+        
+        Args:
+            metadata: Tags extracted so far
+            
+        Returns:
+            True if traversal can stop
+        """
+        if self._wanted_tags is None or self._wanted_groups:
+            return False
+        return all(name in metadata or f"EXIF:{name}" in metadata for name in self._wanted_tags)
         
     def read(self) -> Dict[str, Any]:
         """
@@ -93,10 +282,16 @@ class ExifParser:
         Raises:
             MetadataReadError: If the file cannot be read or parsed
         """
+        owns_map = False
         if self.file_path:
-            with open(self.file_path, 'rb') as f:
-                self.file_data = f.read()
-        elif not self.file_data:
+            if self.use_mmap:
+                self.file_data = map_file(self.file_path)
+                owns_map = True
+            else:
+                # Only the metadata header: segments before SOS for JPEG,
+                # on-demand ranges for TIFF/RAW
+                self.file_data = read_header_window(self.file_path)
+        elif self.file_data is None:
             raise MetadataReadError("No file path or file data provided")
             
         try:
@@ -133,6 +328,11 @@ class ExifParser:
             return metadata
         except Exception as e:
             raise MetadataReadError(f"Failed to read EXIF data: {str(e)}")
+        finally:
+            if owns_map:
+                # Close the map created above; the next read() maps the file again
+                close_buffer(self.file_data)
+                self.file_data = None
     
     def _parse_jpeg(self) -> Dict[str, Any]:
         """Parse EXIF data from a JPEG file."""
@@ -492,6 +692,9 @@ class ExifParser:
         else:
             raise MetadataReadError("File too short for header")
         
+        if self._wanted_tags is not None:
+            return self._parse_tiff_header_targeted(offset, first_ifd_offset, byte_order_str)
+        
         # Parse all IFDs and find the main image IFD
         # For RAW formats, we need to identify which IFD is the main image vs preview
         all_ifds = []
@@ -1597,6 +1800,60 @@ class ExifParser:
         
         return metadata
     
+    def _parse_tiff_header_targeted(self, offset: int, first_ifd_offset: int,
+                                    byte_order_str: Optional[str]) -> Dict[str, Any]:
+        """
+        Walk the IFD chain for tag-targeted extraction.
+        
+        Unlike the full parse, IFDs are parsed once each, in chain order, and
+        the walk stops as soon as every requested tag has been found. Main
+        image selection for RAW previews is skipped.
+        
+        Args:
+            offset: Offset of the TIFF header
+            first_ifd_offset: Offset of IFD0 relative to the TIFF header
+            byte_order_str: File:ExifByteOrder value
+            
+        Returns:
+            Dictionary of the requested tags that were found
+        """
+        metadata = {}
+        if byte_order_str:
+            metadata['File:ExifByteOrder'] = byte_order_str
+        
+        current_ifd_offset = first_ifd_offset
+        visited_ifds = set()
+        ifd_index = 0
+        while current_ifd_offset > 0 and ifd_index < 10 and not self._targeted_tags_complete(metadata):
+            if current_ifd_offset in visited_ifds:
+                break  # Avoid infinite loops
+            visited_ifds.add(current_ifd_offset)
+            
+            ifd_abs_offset = offset + current_ifd_offset
+            if ifd_abs_offset + 2 > len(self.file_data):
+                break
+            if ifd_index == 1 and 'IFD1' in self._wanted_groups:
+                # Thumbnail IFD - same prefixes as the full parse
+                ifd_metadata = self._parse_ifd(ifd_abs_offset, offset)
+                for k, v in ifd_metadata.items():
+                    if not k.startswith('EXIF:') and not k.startswith('GPS:') and not k.startswith('MakerNote:'):
+                        metadata[f"IFD1:{k}"] = v
+                        metadata.setdefault(f"EXIF:{k}", v)
+            else:
+                ifd_metadata = self._parse_ifd(ifd_abs_offset, offset)
+                for k, v in ifd_metadata.items():
+                    metadata.setdefault(k, v)
+            
+            # Follow the chain to the next IFD
+            num_entries = struct.unpack(f'{self.endian}H', self.file_data[ifd_abs_offset:ifd_abs_offset + 2])[0]
+            next_pointer = ifd_abs_offset + 2 + num_entries * 12
+            if next_pointer + 4 > len(self.file_data):
+                break
+            current_ifd_offset = struct.unpack(f'{self.endian}I', self.file_data[next_pointer:next_pointer + 4])[0]
+            ifd_index += 1
+        
+        return metadata
+    
     def _parse_ifd_info(self, ifd_offset: int, base_offset: int) -> Optional[Dict[str, Any]]:
         """
         Parse IFD structure to extract SubfileType and next IFD pointer.
@@ -1613,10 +1870,7 @@ class ExifParser:
             return None
         
         # Read number of directory entries
-        num_entries = struct.unpack(
-            f'{self.endian}H',
-            self.file_data[ifd_offset:ifd_offset + 2]
-        )[0]
+        num_entries = UINT16_STRUCTS[self.endian].unpack(self.file_data[ifd_offset:ifd_offset + 2])[0]
         
         if num_entries == 0:
             return None
@@ -1637,8 +1891,7 @@ class ExifParser:
             if entry_offset + 12 > len(self.file_data):
                 break
             
-            tag_id, tag_type, count, value_offset = struct.unpack(
-                f'{self.endian}HHI4s',
+            tag_id, tag_type, count, value_offset = IFD_ENTRY_STRUCTS[self.endian].unpack(
                 self.file_data[entry_offset:entry_offset + 12]
             )
             
@@ -1690,11 +1943,39 @@ class ExifParser:
         """
         Parse an IFD (Image File Directory) structure.
         
+        Each (offset, base) pair is walked at most once under a top-level
+        call, so IFDs reached again through MakerNote or sub-IFD offset
+        guesses (including pointer cycles) are not walked again.
+        
         Args:
             ifd_offset: Offset to the IFD from start of file
             base_offset: Base offset for relative addressing (TIFF base or JPEG APP1 base)
             parent_metadata: Optional parent metadata dictionary (for accessing Make from IFD0 when parsing EXIF IFD)
             
+        Returns:
+            Dictionary of parsed tags
+        """
+        if self._ifd_depth == 0:
+            self._visited_ifds = set()
+        key = (ifd_offset, base_offset)
+        if key in self._visited_ifds:
+            return {}
+        self._visited_ifds.add(key)
+        self._ifd_depth += 1
+        try:
+            return self._walk_ifd(ifd_offset, base_offset, parent_metadata)
+        finally:
+            self._ifd_depth -= 1
+    
+    def _walk_ifd(self, ifd_offset: int, base_offset: int, parent_metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Walk the entries of an IFD (see _parse_ifd).
+        
+        Args:
+            ifd_offset: Offset to the IFD from start of file
+            base_offset: Base offset for relative addressing (TIFF base or JPEG APP1 base)
+            parent_metadata: Optional parent metadata dictionary
+            
         Returns:
             Dictionary of parsed tags
         """
@@ -1715,10 +1996,7 @@ class ExifParser:
         if ifd_offset + 2 > len(self.file_data):
             return metadata
             
-        num_entries = struct.unpack(
-            f'{self.endian}H',
-            self.file_data[ifd_offset:ifd_offset + 2]
-        )[0]
+        num_entries = UINT16_STRUCTS[self.endian].unpack(self.file_data[ifd_offset:ifd_offset + 2])[0]
         
         # IMPROVEMENT (Build 1417): Track parsed IFD areas to avoid reading from IFD entry structures
         # Initialize tracking if not exists
@@ -1730,22 +2008,24 @@ class ExifParser:
         ifd_entry_end = ifd_entry_start + (num_entries * 12)
         self._parsed_ifd_areas.append((ifd_entry_start, ifd_entry_end))
         
+        # Unpack the whole entry table at once (entries past the end of the data are dropped)
+        table_end = min(ifd_entry_end, ifd_entry_start + (len(self.file_data) - ifd_entry_start) // 12 * 12)
+        entry_table = self.file_data[ifd_entry_start:table_end] if table_end > ifd_entry_start else b''
+        value_offset_struct = UINT32_STRUCTS[self.endian]
+        
         # Parse each directory entry
-        entry_offset = ifd_offset + 2
-        for i in range(num_entries):
-            if entry_offset + 12 > len(self.file_data):
-                break
-                
-            tag_id, tag_type, count, value_offset = struct.unpack(
-                f'{self.endian}HHI4s',
-                self.file_data[entry_offset:entry_offset + 12]
-            )
+        for i, (tag_id, tag_type, count, value_offset) in enumerate(
+                IFD_ENTRY_STRUCTS[self.endian].iter_unpack(entry_table)):
+            entry_offset = ifd_entry_start + i * 12
+            
+            # Tag-targeted extraction: skip unrequested entries before any value
+            # decoding, MakerNote parsing or sub-IFD recursion
+            if self._wanted_tags is not None and not self._is_wanted_entry(tag_id):
+                entry_offset += 12
+                continue
             
             # Convert value_offset bytes to integer
-            if self.endian == '<':
-                value_offset_int = struct.unpack('<I', value_offset)[0]
-            else:
-                value_offset_int = struct.unpack('>I', value_offset)[0]
+            value_offset_int = value_offset_struct.unpack(value_offset)[0]
             
             # CRITICAL: Check for LeafData tag (0x8606) early, before regular tag processing
             # This tag contains PKTS format data with Leaf tags and must be processed specially
@@ -2307,6 +2587,10 @@ class ExifParser:
                 # Also try relative offset
                 exif_ifd_offsets_to_try.append(base_offset + value_offset_int)
                 
+                if self._wanted_tags is not None and not (self._wanted_tags & CRITICAL_EXIF_IFD_TAGS):
+                    # Tag-targeted extraction did not ask for any of these tags
+                    critical_tag_ids = {}
+                
                 for tag_id, tag_name in critical_tag_ids.items():
                     exif_key = f"EXIF:{tag_name}"
                     if exif_key not in metadata and tag_name not in metadata:
@@ -2714,11 +2998,13 @@ class ExifParser:
                     # IMPROVEMENT (Build 1520): Enhanced aggressive IFD scanning around the calculated offset
                     # Scan a wider range to find Leaf MakerNote IFD if standard offsets don't work
                     scan_range = 600  # IMPROVEMENT (Build 1520): Increased from 400 to 600 bytes for wider scanning
+                    queued_offsets = set(leaf_makernote_offsets)
                     for base_calc_offset in [base_offset + value_offset_int, value_offset_int]:
                         for scan_adj in range(-scan_range, scan_range + 1, 1):  # IMPROVEMENT (Build 1520): Step by 1 byte for maximum coverage
                             scan_offset = base_calc_offset + scan_adj
                             if scan_offset not in visited_leaf_ifds and 0 < scan_offset < len(self.file_data) - 2:
-                                if scan_offset not in leaf_makernote_offsets:
+                                if scan_offset not in queued_offsets:
+                                    queued_offsets.add(scan_offset)
                                     leaf_makernote_offsets.append(scan_offset)
                     
                     # IMPROVEMENT (Build 1664): For Leaf MakerNote with type=1 (BYTE) and small count, the IFD may be far away
@@ -2817,18 +3103,18 @@ class ExifParser:
                                     # Build 1678: struct and EXIF_TAG_NAMES are now imported at method start
                                     
                                     # Direct IFD parsing for Leaf tags
-                                    entry_offset = test_makernote_offset + 2
+                                    leaf_entry_offset = test_makernote_offset + 2
                                     direct_leaf_tags = {}
                                     
                                     for entry_idx in range(min(test_count, 200)):
-                                        if entry_offset + 12 > len(self.file_data):
+                                        if leaf_entry_offset + 12 > len(self.file_data):
                                             break
                                         
                                         try:
-                                            tag_id = struct.unpack(f'{self.endian}H', self.file_data[entry_offset:entry_offset+2])[0]
-                                            tag_type = struct.unpack(f'{self.endian}H', self.file_data[entry_offset+2:entry_offset+4])[0]
-                                            tag_count = struct.unpack(f'{self.endian}I', self.file_data[entry_offset+4:entry_offset+8])[0]
-                                            value_offset = struct.unpack(f'{self.endian}I', self.file_data[entry_offset+8:entry_offset+12])[0]
+                                            tag_id = struct.unpack(f'{self.endian}H', self.file_data[leaf_entry_offset:leaf_entry_offset+2])[0]
+                                            tag_type = struct.unpack(f'{self.endian}H', self.file_data[leaf_entry_offset+2:leaf_entry_offset+4])[0]
+                                            tag_count = struct.unpack(f'{self.endian}I', self.file_data[leaf_entry_offset+4:leaf_entry_offset+8])[0]
+                                            value_offset = struct.unpack(f'{self.endian}I', self.file_data[leaf_entry_offset+8:leaf_entry_offset+12])[0]
                                             
                                             # Check if this is a Leaf tag (0x8000-0x8070)
                                             if 0x8000 <= tag_id <= 0x8070:
@@ -2845,7 +3131,7 @@ class ExifParser:
                                                         tag_type,
                                                         tag_count,
                                                         value_offset,
-                                                        entry_offset + 8,
+                                                        leaf_entry_offset + 8,
                                                         base_offset
                                                     )
                                                     if tag_value is not None:
@@ -2855,7 +3141,7 @@ class ExifParser:
                                         except:
                                             pass
                                         
-                                        entry_offset += 12
+                                        leaf_entry_offset += 12
                                     
                                     # Add directly extracted Leaf tags to metadata
                                     for k, v in direct_leaf_tags.items():
@@ -2910,20 +3196,14 @@ class ExifParser:
                                         # If a tag name exists in EXIF_TAG_NAMES and maps to a Leaf tag ID, it's a Leaf tag
                                         else:
                                             # Try to find this tag name in EXIF_TAG_NAMES and check if it's a Leaf tag
-                                            try:
-                                                # Search EXIF_TAG_NAMES for this tag name
-                                                for tag_id, tag_name in EXIF_TAG_NAMES.items():
-                                                    if 0x8000 <= tag_id <= 0x8070 and tag_name == k:
-                                                        # This is a Leaf tag - ensure it has Leaf: prefix
-                                                        if not k.startswith('Leaf:'):
-                                                            leaf_tag_name = f'Leaf:{k}'
-                                                        else:
-                                                            leaf_tag_name = k
-                                                        metadata[leaf_tag_name] = v
-                                                        leaf_tags_found += 1
-                                                        break
-                                            except:
-                                                pass
+                                            if k in LEAF_TAG_IDS_BY_NAME:
+                                                # This is a Leaf tag - ensure it has Leaf: prefix
+                                                if not k.startswith('Leaf:'):
+                                                    leaf_tag_name = f'Leaf:{k}'
+                                                else:
+                                                    leaf_tag_name = k
+                                                metadata[leaf_tag_name] = v
+                                                leaf_tags_found += 1
                                     
                                     # IMPROVEMENT (Build 1428): Also recursively parse SubIFDs and next IFD pointers in Leaf MakerNote IFD
                                     # Leaf MakerNote IFD may have SubIFDs or next IFD pointers that contain more Leaf tags
@@ -3278,7 +3558,7 @@ class ExifParser:
                             try:
                                 makernote_parser = MakerNoteParser(
                                     maker=maker,
-                                    file_data=self.file_data,
+                                    file_data=self._makernote_file_data(),
                                     offset=makernote_offset,
                                     endian=self.endian
                                 )
@@ -3297,7 +3577,7 @@ class ExifParser:
                                         if makernote_data_start >= 0:
                                             makernote_parser = MakerNoteParser(
                                                 maker=maker,
-                                                file_data=self.file_data,
+                                                file_data=self._makernote_file_data(),
                                                 offset=makernote_data_start,
                                                 endian=self.endian
                                             )
@@ -3341,7 +3621,7 @@ class ExifParser:
                                             try:
                                                 test_parser = MakerNoteParser(
                                                     maker=maker,
-                                                    file_data=self.file_data,
+                                                    file_data=self._makernote_file_data(),
                                                     offset=test_offset,
                                                     endian=self.endian
                                                 )
@@ -3367,7 +3647,7 @@ class ExifParser:
                                             try:
                                                 pattern_parser = MakerNoteParser(
                                                     maker=maker,
-                                                    file_data=self.file_data,
+                                                    file_data=self._makernote_file_data(),
                                                     offset=pattern_pos,
                                                     endian=self.endian
                                                 )
@@ -3671,6 +3951,10 @@ class ExifParser:
                 metadata[tag_name] = tag_value
 
             entry_offset += 12
+            
+            # Stop walking this IFD once every targeted tag has been found
+            if self._wanted_tags is not None and self._targeted_tags_complete(metadata):
+                break
 
         if self._is_rw2 and self._rw2_ifd0_offset == ifd_offset:
             for tag_id, tag_name in ((0x013B, "Artist"), (0x8298, "Copyright")):
@@ -4171,12 +4455,10 @@ class ExifParser:
         Returns:
             Parsed tag value(s)
         """
-        try:
-            tag_type_enum = ExifTagType(tag_type)
-        except ValueError:
+        type_info = TAG_TYPE_INFO.get(tag_type)
+        if type_info is None:
             return None
-        
-        tag_size = TAG_SIZES.get(tag_type_enum, 1)
+        tag_type_enum, tag_size = type_info
         total_size = tag_size * count
         
         # If value fits in 4 bytes, it's stored inline
@@ -4189,12 +4471,13 @@ class ExifParser:
             return None
         
         data = self.file_data[data_offset:data_offset + total_size]
+        endian = self.endian
         
-        # Parse based on type
+        # Parse based on type (multi-value tags are decoded in bulk)
         if tag_type_enum == ExifTagType.BYTE:
             if count == 1:
-                return struct.unpack(f'{self.endian}B', data[:1])[0]
-            return list(struct.unpack(f'{self.endian}{count}B', data))
+                return data[0]
+            return list(data)
         
         elif tag_type_enum == ExifTagType.ASCII:
             # Handle null-terminated strings correctly
@@ -4250,58 +4533,62 @@ class ExifParser:
         
         elif tag_type_enum == ExifTagType.SHORT:
             if count == 1:
-                return struct.unpack(f'{self.endian}H', data[:2])[0]
-            return list(struct.unpack(f'{self.endian}{count}H', data))
+                return UINT16_STRUCTS[endian].unpack(data)[0]
+            return self._unpack_array('H', data)
         
         elif tag_type_enum == ExifTagType.LONG:
             if count == 1:
-                return struct.unpack(f'{self.endian}I', data[:4])[0]
-            return list(struct.unpack(f'{self.endian}{count}I', data))
+                return UINT32_STRUCTS[endian].unpack(data)[0]
+            return self._unpack_array(ARRAY_UINT32, data)
         
         elif tag_type_enum == ExifTagType.RATIONAL:
             if count == 1:
-                num, den = struct.unpack(f'{self.endian}II', data[:8])
+                num, den = UINT32_PAIR_STRUCTS[endian].unpack(data)
                 return (num, den) if den != 0 else None
-            values = []
-            for i in range(count):
-                num, den = struct.unpack(f'{self.endian}II', data[i*8:(i+1)*8])
-                values.append((num, den) if den != 0 else None)
-            return values
+            values = iter(self._unpack_array(ARRAY_UINT32, data))
+            return [(num, den) if den != 0 else None for num, den in zip(values, values)]
         
         elif tag_type_enum == ExifTagType.SLONG:
             if count == 1:
-                return struct.unpack(f'{self.endian}i', data[:4])[0]
-            return list(struct.unpack(f'{self.endian}{count}i', data))
+                return SINT32_STRUCTS[endian].unpack(data)[0]
+            return self._unpack_array(ARRAY_SINT32, data)
         
         elif tag_type_enum == ExifTagType.SRATIONAL:
             if count == 1:
-                num, den = struct.unpack(f'{self.endian}ii', data[:8])
+                num, den = SINT32_PAIR_STRUCTS[endian].unpack(data)
                 return (num, den) if den != 0 else None
-            values = []
-            for i in range(count):
-                num, den = struct.unpack(f'{self.endian}ii', data[i*8:(i+1)*8])
-                values.append((num, den) if den != 0 else None)
-            return values
+            values = iter(self._unpack_array(ARRAY_SINT32, data))
+            return [(num, den) if den != 0 else None for num, den in zip(values, values)]
         
-        elif tag_type_enum == ExifTagType.LONG8:
-            # BigTIFF format code 16: 64-bit unsigned integer
+        elif tag_type_enum in (ExifTagType.LONG8, ExifTagType.IFD8):
+            # BigTIFF format codes 16/18: 64-bit unsigned integer / IFD offset
             if count == 1:
-                return struct.unpack(f'{self.endian}Q', data[:8])[0]
-            return list(struct.unpack(f'{self.endian}{count}Q', data[:8*count]))
+                return UINT64_STRUCTS[endian].unpack(data)[0]
+            return self._unpack_array('Q', data)
         
         elif tag_type_enum == ExifTagType.SLONG8:
             # BigTIFF format code 17: 64-bit signed integer
             if count == 1:
-                return struct.unpack(f'{self.endian}q', data[:8])[0]
-            return list(struct.unpack(f'{self.endian}{count}q', data[:8*count]))
-        
-        elif tag_type_enum == ExifTagType.IFD8:
-            # BigTIFF format code 18: 64-bit IFD offset
-            if count == 1:
-                return struct.unpack(f'{self.endian}Q', data[:8])[0]
-            return list(struct.unpack(f'{self.endian}{count}Q', data[:8*count]))
+                return SINT64_STRUCTS[endian].unpack(data)[0]
+            return self._unpack_array('q', data)
         
         elif tag_type_enum == ExifTagType.UNDEFINED:
             return data
         
         return None
+    
+    def _unpack_array(self, typecode: str, data: bytes) -> List[int]:
+        """
+        Decode a run of fixed-size integers in one call.
+        
+        Args:
+            typecode: array typecode of the element type
+            data: Raw bytes in the file's byte order
+            
+        Returns:
+            List of decoded integers
+        """
+        values = array(typecode, data)
+        if self.endian != NATIVE_ENDIAN and values.itemsize > 1:
+            values.byteswap()
+        return values.tolist()
@@ -0,0 +1,525 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Shared file view
+
+This module provides a per-file read buffer that is filled once and shared
+by every parser working on the same file, so that a single DNExif instance
+does not read the same file from disk several times. The buffer can
+optionally be backed by a read-only memory map, which keeps resident memory
+proportional to the bytes actually touched instead of the file size.
+
+It also provides a ranged-read layer for parsers that only need a file's
+metadata header: RangedFile fetches blocks on demand with seek(), and
+read_header_window() picks the cheapest representation for a format (the
+segments before the image data for JPEG, on-demand ranges for TIFF/RAW).
+
+Copyright 2025 DNAi inc.
+"""
+
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+
+# Minimum size of a prefix read; covers the signature and header checks
+# done by the parsers so they share a single read
+HEAD_READ_SIZE = 64 * 1024
+
+# Block size of on-demand reads in RangedFile
+RANGE_BLOCK_SIZE = 64 * 1024
+
+# Signatures of TIFF-structured files (TIFF, most RAW formats, ORF, RW2)
+TIFF_SIGNATURES = (b'II*\x00', b'MM\x00*', b'IIRO', b'MMOR', b'IIRS', b'IIU\x00', b'MMU\x00')
+
+
+class MappedBuffer(mmap.mmap):
+    """
+    Read-only memory map usable wherever the parsers expect file bytes.
+
+    mmap already supports len(), indexing, slicing, find() and rfind(). This
+    subclass adds the remaining bytes methods the parsers use (startswith,
+    endswith, count, index, the ``in`` operator) without copying the mapped
+    region. Slicing copies only the requested range; view() returns a
+    zero-copy memoryview for large payload ranges.
+    """
+
+    def __contains__(self, sub) -> bool:
+        if isinstance(sub, int):
+            sub = bytes((sub,))
+        return self.find(sub) != -1
+
+    def startswith(self, prefix, start: int = 0, end: Optional[int] = None) -> bool:
+        if end is None:
+            end = len(self)
+        if isinstance(prefix, tuple):
+            return any(self.startswith(p, start, end) for p in prefix)
+        if start + len(prefix) > end:
+            return False
+        return self[start:start + len(prefix)] == prefix
+
+    def endswith(self, suffix, start: int = 0, end: Optional[int] = None) -> bool:
+        if end is None:
+            end = len(self)
+        if isinstance(suffix, tuple):
+            return any(self.endswith(s, start, end) for s in suffix)
+        if end - len(suffix) < start:
+            return False
+        return self[end - len(suffix):end] == suffix
+
+    def count(self, sub, start: int = 0, end: Optional[int] = None) -> int:
+        if end is None:
+            end = len(self)
+        step = max(len(sub), 1)
+        total = 0
+        pos = self.find(sub, start, end)
+        while pos != -1:
+            total += 1
+            pos = self.find(sub, pos + step, end)
+        return total
+
+    def index(self, sub, start: int = 0, end: Optional[int] = None) -> int:
+        pos = self.find(sub, start, len(self) if end is None else end)
+        if pos == -1:
+            raise ValueError("subsection not found")
+        return pos
+
+    def rindex(self, sub, start: int = 0, end: Optional[int] = None) -> int:
+        pos = self.rfind(sub, start, len(self) if end is None else end)
+        if pos == -1:
+            raise ValueError("subsection not found")
+        return pos
+
+    def view(self, start: int = 0, end: Optional[int] = None) -> memoryview:
+        """
+        Return a zero-copy view of a range of the mapping.
+
+        Args:
+            start: Start offset
+            end: End offset (default: end of file)
+
+        Returns:
+            memoryview over the requested range
+        """
+        return memoryview(self)[start:end]
+
+
+def map_file(file_path: Union[str, Path]) -> Union[bytes, MappedBuffer]:
+    """
+    Memory-map a file read-only.
+
+    Empty files cannot be mapped and are returned as ``b''``.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        MappedBuffer over the file contents, or b'' for an empty file
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+        return MappedBuffer(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def close_buffer(data) -> None:
+    """
+    Close a buffer returned by map_file(); a no-op for plain bytes.
+
+    A mapping that still has exported memoryviews is left for the garbage
+    collector instead of raising.
+
+    Args:
+        data: Buffer to close
+    """
+    if isinstance(data, mmap.mmap):
+        try:
+            data.close()
+        except BufferError:
+            pass
+
+
+class FileView:
+    """
+    Read-once view over a file's contents.
+
+    The file is read from disk the first time its data is requested and the
+    resulting buffer is reused for all subsequent requests. Prefix reads
+    (e.g. signature checks) are served from the full buffer when it is
+    already loaded, and otherwise from a cached head buffer so that small
+    reads never trigger a full-file read.
+
+    With use_mmap=True the data is a MappedBuffer instead of bytes; pages
+    are loaded by the OS as parsers touch them and slices copy only the
+    requested range.
+
+    Example:
+        >>> view = FileView('image.jpg')
+        >>> signature = view.read(1024)
+        >>> parser = ExifParser(file_data=view.data)
+    """
+
+    def __init__(self, file_path: Union[str, Path], use_mmap: bool = False):
+        """
+        Initialize the file view.
+
+        Args:
+            file_path: Path to the file
+            use_mmap: If True, memory-map the file instead of reading it
+        """
+        self.file_path = str(file_path)
+        self.use_mmap = use_mmap
+        self._data: Optional[Union[bytes, MappedBuffer]] = None
+        self._head: bytes = b''
+        self._stat: Optional[os.stat_result] = None
+
+    @property
+    def data(self) -> Union[bytes, MappedBuffer]:
+        """
+        Complete file contents, read (or mapped) on first access.
+
+        Returns:
+            File data as bytes, or a MappedBuffer in mmap mode
+        """
+        if self._data is None:
+            if self.use_mmap:
+                self._data = map_file(self.file_path)
+            else:
+                with open(self.file_path, 'rb') as f:
+                    self._data = f.read()
+            # The full buffer supersedes any cached prefix
+            self._head = b''
+        return self._data
+
+    def read(self, max_length: Optional[int] = None) -> bytes:
+        """
+        Read up to max_length bytes from the start of the file.
+
+        Args:
+            max_length: Maximum number of bytes to return. If None, returns
+                        the complete file.
+
+        Returns:
+            File data prefix as bytes
+        """
+        if max_length is None:
+            return self.data
+        if self._data is not None or self.use_mmap:
+            return self.data[:max_length]
+        if len(self._head) < max_length:
+            read_size = max(max_length, HEAD_READ_SIZE)
+            with open(self.file_path, 'rb') as f:
+                self._head = f.read(read_size)
+            if len(self._head) < read_size:
+                # Short read - the prefix is the complete file
+                self._data = self._head
+                self._head = b''
+                return self._data[:max_length]
+        return self._head[:max_length]
+
+    def stat(self) -> os.stat_result:
+        """
+        Return the file's stat result, cached after the first call.
+
+        Returns:
+            os.stat_result for the file
+        """
+        if self._stat is None:
+            self._stat = os.stat(self.file_path)
+        return self._stat
+
+    @property
+    def size(self) -> int:
+        """File size in bytes."""
+        return self.stat().st_size
+
+    @property
+    def is_loaded(self) -> bool:
+        """True if the complete file contents are currently buffered."""
+        return self._data is not None
+
+    def release(self) -> None:
+        """
+        Drop the buffered file contents to reduce memory usage.
+
+        The cached stat result is kept. Data is re-read on the next access.
+        A memory map is not closed here, since parsers may still hold it;
+        it is unmapped once the last reference to it is gone.
+        """
+        self._data = None
+        self._head = b''
+
+    def invalidate(self) -> None:
+        """
+        Drop all cached state, including the stat result.
+
+        Must be called after the underlying file has been rewritten.
+        """
+        self.release()
+        self._stat = None
+
+
+class RangedFile:
+    """
+    Read-on-demand, bytes-like view of a file.
+
+    Supports the operations the parsers use on file data (len(), indexing,
+    slicing, find/rfind, startswith/endswith, count, ``in``). Data is read
+    with seek() in RANGE_BLOCK_SIZE blocks the first time a range is
+    touched and cached, so walking a TIFF IFD chain reads only the IFDs and
+    the values they point to. An optional limit exposes only a prefix of the
+    file (a fixed header window), an optional start exposes the file from
+    an offset (e.g. a TIFF structure embedded in another container), and
+    max_blocks bounds the cache for views that scan through large files.
+    readinto() reads payload ranges without caching them.
+
+    Unlike bytes and MappedBuffer, RangedFile does not support the buffer
+    protocol (memoryview, re, struct.unpack_from); slice it first.
+
+    Example:
+        >>> data = RangedFile('image.nef')
+        >>> byte_order = data[:2]
+    """
+
+    def __init__(self, file_path: Union[str, Path], limit: Optional[int] = None,
+                 block_size: int = RANGE_BLOCK_SIZE, start: int = 0,
+                 max_blocks: Optional[int] = None):
+        """
+        Initialize the ranged view.
+
+        Args:
+            file_path: Path to the file
+            limit: Optional maximum number of bytes exposed from the start of the view
+            block_size: Size of each on-demand read
+            start: Offset in the file of the first byte of the view
+            max_blocks: Optional maximum number of cached blocks; the oldest
+                        blocks are dropped first
+        """
+        self.file_path = str(file_path)
+        self.block_size = block_size
+        self.start = start
+        self.max_blocks = max_blocks
+        size = max(0, os.path.getsize(self.file_path) - start)
+        self._length = size if limit is None else min(size, limit)
+        self._blocks: Dict[int, bytes] = {}
+        self._file = None
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    def _block(self, index: int) -> bytes:
+        block = self._blocks.get(index)
+        if block is None:
+            if self._file is None:
+                self._file = open(self.file_path, 'rb')
+            self._file.seek(self.start + index * self.block_size)
+            block = self._file.read(self.block_size)
+            if self.max_blocks is not None and len(self._blocks) >= self.max_blocks:
+                del self._blocks[next(iter(self._blocks))]
+            self._blocks[index] = block
+        return block
+
+    def readinto(self, offset: int, buffer) -> int:
+        """
+        Read bytes at an offset of the view into a buffer, bypassing the cache.
+
+        Args:
+            offset: Offset in the view
+            buffer: Writable buffer (bytearray or memoryview) to fill
+
+        Returns:
+            Number of bytes read; 0 at the end of the view. May be less than
+            the buffer size before the end.
+        """
+        count = min(len(buffer), self._length - offset)
+        if count <= 0:
+            return 0
+        if self._file is None:
+            self._file = open(self.file_path, 'rb')
+        self._file.seek(self.start + offset)
+        return self._file.readinto(memoryview(buffer)[:count]) or 0
+
+    def _read_range(self, start: int, stop: int) -> bytes:
+        """Return bytes [start, stop), both already clamped to the view."""
+        if start >= stop:
+            return b''
+        first = start // self.block_size
+        last = (stop - 1) // self.block_size
+        if first == last:
+            block = self._block(first)
+        else:
+            block = b''.join(self._block(i) for i in range(first, last + 1))
+        offset = start - first * self.block_size
+        return block[offset:offset + stop - start]
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._length)
+            if step == 1:
+                return self._read_range(start, stop)
+            return self._read_range(0, self._length)[key]
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError("index out of range")
+        return self._read_range(key, key + 1)[0]
+
+    def __contains__(self, sub) -> bool:
+        return self.find(sub) != -1
+
+    def find(self, sub, start: int = 0, end: Optional[int] = None) -> int:
+        if isinstance(sub, int):
+            sub = bytes((sub,))
+        start, end, _ = slice(start, end).indices(self._length)
+        if not sub:
+            return start if start <= end else -1
+        # Scan in windows overlapping by len(sub) - 1 so matches spanning
+        # window boundaries are found
+        window = self.block_size * 4
+        overlap = len(sub) - 1
+        pos = start
+        while pos < end:
+            stop = min(end, pos + window + overlap)
+            found = self._read_range(pos, stop).find(sub)
+            if found != -1:
+                return pos + found
+            if stop >= end:
+                break
+            pos += window
+        return -1
+
+    def rfind(self, sub, start: int = 0, end: Optional[int] = None) -> int:
+        if isinstance(sub, int):
+            sub = bytes((sub,))
+        start, end, _ = slice(start, end).indices(self._length)
+        if not sub:
+            return end if start <= end else -1
+        window = self.block_size * 4
+        overlap = len(sub) - 1
+        stop = end
+        while stop > start:
+            pos = max(start, stop - window - overlap)
+            found = self._read_range(pos, stop).rfind(sub)
+            if found != -1:
+                return pos + found
+            if pos <= start:
+                break
+            stop -= window
+        return -1
+
+    def index(self, sub, start: int = 0, end: Optional[int] = None) -> int:
+        pos = self.find(sub, start, end)
+        if pos == -1:
+            raise ValueError("subsection not found")
+        return pos
+
+    def count(self, sub, start: int = 0, end: Optional[int] = None) -> int:
+        step = max(len(sub), 1)
+        total = 0
+        pos = self.find(sub, start, end)
+        while pos != -1:
+            total += 1
+            pos = self.find(sub, pos + step, end)
+        return total
+
+    def startswith(self, prefix, start: int = 0, end: Optional[int] = None) -> bool:
+        if isinstance(prefix, tuple):
+            return any(self.startswith(p, start, end) for p in prefix)
+        start, end, _ = slice(start, end).indices(self._length)
+        if start + len(prefix) > end:
+            return False
+        return self._read_range(start, start + len(prefix)) == prefix
+
+    def endswith(self, suffix, start: int = 0, end: Optional[int] = None) -> bool:
+        if isinstance(suffix, tuple):
+            return any(self.endswith(s, start, end) for s in suffix)
+        start, end, _ = slice(start, end).indices(self._length)
+        if end - len(suffix) < start:
+            return False
+        return self._read_range(end - len(suffix), end) == suffix
+
+    def close(self) -> None:
+        """Close the underlying file and drop cached blocks (reopened on next access)."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._blocks.clear()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+def jpeg_header_size(f) -> Optional[int]:
+    """
+    Find where a JPEG's marker segments end and image data begins.
+
+    Walks the segment headers with seek() without reading segment payloads.
+
+    Args:
+        f: Binary file object positioned anywhere
+
+    Returns:
+        Offset of the SOS (or EOI) marker, or None if the structure is not
+        a well-formed JPEG marker sequence
+    """
+    pos = 2  # Skip SOI
+    while True:
+        f.seek(pos)
+        header = f.read(4)
+        if len(header) < 2 or header[0] != 0xFF:
+            return None
+        marker = header[1]
+        if marker == 0xFF:
+            # Fill byte
+            pos += 1
+        elif marker in (0xDA, 0xD9):
+            # SOS / EOI - everything after is image data
+            return pos
+        elif marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+            # Standalone markers without a length field
+            pos += 2
+        elif len(header) < 4:
+            return None
+        else:
+            pos += 2 + struct.unpack('>H', header[2:4])[0]
+
+
+def read_header_window(file_path: Union[str, Path]) -> Union[bytes, RangedFile]:
+    """
+    Read the part of a file that holds its metadata header, by format.
+
+    - JPEG: only the marker segments before the image data (up to SOS),
+      which contain all APPn metadata blocks.
+    - TIFF and TIFF-based RAW: a RangedFile, so the IFD chain and the value
+      ranges it points to are fetched on demand.
+    - Anything else (or a malformed JPEG): the complete file.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        bytes or RangedFile usable as parser file data
+    """
+    with open(file_path, 'rb') as f:
+        signature = f.read(4)
+        if signature[:2] == b'\xff\xd8':
+            header_size = jpeg_header_size(f)
+            if header_size is not None:
+                f.seek(0)
+                return f.read(header_size)
+        elif signature in TIFF_SIGNATURES:
+            return RangedFile(file_path)
+        f.seek(0)
+        return f.read()
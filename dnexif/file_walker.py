@@ -0,0 +1,246 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Concurrent directory walker
+
+This module enumerates the files in a directory tree with os.scandir(),
+scanning several directories at once so that the latency of each directory
+listing (high on network filesystems such as NFS or SMB) overlaps with the
+others. Directories are filtered by name before they are entered, the file
+type comes from the directory entry (no extra stat() on most filesystems),
+and files are yielded while the walk is still in progress, so processing
+can start on the first files before the tree has been fully listed.
+
+By default files are yielded in a fixed order (depth first, in name order),
+whatever order the concurrent scans finish in. An unordered walk yields
+each batch of files as soon as its directory has been scanned.
+
+Copyright 2025 DNAi inc.
+"""
+
+import os
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+
+# Files passed to the consumer at a time, and batches buffered ahead of it
+BATCH_SIZE = 256
+QUEUE_SIZE = 64
+
+# Seconds between checks for a closed walk while waiting on a full queue
+PUT_INTERVAL = 0.1
+
+# Directories scanned ahead of the consumer in an ordered walk, and the
+# upcoming sibling directories queued each time the consumer enters one
+PREFETCH_DIRECTORIES = 1024
+PREFETCH_SIBLINGS = 64
+
+# Returns True if a file or directory with this name should be included
+NameFilter = Callable[[str], bool]
+
+_WALK_DONE = object()
+
+
+def walk_files(
+    root: Union[str, Path],
+    include_file: Optional[NameFilter] = None,
+    include_dir: Optional[NameFilter] = None,
+    recursive: bool = True,
+    workers: Optional[int] = None,
+    ordered: bool = True
+) -> Iterator[Path]:
+    """
+    Yield the files in a directory tree as they are found.
+
+    Symbolic links to files are included; symbolic links to directories are
+    not followed, so a link cycle cannot make the walk endless. Directories
+    that cannot be read are skipped. Closing the iterator early stops the
+    walk.
+
+    Args:
+        root: Directory to walk
+        include_file: Filter on file names (None includes every file)
+        include_dir: Filter on subdirectory names, applied before a
+                     directory is entered (None enters every directory)
+        recursive: If False, only the files directly in root are listed
+        workers: Number of directories scanned at once (defaults to the
+                 ThreadPoolExecutor default)
+        ordered: If True, the files of each directory are yielded in name
+                 order, followed by the files of each of its subdirectories
+                 in name order. If False, files are yielded in no particular
+                 order, as soon as their directory has been scanned.
+
+    Yields:
+        Paths of the files (root joined with their path below it)
+    """
+    if ordered:
+        return _walk_ordered(root, include_file, include_dir, recursive, workers)
+    return _walk_unordered(root, include_file, include_dir, recursive, workers)
+
+
+def _walk_ordered(
+    root: Union[str, Path],
+    include_file: Optional[NameFilter],
+    include_dir: Optional[NameFilter],
+    recursive: bool,
+    workers: Optional[int]
+) -> Iterator[Path]:
+    """Yield the files of a tree depth first, in name order (see walk_files)."""
+    lock = threading.Lock()
+    closed = threading.Event()
+    scans: Dict[str, Future] = {}  # Directories scanned ahead, not yet consumed
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='dnexif-walk')
+
+    def prefetch(directories: List[str]) -> None:
+        # Start scanning subdirectories before the consumer reaches them,
+        # keeping the number of listings held in memory bounded
+        with lock:
+            for directory in directories:
+                if closed.is_set() or len(scans) >= PREFETCH_DIRECTORIES:
+                    return
+                if directory not in scans:
+                    try:
+                        scans[directory] = executor.submit(scan, directory)
+                    except RuntimeError:
+                        # The walk was closed and the executor shut down
+                        return
+
+    def scan(directory: str) -> Tuple[List[str], List[str]]:
+        files: List[str] = []
+        subdirectories: List[str] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if closed.is_set():
+                        break
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive and (include_dir is None or include_dir(entry.name)):
+                                subdirectories.append(entry.name)
+                        elif entry.is_file() and (include_file is None or include_file(entry.name)):
+                            files.append(entry.name)
+                    except OSError:
+                        # Entry removed or unreadable while listing
+                        continue
+        except OSError:
+            # Directory removed or not readable: skip it, as glob() does
+            pass
+        files.sort()
+        subdirectories = [os.path.join(directory, name) for name in sorted(subdirectories)]
+        prefetch(subdirectories)
+        return files, subdirectories
+
+    def listing(directory: str) -> Tuple[List[str], List[str]]:
+        with lock:
+            future = scans.pop(directory, None)
+        if future is None:
+            # Not prefetched (too many directories ahead): scan it now
+            return scan(directory)
+        return future.result()
+
+    # Directories still to be walked, one [directories, next index] pair
+    # per level, innermost last
+    stack = [[[os.fspath(root)], 0]]
+    try:
+        while stack:
+            level = stack[-1]
+            directories, index = level
+            if index == len(directories):
+                stack.pop()
+                continue
+            level[1] = index + 1
+            prefetch(directories[index:index + PREFETCH_SIBLINGS])
+            directory = directories[index]
+            files, subdirectories = listing(directory)
+            for name in files:
+                yield Path(os.path.join(directory, name))
+            if subdirectories:
+                stack.append([subdirectories, 0])
+    finally:
+        closed.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _walk_unordered(
+    root: Union[str, Path],
+    include_file: Optional[NameFilter],
+    include_dir: Optional[NameFilter],
+    recursive: bool,
+    workers: Optional[int]
+) -> Iterator[Path]:
+    """Yield the files of a tree as each directory is scanned (see walk_files)."""
+    results: queue.Queue = queue.Queue(QUEUE_SIZE)
+    closed = threading.Event()
+    lock = threading.Lock()
+    pending = [1]  # Directories submitted and not yet scanned
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='dnexif-walk')
+
+    def put(item: object) -> None:
+        # Wait for room in the queue, unless the consumer has gone away
+        while not closed.is_set():
+            try:
+                results.put(item, timeout=PUT_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+    def submit(directory: str) -> None:
+        with lock:
+            pending[0] += 1
+        try:
+            executor.submit(scan, directory)
+        except RuntimeError:
+            # The walk was closed and the executor shut down
+            finished()
+
+    def finished() -> None:
+        with lock:
+            pending[0] -= 1
+            done = pending[0] == 0
+        if done:
+            put(_WALK_DONE)
+
+    def scan(directory: str) -> None:
+        batch: List[Path] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if closed.is_set():
+                        return
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive and (include_dir is None or include_dir(entry.name)):
+                                submit(entry.path)
+                        elif entry.is_file() and (include_file is None or include_file(entry.name)):
+                            batch.append(Path(entry.path))
+                            if len(batch) >= BATCH_SIZE:
+                                put(batch)
+                                batch = []
+                    except OSError:
+                        # Entry removed or unreadable while listing
+                        continue
+        except OSError:
+            # Directory removed or not readable: skip it, as glob() does
+            pass
+        finally:
+            if batch:
+                put(batch)
+            finished()
+
+    executor.submit(scan, os.fspath(root))
+    try:
+        while True:
+            item = results.get()
+            if item is _WALK_DONE:
+                return
+            yield from item
+    finally:
+        closed.set()
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -16,6 +16,8 @@ Copyright 2025 DNAi inc.
 from typing import Optional, Dict, Any
 from pathlib import Path
 
+from dnexif.format_registry import FormatHandler, find_handler
+
 
 class FormatDetector:
     """
@@ -116,6 +118,22 @@ class FormatDetector:
         
         return None
     
+    @classmethod
+    def detect_handler(cls, file_path: str, file_data: Optional[bytes] = None) -> Optional[FormatHandler]:
+        """
+        Select the registered format handler for a file.
+        
+        Args:
+            file_path: Path to file
+            file_data: File data (first few bytes, 1KB is plenty)
+            
+        Returns:
+            FormatHandler, or None if the format has no standalone parser
+            registered in dnexif.format_registry
+        """
+        path = Path(file_path)
+        return find_handler(path.name, path.suffix.lower(), file_data or b'')
+    
     @classmethod
     def is_supported_format(cls, format_name: str) -> bool:
         """
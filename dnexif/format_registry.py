@@ -0,0 +1,150 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Format handler registry
+
+This module lists the formats that are read by a single standalone parser:
+for each one its extensions, magic bytes, parser class and capabilities.
+DNExif selects the handler for a file with one dictionary lookup instead of
+testing every format in turn, and the parser module is only imported when
+a file of its format is first read.
+
+Copyright 2025 DNAi inc.
+"""
+
+import importlib
+from typing import Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+
+class FormatHandler(NamedTuple):
+    """
+    A format read by a standalone parser.
+
+    The parser class is constructed with file_path= and its parse() method
+    returns the metadata dictionary for the file.
+    """
+
+    name: str  # Format name used in messages ("Failed to parse <name> metadata ...")
+    module: str  # Module defining the parser
+    parser: str  # Parser class name
+    extensions: Tuple[str, ...] = ()  # Lowercase extensions, with the dot
+    magic: Tuple[bytes, ...] = ()  # Signatures identifying the format regardless of extension
+    file_names: Tuple[str, ...] = ()  # Exact file names (e.g. ".DS_Store")
+    name_prefixes: Tuple[str, ...] = ()  # File name prefixes (e.g. "._" for AppleDouble)
+    capabilities: FrozenSet[str] = frozenset({'read'})
+
+    def load_parser(self) -> type:
+        """Import the parser module and return the parser class."""
+        return getattr(importlib.import_module(self.module), self.parser)
+
+
+FORMAT_HANDLERS: Tuple[FormatHandler, ...] = (
+    FormatHandler('RAR', 'dnexif.rar_parser', 'RARParser', ('.rar',),
+                  magic=(b'Rar!\x1a\x07\x01\x00', b'Rar!\x1a\x07\x00')),
+    FormatHandler('7z', 'dnexif.sevenz_parser', 'SevenZParser', ('.7z',),
+                  magic=(b'7z\xbc\xaf\x27\x1c',)),
+    FormatHandler('AAE', 'dnexif.aae_parser', 'AAParser', ('.aae',)),
+    FormatHandler('Nikon adjustment', 'dnexif.nikon_adjustment_parser', 'NikonAdjustmentParser',
+                  ('.nka', '.nxd')),
+    FormatHandler('XISF', 'dnexif.xisf_parser', 'XISFParser', ('.xisf',)),
+    FormatHandler('GPX', 'dnexif.gpx_parser', 'GPXParser', ('.gpx',)),
+    FormatHandler('KML', 'dnexif.kml_parser', 'KMLParser', ('.kml',)),
+    FormatHandler('CSV', 'dnexif.csv_parser', 'CSVParser', ('.csv',)),
+    FormatHandler('PFM', 'dnexif.pfm_parser', 'PFMParser', ('.pfm',)),
+    FormatHandler('CUBE', 'dnexif.cube_parser', 'CUBEParser', ('.cube',)),
+    FormatHandler('text file', 'dnexif.text_parser', 'TextParser', ('.txt', '.log')),
+    FormatHandler('JSON file', 'dnexif.json_parser', 'JSONParser', ('.json',)),
+    FormatHandler('XML file', 'dnexif.xml_parser', 'XMLParser', ('.xml',)),
+    FormatHandler('MRC', 'dnexif.mrc_parser', 'MRCParser', ('.mrc',)),
+    FormatHandler('AppleDouble', 'dnexif.appledouble_parser', 'AppleDoubleParser',
+                  name_prefixes=('._',)),
+    FormatHandler('ON1 preset', 'dnexif.on1_parser', 'ON1Parser', ('.onp',)),
+    FormatHandler('WOFF', 'dnexif.woff_parser', 'WOFFParser', ('.woff',)),
+    FormatHandler('WOFF2', 'dnexif.woff2_parser', 'WOFF2Parser', ('.woff2',)),
+    FormatHandler('.URL', 'dnexif.url_parser', 'URLParser', ('.url',)),
+    FormatHandler('.LNK', 'dnexif.lnk_parser', 'LNKParser', ('.lnk',)),
+    FormatHandler('iWork', 'dnexif.iwork_parser', 'IWorkParser', ('.pages', '.numbers', '.key')),
+    FormatHandler('FITS', 'dnexif.fits_parser', 'FITSParser', ('.fits', '.fit', '.fts')),
+    FormatHandler('Netpbm', 'dnexif.netpbm_parser', 'NetPBMParser',
+                  ('.pam', '.pbm', '.pgm', '.ppm', '.pnm')),
+    FormatHandler('HDR', 'dnexif.hdr_parser', 'HDRParser', ('.hdr',)),
+    FormatHandler('DDS', 'dnexif.dds_parser', 'DDSParser', ('.dds',)),
+    FormatHandler('EXR', 'dnexif.exr_parser', 'EXRParser', ('.exr',)),
+    FormatHandler('WBMP', 'dnexif.wbmp_parser', 'WBMPParser', ('.wbmp',)),
+    FormatHandler('XBM', 'dnexif.xbm_parser', 'XBMParser', ('.xbm',)),
+    FormatHandler('XPM', 'dnexif.xpm_parser', 'XPMParser', ('.xpm',)),
+    FormatHandler('RAS', 'dnexif.ras_parser', 'RASParser', ('.ras',)),
+    FormatHandler('SGI', 'dnexif.sgi_parser', 'SGIParser', ('.sgi',)),
+    FormatHandler('PCD', 'dnexif.pcd_parser', 'PCDParser', ('.pcd',)),
+    FormatHandler('PICON', 'dnexif.picon_parser', 'PICONParser', ('.picon',)),
+    FormatHandler('MNG', 'dnexif.mng_parser', 'MNGParser', ('.mng',)),
+    FormatHandler('XWD', 'dnexif.xwd_parser', 'XWDParser', ('.xwd',)),
+    FormatHandler('SFW', 'dnexif.sfw_parser', 'SFWParser', ('.sfw',)),
+    FormatHandler('PES', 'dnexif.pes_parser', 'PESParser', ('.pes',)),
+    FormatHandler('PICT', 'dnexif.pict_parser', 'PICTParser', ('.pict',)),
+    FormatHandler('XCF', 'dnexif.xcf_parser', 'XCFParser', ('.xcf',)),
+    FormatHandler('SVG', 'dnexif.svg_parser', 'SVGParser', ('.svg',)),
+    FormatHandler('WPG', 'dnexif.wpg_parser', 'WGPParser', ('.wpg',)),
+    FormatHandler('VNT', 'dnexif.vnt_parser', 'VNTParser', ('.vnt',)),
+    FormatHandler('LIF', 'dnexif.lif_parser', 'LIFParser', ('.lif',)),
+    FormatHandler('LIFEXT', 'dnexif.lifext_parser', 'LIFEXTParser', ('.lifext',)),
+    FormatHandler('DS_Store', 'dnexif.ds_store_parser', 'DSStoreParser', ('.ds_store',),
+                  file_names=('.DS_Store',)),
+    FormatHandler('CZI', 'dnexif.czi_parser', 'CZIParser', ('.czi',)),
+    FormatHandler('GIF', 'dnexif.gif_parser', 'GIFParser', ('.gif',)),
+)
+
+
+def _build_indexes():
+    """Build the lookup tables of FORMAT_HANDLERS (first entry wins on conflicts)."""
+    by_extension: Dict[str, FormatHandler] = {}
+    by_file_name: Dict[str, FormatHandler] = {}
+    by_magic: Dict[int, Dict[bytes, FormatHandler]] = {}
+    by_prefix = []
+    for handler in FORMAT_HANDLERS:
+        for extension in handler.extensions:
+            by_extension.setdefault(extension, handler)
+        for file_name in handler.file_names:
+            by_file_name.setdefault(file_name, handler)
+        for signature in handler.magic:
+            by_magic.setdefault(len(signature), {}).setdefault(signature, handler)
+        for prefix in handler.name_prefixes:
+            by_prefix.append((prefix, handler))
+    # Longest signatures first, so a specific signature beats a shorter one
+    magic = tuple(sorted(by_magic.items(), reverse=True))
+    return by_extension, by_file_name, magic, tuple(by_prefix)
+
+
+_BY_EXTENSION, _BY_FILE_NAME, _BY_MAGIC, _BY_PREFIX = _build_indexes()
+
+
+def find_handler(file_name: str, file_ext: str, header: bytes = b'') -> Optional[FormatHandler]:
+    """
+    Find the handler for a file.
+
+    Magic bytes take precedence (an archive is read as an archive whatever
+    its name), then the file name, then the extension.
+
+    Args:
+        file_name: File name without directory
+        file_ext: Lowercase file extension, with the dot
+        header: First bytes of the file (1KB is plenty)
+
+    Returns:
+        FormatHandler, or None if the file is not handled by the registry
+    """
+    for length, signatures in _BY_MAGIC:
+        handler = signatures.get(header[:length])
+        if handler is not None:
+            return handler
+    handler = _BY_FILE_NAME.get(file_name)
+    if handler is not None:
+        return handler
+    for prefix, handler in _BY_PREFIX:
+        if file_name.startswith(prefix):
+            return handler
+    return _BY_EXTENSION.get(file_ext)
@@ -14,9 +14,12 @@ Copyright 2025 DNAi inc.
 """
 
 import xml.etree.ElementTree as ET
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Union, Iterable, Iterator, Callable
 from pathlib import Path
 from datetime import datetime, timedelta
+from array import array
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
 import re
 import csv
 import json
@@ -25,9 +28,81 @@ from dnexif.core import DNExif
 from dnexif.exceptions import MetadataWriteError
 
 
+# Namespaced element tag prefixes used by the streaming track readers
+_GPX_DEFAULT_PREFIX = '{http://www.topografix.com/GPX/1/1}'
+_GPX_PREFIXES = (_GPX_DEFAULT_PREFIX, '{http://www.topografix.com/GPX/1/0}', '')
+_OPENTRACKS_PREFIX = '{http://www.opentracksapp.com/xmlschemas/GpxExtensions/v1}'
+_KML_PREFIX = '{http://www.opengis.net/kml/2.2}'
+
+_GPX_WAYPOINT_TAGS = frozenset(prefix + 'wpt' for prefix in _GPX_PREFIXES)
+_GPX_POINT_TAGS = _GPX_WAYPOINT_TAGS | frozenset(prefix + 'trkpt' for prefix in _GPX_PREFIXES)
+_KML_COORDINATES_TAGS = frozenset((_KML_PREFIX + 'coordinates', 'coordinates'))
+
+
+def _iter_xml_records(
+    xml_file: str,
+    record_tags: Iterable[str]
+) -> Iterator[Tuple[str, Dict[str, str], Optional[str], Dict[str, Optional[str]]]]:
+    """
+    Stream selected elements of an XML file without keeping the tree.
+    
+    Every element is detached from its parent as soon as it is complete, so
+    memory use stays flat however large the file is.
+    
+    Args:
+        xml_file: Path to XML file
+        record_tags: Fully qualified tags of the elements to yield
+        
+    Yields:
+        Tuple of (tag, attributes, text, descendant texts) for each matching
+        element, where descendant texts maps each descendant tag to the text
+        of its first occurrence
+    """
+    parents = []
+    records = []
+    with open(xml_file, 'rb') as f:
+        for event, elem in ET.iterparse(f, events=('start', 'end')):
+            if event == 'start':
+                if elem.tag in record_tags:
+                    records.append((elem, {}))
+                parents.append(elem)
+                continue
+            
+            parents.pop()
+            if records:
+                if records[-1][0] is elem:
+                    texts = records.pop()[1]
+                    yield elem.tag, elem.attrib, elem.text, texts
+                for _, texts in records:
+                    texts.setdefault(elem.tag, elem.text)
+            if parents:
+                parents[-1].remove(elem)
+
+
+def _first_text(texts: Dict[str, Optional[str]], *tags: str) -> Optional[str]:
+    """Return the text of the first tag present in texts."""
+    for tag in tags:
+        if tag in texts:
+            return texts[tag]
+    return None
+
+
+def _to_float(text: Optional[str]) -> Optional[float]:
+    """Convert element text to float, returning None if missing or invalid."""
+    if text is None:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
 class GPSPoint:
     """Represents a GPS point with timestamp and coordinates."""
     
+    __slots__ = ('latitude', 'longitude', 'timestamp', 'altitude', 'speed',
+                 'accuracy_horizontal', 'direction')
+    
     def __init__(
         self,
         latitude: float,
@@ -63,6 +138,127 @@ class GPSPoint:
         return R * c
 
 
+class GPSTrack:
+    """
+    Time-sorted index of GPS points.
+    
+    Point timestamps are kept as seconds from the first point in a compact
+    array, so the points around an image timestamp are found by binary search
+    instead of scanning the whole track.
+    """
+    
+    def __init__(self, points: Iterable[GPSPoint]):
+        """
+        Build the index.
+        
+        Args:
+            points: GPS points in any order
+        """
+        # Stable sort keeps file order for points sharing a timestamp
+        self.points = sorted(points, key=attrgetter('timestamp'))
+        self._origin = self.points[0].timestamp if self.points else None
+        self._times = array('d', [(point.timestamp - self._origin).total_seconds() for point in self.points])
+    
+    @classmethod
+    def from_file(cls, track_file: Union[str, Path]) -> 'GPSTrack':
+        """
+        Parse a track log file into an index.
+        
+        Args:
+            track_file: Path to GPS track log (GPX, NMEA, KML, CSV or Google Takeout JSON)
+            
+        Returns:
+            GPSTrack instance
+        """
+        return cls(Geotagging.parse_track(str(track_file)))
+    
+    def __len__(self) -> int:
+        return len(self.points)
+    
+    def _first_at(self, index: int) -> int:
+        """Return the index of the first point sharing the timestamp at index."""
+        return bisect_left(self._times, self._times[index], 0, index)
+    
+    def nearest(self, timestamp: datetime) -> Tuple[GPSPoint, float]:
+        """
+        Find the point closest in time to a timestamp.
+        
+        Ties go to the earlier point.
+        
+        Args:
+            timestamp: Timestamp to look up
+            
+        Returns:
+            Tuple of (closest point, absolute time difference in seconds)
+        """
+        if not self.points:
+            raise MetadataWriteError("No GPS points found in track file")
+        offset = (timestamp - self._origin).total_seconds()
+        index = bisect_left(self._times, offset)
+        best = None
+        best_diff = None
+        # Last point before the timestamp, then first point at or after it
+        candidates = []
+        if index > 0:
+            candidates.append(self._first_at(index - 1))
+        if index < len(self.points):
+            candidates.append(index)
+        for candidate in candidates:
+            point = self.points[candidate]
+            diff = abs((point.timestamp - timestamp).total_seconds())
+            if best_diff is None or diff < best_diff:
+                best = point
+                best_diff = diff
+        return best, best_diff
+    
+    def bracket(self, timestamp: datetime) -> Tuple[Optional[GPSPoint], Optional[GPSPoint]]:
+        """
+        Find the points surrounding a timestamp.
+        
+        Args:
+            timestamp: Timestamp to look up
+            
+        Returns:
+            Tuple of (latest point at or before the timestamp, earliest point
+            after it); either may be None at the ends of the track
+        """
+        if not self.points:
+            return None, None
+        offset = (timestamp - self._origin).total_seconds()
+        index = bisect_right(self._times, offset)
+        before = self.points[self._first_at(index - 1)] if index > 0 else None
+        after = self.points[index] if index < len(self.points) else None
+        return before, after
+    
+    def locate(self, timestamp: datetime, interpolate: bool = True) -> Tuple[GPSPoint, float]:
+        """
+        Find the position for a timestamp.
+        
+        Args:
+            timestamp: Timestamp to look up
+            interpolate: Whether to interpolate between the surrounding points
+            
+        Returns:
+            Tuple of (position, time difference to the closest point in seconds)
+        """
+        point, time_diff = self.nearest(timestamp)
+        if interpolate and len(self.points) > 1:
+            before, after = self.bracket(timestamp)
+            if before and after:
+                total_time = (after.timestamp - before.timestamp).total_seconds()
+                image_time = (timestamp - before.timestamp).total_seconds()
+                ratio = image_time / total_time if total_time > 0 else 0
+                
+                latitude = before.latitude + (after.latitude - before.latitude) * ratio
+                longitude = before.longitude + (after.longitude - before.longitude) * ratio
+                altitude = None
+                if before.altitude is not None and after.altitude is not None:
+                    altitude = before.altitude + (after.altitude - before.altitude) * ratio
+                
+                point = GPSPoint(latitude, longitude, timestamp, altitude)
+        return point, time_diff
+
+
 class Geotagging:
     """
     Advanced geotagging features.
@@ -82,104 +278,65 @@ class Geotagging:
         Returns:
             List of GPSPoint objects
         """
-        points = []
+        return list(Geotagging.iter_gpx_points(gpx_file))
+    
+    @staticmethod
+    def iter_gpx_points(gpx_file: str) -> Iterator[GPSPoint]:
+        """
+        Stream the points of a GPX (GPS Exchange Format) file.
         
-        try:
-            tree = ET.parse(gpx_file)
-            root = tree.getroot()
-            
-            # Handle different GPX namespaces
-            namespaces = {
-                'gpx': 'http://www.topografix.com/GPX/1/1',
-                'gpx10': 'http://www.topografix.com/GPX/1/0'
-            }
-            
-            # Find all track points
-            for trk in root.findall('.//gpx:trk', namespaces) or root.findall('.//trk'):
-                for trkseg in trk.findall('.//gpx:trkseg', namespaces) or trk.findall('.//trkseg'):
-                    for trkpt in trkseg.findall('.//gpx:trkpt', namespaces) or trkseg.findall('.//trkpt'):
-                        lat = float(trkpt.get('lat', 0))
-                        lon = float(trkpt.get('lon', 0))
-                        
-                        # Get timestamp
-                        time_elem = trkpt.find('.//gpx:time', namespaces)
-                        if time_elem is None:
-                            time_elem = trkpt.find('.//time')
-                        if time_elem is not None and time_elem.text is not None:
-                            timestamp = datetime.fromisoformat(time_elem.text.replace('Z', '+00:00'))
-                        else:
-                            timestamp = datetime.now()
-                        
-                        # Get elevation
-                        ele_elem = trkpt.find('.//gpx:ele', namespaces)
-                        if ele_elem is None:
-                            ele_elem = trkpt.find('.//ele')
-                        altitude = float(ele_elem.text) if ele_elem is not None and ele_elem.text is not None else None
-                        
-                        # Get speed (OpenTracks extension)
-                        speed = None
-                        # Check for OpenTracks speed extension (namespace: http://www.opentracksapp.com/xmlschemas/GpxExtensions/v1)
-                        speed_elem = trkpt.find('.//{http://www.opentracksapp.com/xmlschemas/GpxExtensions/v1}speed')
-                        if speed_elem is None:
-                            # Try without namespace
-                            speed_elem = trkpt.find('.//speed')
-                        if speed_elem is not None and speed_elem.text is not None:
-                            try:
-                                speed = float(speed_elem.text)  # Speed in m/s
-                            except (ValueError, TypeError):
-                                pass
-                        
-                        # Get accuracy_horizontal (OpenTracks extension)
-                        accuracy_horizontal = None
-                        # Check for OpenTracks accuracy extension
-                        accuracy_elem = trkpt.find('.//{http://www.opentracksapp.com/xmlschemas/GpxExtensions/v1}accuracy')
-                        if accuracy_elem is None:
-                            # Try without namespace
-                            accuracy_elem = trkpt.find('.//accuracy')
-                        if accuracy_elem is None:
-                            # Try hdop (horizontal dilution of precision) as accuracy indicator
-                            hdop_elem = trkpt.find('.//{http://www.opentracksapp.com/xmlschemas/GpxExtensions/v1}hdop')
-                            if hdop_elem is None:
-                                hdop_elem = trkpt.find('.//hdop')
-                            if hdop_elem is not None and hdop_elem.text is not None:
-                                try:
-                                    # Convert HDOP to approximate accuracy (HDOP * ~5 meters is typical)
-                                    hdop = float(hdop_elem.text)
-                                    accuracy_horizontal = hdop * 5.0  # Approximate conversion
-                                except (ValueError, TypeError):
-                                    pass
-                        elif accuracy_elem.text is not None:
-                            try:
-                                accuracy_horizontal = float(accuracy_elem.text)  # Accuracy in meters
-                            except (ValueError, TypeError):
-                                pass
-                        
-                        points.append(GPSPoint(lat, lon, timestamp, altitude, speed, accuracy_horizontal))
+        The file is read incrementally and each point is discarded from the
+        XML tree once it has been decoded, so memory use does not grow with
+        the size of the track. Track points are yielded in file order,
+        followed by the waypoints.
+        
+        Args:
+            gpx_file: Path to GPX file
             
-            # Also check for waypoints
-            for wpt in root.findall('.//gpx:wpt', namespaces) or root.findall('.//wpt'):
-                lat = float(wpt.get('lat', 0))
-                lon = float(wpt.get('lon', 0))
+        Yields:
+            GPSPoint objects
+        """
+        waypoints = []
+        
+        try:
+            for tag, attrib, _, texts in _iter_xml_records(gpx_file, _GPX_POINT_TAGS):
+                namespace = tag[:tag.index('}') + 1] if tag.startswith('{') else _GPX_DEFAULT_PREFIX
+                lat = float(attrib.get('lat', 0))
+                lon = float(attrib.get('lon', 0))
                 
-                time_elem = wpt.find('.//gpx:time', namespaces)
-                if time_elem is None:
-                    time_elem = wpt.find('.//time')
-                if time_elem is not None and time_elem.text is not None:
-                    timestamp = datetime.fromisoformat(time_elem.text.replace('Z', '+00:00'))
+                # Get timestamp
+                time_text = _first_text(texts, namespace + 'time', 'time')
+                if time_text is not None:
+                    timestamp = datetime.fromisoformat(time_text.replace('Z', '+00:00'))
                 else:
                     timestamp = datetime.now()
                 
-                ele_elem = wpt.find('.//gpx:ele', namespaces)
-                if ele_elem is None:
-                    ele_elem = wpt.find('.//ele')
-                altitude = float(ele_elem.text) if ele_elem is not None and ele_elem.text is not None else None
+                # Get elevation
+                ele_text = _first_text(texts, namespace + 'ele', 'ele')
+                altitude = float(ele_text) if ele_text is not None else None
+                
+                if tag in _GPX_WAYPOINT_TAGS:
+                    waypoints.append(GPSPoint(lat, lon, timestamp, altitude))
+                    continue
                 
-                points.append(GPSPoint(lat, lon, timestamp, altitude))
+                # Get speed in m/s (OpenTracks extension)
+                speed = _to_float(_first_text(texts, _OPENTRACKS_PREFIX + 'speed', 'speed'))
+                
+                # Get accuracy_horizontal in meters (OpenTracks extension)
+                if _OPENTRACKS_PREFIX + 'accuracy' in texts or 'accuracy' in texts:
+                    accuracy_horizontal = _to_float(_first_text(texts, _OPENTRACKS_PREFIX + 'accuracy', 'accuracy'))
+                else:
+                    # Try hdop (horizontal dilution of precision) as accuracy indicator
+                    hdop = _to_float(_first_text(texts, _OPENTRACKS_PREFIX + 'hdop', 'hdop'))
+                    # Convert HDOP to approximate accuracy (HDOP * ~5 meters is typical)
+                    accuracy_horizontal = hdop * 5.0 if hdop is not None else None
+                
+                yield GPSPoint(lat, lon, timestamp, altitude, speed, accuracy_horizontal)
         
         except Exception as e:
             raise MetadataWriteError(f"Failed to parse GPX file: {str(e)}")
         
-        return points
+        yield from waypoints
     
     @staticmethod
     def parse_nmea(nmea_file: str) -> List[GPSPoint]:
@@ -299,58 +456,48 @@ class Geotagging:
         Returns:
             List of GPSPoint objects
         """
-        points = []
+        return list(Geotagging.iter_kml_points(kml_file))
+    
+    @staticmethod
+    def iter_kml_points(kml_file: str) -> Iterator[GPSPoint]:
+        """
+        Stream the points of a KML (Keyhole Markup Language) file.
         
-        try:
-            tree = ET.parse(kml_file)
-            root = tree.getroot()
-            
-            # Handle KML namespaces
-            namespaces = {
-                'kml': 'http://www.opengis.net/kml/2.2'
-            }
-            
-            # Find all coordinates
-            coord_elems = root.findall('.//kml:coordinates', namespaces)
-            if not coord_elems:
-                coord_elems = root.findall('.//coordinates')
+        The file is read incrementally and each coordinates element is
+        discarded from the XML tree once it has been decoded.
+        
+        Args:
+            kml_file: Path to KML file
             
-            for coord_elem in coord_elems:
-                if coord_elem.text:
-                    coord_str = coord_elem.text.strip()
-                    for coord_line in coord_str.split():
-                        parts = coord_line.split(',')
-                        if len(parts) >= 2:
-                            longitude = float(parts[0])
-                            latitude = float(parts[1])
-                            altitude = float(parts[2]) if len(parts) >= 3 and parts[2] else None
-                            
-                            # Try to find timestamp - search in parent elements
-                            timestamp = datetime.now()
-                            parent = coord_elem
-                            for _ in range(5):  # Search up to 5 levels up
-                                when_elem = parent.find('.//kml:when', namespaces)
-                                if when_elem is None:
-                                    when_elem = parent.find('.//when')
-                                if when_elem is not None and when_elem.text:
-                                    try:
-                                        timestamp = datetime.fromisoformat(when_elem.text.replace('Z', '+00:00'))
-                                        break
-                                    except:
-                                        pass
-                                # Move to parent
-                                parent_list = list(parent)
-                                if parent_list:
-                                    parent = parent_list[0]
-                                else:
-                                    break
-                            
-                            points.append(GPSPoint(latitude, longitude, timestamp, altitude))
+        Yields:
+            GPSPoint objects
+        """
+        try:
+            for _, _, text, texts in _iter_xml_records(kml_file, _KML_COORDINATES_TAGS):
+                if not text:
+                    continue
+                
+                # Timestamp from a when element inside the coordinates, if any
+                when_timestamp = None
+                when_text = _first_text(texts, _KML_PREFIX + 'when', 'when')
+                if when_text:
+                    try:
+                        when_timestamp = datetime.fromisoformat(when_text.replace('Z', '+00:00'))
+                    except ValueError:
+                        pass
+                
+                for coord_line in text.split():
+                    parts = coord_line.split(',')
+                    if len(parts) >= 2:
+                        longitude = float(parts[0])
+                        latitude = float(parts[1])
+                        altitude = float(parts[2]) if len(parts) >= 3 and parts[2] else None
+                        timestamp = when_timestamp or datetime.now()
+                        
+                        yield GPSPoint(latitude, longitude, timestamp, altitude)
         
         except Exception as e:
             raise MetadataWriteError(f"Failed to parse KML file: {str(e)}")
-        
-        return points
     
     @staticmethod
     def parse_columbus_csv(csv_file: str) -> List[GPSPoint]:
@@ -697,6 +844,37 @@ class Geotagging:
         
         return points
     
+    @staticmethod
+    def parse_track(track_file: str) -> List[GPSPoint]:
+        """
+        Parse a GPS track log, choosing the parser from the file extension.
+        
+        Args:
+            track_file: Path to GPS track log (GPX, NMEA, KML, CSV or Google Takeout JSON)
+            
+        Returns:
+            List of GPSPoint objects
+        """
+        ext = Path(track_file).suffix.lower()
+        
+        if ext == '.gpx':
+            points = Geotagging.parse_gpx(track_file)
+        elif ext == '.nmea' or ext == '.txt':
+            points = Geotagging.parse_nmea(track_file)
+        elif ext == '.kml':
+            points = Geotagging.parse_kml(track_file)
+        elif ext == '.csv':
+            points = Geotagging.parse_columbus_csv(track_file)
+        elif ext == '.json':
+            points = Geotagging.parse_google_takeout_json(track_file)
+        else:
+            raise MetadataWriteError(f"Unsupported track file format: {ext}")
+        
+        if not points:
+            raise MetadataWriteError("No GPS points found in track file")
+        
+        return points
+    
     @staticmethod
     def geotag_from_track(
         image_file: str,
@@ -709,6 +887,9 @@ class Geotagging:
         """
         Geotag an image from a GPS track log file.
         
+        To geotag many images from the same track, use geotag_batch, which
+        parses the track only once.
+        
         Args:
             image_file: Path to image file
             track_file: Path to GPS track log (GPX, NMEA, or KML)
@@ -718,33 +899,157 @@ class Geotagging:
         Returns:
             Dictionary with geotagging results
         """
-        # Parse track file based on extension
-        track_path = Path(track_file)
-        ext = track_path.suffix.lower()
+        track = GPSTrack.from_file(track_file)
+        return Geotagging._geotag_with_track(
+            image_file, track, time_offset, interpolate, gps_hpos_err, gps_quadrant
+        )
+    
+    @staticmethod
+    def geotag_batch(
+        images: Iterable[Union[str, Path]],
+        track: Union[str, Path, GPSTrack, List[GPSPoint]],
+        time_offset: Optional[timedelta] = None,
+        interpolate: bool = True,
+        gps_hpos_err: Optional[float] = None,
+        gps_quadrant: Optional[str] = None,
+        error_handler: Optional[Callable[[str, Exception], None]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Geotag many images from one GPS track.
         
-        if ext == '.gpx':
-            points = Geotagging.parse_gpx(track_file)
-        elif ext == '.nmea' or ext == '.txt':
-            points = Geotagging.parse_nmea(track_file)
-        elif ext == '.kml':
-            points = Geotagging.parse_kml(track_file)
-        elif ext == '.csv':
-            points = Geotagging.parse_columbus_csv(track_file)
-        elif ext == '.json':
-            points = Geotagging.parse_google_takeout_json(track_file)
-        else:
-            raise MetadataWriteError(f"Unsupported track file format: {ext}")
+        The track is parsed and indexed once; each image is then located by
+        binary search and written with a single save.
         
-        if not points:
+        Args:
+            images: Paths to image files
+            track: Path to GPS track log, a GPSTrack, or a list of GPSPoint objects
+            time_offset: Optional time offset to apply (for camera clock drift)
+            interpolate: Whether to interpolate between GPS points
+            gps_hpos_err: Optional GPSHPositioningError to write (meters)
+            gps_quadrant: Optional GPSQuadrant to write (N, S, E, W, NE, NW, SE, SW)
+            error_handler: Optional callback function for handling errors (path, exception)
+            
+        Returns:
+            Dictionary mapping image paths to geotagging results; failed images
+            map to {'success': False, 'error': message}
+            
+        Example:
+            >>> results = Geotagging.geotag_batch(['a.jpg', 'b.jpg'], 'day.gpx')
+            >>> print(results['a.jpg']['latitude'])
+        """
+        if not isinstance(track, GPSTrack):
+            if isinstance(track, (str, Path)):
+                track = GPSTrack.from_file(track)
+            else:
+                track = GPSTrack(track)
+        if not track:
             raise MetadataWriteError("No GPS points found in track file")
         
-        # Get image timestamp
+        results = {}
+        for image_file in images:
+            image_file = str(image_file)
+            try:
+                results[image_file] = Geotagging._geotag_with_track(
+                    image_file, track, time_offset, interpolate, gps_hpos_err, gps_quadrant
+                )
+            except Exception as e:
+                if error_handler:
+                    error_handler(image_file, e)
+                results[image_file] = {'success': False, 'error': str(e)}
+        return results
+    
+    # Marker for tags that had no pending change before being set
+    _UNSET = object()
+    
+    @staticmethod
+    def _restore_tags(manager: DNExif, previous: Dict[str, Any]) -> None:
+        """
+        Restore pending tag changes recorded before setting tags.
+        
+        Args:
+            manager: DNExif instance
+            previous: Tag name -> previous pending value, or _UNSET if none
+        """
+        for tag_name, value in previous.items():
+            if value is Geotagging._UNSET:
+                manager.modified_tags.pop(tag_name, None)
+            else:
+                manager.modified_tags[tag_name] = value
+    
+    @staticmethod
+    def _set_tags_or_restore(manager: DNExif, tags: Dict[str, Any]) -> bool:
+        """
+        Set a group of tags, leaving none of them set if one fails.
+        
+        Args:
+            manager: DNExif instance
+            tags: Tags to set
+            
+        Returns:
+            True if all tags were set
+        """
+        previous = {tag_name: manager.modified_tags.get(tag_name, Geotagging._UNSET) for tag_name in tags}
+        try:
+            for tag_name, value in tags.items():
+                manager.set_tag(tag_name, value)
+        except Exception:
+            Geotagging._restore_tags(manager, previous)
+            return False
+        return True
+    
+    @staticmethod
+    def _save_tags_or_restore(manager: DNExif, tags: Dict[str, Any]) -> bool:
+        """
+        Set and save a group of tags, dropping them again if the save fails.
+        
+        Args:
+            manager: DNExif instance without pending changes
+            tags: Tags to write
+            
+        Returns:
+            True if the tags were written
+        """
+        if not Geotagging._set_tags_or_restore(manager, tags):
+            return False
+        try:
+            manager.save()
+        except Exception:
+            Geotagging._restore_tags(manager, {tag_name: Geotagging._UNSET for tag_name in tags})
+            return False
+        return True
+    
+    @staticmethod
+    def _geotag_with_track(
+        image_file: str,
+        track: GPSTrack,
+        time_offset: Optional[timedelta],
+        interpolate: bool,
+        gps_hpos_err: Optional[float],
+        gps_quadrant: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Geotag an image from an indexed track.
+        
+        The position and the optional GPS tags are written in one save. If
+        that save fails, the position is written alone and each optional
+        group is added best-effort with its own save.
+        
+        Args:
+            image_file: Path to image file
+            track: Indexed GPS track
+            time_offset: Optional time offset to apply (for camera clock drift)
+            interpolate: Whether to interpolate between GPS points
+            gps_hpos_err: Optional GPSHPositioningError to write (meters)
+            gps_quadrant: Optional GPSQuadrant to write
+            
+        Returns:
+            Dictionary with geotagging results
+        """
         try:
             manager = DNExif(image_file)
-            metadata = manager.get_all_metadata()
             
             # Try to get DateTimeOriginal
-            dt_str = metadata.get('EXIF:DateTimeOriginal') or metadata.get('IFD0:DateTime')
+            dt_str = manager.get_formatted_tag('EXIF:DateTimeOriginal') or manager.get_formatted_tag('IFD0:DateTime')
             if not dt_str:
                 raise MetadataWriteError("Image has no timestamp - cannot geotag")
             
@@ -755,128 +1060,80 @@ class Geotagging:
             if time_offset:
                 image_dt = image_dt + time_offset
             
-            # Find closest GPS point
-            closest_point = None
-            min_time_diff = None
-            
-            for point in points:
-                time_diff = abs((point.timestamp - image_dt).total_seconds())
-                if min_time_diff is None or time_diff < min_time_diff:
-                    min_time_diff = time_diff
-                    closest_point = point
+            closest_point, min_time_diff = track.locate(image_dt, interpolate)
             
-            if not closest_point:
-                raise MetadataWriteError("Could not find matching GPS point")
-            
-            # Interpolate if requested and we have multiple points
-            if interpolate and len(points) > 1:
-                # Find points before and after image time
-                before = None
-                after = None
-                
-                for point in points:
-                    if point.timestamp <= image_dt:
-                        if before is None or point.timestamp > before.timestamp:
-                            before = point
-                    else:
-                        if after is None or point.timestamp < after.timestamp:
-                            after = point
-                
-                if before and after:
-                    # Interpolate
-                    total_time = (after.timestamp - before.timestamp).total_seconds()
-                    image_time = (image_dt - before.timestamp).total_seconds()
-                    ratio = image_time / total_time if total_time > 0 else 0
-                    
-                    latitude = before.latitude + (after.latitude - before.latitude) * ratio
-                    longitude = before.longitude + (after.longitude - before.longitude) * ratio
-                    altitude = None
-                    if before.altitude is not None and after.altitude is not None:
-                        altitude = before.altitude + (after.altitude - before.altitude) * ratio
-                    
-                    closest_point = GPSPoint(latitude, longitude, image_dt, altitude)
-            
-            # Geotag the image
             from dnexif.advanced_features import AdvancedFeatures
-            result = AdvancedFeatures.geotag(
-                image_file,
+            gps_tags = AdvancedFeatures.gps_position_tags(
                 closest_point.latitude,
                 closest_point.longitude,
                 closest_point.altitude
             )
+            result = {
+                'latitude': closest_point.latitude,
+                'longitude': closest_point.longitude,
+                'altitude': closest_point.altitude,
+                'success': True
+            }
+            # Optional tags as (result entries, tags) pairs; each pair is
+            # skipped on its own if its tags cannot be set
+            optional_tags = []
             
             # Write GPSDOP and GPSMeasureMode if accuracy_horizontal (hdop/pdop) information exists
             if closest_point.accuracy_horizontal is not None:
-                try:
-                    manager = DNExif(image_file)
-                    
-                    # Convert accuracy_horizontal to HDOP (approximately accuracy / 5)
-                    # HDOP is typically accuracy / 5 meters
-                    hdop = closest_point.accuracy_horizontal / 5.0
-                    
-                    # Write GPSDOP (GPS Dilution of Precision)
-                    # GPSDOP is typically HDOP for horizontal accuracy
-                    manager.set_tag('GPS:GPSDOP', f"{hdop:.2f}")
-                    
-                    # Write GPSMeasureMode
-                    # 2 = 2D measurement (no altitude), 3 = 3D measurement (with altitude)
-                    if closest_point.altitude is not None:
-                        manager.set_tag('GPS:GPSMeasureMode', '3')
-                    else:
-                        manager.set_tag('GPS:GPSMeasureMode', '2')
-                    
-                    manager.save()
-                    result['gpsdop'] = hdop
-                    result['gpsmeasuremode'] = '3' if closest_point.altitude is not None else '2'
-                except Exception:
-                    # If writing GPSDOP/GPSMeasureMode fails, continue without them
-                    pass
+                # Convert accuracy_horizontal to HDOP (approximately accuracy / 5)
+                hdop = closest_point.accuracy_horizontal / 5.0
+                # 2 = 2D measurement (no altitude), 3 = 3D measurement (with altitude)
+                measure_mode = '3' if closest_point.altitude is not None else '2'
+                optional_tags.append((
+                    {'gpsdop': hdop, 'gpsmeasuremode': measure_mode},
+                    {'GPS:GPSDOP': f"{hdop:.2f}", 'GPS:GPSMeasureMode': measure_mode}
+                ))
             
-            # Write GPSHPositioningError if GeoHPosErr option is provided
+            # Write GPSHPositioningError if GeoHPosErr option is provided (meters)
             if gps_hpos_err is not None:
-                try:
-                    manager = DNExif(image_file)
-                    # GPSHPositioningError is stored in meters
-                    manager.set_tag('GPS:GPSHPositioningError', f"{gps_hpos_err:.2f}")
-                    manager.save()
-                    result['gpshposerr'] = gps_hpos_err
-                except Exception:
-                    # If writing GPSHPositioningError fails, continue without it
-                    pass
+                optional_tags.append((
+                    {'gpshposerr': gps_hpos_err},
+                    {'GPS:GPSHPositioningError': f"{gps_hpos_err:.2f}"}
+                ))
             
             # Write GPSQuadrant if GPSQuadrant option is provided
             if gps_quadrant is not None:
-                try:
-                    manager = DNExif(image_file)
-                    # Validate quadrant value (N, S, E, W, NE, NW, SE, SW)
-                    valid_quadrants = ['N', 'S', 'E', 'W', 'NE', 'NW', 'SE', 'SW']
-                    quadrant_upper = gps_quadrant.upper()
-                    if quadrant_upper in valid_quadrants:
-                        # Store GPSQuadrant as a custom tag or use GPSImgDirectionRef if appropriate
-                        # For now, store as a custom tag GPS:GPSQuadrant
-                        manager.set_tag('GPS:GPSQuadrant', quadrant_upper)
-                        manager.save()
-                        result['gpsquadrant'] = quadrant_upper
-                except Exception:
-                    # If writing GPSQuadrant fails, continue without it
-                    pass
+                quadrant_upper = gps_quadrant.upper()
+                if quadrant_upper in ('N', 'S', 'E', 'W', 'NE', 'NW', 'SE', 'SW'):
+                    optional_tags.append((
+                        {'gpsquadrant': quadrant_upper},
+                        {'GPS:GPSQuadrant': quadrant_upper}
+                    ))
             
             # Write GPSImgDirection if reference direction is available from CSV
+            # (GPSImgDirectionRef: 'M' = Magnetic North, 'T' = True North)
             if closest_point.direction is not None:
-                try:
-                    manager = DNExif(image_file)
-                    # GPSImgDirection is stored in degrees (0-360)
-                    # GPSImgDirectionRef: 'M' = Magnetic North, 'T' = True North
-                    manager.set_tag('GPS:GPSImgDirectionRef', 'T')  # Default to True North
-                    manager.set_tag('GPS:GPSImgDirection', f"{closest_point.direction:.2f}")
-                    manager.save()
-                    result['gpsimgdirection'] = closest_point.direction
-                except Exception:
-                    # If writing GPSImgDirection fails, continue without it
-                    pass
+                optional_tags.append((
+                    {'gpsimgdirection': closest_point.direction},
+                    {'GPS:GPSImgDirectionRef': 'T', 'GPS:GPSImgDirection': f"{closest_point.direction:.2f}"}
+                ))
+            
+            for tag_name, value in gps_tags.items():
+                manager.set_tag(tag_name, value)
+            applied = [(result_entries, tags) for result_entries, tags in optional_tags
+                       if Geotagging._set_tags_or_restore(manager, tags)]
+            
+            # All GPS tags are normally written in a single save
+            try:
+                manager.save()
+            except Exception:
+                # Optional tags are best-effort: drop them, write the position
+                # on its own, then add each optional pair with its own save
+                for _, tags in applied:
+                    Geotagging._restore_tags(manager, {tag_name: Geotagging._UNSET for tag_name in tags})
+                manager.save()
+                applied = [(result_entries, tags) for result_entries, tags in applied
+                           if Geotagging._save_tags_or_restore(manager, tags)]
+            for result_entries, _ in applied:
+                result.update(result_entries)
             
             result['time_offset'] = min_time_diff
-            result['interpolated'] = interpolate and len(points) > 1
+            result['interpolated'] = interpolate and len(track) > 1
             
             return result
         
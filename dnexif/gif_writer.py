@@ -18,8 +18,14 @@ from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
 from dnexif.exceptions import MetadataWriteError
+from dnexif.file_view import RangedFile
+from dnexif.stream_copy import LayoutPiece, atomic_output, atomic_write, write_layout
 from dnexif.xmp_writer import XMPWriter
 
+# Blocks cached while indexing a GIF; every image's sub-block sizes are
+# walked once, so only the most recent blocks need to stay in memory
+GIF_CACHE_BLOCKS = 4
+
 
 class GIFWriter:
     """
@@ -62,35 +68,81 @@ class GIFWriter:
         Raises:
             MetadataWriteError: If writing fails
         """
-        if not original_data.startswith(b'GIF87a') and not original_data.startswith(b'GIF89a'):
-            raise MetadataWriteError("Invalid GIF file")
-        
         try:
-            # Parse GIF structure
-            blocks = self._parse_gif_blocks(original_data)
-            
-            # Extract XMP metadata
-            xmp_metadata = {
-                k: v for k, v in metadata.items()
-                if k.startswith('XMP:')
-            }
-            artist_value = metadata.get('EXIF:Artist') or metadata.get('Artist')
-            if artist_value and 'XMP:Creator' not in xmp_metadata:
-                xmp_metadata['XMP:Creator'] = artist_value
-            
-            # Build new GIF file
-            new_gif_data = self._build_gif_file(blocks, xmp_metadata)
+            layout = self._build_gif_layout(original_data, metadata)
+            atomic_write(output_path, b''.join(
+                original_data[piece[0]:piece[1]] if isinstance(piece, tuple) else piece
+                for piece in layout
+            ))
+        except Exception as e:
+            if isinstance(e, MetadataWriteError):
+                raise
+            raise MetadataWriteError(f"Failed to write GIF file: {str(e)}")
+    
+    def write_gif_file(
+        self,
+        file_path: str,
+        metadata: Dict[str, Any],
+        output_path: str
+    ) -> None:
+        """
+        Write metadata to a GIF file without loading the image data.
+        
+        The blocks are indexed through a bounded RangedFile; the rebuilt
+        extension blocks are written as new bytes and every image (its
+        descriptor, color table and LZW data) is copied from the original.
+        
+        Args:
+            file_path: Original GIF file path
+            metadata: Metadata dictionary to write
+            output_path: Output file path (may be file_path itself)
             
-            # Write to output file
-            with open(output_path, 'wb') as f:
-                f.write(new_gif_data)
-                
+        Raises:
+            MetadataWriteError: If writing fails
+        """
+        file_data = RangedFile(file_path, max_blocks=GIF_CACHE_BLOCKS)
+        try:
+            layout = self._build_gif_layout(file_data, metadata)
+            with atomic_output(output_path) as output:
+                with open(file_path, 'rb') as source:
+                    write_layout(source, output, layout)
         except Exception as e:
             if isinstance(e, MetadataWriteError):
                 raise
             raise MetadataWriteError(f"Failed to write GIF file: {str(e)}")
+        finally:
+            file_data.close()
+    
+    def _build_gif_layout(self, original_data: bytes, metadata: Dict[str, Any]) -> List[LayoutPiece]:
+        """
+        Build the layout of a GIF file with updated metadata.
+        
+        Args:
+            original_data: Original GIF file data (bytes or a RangedFile)
+            metadata: Metadata dictionary to write
+            
+        Returns:
+            Layout of new bytes and (start, end) ranges of original_data
+        """
+        if not original_data.startswith(b'GIF87a') and not original_data.startswith(b'GIF89a'):
+            raise MetadataWriteError("Invalid GIF file")
+        
+        # Parse GIF structure
+        blocks = self._parse_gif_blocks(original_data)
+        
+        # Extract XMP metadata
+        xmp_metadata = {
+            k: v for k, v in metadata.items()
+            if k.startswith('XMP:')
+        }
+        artist_value = metadata.get('EXIF:Artist') or metadata.get('Artist')
+        if artist_value and 'XMP:Creator' not in xmp_metadata:
+            xmp_metadata['XMP:Creator'] = artist_value
+        
+        # Build new GIF file
+        return self._build_gif_file(blocks, xmp_metadata)
     
-    def _parse_gif_blocks(self, gif_data: bytes) -> List[Tuple[int, bytes]]:
+    def _parse_gif_blocks(self, gif_data: bytes) -> List[Tuple[int, LayoutPiece]]:
         """
         Parse GIF blocks from file data.
         
@@ -98,7 +150,8 @@ class GIFWriter:
             gif_data: GIF file data
             
         Returns:
-            List of (block_type, block_data) tuples
+            List of (block_type, block_data) tuples; the data of image
+            blocks is their (start, end) range in gif_data
         """
         blocks = []
         offset = 0
@@ -186,10 +239,10 @@ class GIFWriter:
                     break
             elif gif_data[offset] == self.IMAGE_SEPARATOR:
                 # Image data block
-                image_data = self._read_image_data(gif_data, offset)
-                if image_data:
-                    blocks.append((self.IMAGE_SEPARATOR, image_data))
-                    offset += len(image_data)
+                image_end = self._find_image_data_end(gif_data, offset)
+                if image_end is not None:
+                    blocks.append((self.IMAGE_SEPARATOR, (offset, image_end)))
+                    offset = image_end
                 else:
                     break
             elif gif_data[offset] == self.TRAILER:
@@ -303,21 +356,20 @@ class GIFWriter:
         
         return bytes(result) if result else None
     
-    def _read_image_data(self, gif_data: bytes, offset: int) -> Optional[bytes]:
+    def _find_image_data_end(self, gif_data: bytes, offset: int) -> Optional[int]:
         """
-        Read image data block from GIF.
+        Find the end of an image data block in a GIF.
         
         Args:
             gif_data: GIF file data
             offset: Starting offset (should be at IMAGE_SEPARATOR)
             
         Returns:
-            Image data bytes, or None if invalid
+            Offset just past the image data, or None if invalid
         """
         if offset >= len(gif_data) or gif_data[offset] != self.IMAGE_SEPARATOR:
             return None
         
-        start_offset = offset
         offset += 1
         
         # Read Image Descriptor (9 bytes)
@@ -348,13 +400,13 @@ class GIFWriter:
                     break
                 offset += block_size + 1
         
-        return gif_data[start_offset:offset]
+        return offset
     
     def _build_gif_file(
         self,
-        blocks: List[Tuple[int, bytes]],
+        blocks: List[Tuple[int, LayoutPiece]],
         xmp_metadata: Dict[str, Any]
-    ) -> bytes:
+    ) -> List[LayoutPiece]:
         """
         Build a complete GIF file with metadata.
         
@@ -363,9 +415,11 @@ class GIFWriter:
             xmp_metadata: XMP metadata dictionary
             
         Returns:
-            Complete GIF file as bytes
+            Layout of the GIF file: new bytes, and the (start, end) ranges
+            of the original image blocks
         """
         gif_data = bytearray()
+        layout: List[LayoutPiece] = [gif_data]
         
         # Write header and logical screen descriptor first
         for block_type, block_data in blocks:
@@ -422,8 +476,10 @@ class GIFWriter:
                 gif_data.append(self.PLAIN_TEXT_EXTENSION)
                 gif_data.extend(self._write_data_sub_block(block_data))
             elif block_type == self.IMAGE_SEPARATOR:
-                # Image data block (includes separator, descriptor, and image data)
-                gif_data.extend(block_data)
+                # Image data block (includes separator, descriptor, and image data),
+                # copied from the original file
+                gif_data = bytearray()
+                layout.extend([block_data, gif_data])
             elif block_type == self.TRAILER:
                 # Trailer
                 gif_data.extend(block_data)
@@ -431,7 +487,7 @@ class GIFWriter:
                 # Unknown block type - skip to avoid corruption
                 continue
         
-        return bytes(gif_data)
+        return [bytes(piece) if isinstance(piece, bytearray) else piece for piece in layout]
     
     def _build_xmp_application_extension(self, xmp_metadata: Dict[str, Any]) -> Optional[bytes]:
         """
@@ -13,8 +13,10 @@ GPX files are XML-based GPS track log files.
 Copyright 2025 DNAi inc.
 """
 
+import io
+import os
 import xml.etree.ElementTree as ET
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, BinaryIO
 from pathlib import Path
 from datetime import datetime
 
@@ -39,6 +41,9 @@ class GPXParser:
         'gpx10': 'http://www.topografix.com/GPX/1/0',
     }
     
+    # Number of waypoints, tracks and routes described individually
+    SUMMARY_LIMITS = {'wpt': 20, 'trk': 10, 'rte': 10}
+    
     def __init__(self, file_path: Optional[str] = None, file_data: Optional[bytes] = None):
         """
         Initialize GPX parser.
@@ -64,14 +69,12 @@ class GPXParser:
             Dictionary of GPX metadata
         """
         try:
-            # Read file data
             if self.file_data is None:
-                with open(self.file_path, 'rb') as f:
-                    file_data = f.read()
+                file_size = os.path.getsize(self.file_path)
             else:
-                file_data = self.file_data
+                file_size = len(self.file_data)
             
-            if len(file_data) == 0:
+            if file_size == 0:
                 raise MetadataReadError("Invalid GPX file: empty file")
             
             metadata = {}
@@ -79,18 +82,65 @@ class GPXParser:
             metadata['File:FileTypeExtension'] = 'gpx'
             metadata['File:MIMEType'] = 'application/gpx+xml'
             
-            # Try to decode as UTF-8
-            try:
-                xml_content = file_data.decode('utf-8')
-            except UnicodeDecodeError:
-                try:
-                    xml_content = file_data.decode('utf-16-le')
-                except UnicodeDecodeError:
-                    xml_content = file_data.decode('latin-1', errors='ignore')
+            # Stream the XML so that track and route points are counted and
+            # discarded as they are read instead of building the whole tree
+            root = None
+            declared_namespaces = set()
+            parents = []
+            containers = []  # Open trk/rte elements
+            point_counts = {}  # trk/rte element -> point tag -> count
+            described = {}  # trk/rte element -> name/desc/cmt tags seen
+            keep_point = False
+            element_counts = {}  # wpt/trk/rte tag -> count
+            kept_elements = {}  # wpt/trk/rte tag -> first elements, up to the limit
+            first_elements = {}  # time/bounds tag -> first element
             
-            # Parse XML
             try:
-                root = ET.fromstring(xml_content)
+                with self._open_source() as source:
+                    for event, item in ET.iterparse(source, events=('start-ns', 'start', 'end')):
+                        if event == 'start-ns':
+                            declared_namespaces.add(item[1])
+                            continue
+                        
+                        local_name = item.tag.rpartition('}')[2]
+                        if event == 'start':
+                            if root is None:
+                                root = item
+                            parents.append(item)
+                            if local_name in ('trk', 'rte'):
+                                containers.append(item)
+                                point_counts[item] = {}
+                                described[item] = set()
+                            elif local_name in ('trkpt', 'rtept'):
+                                keep_point = False
+                            continue
+                        
+                        parents.pop()
+                        if local_name in ('trkpt', 'rtept'):
+                            for container in containers:
+                                counts = point_counts[container]
+                                counts[item.tag] = counts.get(item.tag, 0) + 1
+                            # A point holding the first name, desc or cmt of its
+                            # track or route is kept, as it supplies that field
+                            if parents and not keep_point:
+                                parents[-1].remove(item)
+                        elif local_name in self.SUMMARY_LIMITS and parents:
+                            if local_name != 'wpt':
+                                containers.pop()
+                            count = element_counts[item.tag] = element_counts.get(item.tag, 0) + 1
+                            if count <= self.SUMMARY_LIMITS[local_name]:
+                                kept_elements.setdefault(item.tag, []).append(item)
+                            else:
+                                point_counts.pop(item, None)
+                                parents[-1].remove(item)
+                            described.pop(item, None)
+                        elif local_name in ('time', 'bounds'):
+                            first_elements.setdefault(item.tag, item)
+                        elif local_name in ('name', 'desc', 'cmt'):
+                            for container in containers:
+                                if item.tag not in described[container]:
+                                    described[container].add(item.tag)
+                                    keep_point = True
             except ET.ParseError:
                 raise MetadataReadError("Invalid GPX file: XML parse error")
             
@@ -101,14 +151,21 @@ class GPXParser:
             else:
                 # Try common namespaces
                 for prefix, uri in self.GPX_NAMESPACES.items():
-                    if uri in xml_content:
+                    if uri in declared_namespaces:
                         ns_uri = uri
                         break
             
-            # Build namespace dictionary for ElementTree
-            namespaces = {}
-            if ns_uri:
-                namespaces['gpx'] = ns_uri
+            def select(table: Dict[str, Any], name: str, default: Any = None) -> Any:
+                # Namespaced element first, then the un-namespaced fallback
+                if ns_uri and table.get(f'{{{ns_uri}}}{name}'):
+                    return table[f'{{{ns_uri}}}{name}']
+                return table.get(name, default)
+            
+            def select_element(name: str) -> Optional[ET.Element]:
+                element = first_elements.get(f'{{{ns_uri}}}{name}') if ns_uri else None
+                if element is None:
+                    element = first_elements.get(name)
+                return element
             
             # Extract GPX version
             version = root.get('version')
@@ -120,12 +177,8 @@ class GPXParser:
             if creator:
                 metadata['GPX:Creator'] = creator
             
-            # Extract time - handle namespace properly
-            time_elem = None
-            if ns_uri:
-                time_elem = root.find(f'.//{{{ns_uri}}}time', namespaces)
-            if time_elem is None:
-                time_elem = root.find('.//time')
+            # Extract time
+            time_elem = select_element('time')
             if time_elem is not None and time_elem.text:
                 metadata['GPX:Time'] = time_elem.text
                 try:
@@ -134,12 +187,8 @@ class GPXParser:
                 except Exception:
                     pass
             
-            # Extract bounds - handle namespace properly
-            bounds = None
-            if ns_uri:
-                bounds = root.find(f'.//{{{ns_uri}}}bounds', namespaces)
-            if bounds is None:
-                bounds = root.find('.//bounds')
+            # Extract bounds
+            bounds = select_element('bounds')
             if bounds is not None:
                 minlat = bounds.get('minlat')
                 minlon = bounds.get('minlon')
@@ -151,71 +200,47 @@ class GPXParser:
                     metadata['GPX:Bounds:MaxLatitude'] = float(maxlat)
                     metadata['GPX:Bounds:MaxLongitude'] = float(maxlon)
             
-            # Count waypoints - handle namespace properly
-            waypoints = []
-            if ns_uri:
-                waypoints = root.findall(f'.//{{{ns_uri}}}wpt', namespaces)
-            if not waypoints:
-                waypoints = root.findall('.//wpt')
-            if waypoints:
-                metadata['GPX:WaypointCount'] = len(waypoints)
-                for i, wpt in enumerate(waypoints[:20], 1):  # Limit to 20 waypoints
+            # Count waypoints
+            waypoint_count = select(element_counts, 'wpt', 0)
+            if waypoint_count:
+                metadata['GPX:WaypointCount'] = waypoint_count
+                for i, wpt in enumerate(select(kept_elements, 'wpt'), 1):
                     wpt_metadata = self._parse_waypoint(wpt, i, ns_uri)
                     if wpt_metadata:
                         metadata.update(wpt_metadata)
             
-            # Count tracks - handle namespace properly
-            tracks = []
-            if ns_uri:
-                tracks = root.findall(f'.//{{{ns_uri}}}trk', namespaces)
-            if not tracks:
-                tracks = root.findall('.//trk')
-            if tracks:
-                metadata['GPX:TrackCount'] = len(tracks)
+            # Count tracks
+            track_count = select(element_counts, 'trk', 0)
+            if track_count:
+                metadata['GPX:TrackCount'] = track_count
                 track_point_count = 0
-                for i, trk in enumerate(tracks[:10], 1):  # Limit to 10 tracks
-                    trk_metadata = self._parse_track(trk, i, ns_uri)
+                for i, trk in enumerate(select(kept_elements, 'trk'), 1):
+                    trkpt_count = select(point_counts[trk], 'trkpt', 0)
+                    trk_metadata = self._parse_track(trk, i, ns_uri, trkpt_count)
                     if trk_metadata:
                         metadata.update(trk_metadata)
-                        # Count track points - handle namespace properly
-                        trkpts = []
-                        if ns_uri:
-                            trkpts = trk.findall(f'.//{{{ns_uri}}}trkpt', namespaces)
-                        if not trkpts:
-                            trkpts = trk.findall('.//trkpt')
-                        track_point_count += len(trkpts)
+                        track_point_count += trkpt_count
                 
                 if track_point_count > 0:
                     metadata['GPX:TrackPointCount'] = track_point_count
             
-            # Count routes - handle namespace properly
-            routes = []
-            if ns_uri:
-                routes = root.findall(f'.//{{{ns_uri}}}rte', namespaces)
-            if not routes:
-                routes = root.findall('.//rte')
-            if routes:
-                metadata['GPX:RouteCount'] = len(routes)
+            # Count routes
+            route_count = select(element_counts, 'rte', 0)
+            if route_count:
+                metadata['GPX:RouteCount'] = route_count
                 route_point_count = 0
-                for i, rte in enumerate(routes[:10], 1):  # Limit to 10 routes
-                    rte_metadata = self._parse_route(rte, i, ns_uri)
+                for i, rte in enumerate(select(kept_elements, 'rte'), 1):
+                    rtept_count = select(point_counts[rte], 'rtept', 0)
+                    rte_metadata = self._parse_route(rte, i, ns_uri, rtept_count)
                     if rte_metadata:
                         metadata.update(rte_metadata)
-                        # Count route points - handle namespace properly
-                        rtepts = []
-                        if ns_uri:
-                            rtepts = rte.findall(f'.//{{{ns_uri}}}rtept', namespaces)
-                        if not rtepts:
-                            rtepts = rte.findall('.//rtept')
-                        route_point_count += len(rtepts)
+                        route_point_count += rtept_count
                 
                 if route_point_count > 0:
                     metadata['GPX:RoutePointCount'] = route_point_count
             
             # Extract file size
             if self.file_path:
-                import os
-                file_size = os.path.getsize(self.file_path)
                 metadata['File:FileSize'] = file_size
                 metadata['File:FileSizeBytes'] = file_size
             
@@ -224,6 +249,12 @@ class GPXParser:
         except Exception as e:
             raise MetadataReadError(f"Failed to parse GPX metadata: {str(e)}")
     
+    def _open_source(self) -> BinaryIO:
+        """Open the GPX data for streaming."""
+        if self.file_data is None:
+            return open(self.file_path, 'rb')
+        return io.BytesIO(self.file_data)
+    
     def _parse_waypoint(self, wpt: ET.Element, index: int, ns_uri: Optional[str]) -> Dict[str, Any]:
         """
         Parse waypoint element.
@@ -312,7 +343,13 @@ class GPXParser:
         
         return metadata
     
-    def _parse_track(self, trk: ET.Element, index: int, ns_uri: Optional[str]) -> Dict[str, Any]:
+    def _parse_track(
+        self,
+        trk: ET.Element,
+        index: int,
+        ns_uri: Optional[str],
+        point_count: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Parse track element.
         
@@ -320,6 +357,8 @@ class GPXParser:
             trk: Track XML element
             index: Track index
             ns_uri: Namespace URI string
+            point_count: Number of trkpt elements, if already counted
+                         (the points may have been discarded while streaming)
             
         Returns:
             Dictionary of track metadata
@@ -371,20 +410,28 @@ class GPXParser:
                 metadata[f'{prefix}:SegmentCount'] = len(trksegs)
             
             # Count track points - handle namespace properly
-            trkpts = []
-            if ns_uri:
-                trkpts = trk.findall(f'.//{{{ns_uri}}}trkpt', namespaces)
-            if not trkpts:
-                trkpts = trk.findall('.//trkpt')
-            if trkpts:
-                metadata[f'{prefix}:PointCount'] = len(trkpts)
+            if point_count is None:
+                trkpts = []
+                if ns_uri:
+                    trkpts = trk.findall(f'.//{{{ns_uri}}}trkpt', namespaces)
+                if not trkpts:
+                    trkpts = trk.findall('.//trkpt')
+                point_count = len(trkpts)
+            if point_count:
+                metadata[f'{prefix}:PointCount'] = point_count
         
         except Exception:
             pass
         
         return metadata
     
-    def _parse_route(self, rte: ET.Element, index: int, ns_uri: Optional[str]) -> Dict[str, Any]:
+    def _parse_route(
+        self,
+        rte: ET.Element,
+        index: int,
+        ns_uri: Optional[str],
+        point_count: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Parse route element.
         
@@ -392,6 +439,8 @@ class GPXParser:
             rte: Route XML element
             index: Route index
             ns_uri: Namespace URI string
+            point_count: Number of rtept elements, if already counted
+                         (the points may have been discarded while streaming)
             
         Returns:
             Dictionary of route metadata
@@ -434,13 +483,15 @@ class GPXParser:
                 metadata[f'{prefix}:Comment'] = cmt_elem.text
             
             # Count route points - handle namespace properly
-            rtepts = []
-            if ns_uri:
-                rtepts = rte.findall(f'.//{{{ns_uri}}}rtept', namespaces)
-            if not rtepts:
-                rtepts = rte.findall('.//rtept')
-            if rtepts:
-                metadata[f'{prefix}:PointCount'] = len(rtepts)
+            if point_count is None:
+                rtepts = []
+                if ns_uri:
+                    rtepts = rte.findall(f'.//{{{ns_uri}}}rtept', namespaces)
+                if not rtepts:
+                    rtepts = rte.findall('.//rtept')
+                point_count = len(rtepts)
+            if point_count:
+                metadata[f'{prefix}:PointCount'] = point_count
         
         except Exception:
             pass
@@ -18,6 +18,7 @@ from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
 from dnexif.exceptions import MetadataWriteError
+from dnexif.stream_copy import atomic_write
 from dnexif.xmp_writer import XMPWriter
 from dnexif.exif_writer import EXIFWriter
 
@@ -109,8 +110,7 @@ class HEICWriter:
                 heic_data = self._write_xmp_box(heic_data, xmp_metadata)
             
             # Write output file
-            with open(output_path, 'wb') as f:
-                f.write(heic_data)
+            atomic_write(output_path, heic_data)
                 
         except Exception as e:
             raise MetadataWriteError(f"Failed to write HEIC metadata: {str(e)}")
@@ -19,6 +19,7 @@ from typing import Dict, Any, List
 from pathlib import Path
 
 from dnexif.exceptions import MetadataWriteError
+from dnexif.stream_copy import atomic_write
 from dnexif.png_writer import PNGWriter
 from dnexif.xmp_writer import XMPWriter
 
@@ -163,8 +164,7 @@ class ICOWriter:
                     if isinstance(xmp_packet, str):
                         xmp_packet = xmp_packet.encode('utf-8')
                     final_data += xmp_packet
-            with open(output_path, 'wb') as f:
-                f.write(final_data)
+            atomic_write(output_path, final_data)
                 
         except Exception as e:
             if isinstance(e, MetadataWriteError):
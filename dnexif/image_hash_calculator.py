@@ -10,14 +10,253 @@ Image Data Hash Calculator Module
 This module provides functions for calculating MD5/hash of image data only,
 excluding metadata. Similar to standard ImageDataMD5/ImageDataHash feature.
 
+Files are never loaded whole: segment, chunk and box headers are read on
+demand, and the image data ranges are streamed through the hash in
+fixed-size chunks, so memory use does not depend on the file size. Several
+algorithms can be computed in the same pass (e.g. MD5 for compatibility and
+SHA-256 for a deduplication store).
+
+In tree mode the image data is split into leaves (one per strip, tile or
+chunk, with large ranges cut into TREE_LEAF_SIZE pieces) that are hashed in
+a thread pool and combined into a Merkle root (ImageDataTreeHash). The root
+differs from the linear hash, but uses every core on large RAW and video
+files, and the leaf digests let a part of the file be verified on its own.
+
 Copyright 2025 DNAi inc.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, NamedTuple, Sequence, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import hashlib
 import struct
 
+from dnexif.file_view import RangedFile
+
+# Try to import xxHash (optional dependency, for fast non-cryptographic checksums)
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+    xxhash = None
+
+
+# Size of the reads that feed image data to the hash. Large buffers let
+# hashlib release the GIL while hashing, so several files can be hashed in
+# parallel threads.
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Blocks of header data kept while walking a file's structure (64 KB each)
+HEADER_CACHE_BLOCKS = 16
+
+# Algorithms provided by hashlib on every platform
+HASHLIB_ALGORITHMS = (
+    'md5', 'sha1', 'sha224', 'sha256', 'sha384', 'sha512',
+    'blake2b', 'blake2s', 'sha3_224', 'sha3_256', 'sha3_384', 'sha3_512',
+)
+
+# Algorithms provided by the optional xxhash package
+XXHASH_ALGORITHMS = ('xxh32', 'xxh64', 'xxh3_64', 'xxh3_128')
+
+# A single hex digest, or hex digests by algorithm when several were requested
+HashResult = Union[str, Dict[str, str]]
+
+# Largest leaf of a hash tree; longer ranges are split into leaves of this size
+TREE_LEAF_SIZE = 4 * 1024 * 1024
+
+# Prefixes that keep leaf and node hashes of a tree apart (as in RFC 6962)
+TREE_LEAF_PREFIX = b'\x00'
+TREE_NODE_PREFIX = b'\x01'
+
+# A piece of image data: bytes, or a (file path, start, end) range of a file
+DataPiece = Union[bytes, Tuple[str, int, int]]
+
+
+def new_hash(algorithm: str):
+    """
+    Create a hash object for an algorithm name.
+    
+    Args:
+        algorithm: Algorithm name, lowercase (e.g. 'md5', 'sha256', 'blake2b', 'xxh3_64')
+        
+    Returns:
+        Hash object with update(), copy() and hexdigest()
+        
+    Raises:
+        ValueError: If the algorithm is not supported, or needs the xxhash
+                    package and it is not installed
+    """
+    if algorithm in HASHLIB_ALGORITHMS:
+        return hashlib.new(algorithm)
+    if algorithm in XXHASH_ALGORITHMS:
+        if not XXHASH_AVAILABLE:
+            raise ValueError(f"Hash type {algorithm} requires the xxhash package")
+        return getattr(xxhash, algorithm)()
+    raise ValueError(f"Unsupported hash type: {algorithm}")
+
+
+class MultiHash:
+    """
+    Several hash objects fed from the same data.
+    
+    Has the update() and copy() interface of a single hash object, so the
+    format walkers can hash each payload chunk once per algorithm without
+    reading it again.
+    """
+    
+    def __init__(self, hashers: Dict[str, Any]):
+        """
+        Initialize the group.
+        
+        Args:
+            hashers: Hash objects by algorithm name
+        """
+        self.hashers = hashers
+    
+    def update(self, data) -> None:
+        for hasher in self.hashers.values():
+            hasher.update(data)
+    
+    def copy(self) -> 'MultiHash':
+        return MultiHash({name: hasher.copy() for name, hasher in self.hashers.items()})
+    
+    def hexdigests(self) -> Dict[str, str]:
+        """Return the hex digests by algorithm name."""
+        return {name: hasher.hexdigest() for name, hasher in self.hashers.items()}
+
+
+class TreeLeaf(NamedTuple):
+    """One leaf of an image data hash tree."""
+    offset: Optional[int]  # Offset in the file; None for header bytes not read as one range
+    length: int
+    digest: str
+
+
+class HashTree(NamedTuple):
+    """Merkle tree of the image data of a file."""
+    algorithm: str
+    root: str
+    leaves: List[TreeLeaf]
+
+
+class RangeCollector:
+    """
+    Records the image data pieces of a file instead of hashing them.
+    
+    Used as the hash object in tree mode: the format walkers feed it header
+    bytes with update() and payload ranges through _hash_range(), and the
+    pieces become the leaves of the hash tree once the walk is complete.
+    """
+    
+    def __init__(self, pieces: Optional[List[DataPiece]] = None):
+        """
+        Initialize the collector.
+        
+        Args:
+            pieces: Pieces recorded so far
+        """
+        self.pieces: List[DataPiece] = pieces if pieces is not None else []
+    
+    def update(self, data) -> None:
+        if data:
+            self.pieces.append(bytes(data))
+    
+    def add_range(self, file_data: RangedFile, start: int, end: int) -> int:
+        """
+        Record a byte range of a file view.
+        
+        Args:
+            file_data: File view the offsets refer to
+            start: Start offset of the range
+            end: End offset of the range (exclusive)
+        
+        Returns:
+            Number of bytes recorded (the range is clipped to the file)
+        """
+        end = min(end, len(file_data))
+        if end <= start:
+            return 0
+        self.pieces.append((file_data.file_path, file_data.start + start, file_data.start + end))
+        return end - start
+    
+    def copy(self) -> 'RangeCollector':
+        return RangeCollector(list(self.pieces))
+
+
+def merkle_root(digests: Sequence[bytes], algorithm: str = 'md5') -> bytes:
+    """
+    Combine leaf digests into the root of a Merkle tree.
+    
+    Pairs of digests are hashed together level by level (a last unpaired
+    digest moves up unchanged) until one is left.
+    
+    Args:
+        digests: Leaf digests, in order
+        algorithm: Hash algorithm of the inner nodes
+    
+    Returns:
+        Root digest (the hash of no data if there are no leaves)
+    """
+    if not digests:
+        return new_hash(algorithm).digest()
+    level = list(digests)
+    while len(level) > 1:
+        parents = []
+        for index in range(0, len(level) - 1, 2):
+            node = new_hash(algorithm)
+            node.update(TREE_NODE_PREFIX)
+            node.update(level[index])
+            node.update(level[index + 1])
+            parents.append(node.digest())
+        if len(level) % 2:
+            parents.append(level[-1])
+        level = parents
+    return level[0]
+
+
+def _hash_leaves(algorithm: str, leaves: Sequence[DataPiece]) -> List[bytes]:
+    """
+    Hash a run of tree leaves.
+    
+    Runs in a worker thread, with its own file handles and read buffer.
+    
+    Args:
+        algorithm: Hash algorithm
+        leaves: Leaf data, or (file path, start, end) ranges to read
+    
+    Returns:
+        Leaf digests, in order
+    """
+    digests = []
+    files: Dict[str, Any] = {}
+    buffer = None
+    try:
+        for leaf in leaves:
+            hasher = new_hash(algorithm)
+            hasher.update(TREE_LEAF_PREFIX)
+            if isinstance(leaf, bytes):
+                hasher.update(leaf)
+            else:
+                path, start, end = leaf
+                if path not in files:
+                    files[path] = open(path, 'rb')
+                if buffer is None:
+                    buffer = memoryview(bytearray(HASH_CHUNK_SIZE))
+                file_obj = files[path]
+                file_obj.seek(start)
+                while start < end:
+                    count = file_obj.readinto(buffer[:min(len(buffer), end - start)])
+                    if not count:
+                        break
+                    hasher.update(buffer[:count])
+                    start += count
+            digests.append(hasher.digest())
+    finally:
+        for file_obj in files.values():
+            file_obj.close()
+    return digests
+
 
 class ImageHashCalculator:
     """
@@ -25,26 +264,230 @@ class ImageHashCalculator:
     
     Calculates MD5/hash of image pixel data only, excluding all metadata
     segments (EXIF, IPTC, XMP, etc.).
+    
+    With a single hash type the calculate_*_hash methods return a hex
+    digest string. With a list of hash types every algorithm is fed from
+    the same pass over the file, and the methods return a dict of hex
+    digests by algorithm name.
+    
+    Example:
+        >>> calculator = ImageHashCalculator(['md5', 'sha256'])
+        >>> calculator.calculate_hash(Path('image.jpg'))
+        {'md5': '...', 'sha256': '...'}
+    
+    In tree mode the methods return the Merkle root of the image data
+    instead, and the full tree of the last file is kept in last_tree.
+    
+    Example:
+        >>> calculator = ImageHashCalculator('sha256', tree=True)
+        >>> root = calculator.calculate_hash(Path('image.dng'))
+        >>> len(calculator.last_tree.leaves)
     """
     
-    def __init__(self, hash_type: str = 'md5'):
+    def __init__(
+        self,
+        hash_type: Union[str, Sequence[str]] = 'md5',
+        use_mmap: bool = False,
+        tree: bool = False,
+        leaf_size: int = TREE_LEAF_SIZE,
+        workers: Optional[int] = None
+    ):
         """
         Initialize hash calculator.
         
         Args:
-            hash_type: Type of hash to calculate ('md5', 'sha1', 'sha256')
+            hash_type: Type of hash to calculate ('md5', 'sha1', 'sha256',
+                       'sha512', 'blake2b', ... or 'xxh64', 'xxh3_64', ... with
+                       the xxhash package), or a list of them
+            use_mmap: Accepted for compatibility; files are always streamed
+                      in fixed-size chunks, which needs no mapping
+            tree: If True, calculate a Merkle tree hash of the image data,
+                  hashing its strips, tiles and chunks in parallel
+            leaf_size: Largest leaf in tree mode
+            workers: Number of threads hashing leaves in tree mode (defaults
+                     to the ThreadPoolExecutor default)
+                      
+        Raises:
+            ValueError: If a hash type is not supported, or several are
+                        given in tree mode
+        """
+        self.use_mmap = use_mmap
+        if isinstance(hash_type, str):
+            self.algorithms: List[str] = [hash_type.lower()]
+            self.multiple = False
+        else:
+            self.algorithms = list(dict.fromkeys(name.lower() for name in hash_type))
+            self.multiple = True
+            if not self.algorithms:
+                raise ValueError("At least one hash type is required")
+        self.hash_type = self.algorithms[0]
+        self.tree = tree
+        if tree and self.multiple:
+            raise ValueError("Tree hashing uses a single hash type")
+        if leaf_size <= 0:
+            raise ValueError("Tree leaf size must be positive")
+        self.leaf_size = leaf_size
+        self.workers = workers
+        self.last_tree: Optional[HashTree] = None
+        self.hasher = self._new_hasher()
+        self._buffer: Optional[bytearray] = None
+    
+    def _new_hasher(self):
+        """Return a new hash object of the configured type(s)."""
+        if self.tree:
+            return RangeCollector()
+        if self.multiple:
+            return MultiHash({name: new_hash(name) for name in self.algorithms})
+        return new_hash(self.hash_type)
+    
+    def _result(self, hasher) -> HashResult:
+        """Return the digest(s) of a finished hash in the configured form."""
+        if self.tree:
+            self.last_tree = self._build_tree(hasher.pieces)
+            return self.last_tree.root
+        if self.multiple:
+            return hasher.hexdigests()
+        return hasher.hexdigest()
+    
+    def _build_tree(self, pieces: Sequence[DataPiece]) -> HashTree:
+        """
+        Hash collected image data pieces as the leaves of a Merkle tree.
+        
+        Consecutive header bytes form one leaf; each range forms its own
+        leaves, so strip and tile boundaries are kept. Leaves are hashed in
+        a thread pool, in runs of about leaf_size bytes.
+        
+        Args:
+            pieces: Image data pieces, in order
+        
+        Returns:
+            HashTree of the pieces
         """
-        self.hash_type = hash_type.lower()
-        if self.hash_type == 'md5':
-            self.hasher = hashlib.md5()
-        elif self.hash_type == 'sha1':
-            self.hasher = hashlib.sha1()
-        elif self.hash_type == 'sha256':
-            self.hasher = hashlib.sha256()
+        leaves: List[DataPiece] = []
+        offsets: List[Optional[int]] = []
+        for piece in pieces:
+            if isinstance(piece, bytes):
+                if leaves and offsets[-1] is None:
+                    leaves[-1] += piece
+                else:
+                    leaves.append(piece)
+                    offsets.append(None)
+                continue
+            path, start, end = piece
+            for leaf_start in range(start, end, self.leaf_size):
+                leaves.append((path, leaf_start, min(end, leaf_start + self.leaf_size)))
+                offsets.append(leaf_start)
+        
+        # Group small leaves (e.g. thousands of strips) into runs, so that
+        # each task hashes a useful amount of data
+        runs: List[List[DataPiece]] = []
+        run_size = self.leaf_size
+        for leaf in leaves:
+            size = len(leaf) if isinstance(leaf, bytes) else leaf[2] - leaf[1]
+            if run_size + size > self.leaf_size:
+                runs.append([])
+                run_size = 0
+            runs[-1].append(leaf)
+            run_size += size
+        
+        if len(runs) > 1 and self.workers != 1:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='dnexif-hash') as executor:
+                results = list(executor.map(_hash_leaves, [self.hash_type] * len(runs), runs))
         else:
-            raise ValueError(f"Unsupported hash type: {hash_type}")
+            results = [_hash_leaves(self.hash_type, run) for run in runs]
+        digests = [digest for run_digests in results for digest in run_digests]
+        
+        tree_leaves = []
+        for leaf, offset, digest in zip(leaves, offsets, digests):
+            length = len(leaf) if isinstance(leaf, bytes) else leaf[2] - leaf[1]
+            tree_leaves.append(TreeLeaf(offset, length, digest.hex()))
+        return HashTree(self.hash_type, merkle_root(digests, self.hash_type).hex(), tree_leaves)
     
-    def calculate_jpeg_hash(self, file_path: Path) -> Optional[str]:
+    def _open_file(self, file_path: Path) -> RangedFile:
+        """
+        Open a file for structure parsing.
+        
+        Headers are read on demand through a bounded block cache; image data
+        ranges are hashed with _hash_range() without being cached.
+        
+        Args:
+            file_path: Path to file
+            
+        Returns:
+            RangedFile over the file
+        """
+        return RangedFile(file_path, max_blocks=HEADER_CACHE_BLOCKS)
+    
+    def _chunk_buffer(self) -> memoryview:
+        """Return the reusable read buffer, allocating it on first use."""
+        if self._buffer is None:
+            self._buffer = bytearray(HASH_CHUNK_SIZE)
+        return memoryview(self._buffer)
+    
+    def _hash_range(self, hasher, file_data: RangedFile, start: int, end: int) -> int:
+        """
+        Feed a byte range of a file to a hash in fixed-size chunks.
+        
+        Args:
+            hasher: Hash object to update
+            file_data: File to read from
+            start: Start offset of the range
+            end: End offset of the range (exclusive)
+            
+        Returns:
+            Number of bytes hashed
+        """
+        if isinstance(hasher, RangeCollector):
+            return hasher.add_range(file_data, start, end)
+        buffer = self._chunk_buffer()
+        hashed = 0
+        while start < end:
+            count = file_data.readinto(start, buffer[:min(len(buffer), end - start)])
+            if not count:
+                break
+            hasher.update(buffer[:count])
+            start += count
+            hashed += count
+        return hashed
+    
+    def _hash_through(self, hasher, file_data: RangedFile, start: int, marker: bytes) -> int:
+        """
+        Feed a file to a hash from an offset through the next occurrence of a marker.
+        
+        If the marker is not found, the hash has been updated with the rest
+        of the file; callers that must not include unterminated data pass a
+        copy of their hash object.
+        
+        Args:
+            hasher: Hash object to update
+            file_data: File to read from
+            start: Offset to start at
+            marker: Byte sequence that ends the range (included in the hash)
+            
+        Returns:
+            Offset just past the marker, or -1 if it was not found
+        """
+        if isinstance(hasher, RangeCollector):
+            found = file_data.find(marker, start)
+            end = found + len(marker) if found != -1 else len(file_data)
+            hasher.add_range(file_data, start, end)
+            return end if found != -1 else -1
+        buffer = self._chunk_buffer()
+        keep = len(marker) - 1
+        offset = start
+        while True:
+            count = file_data.readinto(offset, buffer)
+            if count < len(marker):
+                return -1
+            found = self._buffer.find(marker, 0, count)
+            if found != -1:
+                hasher.update(buffer[:found + len(marker)])
+                return offset + found + len(marker)
+            # Hold back the bytes that could start a marker split across reads
+            hasher.update(buffer[:count - keep])
+            offset += count - keep
+    
+    def calculate_jpeg_hash(self, file_path: Path) -> Optional[HashResult]:
         """
         Calculate hash of JPEG image data (excluding metadata).
         
@@ -56,11 +499,10 @@ class ImageHashCalculator:
             file_path: Path to JPEG file
             
         Returns:
-            Hexadecimal hash string or None if calculation fails
+            Hexadecimal hash string (or dict of them) or None if calculation fails
         """
         try:
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
+            file_data = self._open_file(file_path)
         except Exception:
             return None
         
@@ -72,12 +514,7 @@ class ImageHashCalculator:
             return None
         
         # Reset hasher
-        if self.hash_type == 'md5':
-            hasher = hashlib.md5()
-        elif self.hash_type == 'sha1':
-            hasher = hashlib.sha1()
-        else:
-            hasher = hashlib.sha256()
+        hasher = self._new_hasher()
         
         # Process JPEG segments
         offset = 0
@@ -116,15 +553,11 @@ class ImageHashCalculator:
                 segment_length = struct.unpack('>H', file_data[offset:offset + 2])[0]
                 offset += segment_length
                 
-                # Include scan data until EOI marker
-                scan_start = offset
-                while offset < len(file_data) - 1:
-                    if file_data[offset] == 0xff and file_data[offset + 1] == 0xd9:
-                        # Found EOI
-                        hasher.update(file_data[scan_start:offset + 2])
-                        offset += 2
-                        break
-                    offset += 1
+                # Include scan data through the EOI marker; an unterminated
+                # scan is left out entirely
+                scan_hasher = hasher.copy()
+                if self._hash_through(scan_hasher, file_data, offset, b'\xff\xd9') != -1:
+                    hasher = scan_hasher
                 break
             
             # APP segments (EXIF, IPTC, XMP, etc.) - skip
@@ -146,9 +579,9 @@ class ImageHashCalculator:
             hasher.update(file_data[offset - 2:offset + 2])
             offset += segment_length
         
-        return hasher.hexdigest()
+        return self._result(hasher)
     
-    def calculate_png_hash(self, file_path: Path) -> Optional[str]:
+    def calculate_png_hash(self, file_path: Path) -> Optional[HashResult]:
         """
         Calculate hash of PNG image data (excluding metadata).
         
@@ -159,11 +592,10 @@ class ImageHashCalculator:
             file_path: Path to PNG file
             
         Returns:
-            Hexadecimal hash string or None if calculation fails
+            Hexadecimal hash string (or dict of them) or None if calculation fails
         """
         try:
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
+            file_data = self._open_file(file_path)
         except Exception:
             return None
         
@@ -175,12 +607,7 @@ class ImageHashCalculator:
             return None
         
         # Reset hasher
-        if self.hash_type == 'md5':
-            hasher = hashlib.md5()
-        elif self.hash_type == 'sha1':
-            hasher = hashlib.sha1()
-        else:
-            hasher = hashlib.sha256()
+        hasher = self._new_hasher()
         
         # Include PNG signature
         hasher.update(file_data[:8])
@@ -203,13 +630,13 @@ class ImageHashCalculator:
                 # Include chunk (length, type, data, CRC)
                 if offset + chunk_length + 4 > len(file_data):
                     break
-                hasher.update(file_data[offset - 8:offset + chunk_length + 4])
+                self._hash_range(hasher, file_data, offset - 8, offset + chunk_length + 4)
             
             offset += chunk_length + 4  # Skip data and CRC
         
-        return hasher.hexdigest()
+        return self._result(hasher)
     
-    def calculate_tiff_hash(self, file_path: Path) -> Optional[str]:
+    def calculate_tiff_hash(self, file_path: Path) -> Optional[HashResult]:
         """
         Calculate hash of TIFF image data (excluding metadata).
         
@@ -220,11 +647,10 @@ class ImageHashCalculator:
             file_path: Path to TIFF file
             
         Returns:
-            Hexadecimal hash string or None if calculation fails
+            Hexadecimal hash string (or dict of them) or None if calculation fails
         """
         try:
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
+            file_data = self._open_file(file_path)
         except Exception:
             return None
         
@@ -236,12 +662,7 @@ class ImageHashCalculator:
             return None
         
         # Reset hasher
-        if self.hash_type == 'md5':
-            hasher = hashlib.md5()
-        elif self.hash_type == 'sha1':
-            hasher = hashlib.sha1()
-        else:
-            hasher = hashlib.sha256()
+        hasher = self._new_hasher()
         
         # Determine byte order
         if file_data[0] == 0x49:  # 'II' - little endian
@@ -336,28 +757,25 @@ class ImageHashCalculator:
             
             entry_offset += 12
         
-        # Extract image data from strips or tiles
-        image_data = b''
+        # Hash the image data from strips or tiles
+        hashed = 0
         if is_tiled and tile_offsets and tile_byte_counts:
             # Tiled image
             for offset, byte_count in zip(tile_offsets, tile_byte_counts):
                 if offset + byte_count <= len(file_data):
-                    image_data += file_data[offset:offset + byte_count]
+                    hashed += self._hash_range(hasher, file_data, offset, offset + byte_count)
         elif strip_offsets and strip_byte_counts:
             # Strip-based image
             for offset, byte_count in zip(strip_offsets, strip_byte_counts):
                 if offset + byte_count <= len(file_data):
-                    image_data += file_data[offset:offset + byte_count]
+                    hashed += self._hash_range(hasher, file_data, offset, offset + byte_count)
         
-        if not image_data:
+        if not hashed:
             return None
         
-        # Hash the image data
-        hasher.update(image_data)
-        
-        return hasher.hexdigest()
+        return self._result(hasher)
     
-    def calculate_heic_hash(self, file_path: Path) -> Optional[str]:
+    def calculate_heic_hash(self, file_path: Path) -> Optional[HashResult]:
         """
         Calculate hash of HEIC/HEIF image data (excluding metadata).
         
@@ -368,11 +786,10 @@ class ImageHashCalculator:
             file_path: Path to HEIC/HEIF file
             
         Returns:
-            Hexadecimal hash string or None if calculation fails
+            Hexadecimal hash string (or dict of them) or None if calculation fails
         """
         try:
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
+            file_data = self._open_file(file_path)
         except Exception:
             return None
         
@@ -386,12 +803,7 @@ class ImageHashCalculator:
                 return None
         
         # Reset hasher
-        if self.hash_type == 'md5':
-            hasher = hashlib.md5()
-        elif self.hash_type == 'sha1':
-            hasher = hashlib.sha1()
-        else:
-            hasher = hashlib.sha256()
+        hasher = self._new_hasher()
         
         # Metadata boxes to exclude
         metadata_boxes = {b'meta', b'exif', b'xmp ', b'uuid', b'iref', b'pitm', b'iloc', b'iinf', b'infe', b'iprp', b'ipco', b'ispe', b'pasp', b'colr', b'pixi'}
@@ -433,8 +845,7 @@ class ImageHashCalculator:
             # Exclude metadata boxes
             if box_type == b'mdat':
                 # mdat box contains the actual image data
-                box_data = file_data[box_data_start:box_end]
-                hasher.update(box_data)
+                self._hash_range(hasher, file_data, box_data_start, box_end)
             elif box_type not in metadata_boxes:
                 # Include other non-metadata boxes (like ftyp, moov, etc.)
                 # These are part of the container structure
@@ -443,9 +854,9 @@ class ImageHashCalculator:
             offset = box_end
             box_count += 1
         
-        return hasher.hexdigest()
+        return self._result(hasher)
     
-    def calculate_j2c_hash(self, file_path: Path) -> Optional[str]:
+    def calculate_j2c_hash(self, file_path: Path) -> Optional[HashResult]:
         """
         Calculate hash of J2C (JPEG 2000 codestream) image data (excluding metadata).
         
@@ -456,11 +867,10 @@ class ImageHashCalculator:
             file_path: Path to J2C file
             
         Returns:
-            Hexadecimal hash string or None if calculation fails
+            Hexadecimal hash string (or dict of them) or None if calculation fails
         """
         try:
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
+            file_data = self._open_file(file_path)
         except Exception:
             return None
         
@@ -472,12 +882,7 @@ class ImageHashCalculator:
             return None
         
         # Reset hasher
-        if self.hash_type == 'md5':
-            hasher = hashlib.md5()
-        elif self.hash_type == 'sha1':
-            hasher = hashlib.sha1()
-        else:
-            hasher = hashlib.sha256()
+        hasher = self._new_hasher()
         
         # Process JPEG 2000 codestream
         # Include SOC, SIZ, and codestream data
@@ -548,12 +953,14 @@ class ImageHashCalculator:
                             offset += 2
                 continue
             
-            # Include other codestream data
-            offset += 1
+            # Skip other codestream data up to the next 0xFF marker candidate
+            offset = file_data.find(b'\xff', offset + 1)
+            if offset == -1:
+                break
         
-        return hasher.hexdigest()
+        return self._result(hasher)
     
-    def calculate_jxl_hash(self, file_path: Path) -> Optional[str]:
+    def calculate_jxl_hash(self, file_path: Path) -> Optional[HashResult]:
         """
         Calculate hash of JXL (JPEG XL) image data (excluding metadata).
         
@@ -564,11 +971,10 @@ class ImageHashCalculator:
             file_path: Path to JXL file
             
         Returns:
-            Hexadecimal hash string or None if calculation fails
+            Hexadecimal hash string (or dict of them) or None if calculation fails
         """
         try:
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
+            file_data = self._open_file(file_path)
         except Exception:
             return None
         
@@ -580,39 +986,18 @@ class ImageHashCalculator:
             return None
         
         # Reset hasher
-        if self.hash_type == 'md5':
-            hasher = hashlib.md5()
-        elif self.hash_type == 'sha1':
-            hasher = hashlib.sha1()
-        else:
-            hasher = hashlib.sha256()
+        hasher = self._new_hasher()
         
         # Process JPEG XL codestream
-        # Include codestream data, exclude metadata boxes
-        offset = 0
-        while offset < len(file_data) - 1:
-            if offset + 2 > len(file_data):
-                break
-            
-            marker = struct.unpack('>H', file_data[offset:offset+2])[0]
-            
-            # JXL signature (FF 0A)
-            if marker == 0xFF0A:
-                # Include signature
-                hasher.update(file_data[offset:offset+2])
-                offset += 2
-                continue
-            
-            # Include codestream data
-            # JXL uses variable-length segments
-            # For simplicity, include all data except known metadata boxes
-            # Metadata in JXL is typically in boxes with specific markers
-            hasher.update(file_data[offset:offset+1])
-            offset += 1
+        # A bare codestream has no metadata boxes, so all of its data is
+        # included: the signature and the codestream up to the last byte,
+        # which is only included when it completes an FF 0A pair
+        end = len(file_data) if file_data.endswith(b'\xff\x0a') else len(file_data) - 1
+        self._hash_range(hasher, file_data, 0, end)
         
-        return hasher.hexdigest()
+        return self._result(hasher)
     
-    def calculate_avif_hash(self, file_path: Path) -> Optional[str]:
+    def calculate_avif_hash(self, file_path: Path) -> Optional[HashResult]:
         """
         Calculate hash of AVIF image data (excluding metadata).
         
@@ -624,11 +1009,10 @@ class ImageHashCalculator:
             file_path: Path to AVIF file
             
         Returns:
-            Hexadecimal hash string or None if calculation fails
+            Hexadecimal hash string (or dict of them) or None if calculation fails
         """
         try:
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
+            file_data = self._open_file(file_path)
         except Exception:
             return None
         
@@ -642,12 +1026,7 @@ class ImageHashCalculator:
                 return None
         
         # Reset hasher
-        if self.hash_type == 'md5':
-            hasher = hashlib.md5()
-        elif self.hash_type == 'sha1':
-            hasher = hashlib.sha1()
-        else:
-            hasher = hashlib.sha256()
+        hasher = self._new_hasher()
         
         # Metadata boxes to exclude
         metadata_boxes = {b'meta', b'exif', b'xmp ', b'uuid', b'iref', b'pitm', b'iloc', b'iinf', b'infe', b'iprp', b'ipco', b'ispe', b'pasp', b'colr', b'pixi'}
@@ -689,8 +1068,7 @@ class ImageHashCalculator:
             # Exclude metadata boxes
             if box_type == b'mdat':
                 # mdat box contains the actual image data
-                box_data = file_data[box_data_start:box_end]
-                hasher.update(box_data)
+                self._hash_range(hasher, file_data, box_data_start, box_end)
             elif box_type not in metadata_boxes:
                 # Include other non-metadata boxes (like ftyp, moov, etc.)
                 # These are part of the container structure
@@ -699,9 +1077,9 @@ class ImageHashCalculator:
             offset = box_end
             box_count += 1
         
-        return hasher.hexdigest()
+        return self._result(hasher)
     
-    def calculate_raf_hash(self, file_path: Path) -> Optional[str]:
+    def calculate_raf_hash(self, file_path: Path) -> Optional[HashResult]:
         """
         Calculate hash of RAF (Fujifilm RAW) image data (excluding metadata).
         
@@ -713,11 +1091,10 @@ class ImageHashCalculator:
             file_path: Path to RAF file
             
         Returns:
-            Hexadecimal hash string or None if calculation fails
+            Hexadecimal hash string (or dict of them) or None if calculation fails
         """
         try:
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
+            file_data = self._open_file(file_path)
         except Exception:
             return None
         
@@ -741,10 +1118,9 @@ class ImageHashCalculator:
         if tiff_offset is None:
             return None
         
-        # Extract TIFF portion and use TIFF hash calculation
-        # Create a temporary Path-like object for the TIFF data
-        # We'll use the TIFF hash calculation logic directly
-        tiff_data = file_data[tiff_offset:]
+        # View the TIFF portion (offsets in it are relative to its start)
+        # and use the TIFF hash calculation logic directly
+        tiff_data = RangedFile(file_path, start=tiff_offset, max_blocks=HEADER_CACHE_BLOCKS)
         
         # Use TIFF hash calculation logic
         # Determine endianness
@@ -755,12 +1131,7 @@ class ImageHashCalculator:
             return None
         
         # Reset hasher
-        if self.hash_type == 'md5':
-            hasher = hashlib.md5()
-        elif self.hash_type == 'sha1':
-            hasher = hashlib.sha1()
-        else:
-            hasher = hashlib.sha256()
+        hasher = self._new_hasher()
         
         # Parse TIFF structure to extract image data (strips/tiles)
         if len(tiff_data) < 8:
@@ -842,18 +1213,18 @@ class ImageHashCalculator:
         if is_tiled and tile_offsets and tile_byte_counts:
             for offset, count in zip(tile_offsets, tile_byte_counts):
                 if offset + count <= len(tiff_data):
-                    hasher.update(tiff_data[offset:offset+count])
+                    self._hash_range(hasher, tiff_data, offset, offset + count)
         elif strip_offsets and strip_byte_counts:
             for offset, count in zip(strip_offsets, strip_byte_counts):
                 if offset + count <= len(tiff_data):
-                    hasher.update(tiff_data[offset:offset+count])
+                    self._hash_range(hasher, tiff_data, offset, offset + count)
         else:
             # No image data found
             return None
         
-        return hasher.hexdigest()
+        return self._result(hasher)
     
-    def calculate_mrw_hash(self, file_path: Path) -> Optional[str]:
+    def calculate_mrw_hash(self, file_path: Path) -> Optional[HashResult]:
         """
         Calculate hash of MRW (Minolta RAW) image data (excluding metadata).
         
@@ -865,11 +1236,10 @@ class ImageHashCalculator:
             file_path: Path to MRW file
             
         Returns:
-            Hexadecimal hash string or None if calculation fails
+            Hexadecimal hash string (or dict of them) or None if calculation fails
         """
         try:
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
+            file_data = self._open_file(file_path)
         except Exception:
             return None
         
@@ -906,12 +1276,12 @@ class ImageHashCalculator:
 
         # Search for TIFF signature (II*\x00 or MM\x00*), prefer TTW section if present.
         if ttw_offset is not None and ttw_size:
-            ttw_data = file_data[ttw_offset:ttw_offset + ttw_size]
-            tiff_pos = ttw_data.find(b'II*\x00')
+            ttw_end = ttw_offset + ttw_size
+            tiff_pos = file_data.find(b'II*\x00', ttw_offset, ttw_end)
             if tiff_pos == -1:
-                tiff_pos = ttw_data.find(b'MM\x00*')
+                tiff_pos = file_data.find(b'MM\x00*', ttw_offset, ttw_end)
             if tiff_pos != -1:
-                tiff_offset = ttw_offset + tiff_pos
+                tiff_offset = tiff_pos
 
         if tiff_offset is None:
             for i in range(8, min(10000, len(file_data) - 4)):
@@ -925,8 +1295,8 @@ class ImageHashCalculator:
         if tiff_offset is None:
             return None
         
-        # Extract TIFF portion and use TIFF hash calculation logic
-        tiff_data = file_data[tiff_offset:]
+        # View the TIFF portion and use TIFF hash calculation logic
+        tiff_data = RangedFile(file_path, start=tiff_offset, max_blocks=HEADER_CACHE_BLOCKS)
         
         # Determine endianness
         endian = '<'
@@ -936,12 +1306,7 @@ class ImageHashCalculator:
             return None
         
         # Reset hasher
-        if self.hash_type == 'md5':
-            hasher = hashlib.md5()
-        elif self.hash_type == 'sha1':
-            hasher = hashlib.sha1()
-        else:
-            hasher = hashlib.sha256()
+        hasher = self._new_hasher()
         
         # Parse TIFF structure to extract image data (strips/tiles)
         if len(tiff_data) < 8:
@@ -1022,18 +1387,18 @@ class ImageHashCalculator:
         if is_tiled and tile_offsets and tile_byte_counts:
             for offset, count in zip(tile_offsets, tile_byte_counts):
                 if offset + count <= len(tiff_data):
-                    hasher.update(tiff_data[offset:offset+count])
+                    self._hash_range(hasher, tiff_data, offset, offset + count)
         elif strip_offsets and strip_byte_counts:
             for offset, count in zip(strip_offsets, strip_byte_counts):
                 if offset + count <= len(tiff_data):
-                    hasher.update(tiff_data[offset:offset+count])
+                    self._hash_range(hasher, tiff_data, offset, offset + count)
         else:
             # No image data found
             return None
         
-        return hasher.hexdigest()
+        return self._result(hasher)
     
-    def calculate_cr3_hash(self, file_path: Path) -> Optional[str]:
+    def calculate_cr3_hash(self, file_path: Path) -> Optional[HashResult]:
         """
         Calculate hash of CR3 (Canon RAW 3) image data (excluding metadata).
         
@@ -1045,11 +1410,10 @@ class ImageHashCalculator:
             file_path: Path to CR3 file
             
         Returns:
-            Hexadecimal hash string or None if calculation fails
+            Hexadecimal hash string (or dict of them) or None if calculation fails
         """
         try:
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
+            file_data = self._open_file(file_path)
         except Exception:
             return None
         
@@ -1064,12 +1428,7 @@ class ImageHashCalculator:
                 return None
         
         # Reset hasher
-        if self.hash_type == 'md5':
-            hasher = hashlib.md5()
-        elif self.hash_type == 'sha1':
-            hasher = hashlib.sha1()
-        else:
-            hasher = hashlib.sha256()
+        hasher = self._new_hasher()
         
         # Metadata boxes to exclude
         metadata_boxes = {b'meta', b'exif', b'xmp ', b'uuid', b'iref', b'pitm', b'iloc', b'iinf', b'infe', b'iprp', b'ipco', b'ispe', b'pasp', b'colr', b'pixi', b'moov', b'mvhd', b'trak', b'mdia', b'minf', b'stbl', b'co64', b'stco', b'stsc', b'stsz', b'stts', b'ctts', b'stss', b'stsd', b'pdin', b'free', b'skip', b'wide', b'pnot', b'udta'}
@@ -1111,8 +1470,7 @@ class ImageHashCalculator:
             # Exclude metadata boxes
             if box_type == b'mdat':
                 # mdat box contains the actual image data
-                box_data = file_data[box_data_start:box_end]
-                hasher.update(box_data)
+                self._hash_range(hasher, file_data, box_data_start, box_end)
             elif box_type not in metadata_boxes:
                 # Include other non-metadata boxes (like ftyp, etc.)
                 # These are part of the container structure
@@ -1121,9 +1479,9 @@ class ImageHashCalculator:
             offset = box_end
             box_count += 1
         
-        return hasher.hexdigest()
+        return self._result(hasher)
     
-    def calculate_mov_mp4_hash(self, file_path: Path) -> Optional[str]:
+    def calculate_mov_mp4_hash(self, file_path: Path) -> Optional[HashResult]:
         """
         Calculate hash of MOV/MP4 video/image data (excluding metadata).
         
@@ -1135,11 +1493,10 @@ class ImageHashCalculator:
             file_path: Path to MOV/MP4 file
             
         Returns:
-            Hexadecimal hash string or None if calculation fails
+            Hexadecimal hash string (or dict of them) or None if calculation fails
         """
         try:
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
+            file_data = self._open_file(file_path)
         except Exception:
             return None
         
@@ -1153,12 +1510,7 @@ class ImageHashCalculator:
                 return None
         
         # Reset hasher
-        if self.hash_type == 'md5':
-            hasher = hashlib.md5()
-        elif self.hash_type == 'sha1':
-            hasher = hashlib.sha1()
-        else:
-            hasher = hashlib.sha256()
+        hasher = self._new_hasher()
         
         # Metadata boxes to exclude (more comprehensive for video files)
         metadata_boxes = {
@@ -1208,8 +1560,7 @@ class ImageHashCalculator:
             # Exclude metadata boxes
             if box_type == b'mdat':
                 # mdat box contains the actual video/image data
-                box_data = file_data[box_data_start:box_end]
-                hasher.update(box_data)
+                self._hash_range(hasher, file_data, box_data_start, box_end)
             elif box_type not in metadata_boxes:
                 # Include other non-metadata boxes (like ftyp, etc.)
                 # These are part of the container structure
@@ -1218,9 +1569,9 @@ class ImageHashCalculator:
             offset = box_end
             box_count += 1
         
-        return hasher.hexdigest()
+        return self._result(hasher)
     
-    def calculate_riff_hash(self, file_path: Path) -> Optional[str]:
+    def calculate_riff_hash(self, file_path: Path) -> Optional[HashResult]:
         """
         Calculate hash of RIFF-based file data (excluding metadata).
         
@@ -1231,11 +1582,10 @@ class ImageHashCalculator:
             file_path: Path to RIFF file (WAV, AVI, etc.)
             
         Returns:
-            Hexadecimal hash string or None if calculation fails
+            Hexadecimal hash string (or dict of them) or None if calculation fails
         """
         try:
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
+            file_data = self._open_file(file_path)
         except Exception:
             return None
         
@@ -1247,12 +1597,7 @@ class ImageHashCalculator:
             return None
         
         # Reset hasher
-        if self.hash_type == 'md5':
-            hasher = hashlib.md5()
-        elif self.hash_type == 'sha1':
-            hasher = hashlib.sha1()
-        else:
-            hasher = hashlib.sha256()
+        hasher = self._new_hasher()
         
         # Metadata chunks to exclude
         metadata_chunks = {b'LIST', b'INFO', b'id3 ', b'JUNK', b'FMT ', b'fact', b'cue ', b'plst', b'labl', b'note', b'ltxt', b'smpl', b'inst', b'PEAK', b'DISP', b'acid', b'strc', b'strh', b'strf', b'strd', b'vprp', b'indx', b'odml', b'dmlh', b'idx1'}
@@ -1280,8 +1625,7 @@ class ImageHashCalculator:
             # Exclude metadata chunks
             if chunk_id == b'data':
                 # 'data' chunk contains actual audio/video data
-                chunk_data = file_data[chunk_data_start:chunk_data_end]
-                hasher.update(chunk_data)
+                self._hash_range(hasher, file_data, chunk_data_start, chunk_data_end)
             elif chunk_id not in metadata_chunks:
                 # Include other non-metadata chunks (like 'fmt ', 'WAVE', etc.)
                 # These are part of the format structure
@@ -1292,9 +1636,9 @@ class ImageHashCalculator:
             if offset % 2:
                 offset += 1  # Skip padding byte
         
-        return hasher.hexdigest()
+        return self._result(hasher)
     
-    def calculate_iiq_hash(self, file_path: Path) -> Optional[str]:
+    def calculate_iiq_hash(self, file_path: Path) -> Optional[HashResult]:
         """
         Calculate hash of IIQ (Phase One RAW) image data (excluding metadata).
         
@@ -1306,11 +1650,10 @@ class ImageHashCalculator:
             file_path: Path to IIQ file
             
         Returns:
-            Hexadecimal hash string or None if calculation fails
+            Hexadecimal hash string (or dict of them) or None if calculation fails
         """
         try:
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
+            file_data = self._open_file(file_path)
         except Exception:
             return None
         
@@ -1323,12 +1666,7 @@ class ImageHashCalculator:
             return None
         
         # Reset hasher
-        if self.hash_type == 'md5':
-            hasher = hashlib.md5()
-        elif self.hash_type == 'sha1':
-            hasher = hashlib.sha1()
-        else:
-            hasher = hashlib.sha256()
+        hasher = self._new_hasher()
         
         # IIQ files use little-endian TIFF structure (II = little-endian)
         endian = '<'
@@ -1442,25 +1780,21 @@ class ImageHashCalculator:
             
             entry_offset += 12
         
-        # Extract image data from strips or tiles
-        image_data = b''
+        # Hash the image data from strips or tiles
         if is_tiled and tile_offsets and tile_byte_counts:
             # Tiled image
             for offset, byte_count in zip(tile_offsets, tile_byte_counts):
                 if offset + byte_count <= len(file_data):
-                    image_data += file_data[offset:offset + byte_count]
+                    self._hash_range(hasher, file_data, offset, offset + byte_count)
         elif strip_offsets and strip_byte_counts:
             # Striped image
             for offset, byte_count in zip(strip_offsets, strip_byte_counts):
                 if offset + byte_count <= len(file_data):
-                    image_data += file_data[offset:offset + byte_count]
-        
-        if image_data:
-            hasher.update(image_data)
+                    self._hash_range(hasher, file_data, offset, offset + byte_count)
         
-        return hasher.hexdigest()
+        return self._result(hasher)
     
-    def calculate_crw_hash(self, file_path: Path) -> Optional[str]:
+    def calculate_crw_hash(self, file_path: Path) -> Optional[HashResult]:
         """
         Calculate hash of CRW (Canon RAW) image data (excluding metadata).
         
@@ -1475,11 +1809,10 @@ class ImageHashCalculator:
             file_path: Path to CRW file
             
         Returns:
-            Hexadecimal hash string or None if calculation fails
+            Hexadecimal hash string (or dict of them) or None if calculation fails
         """
         try:
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
+            file_data = self._open_file(file_path)
         except Exception:
             return None
         
@@ -1492,12 +1825,7 @@ class ImageHashCalculator:
             return None
         
         # Reset hasher
-        if self.hash_type == 'md5':
-            hasher = hashlib.md5()
-        elif self.hash_type == 'sha1':
-            hasher = hashlib.sha1()
-        else:
-            hasher = hashlib.sha256()
+        hasher = self._new_hasher()
         
         # CRW uses little-endian
         endian = '<'
@@ -1521,11 +1849,11 @@ class ImageHashCalculator:
         if len(file_data) > 20:
             # Skip HEAPCCDR header and include rest as image data
             # This is a simplified approach - actual CRW image data extraction requires HEAP parsing
-            hasher.update(file_data[20:])
+            self._hash_range(hasher, file_data, 20, len(file_data))
         
-        return hasher.hexdigest()
+        return self._result(hasher)
     
-    def calculate_x3f_hash(self, file_path: Path) -> Optional[str]:
+    def calculate_x3f_hash(self, file_path: Path) -> Optional[HashResult]:
         """
         Calculate hash of X3F (Sigma RAW) image data (excluding metadata).
         
@@ -1545,11 +1873,10 @@ class ImageHashCalculator:
             file_path: Path to X3F file
             
         Returns:
-            Hexadecimal hash string or None if calculation fails
+            Hexadecimal hash string (or dict of them) or None if calculation fails
         """
         try:
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
+            file_data = self._open_file(file_path)
         except Exception:
             return None
         
@@ -1561,12 +1888,7 @@ class ImageHashCalculator:
             return None
         
         # Reset hasher
-        if self.hash_type == 'md5':
-            hasher = hashlib.md5()
-        elif self.hash_type == 'sha1':
-            hasher = hashlib.sha1()
-        else:
-            hasher = hashlib.sha256()
+        hasher = self._new_hasher()
         
         # X3F uses big-endian
         endian = '>'
@@ -1584,25 +1906,40 @@ class ImageHashCalculator:
             
             # Extract image data
             if image_offset > 0 and image_size > 0 and image_offset + image_size <= len(file_data):
-                image_data = file_data[image_offset:image_offset + image_size]
-                hasher.update(image_data)
+                self._hash_range(hasher, file_data, image_offset, image_offset + image_size)
             else:
                 # Fallback: include all data after header if offsets are invalid
                 if len(file_data) > 28:
-                    hasher.update(file_data[28:])
+                    self._hash_range(hasher, file_data, 28, len(file_data))
         
-        return hasher.hexdigest()
+        return self._result(hasher)
     
-    def calculate_hash(self, file_path: Path) -> Optional[str]:
+    def calculate_hash(
+        self,
+        file_path: Path,
+        algorithms: Optional[Sequence[str]] = None
+    ) -> Optional[HashResult]:
         """
         Calculate hash of image data for supported formats.
         
         Args:
             file_path: Path to image file
+            algorithms: Optional list of hash types to compute in a single
+                        pass instead of the calculator's own
             
         Returns:
-            Hexadecimal hash string or None if format not supported or calculation fails
+            Hexadecimal hash string, or a dict of them by algorithm if several
+            algorithms were requested; None if format not supported or
+            calculation fails
+            
+        Raises:
+            ValueError: If one of the algorithms is not supported
         """
+        if algorithms is not None:
+            calculator = ImageHashCalculator(list(algorithms), use_mmap=self.use_mmap)
+            return calculator.calculate_hash(file_path)
+        
+        file_path = Path(file_path)
         suffix = file_path.suffix.lower()
         
         if suffix in ['.jpg', '.jpeg']:
@@ -1639,57 +1976,216 @@ class ImageHashCalculator:
             # Format not yet supported
             return None
 
+    def calculate_hash_tree(self, file_path: Path) -> Optional[HashTree]:
+        """
+        Calculate the Merkle tree of the image data of a file.
+        
+        Args:
+            file_path: Path to image file
+        
+        Returns:
+            HashTree with the root and the leaf digests, or None if format
+            not supported or calculation fails
+        
+        Raises:
+            ValueError: If several hash types were configured
+        """
+        calculator = self
+        if not self.tree:
+            calculator = ImageHashCalculator(
+                self.hash_type, use_mmap=self.use_mmap, tree=True,
+                leaf_size=self.leaf_size, workers=self.workers
+            )
+        calculator.last_tree = None
+        if calculator.calculate_hash(file_path) is None:
+            return None
+        return calculator.last_tree
+
 
 def calculate_image_data_hash(
     file_path: Path,
-    hash_type: str = 'md5'
-) -> Optional[str]:
+    hash_type: Union[str, Sequence[str]] = 'md5',
+    use_mmap: bool = False
+) -> Optional[HashResult]:
     """
     Calculate hash of image data (excluding metadata).
     
     Args:
         file_path: Path to image file
-        hash_type: Type of hash ('md5', 'sha1', 'sha256')
+        hash_type: Type of hash ('md5', 'sha1', 'sha256', ...), or a list of
+                   types to compute in a single pass
+        use_mmap: Accepted for compatibility (files are always streamed)
         
     Returns:
-        Hexadecimal hash string or None if calculation fails
+        Hexadecimal hash string (a dict of them by algorithm for a list of
+        types) or None if calculation fails
         
     Example:
         >>> hash_value = calculate_image_data_hash(Path('image.jpg'))
         >>> print(f"ImageDataMD5: {hash_value}")
     """
-    calculator = ImageHashCalculator(hash_type=hash_type)
+    calculator = ImageHashCalculator(hash_type=hash_type, use_mmap=use_mmap)
+    return calculator.calculate_hash(file_path)
+
+
+def calculate_image_data_hashes(
+    file_path: Path,
+    algorithms: Sequence[str] = ('md5', 'sha256')
+) -> Optional[Dict[str, str]]:
+    """
+    Calculate several hashes of image data (excluding metadata) in one pass.
+    
+    The file structure is parsed and the image data is read once; every
+    algorithm is fed from the same chunks.
+    
+    Args:
+        file_path: Path to image file
+        algorithms: Hash types to compute (e.g. 'md5', 'sha256', 'blake2b', 'xxh3_64')
+        
+    Returns:
+        Dictionary of hexadecimal hash strings by algorithm, or None if
+        calculation fails
+        
+    Example:
+        >>> hashes = calculate_image_data_hashes(Path('image.jpg'), ['md5', 'sha256'])
+        >>> print(hashes['sha256'])
+    """
+    return ImageHashCalculator(list(algorithms)).calculate_hash(file_path)
+
+
+def calculate_image_data_tree_hash(
+    file_path: Path,
+    hash_type: str = 'md5',
+    leaf_size: int = TREE_LEAF_SIZE,
+    workers: Optional[int] = None
+) -> Optional[str]:
+    """
+    Calculate a Merkle tree hash of image data (excluding metadata).
+    
+    The strips, tiles and chunks of image data are hashed in parallel
+    threads and combined into a tree, which is much faster than the linear
+    hash on large multi-strip RAW files and videos. The result is not the
+    same as calculate_image_data_hash() with the same hash type.
+    
+    Args:
+        file_path: Path to image file
+        hash_type: Type of hash for the leaves and nodes
+        leaf_size: Largest leaf; longer ranges are split
+        workers: Number of hashing threads (None for the default)
+    
+    Returns:
+        Hexadecimal root hash or None if calculation fails
+    
+    Example:
+        >>> root = calculate_image_data_tree_hash(Path('image.dng'), 'sha256')
+        >>> print(f"ImageDataTreeHash: {root}")
+    """
+    calculator = ImageHashCalculator(hash_type, tree=True, leaf_size=leaf_size, workers=workers)
     return calculator.calculate_hash(file_path)
 
 
+def calculate_image_data_hash_tree(
+    file_path: Path,
+    hash_type: str = 'md5',
+    leaf_size: int = TREE_LEAF_SIZE,
+    workers: Optional[int] = None
+) -> Optional[HashTree]:
+    """
+    Calculate the Merkle tree of image data, with the digest of every leaf.
+    
+    Keeping the leaves lets a part of the image data be checked later with
+    verify_hash_tree_leaves() without hashing the whole file.
+    
+    Args:
+        file_path: Path to image file
+        hash_type: Type of hash for the leaves and nodes
+        leaf_size: Largest leaf; longer ranges are split
+        workers: Number of hashing threads (None for the default)
+    
+    Returns:
+        HashTree or None if calculation fails
+    """
+    calculator = ImageHashCalculator(hash_type, leaf_size=leaf_size, workers=workers)
+    return calculator.calculate_hash_tree(file_path)
+
+
+def verify_hash_tree_leaves(
+    file_path: Path,
+    tree: HashTree,
+    indexes: Optional[Sequence[int]] = None
+) -> List[int]:
+    """
+    Check leaves of a hash tree against the current contents of a file.
+    
+    Only the ranges of the selected leaves are read. Header leaves (with no
+    offset) are not checked, as they are not a single range of the file.
+    
+    Args:
+        file_path: Path to the file the tree was calculated from
+        tree: Tree from calculate_image_data_hash_tree()
+        indexes: Indexes of the leaves to check (None checks every leaf)
+    
+    Returns:
+        Indexes of the checked leaves whose data no longer matches
+    """
+    if indexes is None:
+        indexes = range(len(tree.leaves))
+    checked = [index for index in indexes if tree.leaves[index].offset is not None]
+    path = str(file_path)
+    ranges = [
+        (path, tree.leaves[index].offset, tree.leaves[index].offset + tree.leaves[index].length)
+        for index in checked
+    ]
+    digests = _hash_leaves(tree.algorithm, ranges)
+    # A leaf cut short by a truncated file does not match either
+    return [
+        index for index, digest in zip(checked, digests)
+        if digest.hex() != tree.leaves[index].digest
+    ]
+
+
 def add_image_data_hash_to_metadata(
     metadata: Dict[str, Any],
     file_path: Path,
-    hash_type: str = 'md5'
+    hash_type: Union[str, Sequence[str]] = 'md5',
+    tree_hash: bool = False
 ) -> Dict[str, Any]:
     """
     Calculate image data hash and add to metadata.
     
+    With a list of hash types all of them are computed in one pass:
+    ImageDataMD5 is set if MD5 is among them, and ImageDataHash holds the
+    first type's hash.
+    
     Args:
         metadata: Existing metadata dictionary
         file_path: Path to image file
-        hash_type: Type of hash ('md5', 'sha1', 'sha256')
+        hash_type: Type of hash ('md5', 'sha1', 'sha256', ...), or a list of types
+        tree_hash: If True, also add ImageDataTreeHash, the Merkle tree hash
+                   of the image data with the first hash type
         
     Returns:
         Updated metadata dictionary with ImageDataMD5/ImageDataHash tag
+        (and ImageDataTreeHash)
         
     Example:
         >>> metadata = {}
         >>> metadata = add_image_data_hash_to_metadata(metadata, Path('image.jpg'))
         >>> print(metadata.get('Composite:ImageDataMD5'))
     """
-    hash_value = calculate_image_data_hash(file_path, hash_type)
+    if isinstance(hash_type, str):
+        hash_type = [hash_type]
+    hashes = calculate_image_data_hash(file_path, list(hash_type))
     
-    if hash_value:
-        if hash_type.lower() == 'md5':
-            metadata['Composite:ImageDataMD5'] = hash_value
-            metadata['Composite:ImageDataHash'] = hash_value  # Alias
-        else:
-            metadata[f'Composite:ImageDataHash'] = hash_value
+    if hashes:
+        if 'md5' in hashes:
+            metadata['Composite:ImageDataMD5'] = hashes['md5']
+        # Alias of the MD5 hash, or the hash of the first requested type
+        metadata['Composite:ImageDataHash'] = next(iter(hashes.values()))
+    
+    if tree_hash:
+        root = calculate_image_data_tree_hash(file_path, hash_type[0])
+        if root:
+            metadata['Composite:ImageDataTreeHash'] = root
     
     return metadata
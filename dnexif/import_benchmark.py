@@ -0,0 +1,176 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Import-time benchmark
+
+Measures how long it takes a fresh interpreter to import DNExif and which
+dnexif modules that loads, and fails if the import exceeds a time budget or
+eagerly loads a format-specific parser or writer. Format modules are meant
+to be imported only when a file of their format is first read or written,
+so this catches regressions in start-up cost for short-lived CLI calls and
+serverless functions.
+
+Usage:
+    python -m dnexif.import_benchmark
+    python -m dnexif.import_benchmark --max-ms 60 --repeat 10
+
+Copyright 2025 DNAi inc.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from typing import Dict, List, Optional, Sequence
+
+
+# Statements measured, from the cheapest entry point to the main class
+DEFAULT_STATEMENTS = (
+    'import dnexif',
+    'from dnexif import DNExif',
+)
+
+# Modules that must not be loaded just by importing the library
+EAGER_IMPORT_FORBIDDEN = (
+    'dnexif.raw_parser',
+    'dnexif.raw_writer',
+    'dnexif.video_parser',
+    'dnexif.video_writer',
+    'dnexif.audio_parser',
+    'dnexif.audio_writer',
+    'dnexif.document_parser',
+    'dnexif.dicom_parser',
+    'dnexif.dicom_index',
+    'dnexif.dicom_writer',
+    'dnexif.heic_writer',
+    'dnexif.pdf_writer',
+    'dnexif.psd_writer',
+    'dnexif.tiff_writer',
+    'dnexif.png_writer',
+    'dnexif.webp_writer',
+    'dnexif.gif_writer',
+    'dnexif.exif_writer',
+    'dnexif.xmp_writer',
+    'dnexif.metadata_cache',
+)
+
+# Runs in a fresh interpreter: time one import statement and report the
+# dnexif modules it loaded
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - start
+modules = sorted(name for name in sys.modules if name == 'dnexif' or name.startswith('dnexif.'))
+print(json.dumps({{'seconds': elapsed, 'modules': modules}}))
+"""
+
+
+def measure_import(statement: str, repeat: int = 5, python: Optional[str] = None) -> Dict[str, object]:
+    """
+    Measure the cost of an import statement in fresh interpreters.
+
+    Args:
+        statement: Import statement to run (e.g. "from dnexif import DNExif")
+        repeat: Number of interpreters to start; the fastest run is reported,
+                as the others only add scheduling and disk cache noise
+        python: Interpreter to use (defaults to the current one)
+
+    Returns:
+        Dictionary with 'statement', 'milliseconds' (fastest run) and
+        'modules' (dnexif modules loaded by the statement)
+
+    Raises:
+        RuntimeError: If the statement fails to import
+    """
+    best = None
+    for _ in range(max(1, repeat)):
+        result = subprocess.run(
+            [python or sys.executable, '-c', _PROBE.format(statement=statement)],
+            capture_output=True,
+            text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"{statement!r} failed:\n{result.stderr.strip()}")
+        run = json.loads(result.stdout.strip().splitlines()[-1])
+        if best is None or run['seconds'] < best['seconds']:
+            best = run
+    return {
+        'statement': statement,
+        'milliseconds': round(best['seconds'] * 1000, 2),
+        'modules': best['modules'],
+    }
+
+
+def check_import(
+    result: Dict[str, object],
+    max_ms: Optional[float] = None,
+    forbidden: Sequence[str] = EAGER_IMPORT_FORBIDDEN
+) -> List[str]:
+    """
+    Check a measurement against the start-up budget.
+
+    Args:
+        result: Result of measure_import()
+        max_ms: Maximum allowed import time in milliseconds (None for no limit)
+        forbidden: Modules that must not have been loaded
+
+    Returns:
+        List of problems found (empty if the import is within budget)
+    """
+    problems = []
+    if max_ms is not None and result['milliseconds'] > max_ms:
+        problems.append(
+            f"{result['statement']!r} took {result['milliseconds']:.1f} ms (budget {max_ms:.1f} ms)"
+        )
+    loaded = set(result['modules'])
+    for module in forbidden:
+        if module in loaded:
+            problems.append(f"{result['statement']!r} eagerly imports {module}")
+    return problems
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the import-time benchmark.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit status: 0 if every statement is within budget, 1 otherwise
+    """
+    parser = argparse.ArgumentParser(description='Measure DNExif import time')
+    parser.add_argument('--statement', action='append',
+                        help='Import statement to measure (may be repeated)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Fresh interpreters per statement (fastest is reported)')
+    parser.add_argument('--max-ms', type=float,
+                        help='Fail if any statement takes longer than this')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args(argv)
+
+    results = []
+    problems = []
+    for statement in args.statement or DEFAULT_STATEMENTS:
+        result = measure_import(statement, args.repeat)
+        results.append(result)
+        problems.extend(check_import(result, args.max_ms))
+
+    if args.json:
+        print(json.dumps({'results': results, 'problems': problems}, indent=2))
+    else:
+        for result in results:
+            print(f"{result['milliseconds']:8.1f} ms  {len(result['modules']):3d} modules  "
+                  f"{result['statement']}")
+        for problem in problems:
+            print(f"FAIL: {problem}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
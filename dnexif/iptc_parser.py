@@ -185,7 +185,7 @@ class IPTCParser:
         if self.file_path:
             with open(self.file_path, 'rb') as f:
                 self.file_data = f.read()
-        elif not self.file_data:
+        elif self.file_data is None:
             raise MetadataReadError("No file path or file data provided")
         
         try:
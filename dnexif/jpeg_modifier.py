@@ -14,8 +14,10 @@ Copyright 2025 DNAi inc.
 """
 
 import struct
-from typing import List, Tuple, Optional
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Tuple, Optional, Union
 from dnexif.exceptions import MetadataWriteError
+from dnexif.stream_copy import atomic_output, copy_range
 
 
 class JPEGModifier:
@@ -354,3 +356,221 @@ class JPEGModifier:
         """
         return self.replace_app1_segment(b'', is_xmp=is_xmp)
 
+
+
+class JPEGSegmentRewriter:
+    """
+    Single-pass rewriter for the metadata segments of a JPEG file.
+    
+    The marker segments in front of the image data are read once and
+    classified by the metadata they carry. Replacement segments are collected
+    per kind, and the output is then written in one sequential pass: the
+    rebuilt header segments followed by the rest of the file (scan data and
+    any trailer), streamed unchanged from the source.
+    """
+    
+    # Segment kinds
+    JFIF = 'JFIF'
+    EXIF = 'EXIF'
+    XMP = 'XMP'
+    ICC = 'ICC'
+    PHOTOSHOP = 'Photoshop'
+    AFCP = 'AFCP'
+    
+    # (marker byte, payload signature, kind); any APP13 is a Photoshop segment
+    SEGMENT_SIGNATURES = (
+        (0xE0, b'JFIF\x00', JFIF),
+        (0xE1, b'Exif\x00\x00', EXIF),
+        (0xE1, b'http://ns.adobe.com/xap/1.0/\x00', XMP),
+        (0xE2, b'ICC_PROFILE\x00', ICC),
+        (0xE2, b'AFCP\x00\x00\x00\x00', AFCP),
+        (0xED, b'', PHOTOSHOP),
+    )
+    
+    # Order in which new segments are inserted when the file has none of a kind
+    INSERT_ORDER = (JFIF, EXIF, XMP, PHOTOSHOP, ICC, AFCP)
+    
+    def __init__(self, source: BinaryIO):
+        """
+        Read the header segments of a JPEG file.
+        
+        Args:
+            source: Seekable binary file object positioned at the start of the JPEG
+            
+        Raises:
+            MetadataWriteError: If the data does not start with a SOI marker
+        """
+        self.source = source
+        self.segments: List[Tuple[Optional[str], bytes]] = []  # (kind, segment bytes)
+        self.data_offset = 0  # Offset of the first byte after the header segments
+        self.replacements: Dict[str, bytes] = {}
+        self._parse_header()
+    
+    def _parse_header(self) -> None:
+        """
+        Read the marker segments up to the first SOS (or EOI) marker.
+        """
+        read = self.source.read
+        start = self.source.tell()
+        if read(2) != b'\xff\xd8':
+            raise MetadataWriteError("Invalid JPEG file: missing SOI marker")
+        
+        offset = start + 2
+        while True:
+            marker = read(2)
+            if len(marker) < 2 or marker[0] != 0xFF:
+                break
+            code = marker[1]
+            # Image data, end of image, fill bytes or garbage: copy the rest as is
+            if code in (0xDA, 0xD9, 0xFF, 0x00):
+                break
+            if 0xD0 <= code <= 0xD7 or code == 0x01:
+                # Standalone marker without a length field
+                self.segments.append((None, marker))
+                offset += 2
+                continue
+            
+            length_bytes = read(2)
+            if len(length_bytes) < 2:
+                break
+            length = struct.unpack('>H', length_bytes)[0]
+            payload = read(length - 2) if length >= 2 else b''
+            if length < 2 or len(payload) < length - 2:
+                break
+            
+            kind = None
+            for signature_code, signature, signature_kind in self.SEGMENT_SIGNATURES:
+                if code == signature_code and payload.startswith(signature):
+                    kind = signature_kind
+                    break
+            self.segments.append((kind, marker + length_bytes + payload))
+            offset += 2 + length
+        
+        self.data_offset = offset
+    
+    def replace(self, kind: str, segment: bytes) -> None:
+        """
+        Set the new segment for a kind of metadata.
+        
+        The first existing segment of the kind is replaced (for ICC, all
+        chunks of the old profile); if there is none, the segment is inserted
+        at the usual position for its kind.
+        
+        Args:
+            kind: Segment kind
+            segment: Complete segment bytes including marker and length
+                     (several concatenated segments for a chunked ICC
+                     profile); empty bytes remove the existing segment
+        """
+        self.replacements[kind] = segment
+    
+    def remove(self, kind: str) -> None:
+        """
+        Remove the segment of a kind.
+        
+        Args:
+            kind: Segment kind
+        """
+        self.replace(kind, b'')
+    
+    def _build_header(self) -> List[Tuple[Optional[str], bytes]]:
+        """
+        Apply the replacements to the header segments.
+        
+        Returns:
+            List of (kind, segment bytes) in output order
+        """
+        header = []
+        placed = set()
+        for kind, segment in self.segments:
+            if kind in self.replacements:
+                if kind not in placed:
+                    placed.add(kind)
+                    if self.replacements[kind]:
+                        header.append((kind, self.replacements[kind]))
+                    continue
+                if kind == self.ICC:
+                    # Remaining chunks of the replaced profile
+                    continue
+            header.append((kind, segment))
+        
+        for kind in self.INSERT_ORDER:
+            segment = self.replacements.get(kind)
+            if segment and kind not in placed:
+                header.insert(self._insert_index(header, kind), (kind, segment))
+        
+        return header
+    
+    def _insert_index(self, header: List[Tuple[Optional[str], bytes]], kind: str) -> int:
+        """
+        Find where a new segment of a kind goes in the header.
+        
+        Args:
+            header: Header segments in output order
+            kind: Segment kind
+            
+        Returns:
+            Index to insert the segment at
+        """
+        kinds = [segment_kind for segment_kind, _ in header]
+        if kind == self.JFIF:
+            return 0
+        
+        # After a leading JFIF APP0, otherwise directly after SOI
+        start = 1 if kinds and kinds[0] == self.JFIF else 0
+        if kind == self.EXIF:
+            return start
+        if kind == self.XMP:
+            return kinds.index(self.EXIF) + 1 if self.EXIF in kinds else start
+        
+        if kind == self.PHOTOSHOP:
+            # After the first APP1 and the XMP segment that follows it
+            for index, (_, segment) in enumerate(header):
+                if segment[1] == 0xE1:
+                    index += 1
+                    if index < len(kinds) and kinds[index] == self.XMP:
+                        index += 1
+                    return index
+            return start
+        
+        # ICC and AFCP go after the leading APP0/APP1 segments
+        index = 0
+        while index < len(header) and header[index][1][1] in (0xE0, 0xE1):
+            index += 1
+        return index
+    
+    def write(self, output: BinaryIO) -> None:
+        """
+        Write the rewritten JPEG.
+        
+        Args:
+            output: Binary file object to write to
+        """
+        header = self._build_header()
+        output.write(b'\xff\xd8' + b''.join(segment for _, segment in header))
+        copy_range(self.source, output, self.data_offset)
+    
+    @classmethod
+    def rewrite_file(
+        cls,
+        input_path: Union[str, Path],
+        output_path: Union[str, Path],
+        replacements: Dict[str, bytes]
+    ) -> None:
+        """
+        Rewrite the metadata segments of a JPEG file.
+        
+        The result is written atomically (see stream_copy.atomic_output), so
+        output_path may be the input file itself.
+        
+        Args:
+            input_path: Path to input JPEG file
+            output_path: Path to output JPEG file
+            replacements: Segment kind -> new segment bytes (empty to remove)
+        """
+        with atomic_output(output_path) as output:
+            with open(input_path, 'rb') as source:
+                rewriter = cls(source)
+                for kind, segment in replacements.items():
+                    rewriter.replace(kind, segment)
+                rewriter.write(output)
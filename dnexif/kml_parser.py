@@ -13,8 +13,10 @@ KML files are XML-based Google Earth files.
 Copyright 2025 DNAi inc.
 """
 
+import io
+import os
 import xml.etree.ElementTree as ET
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, BinaryIO
 from pathlib import Path
 from datetime import datetime
 
@@ -40,6 +42,10 @@ class KMLParser:
         'gx': 'http://www.google.com/kml/ext/2.2',
     }
     
+    # Elements counted in the summary, and number of placemarks described
+    COUNTED_ELEMENTS = frozenset(('Placemark', 'Folder', 'Style', 'GroundOverlay'))
+    PLACEMARK_LIMIT = 20
+    
     def __init__(self, file_path: Optional[str] = None, file_data: Optional[bytes] = None):
         """
         Initialize KML parser.
@@ -65,14 +71,12 @@ class KMLParser:
             Dictionary of KML metadata
         """
         try:
-            # Read file data
             if self.file_data is None:
-                with open(self.file_path, 'rb') as f:
-                    file_data = f.read()
+                file_size = os.path.getsize(self.file_path)
             else:
-                file_data = self.file_data
+                file_size = len(self.file_data)
             
-            if len(file_data) == 0:
+            if file_size == 0:
                 raise MetadataReadError("Invalid KML file: empty file")
             
             metadata = {}
@@ -80,18 +84,49 @@ class KMLParser:
             metadata['File:FileTypeExtension'] = 'kml'
             metadata['File:MIMEType'] = 'application/vnd.google-earth.kml+xml'
             
-            # Try to decode as UTF-8
-            try:
-                xml_content = file_data.decode('utf-8')
-            except UnicodeDecodeError:
-                try:
-                    xml_content = file_data.decode('utf-16-le')
-                except UnicodeDecodeError:
-                    xml_content = file_data.decode('latin-1', errors='ignore')
+            # Stream the XML, counting elements as they are read and dropping
+            # the bulk of large tracks (placemarks past the summary limit,
+            # repeated gx:Track samples and line coordinates) from the tree
+            root = None
+            declared_namespaces = set()
+            parents = []
+            element_counts = {}  # Placemark/Folder/Style/GroundOverlay tag -> count
+            placemarks_by_tag = {}  # Placemark tag -> first placemarks, up to the limit
+            documents = {}  # Document tag -> first Document element
             
-            # Parse XML
             try:
-                root = ET.fromstring(xml_content)
+                with self._open_source() as source:
+                    for event, item in ET.iterparse(source, events=('start-ns', 'start', 'end')):
+                        if event == 'start-ns':
+                            declared_namespaces.add(item[1])
+                            continue
+                        
+                        local_name = item.tag.rpartition('}')[2]
+                        if event == 'start':
+                            if root is None:
+                                root = item
+                            elif local_name == 'Document':
+                                documents.setdefault(item.tag, item)
+                            parents.append(item)
+                            continue
+                        
+                        parents.pop()
+                        if not parents:
+                            continue
+                        parent = parents[-1]
+                        if local_name in self.COUNTED_ELEMENTS:
+                            count = element_counts[item.tag] = element_counts.get(item.tag, 0) + 1
+                            if local_name == 'Placemark':
+                                if count <= self.PLACEMARK_LIMIT:
+                                    placemarks_by_tag.setdefault(item.tag, []).append(item)
+                                else:
+                                    parent.remove(item)
+                        elif local_name in ('when', 'coord') and parent.tag.endswith('Track'):
+                            # Only the first sample of a gx:Track is ever read
+                            if parent.find(item.tag) is not item:
+                                parent.remove(item)
+                        elif local_name == 'coordinates' and not parent.tag.endswith('Point'):
+                            item.text = None
             except ET.ParseError:
                 raise MetadataReadError("Invalid KML file: XML parse error")
             
@@ -103,16 +138,21 @@ class KMLParser:
             else:
                 # Try common namespaces
                 for prefix, uri in self.KML_NAMESPACES.items():
-                    if uri in xml_content:
+                    if uri in declared_namespaces:
                         ns['kml'] = uri
                         break
             
+            def count_of(name: str) -> int:
+                # Namespaced elements first, then the un-namespaced fallback
+                count = element_counts.get(f'{{{ns["kml"]}}}{name}', 0) if 'kml' in ns else 0
+                return count or element_counts.get(name, 0)
+            
             # Extract Document element - handle namespace properly
             document = None
             if ns and 'kml' in ns:
-                document = root.find(f'.//{{{ns["kml"]}}}Document')
+                document = documents.get(f'{{{ns["kml"]}}}Document')
             if document is None:
-                document = root.find('.//Document')
+                document = documents.get('Document')
             if document is None:
                 document = root  # Use root if no Document element
             
@@ -135,53 +175,34 @@ class KMLParser:
                 metadata['KML:Document:Description'] = desc_elem.text
             
             # Count placemarks - handle namespace properly
-            placemarks = []
-            if ns and 'kml' in ns:
-                placemarks = root.findall(f'.//{{{ns["kml"]}}}Placemark')
-            if not placemarks:
-                placemarks = root.findall('.//Placemark')
-            
-            if placemarks:
-                metadata['KML:PlacemarkCount'] = len(placemarks)
-                for i, pm in enumerate(placemarks[:20], 1):  # Limit to 20 placemarks
+            placemark_count = count_of('Placemark')
+            if placemark_count:
+                metadata['KML:PlacemarkCount'] = placemark_count
+                placemarks = []
+                if ns and 'kml' in ns:
+                    placemarks = placemarks_by_tag.get(f'{{{ns["kml"]}}}Placemark', [])
+                if not placemarks:
+                    placemarks = placemarks_by_tag.get('Placemark', [])
+                for i, pm in enumerate(placemarks, 1):
                     pm_metadata = self._parse_placemark(pm, i, ns)
                     if pm_metadata:
                         metadata.update(pm_metadata)
             
-            # Count folders - handle namespace properly
-            folders = []
-            if ns and 'kml' in ns:
-                folders = root.findall(f'.//{{{ns["kml"]}}}Folder')
-            if not folders:
-                folders = root.findall('.//Folder')
-            
-            if folders:
-                metadata['KML:FolderCount'] = len(folders)
-            
-            # Count styles - handle namespace properly
-            styles = []
-            if ns and 'kml' in ns:
-                styles = root.findall(f'.//{{{ns["kml"]}}}Style')
-            if not styles:
-                styles = root.findall('.//Style')
+            # Count folders, styles and ground overlays
+            folder_count = count_of('Folder')
+            if folder_count:
+                metadata['KML:FolderCount'] = folder_count
             
-            if styles:
-                metadata['KML:StyleCount'] = len(styles)
+            style_count = count_of('Style')
+            if style_count:
+                metadata['KML:StyleCount'] = style_count
             
-            # Count ground overlays - handle namespace properly
-            overlays = []
-            if ns and 'kml' in ns:
-                overlays = root.findall(f'.//{{{ns["kml"]}}}GroundOverlay')
-            if not overlays:
-                overlays = root.findall('.//GroundOverlay')
-            
-            if overlays:
-                metadata['KML:GroundOverlayCount'] = len(overlays)
+            overlay_count = count_of('GroundOverlay')
+            if overlay_count:
+                metadata['KML:GroundOverlayCount'] = overlay_count
             
             # Extract file size
             if self.file_path:
-                import os
-                file_size = os.path.getsize(self.file_path)
                 metadata['File:FileSize'] = file_size
                 metadata['File:FileSizeBytes'] = file_size
             
@@ -190,6 +211,12 @@ class KMLParser:
         except Exception as e:
             raise MetadataReadError(f"Failed to parse KML metadata: {str(e)}")
     
+    def _open_source(self) -> BinaryIO:
+        """Open the KML data for streaming."""
+        if self.file_data is None:
+            return open(self.file_path, 'rb')
+        return io.BytesIO(self.file_data)
+    
     def _parse_placemark(self, pm: ET.Element, index: int, ns: Dict[str, str]) -> Dict[str, Any]:
         """
         Parse placemark element.
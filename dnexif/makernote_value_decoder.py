@@ -16,6 +16,14 @@ Copyright 2025 DNAi inc.
 import struct
 from typing import Dict, Any, Optional, List, Tuple
 from dnexif.exceptions import MetadataReadError
+from dnexif.makernote_value_maps import (
+    MAIN_DIRECTORY,
+    MAKERNOTE_ENUM_LOOKUP,
+    MAKERNOTE_FLAG_LOOKUP,
+    get_enum_map,
+    get_flag_map,
+    resolve_subdirectory,
+)
 
 
 class MakerNoteValueDecoder:
@@ -278,18 +286,24 @@ class MakerNoteValueDecoder:
         Returns:
             Value with enum/flag interpretation if available
         """
-        # Get enum/flag definitions for this tag (with sub-IFD context)
-        enum_map = self._get_enum_map(manufacturer, tag_id, parent_tag_name)
-        flag_map = self._get_flag_map(manufacturer, tag_id, parent_tag_name)
+        if not isinstance(raw_value, int):
+            # Enum/flag mappings only apply to integer values
+            return raw_value
         
-        if enum_map and isinstance(raw_value, int):
+        # Get enum/flag definitions for this tag (with sub-IFD context)
+        directory = resolve_subdirectory(manufacturer, parent_tag_name) if parent_tag_name else MAIN_DIRECTORY
+        key = (manufacturer, directory, tag_id)
+        enum_map = MAKERNOTE_ENUM_LOOKUP.get(key)
+        if enum_map:
             # Check if value is in enum map
             if raw_value in enum_map:
                 # Return just the enum name to standard format format (no numeric suffix)
                 return enum_map[raw_value]
             # Return raw value if not in enum
             return raw_value
-        elif flag_map and isinstance(raw_value, int):
+        
+        flag_map = MAKERNOTE_FLAG_LOOKUP.get(key)
+        if flag_map:
             # Decode flags (bitwise)
             flags = []
             for bit, flag_name in flag_map.items():
@@ -314,800 +328,7 @@ class MakerNoteValueDecoder:
         Returns:
             Dictionary mapping values to enum names, or None
         """
-        # Canon enums
-        if manufacturer == 'CANON':
-            # Canon CameraSettings sub-IFD enums (tag 0x0001)
-            if parent_tag_name and 'CanonCameraSettings' in parent_tag_name:
-                # Canon CameraSettings sub-IFD tag enums
-                if tag_id == 0x0001:  # MacroMode
-                    return {
-                        0: "Off",
-                        1: "On",
-                        2: "Normal",  # Some Canon cameras use 2 for Normal mode
-                    }
-                elif tag_id == 0x0002:  # SelfTimer
-                    return {
-                        0: "Off",
-                        1: "2 s",
-                        2: "10 s",
-                        3: "Custom",
-                    }
-                elif tag_id == 0x0003:  # Quality
-                    return {
-                        0: "Normal",
-                        1: "Fine",
-                        2: "RAW",
-                        3: "RAW+Fine",
-                        4: "RAW+Normal",
-                    }
-                elif tag_id == 0x000F:  # MeteringMode
-                    return {
-                        0: "Default",
-                        1: "Spot",
-                        2: "Average",
-                        3: "Evaluative",
-                        4: "Partial",
-                        5: "Center-weighted average",
-                    }
-                elif tag_id == 0x0011:  # AFPointSelection
-                    return {
-                        0: "Manual",
-                        1: "Auto",
-                    }
-                elif tag_id == 0x0003:  # ExposureMode
-                    return {
-                        0: "Easy Shooting",
-                        1: "Program",
-                        2: "Tv",
-                        3: "Av",
-                        4: "Manual",
-                        5: "A-DEP",
-                    }
-                elif tag_id == 0x0004:  # FlashMode
-                    return {
-                        0: "No Flash",
-                        1: "Auto",
-                        2: "On",
-                        3: "Red-eye Reduction",
-                        4: "Slow Sync",
-                        5: "Red-eye Reduction + Slow Sync",
-                    }
-                elif tag_id == 0x0005:  # DriveMode
-                    return {
-                        0: "Single",
-                        1: "Continuous",
-                        2: "Timer",
-                    }
-                elif tag_id == 0x0007:  # FocusMode
-                    return {
-                        0: "One-Shot AF",
-                        1: "AI Servo AF",
-                        2: "AI Focus AF",
-                        3: "Manual Focus",
-                    }
-                elif tag_id == 0x0008:  # ImageSize
-                    return {
-                        0: "Large",
-                        1: "Medium",
-                        2: "Small",
-                    }
-                elif tag_id == 0x0009:  # Quality
-                    return {
-                        0: "Normal",
-                        1: "Fine",
-                        2: "RAW",
-                        3: "RAW+Fine",
-                        4: "RAW+Normal",
-                    }
-                elif tag_id == 0x000A:  # ISO
-                    return {
-                        0: "Auto",
-                        15: "ISO 50",
-                        16: "ISO 100",
-                        17: "ISO 200",
-                        18: "ISO 400",
-                        19: "ISO 800",
-                        20: "ISO 1600",
-                        21: "ISO 3200",
-                    }
-                elif tag_id == 0x000B:  # MeteringMode (alternative)
-                    return {
-                        0: "Default",
-                        1: "Spot",
-                        2: "Average",
-                        3: "Evaluative",
-                        4: "Partial",
-                        5: "Center-weighted average",
-                    }
-                elif tag_id == 0x000C:  # FocusType
-                    return {
-                        0: "Manual",
-                        1: "Auto",
-                        2: "Not Known",
-                    }
-                elif tag_id == 0x000D:  # AFPoint
-                    return {
-                        0: "None",
-                        1: "Manual",
-                        2: "Auto",
-                    }
-                elif tag_id == 0x000E:  # ExposureCompensation
-                    # This is typically a signed value, not an enum
-                    return None
-                elif tag_id == 0x000F:  # ISOSpeed
-                    # ISO speed values (similar to 0x000A)
-                    return {
-                        0: "Auto",
-                        15: "ISO 50",
-                        16: "ISO 100",
-                        17: "ISO 200",
-                        18: "ISO 400",
-                        19: "ISO 800",
-                        20: "ISO 1600",
-                        21: "ISO 3200",
-                    }
-                elif tag_id == 0x001B:  # FocalLength
-                    # FocalLength is typically a RATIONAL value, not an enum
-                    # But if it's stored as integer, return None to use raw value
-                    return None
-                elif tag_id == 0x001C:  # FlashActivity
-                    # FlashActivity is typically a numeric value (0 = no flash activity)
-                    # Return None to use raw numeric value (not an enum)
-                    return None
-                elif tag_id == 0x0030:  # FlashGuideNumber
-                    # FlashGuideNumber is typically a numeric value, not an enum
-                    return None
-            
-            # Canon FlashInfo sub-IFD enums (tag 0x0003)
-            elif parent_tag_name and 'CanonFlashInfo' in parent_tag_name:
-                if tag_id == 0x0001:  # FlashMode
-                    return {
-                        0: "No Flash",
-                        1: "Auto",
-                        2: "On",
-                        3: "Red-eye Reduction",
-                        4: "Slow Sync",
-                    }
-                elif tag_id == 0x0003:  # FlashQuality
-                    return {
-                        2: "Normal",
-                        3: "Fine",
-                        5: "SuperFine",
-                    }
-            
-            # Canon ShotInfo sub-IFD enums (tag 0x0004)
-            # Note: Most ShotInfo tags are numeric values, not enums
-            # Only specific tags have enum mappings
-            elif parent_tag_name and 'CanonShotInfo' in parent_tag_name:
-                if tag_id == 0x0007:  # WhiteBalance
-                    return {
-                        0: "Auto",
-                        1: "Daylight",
-                        2: "Cloudy",
-                        3: "Tungsten",
-                        4: "Fluorescent",
-                        5: "Flash",
-                        6: "Custom",
-                        7: "Black & White",
-                        8: "Shade",
-                        9: "Manual Temperature (Kelvin)",
-                        10: "PC Set1",
-                        11: "PC Set2",
-                        12: "PC Set3",
-                        14: "Fluorescent H (Daylight)",
-                        15: "Custom 1",
-                        16: "Custom 2",
-                        17: "Underwater",
-                    }
-                elif tag_id == 0x0008:  # SlowShutter
-                    return {
-                        -1: "n/a",
-                        0: "Off",
-                        1: "Night Scene",
-                        2: "On",
-                        3: "None",
-                    }
-                # AutoISO (0x0001), BaseISO (0x0002), etc. are numeric - no enum mapping
-                return None
-
-            # Canon AFInfo2 SerialData enums (tag 0x0026)
-            elif parent_tag_name and 'CanonAFInfo2' in parent_tag_name:
-                if tag_id == 0x0001:  # AFAreaMode
-                    return {
-                        0: "Off (Manual Focus)",
-                        1: "Single-point AF",
-                        2: "Dynamic AF (9 points)",
-                        3: "Dynamic AF (21 points)",
-                        4: "Auto",
-                        5: "Zone AF",
-                        6: "Face Detection AF",
-                    }
-
-            # Canon ImageType (tag 0x0006)
-            if tag_id == 0x0006:
-                return {
-                    0: "Original",
-                    1: "Standard",
-                    2: "Fine",
-                    3: "RAW",
-                }
-            # Canon DateStampMode (tag 0x0012)
-            elif tag_id == 0x0012:
-                return {
-                    0: "Off",
-                    1: "Date",
-                    2: "Date and Time",
-                }
-            # Canon MyColors (tag 0x0013)
-            elif tag_id == 0x0013:
-                return {
-                    0: "Off",
-                    1: "Vivid",
-                    2: "Neutral",
-                    3: "Sepia",
-                    4: "B&W",
-                    5: "Custom",
-                }
-            # Canon WhiteBalance (main tag, but also in CameraSettings sub-IFD)
-            elif tag_id == 0x0007 and not parent_tag_name:
-                return {
-                    0: "Auto",
-                    1: "Daylight",
-                    2: "Cloudy",
-                    3: "Tungsten",
-                    4: "Fluorescent",
-                    5: "Flash",
-                    6: "Custom",
-                    7: "Color Temperature",
-                }
-        
-        # Nikon enums
-        elif manufacturer == 'NIKON':
-            # Nikon Quality (tag 0x0004)
-            if tag_id == 0x0004:
-                return {
-                    1: "VGA Basic",
-                    2: "VGA Normal",
-                    3: "VGA Fine",
-                    4: "SXGA Basic",
-                    5: "SXGA Normal",
-                    6: "SXGA Fine",
-                }
-            # Nikon WhiteBalance (tag 0x0005)
-            elif tag_id == 0x0005:
-                return {
-                    0: "Auto",
-                    1: "Preset",
-                    2: "Daylight",
-                    3: "Incandescent",
-                    4: "Fluorescent",
-                    5: "Cloudy",
-                    6: "Speedlight",
-                    7: "Shade",
-                    8: "Color Temperature",
-                }
-            # Nikon FocusMode (tag 0x0007)
-            elif tag_id == 0x0007:
-                return {
-                    0: "Manual",
-                    1: "AF-S",
-                    2: "AF-C",
-                    3: "AF-A",
-                }
-            # Nikon ColorMode (tag 0x0003)
-            elif tag_id == 0x0003:
-                return {
-                    1: "Color",
-                    2: "Monochrome",
-                }
-            # Nikon ImageSharpening (tag 0x0006)
-            elif tag_id == 0x0006:
-                return {
-                    0: "None",
-                    1: "Low",
-                    2: "Normal",
-                    3: "High",
-                }
-            # Nikon FlashMode (tag 0x0009)
-            elif tag_id == 0x0009:
-                return {
-                    0: "No Flash",
-                    1: "Flash Fired",
-                }
-            # Nikon ExposureMode (tag 0x000A)
-            elif tag_id == 0x000A:
-                return {
-                    0: "Program",
-                    1: "Aperture Priority",
-                    2: "Shutter Priority",
-                    3: "Manual",
-                }
-            # Nikon ColorSpace (tag 0x001A)
-            elif tag_id == 0x001A:
-                return {
-                    1: "sRGB",
-                    2: "Adobe RGB",
-                }
-            # Nikon ActiveD-Lighting (tag 0x001D)
-            elif tag_id == 0x001D:
-                return {
-                    0: "Off",
-                    1: "Low",
-                    2: "Normal",
-                    3: "High",
-                    4: "Extra High",
-                }
-            # Nikon VibrationReduction (tag 0x0024)
-            elif tag_id == 0x0024:
-                return {
-                    0: "Off",
-                    1: "On",
-                }
-            # Nikon PictureControl (tag 0x001E)
-            elif tag_id == 0x001E:
-                return {
-                    0: "Standard",
-                    1: "Neutral",
-                    2: "Vivid",
-                    3: "Monochrome",
-                    4: "Portrait",
-                    5: "Landscape",
-                }
-        
-        # Sony enums
-        elif manufacturer == 'SONY':
-            # Sony Quality (tag 0x0102)
-            if tag_id == 0x0102:
-                return {
-                    0: "RAW",
-                    1: "RAW+JPEG",
-                    2: "Fine",
-                    3: "Standard",
-                }
-            # Sony WhiteBalance (tag 0x0115)
-            elif tag_id == 0x0115:
-                return {
-                    0: "Auto",
-                    1: "Daylight",
-                    2: "Cloudy",
-                    3: "Tungsten",
-                    4: "Fluorescent",
-                    5: "Flash",
-                    6: "Color Temperature",
-                    7: "Custom",
-                }
-            # Sony ColorMode (tag 0x0104)
-            elif tag_id == 0x0104:
-                return {
-                    0: "Standard",
-                    1: "Vivid",
-                    2: "Portrait",
-                    3: "Landscape",
-                    4: "Sunset",
-                    5: "Night View",
-                    6: "B&W",
-                    7: "Sepia",
-                }
-            # Sony SceneMode (tag 0x0107)
-            elif tag_id == 0x0107:
-                return {
-                    0: "Auto",
-                    1: "Portrait",
-                    2: "Landscape",
-                    3: "Macro",
-                    4: "Sports",
-                    5: "Sunset",
-                    6: "Night View",
-                    7: "Handheld Twilight",
-                    8: "Anti Motion Blur",
-                }
-            # Sony FlashMode (tag 0x0112)
-            elif tag_id == 0x0112:
-                return {
-                    0: "No Flash",
-                    1: "Flash Fired",
-                    2: "Fill Flash",
-                    3: "Red-eye Reduction",
-                    4: "Wireless",
-                }
-            # Sony ExposureMode (tag 0x0111)
-            elif tag_id == 0x0111:
-                return {
-                    0: "Auto",
-                    1: "Program",
-                    2: "Aperture Priority",
-                    3: "Shutter Priority",
-                    4: "Manual",
-                    5: "Scene Selection",
-                }
-            # Sony DynamicRangeOptimizer (tag 0x0102)
-            elif tag_id == 0x0102:
-                return {
-                    0: "Off",
-                    1: "Standard",
-                    2: "Plus",
-                }
-            # Sony ImageStabilization (tag 0x0103)
-            elif tag_id == 0x0103:
-                return {
-                    0: "Off",
-                    1: "On",
-                }
-        
-        # Olympus enums
-        elif manufacturer == 'OLYMPUS':
-            # Olympus Quality (tag 0x0101)
-            if tag_id == 0x0101:
-                return {
-                    1: "SQ",
-                    2: "HQ",
-                    3: "SHQ",
-                    4: "RAW",
-                }
-            # Olympus SpecialMode (tag 0x0100)
-            elif tag_id == 0x0100:
-                return {
-                    0: "Normal",
-                    1: "Unknown",
-                    2: "Fast",
-                    3: "Panorama",
-                }
-            # Olympus Macro (tag 0x0102)
-            elif tag_id == 0x0102:
-                return {
-                    0: "Off",
-                    1: "On",
-                }
-            # Olympus BWMode (tag 0x0103)
-            elif tag_id == 0x0103:
-                return {
-                    0: "Off",
-                    1: "On",
-                }
-            # Olympus WhiteBalance (tag 0x0104)
-            elif tag_id == 0x0104:
-                return {
-                    0: "Auto",
-                    1: "Daylight",
-                    2: "Cloudy",
-                    3: "Tungsten",
-                    4: "Fluorescent",
-                }
-            # Olympus PictureMode (tag 0x0116)
-            elif tag_id == 0x0116:
-                return {
-                    1: "i-Auto",
-                    2: "Program",
-                    3: "Aperture Priority",
-                    4: "Shutter Priority",
-                    5: "Manual",
-                }
-            # Olympus FlashMode (tag 0x010C)
-            elif tag_id == 0x010C:
-                return {
-                    0: "No Flash",
-                    1: "Flash Fired",
-                }
-            # Olympus FocusMode (tag 0x010D)
-            elif tag_id == 0x010D:
-                return {
-                    0: "Auto",
-                    1: "Manual",
-                }
-        
-        # Pentax enums
-        elif manufacturer == 'PENTAX':
-            # Pentax Quality (tag 0x0009)
-            if tag_id == 0x0009:
-                return {
-                    0: "Good",
-                    1: "Better",
-                    2: "Best",
-                    3: "TIFF",
-                    4: "RAW",
-                }
-            # Pentax Mode (tag 0x0002)
-            elif tag_id == 0x0002:
-                return {
-                    0: "Auto",
-                    1: "Program",
-                    2: "Aperture Priority",
-                    3: "Shutter Priority",
-                    4: "Manual",
-                    5: "Bulb",
-                }
-            # Pentax Flash (tag 0x000B)
-            elif tag_id == 0x000B:
-                return {
-                    0: "No Flash",
-                    1: "Flash Fired",
-                }
-            # Pentax WhiteBalance (tag 0x0007)
-            elif tag_id == 0x0007:
-                return {
-                    0: "Auto",
-                    1: "Daylight",
-                    2: "Shade",
-                    3: "Cloudy",
-                    4: "Tungsten",
-                    5: "Fluorescent",
-                    6: "Flash",
-                }
-            # Pentax ColorSpace (tag 0x0013)
-            elif tag_id == 0x0013:
-                return {
-                    1: "sRGB",
-                    2: "Adobe RGB",
-                }
-            # Pentax FocusMode (tag 0x0008)
-            elif tag_id == 0x0008:
-                return {
-                    0: "Manual",
-                    1: "AF-S",
-                    2: "AF-C",
-                }
-        
-        # Fujifilm enums
-        elif manufacturer == 'FUJIFILM':
-            # Fujifilm Quality (tag 0x1002) - Note: 0x1000 is Version, not Quality
-            if tag_id == 0x1002:
-                return {
-                    0: "NORMAL",
-                    1: "FINE",
-                    2: "RAW",
-                    3: "RAW+FINE",
-                    4: "RAW+",
-                }
-            # Fujifilm Sharpness (tag 0x1003) - Note: 0x1001 is SerialNumber, 0x101D is also Sharpness
-            elif tag_id == 0x1003 or tag_id == 0x101D:
-                return {
-                    0: "Soft",
-                    1: "Normal",
-                    2: "Hard",
-                    3: "Medium Soft",
-                    4: "Medium Hard",
-                }
-            # Fujifilm WhiteBalance (tag 0x1004) - Note: 0x1025 is also WhiteBalance
-            elif tag_id == 0x1004 or tag_id == 0x1025:
-                return {
-                    0: "Auto",
-                    256: "Daylight",
-                    512: "Cloudy",
-                    768: "Tungsten",
-                    1024: "Fluorescent",
-                    1280: "Custom",
-                }
-            # Fujifilm Color (tag 0x1005) - Saturation
-            elif tag_id == 0x1005:
-                return {
-                    0: "Standard",
-                    1: "High",
-                    2: "Low",
-                }
-            # Fujifilm Tone (tag 0x1006)
-            elif tag_id == 0x1006:
-                return {
-                    0: "Standard",
-                    1: "High",
-                    2: "Low",
-                }
-            # Fujifilm FlashMode (tag 0x101A)
-            elif tag_id == 0x101A:
-                return {
-                    0: "Off",
-                    1: "On",
-                    2: "Red-eye Reduction",
-                    3: "External",
-                }
-            # Fujifilm FocusMode (tag 0x1017)
-            elif tag_id == 0x1017:
-                return {
-                    0: "Manual",
-                    1: "AF-S",
-                    2: "AF-C",
-                }
-            # Fujifilm ShutterType (tag 0x1020 or 0x1050)
-            elif tag_id == 0x1020 or tag_id == 0x1050:
-                return {
-                    0: "Mechanical",
-                    1: "Electronic",
-                    2: "Electronic (Front Curtain)",
-                }
-            # Fujifilm SlowSync (tag 0x1019 or 0x1030)
-            elif tag_id == 0x1019 or tag_id == 0x1030:
-                return {
-                    0: "Off",
-                    1: "On",
-                }
-            # Fujifilm PictureMode (tag 0x1031)
-            elif tag_id == 0x1031:
-                return {
-                    0: "Auto",
-                    1: "Program AE",
-                    2: "Aperture-priority AE",
-                    3: "Shutter-priority AE",
-                    4: "Manual",
-                    5: "Scene Position",
-                    256: "Aperture-priority AE",
-                    512: "Shutter-priority AE",
-                }
-            # Fujifilm DynamicRangeSetting (tag 0x100A)
-            elif tag_id == 0x100A:
-                return {
-                    0: "Auto",
-                    1: "Manual",
-                }
-            # Fujifilm LensModulationOptimizer (tag 0x1045)
-            elif tag_id == 0x1045:
-                return {
-                    0: "Off",
-                    1: "On",
-                }
-            # Fujifilm FileSource (tag 0x1010)
-            elif tag_id == 0x1010:
-                return {
-                    0: "Digital Camera",
-                    1: "Film Scanner",
-                    2: "Reflection Print Scanner",
-                }
-            # Fujifilm DynamicRange (tag 0x1008)
-            elif tag_id == 0x1008:
-                return {
-                    0: "Standard",
-                    1: "Wide",
-                    256: "Standard",
-                    512: "Wide",
-                }
-            # Fujifilm FilmMode (tag 0x1009) - Note: FilmMode can be string or enum
-            # Common values: "F0/Standard (Provia)", "F1/Standard (Provia)", etc.
-            # For enum values, map common numeric values
-            elif tag_id == 0x1009:
-                return {
-                    0: "F0/Standard (Provia)",
-                    1: "F1/Standard (Provia)",
-                    2: "F2/Standard (Provia)",
-                    3: "F3/Standard (Provia)",
-                }
-            # Fujifilm NoiseReduction (tag 0x1028)
-            elif tag_id == 0x1028:
-                return {
-                    0: "0 (normal)",
-                    1: "1 (low)",
-                    2: "2 (normal)",
-                    3: "3 (high)",
-                    4: "4 (normal+)",
-                    5: "5 (low+)",
-                    6: "6 (normal++)",
-                    7: "7 (high++)",
-                }
-            # Fujifilm ImageStabilization (tag 0x101F) - Note: Can be complex string format
-            # Common values: "Off", "On", "Optical; On (mode 1, continuous); 0"
-            elif tag_id == 0x101F:
-                return {
-                    0: "Off",
-                    1: "On",
-                    2: "Optical; On (mode 1, continuous); 0",
-                }
-        
-        # Panasonic enums
-        elif manufacturer == 'PANASONIC':
-            # Panasonic Quality (tag 0x0001)
-            if tag_id == 0x0001:
-                return {
-                    2: "High",
-                    3: "Normal",
-                    6: "Very High",
-                    7: "RAW",
-                }
-            # Panasonic FirmwareVersion (tag 0x0002) - string, no enum
-            # Panasonic WhiteBalance (tag 0x0003)
-            elif tag_id == 0x0003:
-                return {
-                    1: "Auto",
-                    2: "Daylight",
-                    3: "Cloudy",
-                    4: "Tungsten",
-                    5: "Fluorescent",
-                    6: "Shade",
-                    7: "Color Temperature",
-                }
-            # Panasonic FocusMode (tag 0x0004)
-            elif tag_id == 0x0004:
-                return {
-                    1: "Auto",
-                    2: "Manual",
-                    4: "AF-S",
-                    5: "AF-C",
-                }
-            # Panasonic AFAreaMode (tag 0x0005)
-            elif tag_id == 0x0005:
-                return {
-                    0: "Off",
-                    1: "1-area",
-                    2: "Multi-area",
-                    3: "Tracking",
-                }
-            # Panasonic ImageStabilization (tag 0x0006)
-            elif tag_id == 0x0006:
-                return {
-                    0: "Off",
-                    1: "On",
-                }
-            # Panasonic MacroMode (tag 0x0007)
-            elif tag_id == 0x0007:
-                return {
-                    0: "Off",
-                    1: "On",
-                    2: "Off",  # Some cameras use 2 for Off
-                }
-            # Panasonic ShootingMode (tag 0x0008)
-            elif tag_id == 0x0008:
-                return {
-                    1: "Program",
-                    2: "Aperture Priority",
-                    3: "Shutter Priority",
-                    4: "Manual",
-                }
-            # Panasonic Audio (tag 0x0009)
-            elif tag_id == 0x0009:
-                return {
-                    0: "No",
-                    1: "Yes",
-                }
-            # Panasonic FlashMode (tag 0x000C)
-            elif tag_id == 0x000C:
-                return {
-                    0: "No Flash",
-                    1: "Flash Fired",
-                }
-            # Panasonic ColorMode (tag 0x000E)
-            elif tag_id == 0x000E:
-                return {
-                    0: "Standard",
-                    1: "Vivid",
-                    2: "Natural",
-                }
-            # Panasonic Sharpness (tag 0x00EC)
-            elif tag_id == 0x00EC:
-                return {
-                    0: "Off",
-                    1: "Low",
-                    2: "Normal",
-                    3: "High",
-                    4: "Standard",
-                    5: "Medium Low",
-                    6: "Medium High",
-                }
-            # Panasonic FilmMode (tag 0x00A5, 0x00CA)
-            elif tag_id in (0x00A5, 0x00CA):
-                return {
-                    0: "Standard (color)",
-                    1: "Dynamic (color)",
-                    2: "Nature (color)",
-                    3: "Smooth (color)",
-                    4: "Standard (B&W)",
-                    5: "Dynamic (B&W)",
-                    6: "Smooth (B&W)",
-                    7: "n/a",
-                }
-            # Panasonic FocusMode (tag 0x00CE) - alternative tag ID
-            elif tag_id == 0x00CE:
-                return {
-                    1: "Auto",
-                    2: "Manual",
-                    4: "AF-S",
-                    5: "AF-C",
-                }
-            # Panasonic ImageStabilization (tag 0x00D1) - alternative tag ID
-            elif tag_id == 0x00D1:
-                return {
-                    0: "Off",
-                    1: "On",
-                    2: "Mode 1",
-                    3: "Mode 2",
-                }
-        
-        return None
+        return get_enum_map(manufacturer, tag_id, parent_tag_name)
     
     def _get_flag_map(self, manufacturer: str, tag_id: int, parent_tag_name: Optional[str] = None) -> Optional[Dict[int, str]]:
         """
@@ -1121,108 +342,7 @@ class MakerNoteValueDecoder:
         Returns:
             Dictionary mapping bit positions to flag names, or None
         """
-        # Canon flags
-        if manufacturer == 'CANON':
-            # Canon CustomFunctions flags (tag 0x000C)
-            if tag_id == 0x000C:
-                return {
-                    0: "LongExposureNoiseReduction",
-                    1: "ShutterAELockButton",
-                    2: "MirrorLockup",
-                    3: "ExposureLevelIncrements",
-                    4: "ISOExpansion",
-                    5: "AEBSequence",
-                }
-            # Canon CameraSettings sub-IFD flags
-            elif parent_tag_name and 'CanonCameraSettings' in parent_tag_name:
-                if tag_id == 0x0001:  # MeteringMode flags
-                    return {
-                        0: "Spot",
-                        1: "Average",
-                        2: "Evaluative",
-                        3: "Partial",
-                        4: "Center-weighted average",
-                    }
-                elif tag_id == 0x0004:  # FlashMode flags
-                    return {
-                        0: "No Flash",
-                        1: "Auto",
-                        2: "On",
-                        3: "Red-eye Reduction",
-                        4: "Slow Sync",
-                    }
-            # Canon CameraSettings flags (main tag)
-            elif tag_id == 0x0001 and not parent_tag_name:
-                return {
-                    0: "MacroMode",
-                    1: "SelfTimer",
-                    2: "Quality",
-                    3: "FlashMode",
-                }
-        
-        # Nikon flags
-        elif manufacturer == 'NIKON':
-            # Nikon FlashSetting flags (tag 0x0008)
-            if tag_id == 0x0008:
-                return {
-                    0: "FlashFired",
-                    1: "FlashMode",
-                    2: "FlashCompensation",
-                }
-            # Nikon ImageProcessing flags (tag 0x0016)
-            elif tag_id == 0x0016:
-                return {
-                    0: "NoiseReduction",
-                    1: "ActiveD-Lighting",
-                    2: "VignetteControl",
-                }
-        
-        # Sony flags
-        elif manufacturer == 'SONY':
-            # Sony CameraSettings flags
-            if tag_id == 0x0100:
-                return {
-                    0: "AFMode",
-                    1: "AFAreaMode",
-                    2: "FocusMode",
-                }
-        
-        # Olympus flags
-        elif manufacturer == 'OLYMPUS':
-            # Olympus SpecialMode flags (tag 0x0100)
-            if tag_id == 0x0100:
-                return {
-                    0: "Normal",
-                    1: "Unknown",
-                    2: "Fast",
-                    3: "Panorama",
-                }
-        
-        # Pentax flags
-        elif manufacturer == 'PENTAX':
-            # Pentax Flash flags (tag 0x000B)
-            if tag_id == 0x000B:
-                return {
-                    0: "No Flash",
-                    1: "Flash Fired",
-                }
-        
-        # Fujifilm flags
-        elif manufacturer == 'FUJIFILM':
-            # Fujifilm flags (if any)
-            pass
-        
-        # Panasonic flags
-        elif manufacturer == 'PANASONIC':
-            # Panasonic ImageStabilization flags (tag 0x0006)
-            if tag_id == 0x0006:
-                return {
-                    0: "Off",
-                    1: "On",
-                }
-        
-        # Add more flag mappings as needed
-        return None
+        return get_flag_map(manufacturer, tag_id, parent_tag_name)
     
     def decode_nikon_value(
         self,
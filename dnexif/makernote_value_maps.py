@@ -0,0 +1,881 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+MakerNote enum and flag value maps
+
+This module contains the value interpretation tables used by the MakerNote
+value decoder. Maps are keyed by (manufacturer, directory, tag ID), where
+directory is the sub-IFD a tag belongs to (e.g., "CanonCameraSettings"),
+MAIN_DIRECTORY for tags that only apply in the main MakerNote IFD, or
+ANY_DIRECTORY for tags that apply wherever they appear. A value of None
+marks a tag that explicitly has no mapping.
+
+Copyright 2025 DNAi inc.
+"""
+
+from typing import Dict, Optional, Tuple, FrozenSet
+
+ANY_DIRECTORY = '*'
+MAIN_DIRECTORY = ''
+
+# Sub-IFDs with their own tag numbering, in matching order. A parent tag name
+# selects the first directory whose name it contains.
+MAKERNOTE_SUBDIRECTORIES = {
+    'CANON': ('CanonCameraSettings', 'CanonFlashInfo', 'CanonShotInfo', 'CanonAFInfo2'),
+}
+
+MAKERNOTE_ENUM_MAPS = {
+    # Canon enums
+    # Canon CameraSettings sub-IFD enums (tag 0x0001)
+    ('CANON', 'CanonCameraSettings', 0x0001): {  # MacroMode
+        0: "Off",
+        1: "On",
+        2: "Normal",  # Some Canon cameras use 2 for Normal mode
+    },
+    ('CANON', 'CanonCameraSettings', 0x0002): {  # SelfTimer
+        0: "Off",
+        1: "2 s",
+        2: "10 s",
+        3: "Custom",
+    },
+    ('CANON', 'CanonCameraSettings', 0x0003): {  # Quality
+        0: "Normal",
+        1: "Fine",
+        2: "RAW",
+        3: "RAW+Fine",
+        4: "RAW+Normal",
+    },
+    ('CANON', 'CanonCameraSettings', 0x000F): {  # MeteringMode
+        0: "Default",
+        1: "Spot",
+        2: "Average",
+        3: "Evaluative",
+        4: "Partial",
+        5: "Center-weighted average",
+    },
+    ('CANON', 'CanonCameraSettings', 0x0011): {  # AFPointSelection
+        0: "Manual",
+        1: "Auto",
+    },
+    ('CANON', 'CanonCameraSettings', 0x0004): {  # FlashMode
+        0: "No Flash",
+        1: "Auto",
+        2: "On",
+        3: "Red-eye Reduction",
+        4: "Slow Sync",
+        5: "Red-eye Reduction + Slow Sync",
+    },
+    ('CANON', 'CanonCameraSettings', 0x0005): {  # DriveMode
+        0: "Single",
+        1: "Continuous",
+        2: "Timer",
+    },
+    ('CANON', 'CanonCameraSettings', 0x0007): {  # FocusMode
+        0: "One-Shot AF",
+        1: "AI Servo AF",
+        2: "AI Focus AF",
+        3: "Manual Focus",
+    },
+    ('CANON', 'CanonCameraSettings', 0x0008): {  # ImageSize
+        0: "Large",
+        1: "Medium",
+        2: "Small",
+    },
+    ('CANON', 'CanonCameraSettings', 0x0009): {  # Quality
+        0: "Normal",
+        1: "Fine",
+        2: "RAW",
+        3: "RAW+Fine",
+        4: "RAW+Normal",
+    },
+    ('CANON', 'CanonCameraSettings', 0x000A): {  # ISO
+        0: "Auto",
+        15: "ISO 50",
+        16: "ISO 100",
+        17: "ISO 200",
+        18: "ISO 400",
+        19: "ISO 800",
+        20: "ISO 1600",
+        21: "ISO 3200",
+    },
+    ('CANON', 'CanonCameraSettings', 0x000B): {  # MeteringMode (alternative)
+        0: "Default",
+        1: "Spot",
+        2: "Average",
+        3: "Evaluative",
+        4: "Partial",
+        5: "Center-weighted average",
+    },
+    ('CANON', 'CanonCameraSettings', 0x000C): {  # FocusType
+        0: "Manual",
+        1: "Auto",
+        2: "Not Known",
+    },
+    ('CANON', 'CanonCameraSettings', 0x000D): {  # AFPoint
+        0: "None",
+        1: "Manual",
+        2: "Auto",
+    },
+    # Numeric CameraSettings values with no enum mapping: ExposureCompensation
+    # (signed value), FocalLength (RATIONAL), FlashActivity and FlashGuideNumber
+    ('CANON', 'CanonCameraSettings', 0x000E): None,
+    ('CANON', 'CanonCameraSettings', 0x001B): None,
+    ('CANON', 'CanonCameraSettings', 0x001C): None,
+    ('CANON', 'CanonCameraSettings', 0x0030): None,
+    # Canon FlashInfo sub-IFD enums (tag 0x0003)
+    ('CANON', 'CanonFlashInfo', 0x0001): {  # FlashMode
+        0: "No Flash",
+        1: "Auto",
+        2: "On",
+        3: "Red-eye Reduction",
+        4: "Slow Sync",
+    },
+    ('CANON', 'CanonFlashInfo', 0x0003): {  # FlashQuality
+        2: "Normal",
+        3: "Fine",
+        5: "SuperFine",
+    },
+    # Canon ShotInfo sub-IFD enums (tag 0x0004)
+    # Note: Most ShotInfo tags are numeric values, not enums
+    ('CANON', 'CanonShotInfo', 0x0007): {  # WhiteBalance
+        0: "Auto",
+        1: "Daylight",
+        2: "Cloudy",
+        3: "Tungsten",
+        4: "Fluorescent",
+        5: "Flash",
+        6: "Custom",
+        7: "Black & White",
+        8: "Shade",
+        9: "Manual Temperature (Kelvin)",
+        10: "PC Set1",
+        11: "PC Set2",
+        12: "PC Set3",
+        14: "Fluorescent H (Daylight)",
+        15: "Custom 1",
+        16: "Custom 2",
+        17: "Underwater",
+    },
+    ('CANON', 'CanonShotInfo', 0x0008): {  # SlowShutter
+        -1: "n/a",
+        0: "Off",
+        1: "Night Scene",
+        2: "On",
+        3: "None",
+    },
+    # Canon AFInfo2 SerialData enums (tag 0x0026)
+    ('CANON', 'CanonAFInfo2', 0x0001): {  # AFAreaMode
+        0: "Off (Manual Focus)",
+        1: "Single-point AF",
+        2: "Dynamic AF (9 points)",
+        3: "Dynamic AF (21 points)",
+        4: "Auto",
+        5: "Zone AF",
+        6: "Face Detection AF",
+    },
+    # Canon ImageType (tag 0x0006)
+    ('CANON', ANY_DIRECTORY, 0x0006): {
+        0: "Original",
+        1: "Standard",
+        2: "Fine",
+        3: "RAW",
+    },
+    # Canon DateStampMode (tag 0x0012)
+    ('CANON', ANY_DIRECTORY, 0x0012): {
+        0: "Off",
+        1: "Date",
+        2: "Date and Time",
+    },
+    # Canon MyColors (tag 0x0013)
+    ('CANON', ANY_DIRECTORY, 0x0013): {
+        0: "Off",
+        1: "Vivid",
+        2: "Neutral",
+        3: "Sepia",
+        4: "B&W",
+        5: "Custom",
+    },
+    # Canon WhiteBalance (main tag, but also in CameraSettings sub-IFD)
+    ('CANON', MAIN_DIRECTORY, 0x0007): {
+        0: "Auto",
+        1: "Daylight",
+        2: "Cloudy",
+        3: "Tungsten",
+        4: "Fluorescent",
+        5: "Flash",
+        6: "Custom",
+        7: "Color Temperature",
+    },
+
+    # Nikon enums
+    # Nikon Quality (tag 0x0004)
+    ('NIKON', ANY_DIRECTORY, 0x0004): {
+        1: "VGA Basic",
+        2: "VGA Normal",
+        3: "VGA Fine",
+        4: "SXGA Basic",
+        5: "SXGA Normal",
+        6: "SXGA Fine",
+    },
+    # Nikon WhiteBalance (tag 0x0005)
+    ('NIKON', ANY_DIRECTORY, 0x0005): {
+        0: "Auto",
+        1: "Preset",
+        2: "Daylight",
+        3: "Incandescent",
+        4: "Fluorescent",
+        5: "Cloudy",
+        6: "Speedlight",
+        7: "Shade",
+        8: "Color Temperature",
+    },
+    # Nikon FocusMode (tag 0x0007)
+    ('NIKON', ANY_DIRECTORY, 0x0007): {
+        0: "Manual",
+        1: "AF-S",
+        2: "AF-C",
+        3: "AF-A",
+    },
+    # Nikon ColorMode (tag 0x0003)
+    ('NIKON', ANY_DIRECTORY, 0x0003): {
+        1: "Color",
+        2: "Monochrome",
+    },
+    # Nikon ImageSharpening (tag 0x0006)
+    ('NIKON', ANY_DIRECTORY, 0x0006): {
+        0: "None",
+        1: "Low",
+        2: "Normal",
+        3: "High",
+    },
+    # Nikon FlashMode (tag 0x0009)
+    ('NIKON', ANY_DIRECTORY, 0x0009): {
+        0: "No Flash",
+        1: "Flash Fired",
+    },
+    # Nikon ExposureMode (tag 0x000A)
+    ('NIKON', ANY_DIRECTORY, 0x000A): {
+        0: "Program",
+        1: "Aperture Priority",
+        2: "Shutter Priority",
+        3: "Manual",
+    },
+    # Nikon ColorSpace (tag 0x001A)
+    ('NIKON', ANY_DIRECTORY, 0x001A): {
+        1: "sRGB",
+        2: "Adobe RGB",
+    },
+    # Nikon ActiveD-Lighting (tag 0x001D)
+    ('NIKON', ANY_DIRECTORY, 0x001D): {
+        0: "Off",
+        1: "Low",
+        2: "Normal",
+        3: "High",
+        4: "Extra High",
+    },
+    # Nikon VibrationReduction (tag 0x0024)
+    ('NIKON', ANY_DIRECTORY, 0x0024): {
+        0: "Off",
+        1: "On",
+    },
+    # Nikon PictureControl (tag 0x001E)
+    ('NIKON', ANY_DIRECTORY, 0x001E): {
+        0: "Standard",
+        1: "Neutral",
+        2: "Vivid",
+        3: "Monochrome",
+        4: "Portrait",
+        5: "Landscape",
+    },
+
+    # Sony enums
+    # Sony Quality (tag 0x0102)
+    ('SONY', ANY_DIRECTORY, 0x0102): {
+        0: "RAW",
+        1: "RAW+JPEG",
+        2: "Fine",
+        3: "Standard",
+    },
+    # Sony WhiteBalance (tag 0x0115)
+    ('SONY', ANY_DIRECTORY, 0x0115): {
+        0: "Auto",
+        1: "Daylight",
+        2: "Cloudy",
+        3: "Tungsten",
+        4: "Fluorescent",
+        5: "Flash",
+        6: "Color Temperature",
+        7: "Custom",
+    },
+    # Sony ColorMode (tag 0x0104)
+    ('SONY', ANY_DIRECTORY, 0x0104): {
+        0: "Standard",
+        1: "Vivid",
+        2: "Portrait",
+        3: "Landscape",
+        4: "Sunset",
+        5: "Night View",
+        6: "B&W",
+        7: "Sepia",
+    },
+    # Sony SceneMode (tag 0x0107)
+    ('SONY', ANY_DIRECTORY, 0x0107): {
+        0: "Auto",
+        1: "Portrait",
+        2: "Landscape",
+        3: "Macro",
+        4: "Sports",
+        5: "Sunset",
+        6: "Night View",
+        7: "Handheld Twilight",
+        8: "Anti Motion Blur",
+    },
+    # Sony FlashMode (tag 0x0112)
+    ('SONY', ANY_DIRECTORY, 0x0112): {
+        0: "No Flash",
+        1: "Flash Fired",
+        2: "Fill Flash",
+        3: "Red-eye Reduction",
+        4: "Wireless",
+    },
+    # Sony ExposureMode (tag 0x0111)
+    ('SONY', ANY_DIRECTORY, 0x0111): {
+        0: "Auto",
+        1: "Program",
+        2: "Aperture Priority",
+        3: "Shutter Priority",
+        4: "Manual",
+        5: "Scene Selection",
+    },
+    # Sony ImageStabilization (tag 0x0103)
+    ('SONY', ANY_DIRECTORY, 0x0103): {
+        0: "Off",
+        1: "On",
+    },
+
+    # Olympus enums
+    # Olympus Quality (tag 0x0101)
+    ('OLYMPUS', ANY_DIRECTORY, 0x0101): {
+        1: "SQ",
+        2: "HQ",
+        3: "SHQ",
+        4: "RAW",
+    },
+    # Olympus SpecialMode (tag 0x0100)
+    ('OLYMPUS', ANY_DIRECTORY, 0x0100): {
+        0: "Normal",
+        1: "Unknown",
+        2: "Fast",
+        3: "Panorama",
+    },
+    # Olympus Macro (tag 0x0102)
+    ('OLYMPUS', ANY_DIRECTORY, 0x0102): {
+        0: "Off",
+        1: "On",
+    },
+    # Olympus BWMode (tag 0x0103)
+    ('OLYMPUS', ANY_DIRECTORY, 0x0103): {
+        0: "Off",
+        1: "On",
+    },
+    # Olympus WhiteBalance (tag 0x0104)
+    ('OLYMPUS', ANY_DIRECTORY, 0x0104): {
+        0: "Auto",
+        1: "Daylight",
+        2: "Cloudy",
+        3: "Tungsten",
+        4: "Fluorescent",
+    },
+    # Olympus PictureMode (tag 0x0116)
+    ('OLYMPUS', ANY_DIRECTORY, 0x0116): {
+        1: "i-Auto",
+        2: "Program",
+        3: "Aperture Priority",
+        4: "Shutter Priority",
+        5: "Manual",
+    },
+    # Olympus FlashMode (tag 0x010C)
+    ('OLYMPUS', ANY_DIRECTORY, 0x010C): {
+        0: "No Flash",
+        1: "Flash Fired",
+    },
+    # Olympus FocusMode (tag 0x010D)
+    ('OLYMPUS', ANY_DIRECTORY, 0x010D): {
+        0: "Auto",
+        1: "Manual",
+    },
+
+    # Pentax enums
+    # Pentax Quality (tag 0x0009)
+    ('PENTAX', ANY_DIRECTORY, 0x0009): {
+        0: "Good",
+        1: "Better",
+        2: "Best",
+        3: "TIFF",
+        4: "RAW",
+    },
+    # Pentax Mode (tag 0x0002)
+    ('PENTAX', ANY_DIRECTORY, 0x0002): {
+        0: "Auto",
+        1: "Program",
+        2: "Aperture Priority",
+        3: "Shutter Priority",
+        4: "Manual",
+        5: "Bulb",
+    },
+    # Pentax Flash (tag 0x000B)
+    ('PENTAX', ANY_DIRECTORY, 0x000B): {
+        0: "No Flash",
+        1: "Flash Fired",
+    },
+    # Pentax WhiteBalance (tag 0x0007)
+    ('PENTAX', ANY_DIRECTORY, 0x0007): {
+        0: "Auto",
+        1: "Daylight",
+        2: "Shade",
+        3: "Cloudy",
+        4: "Tungsten",
+        5: "Fluorescent",
+        6: "Flash",
+    },
+    # Pentax ColorSpace (tag 0x0013)
+    ('PENTAX', ANY_DIRECTORY, 0x0013): {
+        1: "sRGB",
+        2: "Adobe RGB",
+    },
+    # Pentax FocusMode (tag 0x0008)
+    ('PENTAX', ANY_DIRECTORY, 0x0008): {
+        0: "Manual",
+        1: "AF-S",
+        2: "AF-C",
+    },
+
+    # Fujifilm enums
+    # Fujifilm Quality (tag 0x1002) - Note: 0x1000 is Version, not Quality
+    ('FUJIFILM', ANY_DIRECTORY, 0x1002): {
+        0: "NORMAL",
+        1: "FINE",
+        2: "RAW",
+        3: "RAW+FINE",
+        4: "RAW+",
+    },
+    # Fujifilm Sharpness (tag 0x1003) - Note: 0x1001 is SerialNumber, 0x101D is also Sharpness
+    ('FUJIFILM', ANY_DIRECTORY, 0x1003): {
+        0: "Soft",
+        1: "Normal",
+        2: "Hard",
+        3: "Medium Soft",
+        4: "Medium Hard",
+    },
+    # Fujifilm WhiteBalance (tag 0x1004) - Note: 0x1025 is also WhiteBalance
+    ('FUJIFILM', ANY_DIRECTORY, 0x1004): {
+        0: "Auto",
+        256: "Daylight",
+        512: "Cloudy",
+        768: "Tungsten",
+        1024: "Fluorescent",
+        1280: "Custom",
+    },
+    # Fujifilm Color (tag 0x1005) - Saturation
+    ('FUJIFILM', ANY_DIRECTORY, 0x1005): {
+        0: "Standard",
+        1: "High",
+        2: "Low",
+    },
+    # Fujifilm Tone (tag 0x1006)
+    ('FUJIFILM', ANY_DIRECTORY, 0x1006): {
+        0: "Standard",
+        1: "High",
+        2: "Low",
+    },
+    # Fujifilm FlashMode (tag 0x101A)
+    ('FUJIFILM', ANY_DIRECTORY, 0x101A): {
+        0: "Off",
+        1: "On",
+        2: "Red-eye Reduction",
+        3: "External",
+    },
+    # Fujifilm FocusMode (tag 0x1017)
+    ('FUJIFILM', ANY_DIRECTORY, 0x1017): {
+        0: "Manual",
+        1: "AF-S",
+        2: "AF-C",
+    },
+    # Fujifilm ShutterType (tag 0x1020 or 0x1050)
+    ('FUJIFILM', ANY_DIRECTORY, 0x1020): {
+        0: "Mechanical",
+        1: "Electronic",
+        2: "Electronic (Front Curtain)",
+    },
+    # Fujifilm SlowSync (tag 0x1019 or 0x1030)
+    ('FUJIFILM', ANY_DIRECTORY, 0x1019): {
+        0: "Off",
+        1: "On",
+    },
+    # Fujifilm PictureMode (tag 0x1031)
+    ('FUJIFILM', ANY_DIRECTORY, 0x1031): {
+        0: "Auto",
+        1: "Program AE",
+        2: "Aperture-priority AE",
+        3: "Shutter-priority AE",
+        4: "Manual",
+        5: "Scene Position",
+        256: "Aperture-priority AE",
+        512: "Shutter-priority AE",
+    },
+    # Fujifilm DynamicRangeSetting (tag 0x100A)
+    ('FUJIFILM', ANY_DIRECTORY, 0x100A): {
+        0: "Auto",
+        1: "Manual",
+    },
+    # Fujifilm LensModulationOptimizer (tag 0x1045)
+    ('FUJIFILM', ANY_DIRECTORY, 0x1045): {
+        0: "Off",
+        1: "On",
+    },
+    # Fujifilm FileSource (tag 0x1010)
+    ('FUJIFILM', ANY_DIRECTORY, 0x1010): {
+        0: "Digital Camera",
+        1: "Film Scanner",
+        2: "Reflection Print Scanner",
+    },
+    # Fujifilm DynamicRange (tag 0x1008)
+    ('FUJIFILM', ANY_DIRECTORY, 0x1008): {
+        0: "Standard",
+        1: "Wide",
+        256: "Standard",
+        512: "Wide",
+    },
+    # Fujifilm FilmMode (tag 0x1009) - Note: FilmMode can be string or enum
+    # Common values: "F0/Standard (Provia)", "F1/Standard (Provia)", etc.
+    # For enum values, map common numeric values
+    ('FUJIFILM', ANY_DIRECTORY, 0x1009): {
+        0: "F0/Standard (Provia)",
+        1: "F1/Standard (Provia)",
+        2: "F2/Standard (Provia)",
+        3: "F3/Standard (Provia)",
+    },
+    # Fujifilm NoiseReduction (tag 0x1028)
+    ('FUJIFILM', ANY_DIRECTORY, 0x1028): {
+        0: "0 (normal)",
+        1: "1 (low)",
+        2: "2 (normal)",
+        3: "3 (high)",
+        4: "4 (normal+)",
+        5: "5 (low+)",
+        6: "6 (normal++)",
+        7: "7 (high++)",
+    },
+    # Fujifilm ImageStabilization (tag 0x101F) - Note: Can be complex string format
+    # Common values: "Off", "On", "Optical; On (mode 1, continuous); 0"
+    ('FUJIFILM', ANY_DIRECTORY, 0x101F): {
+        0: "Off",
+        1: "On",
+        2: "Optical; On (mode 1, continuous); 0",
+    },
+
+    # Panasonic enums
+    # Panasonic Quality (tag 0x0001)
+    ('PANASONIC', ANY_DIRECTORY, 0x0001): {
+        2: "High",
+        3: "Normal",
+        6: "Very High",
+        7: "RAW",
+    },
+    # Panasonic FirmwareVersion (tag 0x0002) - string, no enum
+    # Panasonic WhiteBalance (tag 0x0003)
+    ('PANASONIC', ANY_DIRECTORY, 0x0003): {
+        1: "Auto",
+        2: "Daylight",
+        3: "Cloudy",
+        4: "Tungsten",
+        5: "Fluorescent",
+        6: "Shade",
+        7: "Color Temperature",
+    },
+    # Panasonic FocusMode (tag 0x0004)
+    ('PANASONIC', ANY_DIRECTORY, 0x0004): {
+        1: "Auto",
+        2: "Manual",
+        4: "AF-S",
+        5: "AF-C",
+    },
+    # Panasonic AFAreaMode (tag 0x0005)
+    ('PANASONIC', ANY_DIRECTORY, 0x0005): {
+        0: "Off",
+        1: "1-area",
+        2: "Multi-area",
+        3: "Tracking",
+    },
+    # Panasonic ImageStabilization (tag 0x0006)
+    ('PANASONIC', ANY_DIRECTORY, 0x0006): {
+        0: "Off",
+        1: "On",
+    },
+    # Panasonic MacroMode (tag 0x0007)
+    ('PANASONIC', ANY_DIRECTORY, 0x0007): {
+        0: "Off",
+        1: "On",
+        2: "Off",  # Some cameras use 2 for Off
+    },
+    # Panasonic ShootingMode (tag 0x0008)
+    ('PANASONIC', ANY_DIRECTORY, 0x0008): {
+        1: "Program",
+        2: "Aperture Priority",
+        3: "Shutter Priority",
+        4: "Manual",
+    },
+    # Panasonic Audio (tag 0x0009)
+    ('PANASONIC', ANY_DIRECTORY, 0x0009): {
+        0: "No",
+        1: "Yes",
+    },
+    # Panasonic FlashMode (tag 0x000C)
+    ('PANASONIC', ANY_DIRECTORY, 0x000C): {
+        0: "No Flash",
+        1: "Flash Fired",
+    },
+    # Panasonic ColorMode (tag 0x000E)
+    ('PANASONIC', ANY_DIRECTORY, 0x000E): {
+        0: "Standard",
+        1: "Vivid",
+        2: "Natural",
+    },
+    # Panasonic Sharpness (tag 0x00EC)
+    ('PANASONIC', ANY_DIRECTORY, 0x00EC): {
+        0: "Off",
+        1: "Low",
+        2: "Normal",
+        3: "High",
+        4: "Standard",
+        5: "Medium Low",
+        6: "Medium High",
+    },
+    # Panasonic FilmMode (tag 0x00A5, 0x00CA)
+    ('PANASONIC', ANY_DIRECTORY, 0x00A5): {
+        0: "Standard (color)",
+        1: "Dynamic (color)",
+        2: "Nature (color)",
+        3: "Smooth (color)",
+        4: "Standard (B&W)",
+        5: "Dynamic (B&W)",
+        6: "Smooth (B&W)",
+        7: "n/a",
+    },
+    # Panasonic FocusMode (tag 0x00CE) - alternative tag ID
+    ('PANASONIC', ANY_DIRECTORY, 0x00CE): {
+        1: "Auto",
+        2: "Manual",
+        4: "AF-S",
+        5: "AF-C",
+    },
+    # Panasonic ImageStabilization (tag 0x00D1) - alternative tag ID
+    ('PANASONIC', ANY_DIRECTORY, 0x00D1): {
+        0: "Off",
+        1: "On",
+        2: "Mode 1",
+        3: "Mode 2",
+    },
+}
+
+# Tags that share a mapping with another tag ID
+_ENUM_MAP_ALIASES = {
+    ('FUJIFILM', ANY_DIRECTORY, 0x101D): ('FUJIFILM', ANY_DIRECTORY, 0x1003),  # Sharpness
+    ('FUJIFILM', ANY_DIRECTORY, 0x1025): ('FUJIFILM', ANY_DIRECTORY, 0x1004),  # WhiteBalance
+    ('FUJIFILM', ANY_DIRECTORY, 0x1050): ('FUJIFILM', ANY_DIRECTORY, 0x1020),  # ShutterType
+    ('FUJIFILM', ANY_DIRECTORY, 0x1030): ('FUJIFILM', ANY_DIRECTORY, 0x1019),  # SlowSync
+    ('PANASONIC', ANY_DIRECTORY, 0x00CA): ('PANASONIC', ANY_DIRECTORY, 0x00A5),  # FilmMode
+}
+MAKERNOTE_ENUM_MAPS.update({alias: MAKERNOTE_ENUM_MAPS[key] for alias, key in _ENUM_MAP_ALIASES.items()})
+
+# Sub-IFDs whose tags never fall back to the main IFD enum maps
+# (AutoISO, BaseISO, etc. in Canon ShotInfo are numeric)
+MAKERNOTE_ENUM_CLOSED_DIRECTORIES = frozenset({('CANON', 'CanonShotInfo')})
+
+MAKERNOTE_FLAG_MAPS = {
+    # Canon flags
+    # Canon CustomFunctions flags (tag 0x000C)
+    ('CANON', ANY_DIRECTORY, 0x000C): {
+        0: "LongExposureNoiseReduction",
+        1: "ShutterAELockButton",
+        2: "MirrorLockup",
+        3: "ExposureLevelIncrements",
+        4: "ISOExpansion",
+        5: "AEBSequence",
+    },
+    # Canon CameraSettings sub-IFD flags
+    ('CANON', 'CanonCameraSettings', 0x0001): {  # MeteringMode flags
+        0: "Spot",
+        1: "Average",
+        2: "Evaluative",
+        3: "Partial",
+        4: "Center-weighted average",
+    },
+    ('CANON', 'CanonCameraSettings', 0x0004): {  # FlashMode flags
+        0: "No Flash",
+        1: "Auto",
+        2: "On",
+        3: "Red-eye Reduction",
+        4: "Slow Sync",
+    },
+    # Canon CameraSettings flags (main tag)
+    ('CANON', MAIN_DIRECTORY, 0x0001): {
+        0: "MacroMode",
+        1: "SelfTimer",
+        2: "Quality",
+        3: "FlashMode",
+    },
+
+    # Nikon flags
+    # Nikon FlashSetting flags (tag 0x0008)
+    ('NIKON', ANY_DIRECTORY, 0x0008): {
+        0: "FlashFired",
+        1: "FlashMode",
+        2: "FlashCompensation",
+    },
+    # Nikon ImageProcessing flags (tag 0x0016)
+    ('NIKON', ANY_DIRECTORY, 0x0016): {
+        0: "NoiseReduction",
+        1: "ActiveD-Lighting",
+        2: "VignetteControl",
+    },
+
+    # Sony flags
+    # Sony CameraSettings flags
+    ('SONY', ANY_DIRECTORY, 0x0100): {
+        0: "AFMode",
+        1: "AFAreaMode",
+        2: "FocusMode",
+    },
+
+    # Olympus flags
+    # Olympus SpecialMode flags (tag 0x0100)
+    ('OLYMPUS', ANY_DIRECTORY, 0x0100): {
+        0: "Normal",
+        1: "Unknown",
+        2: "Fast",
+        3: "Panorama",
+    },
+
+    # Pentax flags
+    # Pentax Flash flags (tag 0x000B)
+    ('PENTAX', ANY_DIRECTORY, 0x000B): {
+        0: "No Flash",
+        1: "Flash Fired",
+    },
+
+    # Panasonic flags
+    # Panasonic ImageStabilization flags (tag 0x0006)
+    ('PANASONIC', ANY_DIRECTORY, 0x0006): {
+        0: "Off",
+        1: "On",
+    },
+}
+
+
+
+def _build_lookup(
+    value_maps: Dict[Tuple[str, str, int], Optional[Dict[int, str]]],
+    closed_directories: FrozenSet[Tuple[str, str]] = frozenset()
+) -> Dict[Tuple[str, str, int], Dict[int, str]]:
+    """
+    Resolve directory fallbacks ahead of time so lookups are a single dict access.
+
+    Sub-IFD entries take precedence over ANY_DIRECTORY entries (unless the
+    sub-IFD is closed), and MAIN_DIRECTORY entries take precedence over
+    ANY_DIRECTORY entries for tags in the main IFD.
+
+    Args:
+        value_maps: MAKERNOTE_ENUM_MAPS or MAKERNOTE_FLAG_MAPS
+        closed_directories: (manufacturer, directory) pairs whose tags do not
+                            fall back to ANY_DIRECTORY entries
+
+    Returns:
+        Dictionary mapping (manufacturer, directory, tag ID) to value map,
+        where directory is a sub-IFD name, MAIN_DIRECTORY or ANY_DIRECTORY
+        (for unknown parents)
+    """
+    tags_by_manufacturer: Dict[str, set] = {}
+    for manufacturer, _, tag_id in value_maps:
+        tags_by_manufacturer.setdefault(manufacturer, set()).add(tag_id)
+    lookup = {}
+    for manufacturer, tag_ids in tags_by_manufacturer.items():
+        directories = (MAIN_DIRECTORY, ANY_DIRECTORY) + MAKERNOTE_SUBDIRECTORIES.get(manufacturer, ())
+        for directory in directories:
+            for tag_id in tag_ids:
+                key = (manufacturer, directory, tag_id)
+                if key in value_maps:
+                    value_map = value_maps[key]
+                elif (manufacturer, directory) in closed_directories:
+                    value_map = None
+                else:
+                    value_map = value_maps.get((manufacturer, ANY_DIRECTORY, tag_id))
+                if value_map is not None:
+                    lookup[key] = value_map
+    return lookup
+
+
+# Flattened lookup tables, keyed by (manufacturer, resolve_subdirectory(), tag ID)
+MAKERNOTE_ENUM_LOOKUP = _build_lookup(MAKERNOTE_ENUM_MAPS, MAKERNOTE_ENUM_CLOSED_DIRECTORIES)
+MAKERNOTE_FLAG_LOOKUP = _build_lookup(MAKERNOTE_FLAG_MAPS)
+_subdirectory_cache: Dict[Tuple[str, str], str] = {}
+
+
+def resolve_subdirectory(manufacturer: str, parent_tag_name: Optional[str]) -> str:
+    """
+    Resolve a parent tag name to the directory used in the value maps.
+
+    Args:
+        manufacturer: Camera manufacturer (uppercase)
+        parent_tag_name: Parent tag name for sub-IFD context (e.g., "CanonCameraSettings")
+
+    Returns:
+        Sub-IFD directory name, MAIN_DIRECTORY if there is no parent, or
+        ANY_DIRECTORY if the parent is not a known sub-IFD
+    """
+    if not parent_tag_name:
+        return MAIN_DIRECTORY
+    key = (manufacturer, parent_tag_name)
+    directory = _subdirectory_cache.get(key)
+    if directory is None:
+        directory = ANY_DIRECTORY
+        for name in MAKERNOTE_SUBDIRECTORIES.get(manufacturer, ()):
+            if name in parent_tag_name:
+                directory = name
+                break
+        _subdirectory_cache[key] = directory
+    return directory
+
+
+def get_enum_map(manufacturer: str, tag_id: int, parent_tag_name: Optional[str] = None) -> Optional[Dict[int, str]]:
+    """
+    Get the enum mapping for a MakerNote tag.
+
+    Args:
+        manufacturer: Camera manufacturer (uppercase)
+        tag_id: Tag ID
+        parent_tag_name: Parent tag name for sub-IFD context
+
+    Returns:
+        Dictionary mapping values to enum names, or None
+    """
+    return MAKERNOTE_ENUM_LOOKUP.get((manufacturer, resolve_subdirectory(manufacturer, parent_tag_name), tag_id))
+
+
+def get_flag_map(manufacturer: str, tag_id: int, parent_tag_name: Optional[str] = None) -> Optional[Dict[int, str]]:
+    """
+    Get the flag mapping for a MakerNote tag.
+
+    Args:
+        manufacturer: Camera manufacturer (uppercase)
+        tag_id: Tag ID
+        parent_tag_name: Parent tag name for sub-IFD context
+
+    Returns:
+        Dictionary mapping bit positions to flag names, or None
+    """
+    return MAKERNOTE_FLAG_LOOKUP.get((manufacturer, resolve_subdirectory(manufacturer, parent_tag_name), tag_id))
@@ -0,0 +1,339 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Persistent metadata cache
+
+This module provides an on-disk (SQLite) cache of parsed metadata, keyed on
+file identity, so that repeated scans of unchanged files can skip parsing
+entirely. Entries are validated against the file's size, modification time
+and inode (or a fast content fingerprint) on every lookup, and the cache is
+bounded in size with least-recently-used eviction.
+
+Entries are stored as JSON, so reading a cache file never runs code from
+it. Bytes, tuples, dates and dicts with non-string keys are kept through
+small tagged objects; metadata holding other types is not cached.
+
+Copyright 2025 DNAi inc.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, time as dt_time
+from pathlib import Path
+from typing import Dict, Any, Optional, Union
+
+
+# Tags of the JSON objects standing for values JSON has no type for
+_TAG_BYTES = '__bytes__'
+_TAG_TUPLE = '__tuple__'
+_TAG_DATETIME = '__datetime__'
+_TAG_DATE = '__date__'
+_TAG_TIME = '__time__'
+_TAG_DICT = '__dict__'
+_TAGS = {_TAG_BYTES, _TAG_TUPLE, _TAG_DATETIME, _TAG_DATE, _TAG_TIME, _TAG_DICT}
+
+
+def _encode_value(value: Any) -> Any:
+    """
+    Convert a metadata value to a JSON-serializable structure.
+
+    Args:
+        value: Metadata value
+
+    Returns:
+        Value made of JSON types, with tagged objects for other types
+
+    Raises:
+        TypeError: If the value contains a type that cannot be encoded
+    """
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {_TAG_BYTES: base64.b64encode(value).decode('ascii')}
+    if isinstance(value, list):
+        return [_encode_value(item) for item in value]
+    if isinstance(value, tuple):
+        return {_TAG_TUPLE: [_encode_value(item) for item in value]}
+    if isinstance(value, dict):
+        # Dicts that could be mistaken for a tagged object are tagged themselves
+        if all(isinstance(key, str) for key in value) and not (len(value) == 1 and next(iter(value)) in _TAGS):
+            return {key: _encode_value(item) for key, item in value.items()}
+        return {_TAG_DICT: [[_encode_value(key), _encode_value(item)] for key, item in value.items()]}
+    # datetime is a subclass of date, so it is checked first
+    if isinstance(value, datetime):
+        return {_TAG_DATETIME: value.isoformat()}
+    if isinstance(value, date):
+        return {_TAG_DATE: value.isoformat()}
+    if isinstance(value, dt_time):
+        return {_TAG_TIME: value.isoformat()}
+    raise TypeError(f"Cannot cache values of type {type(value).__name__}")
+
+
+def _decode_object(obj: Dict[str, Any]) -> Any:
+    """Turn a tagged JSON object back into its value (json.loads object_hook)."""
+    if len(obj) != 1:
+        return obj
+    tag, payload = next(iter(obj.items()))
+    if tag == _TAG_BYTES:
+        return base64.b64decode(payload)
+    if tag == _TAG_TUPLE:
+        return tuple(payload)
+    if tag == _TAG_DATETIME:
+        return datetime.fromisoformat(payload)
+    if tag == _TAG_DATE:
+        return date.fromisoformat(payload)
+    if tag == _TAG_TIME:
+        return dt_time.fromisoformat(payload)
+    if tag == _TAG_DICT:
+        return {key: item for key, item in payload}
+    return obj
+
+
+def _dumps(metadata: Dict[str, Any]) -> bytes:
+    """Serialize metadata for the cache."""
+    return json.dumps(_encode_value(metadata), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(data: bytes) -> Dict[str, Any]:
+    """Deserialize metadata stored by _dumps."""
+    return json.loads(data, object_hook=_decode_object)
+
+
+class MetadataCache:
+    """
+    Size-bounded LRU cache of parsed metadata stored in an SQLite database.
+
+    The cache is safe to share between threads, and instances can be passed
+    to worker processes (each process opens its own database connection).
+
+    Example:
+        >>> cache = MetadataCache('~/.cache/dnexif.sqlite')
+        >>> with DNExif('image.jpg', read_only=True, cache=cache) as exif:
+        ...     make = exif.get_tag('EXIF:Make')
+    """
+
+    DEFAULT_MAX_SIZE = 256 * 1024 * 1024  # 256MB of encoded metadata
+    FINGERPRINT_BYTES = 64 * 1024  # Bytes hashed from each end in content mode
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS metadata_cache (
+            path TEXT NOT NULL,
+            variant TEXT NOT NULL,
+            identity TEXT NOT NULL,
+            data BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            last_access REAL NOT NULL,
+            PRIMARY KEY (path, variant)
+        );
+        CREATE INDEX IF NOT EXISTS metadata_cache_last_access
+            ON metadata_cache (last_access);
+    """
+
+    def __init__(
+        self,
+        cache_path: Union[str, Path],
+        max_size: int = DEFAULT_MAX_SIZE,
+        content_fingerprint: bool = False
+    ):
+        """
+        Initialize the metadata cache.
+
+        Args:
+            cache_path: Path to the SQLite database file (created if missing)
+            max_size: Maximum total size of cached entries in bytes
+            content_fingerprint: If True, identify files by size plus a hash of
+                                 their first and last 64KB instead of by
+                                 size/mtime/inode (survives copies and touches)
+        """
+        self.cache_path = str(Path(cache_path).expanduser())
+        self.max_size = max_size
+        self.content_fingerprint = content_fingerprint
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Connections and locks cannot be pickled; worker processes reconnect
+        state = self.__dict__.copy()
+        state['_lock'] = None
+        state['_connection'] = None
+        state['_pid'] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the connection for this process, opening it if needed."""
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(self.cache_path, timeout=30, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.executescript(self._SCHEMA)
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    @staticmethod
+    def _normalize_path(file_path: Union[str, Path]) -> str:
+        return os.path.abspath(str(file_path))
+
+    def _identity(self, file_path: str) -> str:
+        """
+        Compute the identity string of a file.
+
+        Args:
+            file_path: Normalized file path
+
+        Returns:
+            Identity string; changes whenever the file is modified
+        """
+        st = os.stat(file_path)
+        if not self.content_fingerprint:
+            return f"{st.st_size}:{st.st_mtime_ns}:{st.st_ino}:{st.st_dev}"
+        digest = hashlib.blake2b(digest_size=16)
+        with open(file_path, 'rb') as f:
+            digest.update(f.read(self.FINGERPRINT_BYTES))
+            if st.st_size > 2 * self.FINGERPRINT_BYTES:
+                f.seek(-self.FINGERPRINT_BYTES, os.SEEK_END)
+                digest.update(f.read(self.FINGERPRINT_BYTES))
+            elif st.st_size > self.FINGERPRINT_BYTES:
+                digest.update(f.read())
+        return f"{st.st_size}:{digest.hexdigest()}"
+
+    def get(self, file_path: Union[str, Path], variant: str = '') -> Optional[Dict[str, Any]]:
+        """
+        Look up cached metadata for a file.
+
+        Args:
+            file_path: Path to the file
+            variant: Key distinguishing different parse settings for the same file
+
+        Returns:
+            Cached metadata dictionary, or None on a miss or stale entry
+        """
+        path = self._normalize_path(file_path)
+        try:
+            identity = self._identity(path)
+            with self._lock:
+                connection = self._connect()
+                row = connection.execute(
+                    'SELECT identity, data FROM metadata_cache WHERE path = ? AND variant = ?',
+                    (path, variant)
+                ).fetchone()
+                if row is None:
+                    return None
+                if row[0] != identity:
+                    # File changed since it was cached
+                    connection.execute(
+                        'DELETE FROM metadata_cache WHERE path = ? AND variant = ?',
+                        (path, variant)
+                    )
+                    connection.commit()
+                    return None
+                connection.execute(
+                    'UPDATE metadata_cache SET last_access = ? WHERE path = ? AND variant = ?',
+                    (time.time(), path, variant)
+                )
+                connection.commit()
+            return _loads(row[1])
+        except (OSError, sqlite3.Error, ValueError, TypeError):
+            # A cache failure must never break metadata reading
+            return None
+
+    def put(self, file_path: Union[str, Path], metadata: Dict[str, Any], variant: str = '') -> bool:
+        """
+        Store metadata for a file.
+
+        Args:
+            file_path: Path to the file
+            metadata: Metadata dictionary to cache
+            variant: Key distinguishing different parse settings for the same file
+
+        Returns:
+            True if the entry was stored
+        """
+        path = self._normalize_path(file_path)
+        try:
+            identity = self._identity(path)
+            data = _dumps(metadata)
+        except (OSError, TypeError, ValueError):
+            return False
+        if len(data) > self.max_size:
+            return False
+        try:
+            with self._lock:
+                connection = self._connect()
+                connection.execute(
+                    'INSERT OR REPLACE INTO metadata_cache '
+                    '(path, variant, identity, data, size, last_access) VALUES (?, ?, ?, ?, ?, ?)',
+                    (path, variant, identity, data, len(data), time.time())
+                )
+                self._evict(connection)
+                connection.commit()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Evict least recently used entries until the cache fits in max_size."""
+        total = connection.execute('SELECT COALESCE(SUM(size), 0) FROM metadata_cache').fetchone()[0]
+        if total <= self.max_size:
+            return
+        # Evict down to 90% of the limit so eviction is not repeated on every insert
+        target = total - int(self.max_size * 0.9)
+        freed = 0
+        stale = []
+        for rowid, size in connection.execute(
+            'SELECT rowid, size FROM metadata_cache ORDER BY last_access'
+        ):
+            if freed >= target:
+                break
+            stale.append((rowid,))
+            freed += size
+        connection.executemany('DELETE FROM metadata_cache WHERE rowid = ?', stale)
+
+    def invalidate(self, file_path: Union[str, Path]) -> None:
+        """
+        Remove all cached entries for a file.
+
+        Args:
+            file_path: Path to the file
+        """
+        path = self._normalize_path(file_path)
+        try:
+            with self._lock:
+                connection = self._connect()
+                connection.execute('DELETE FROM metadata_cache WHERE path = ?', (path,))
+                connection.commit()
+        except sqlite3.Error:
+            pass
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            connection = self._connect()
+            connection.execute('DELETE FROM metadata_cache')
+            connection.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute('SELECT COUNT(*) FROM metadata_cache').fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection (reopened automatically on next use)."""
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+            self._pid = None
@@ -18,7 +18,7 @@ from typing import Dict, Any, Optional, List
 from pathlib import Path
 
 from dnexif.exceptions import MetadataWriteError
-from dnexif.jpeg_modifier import JPEGModifier
+from dnexif.jpeg_modifier import JPEGSegmentRewriter
 
 
 class MetadataStandardsWriter:
@@ -28,9 +28,11 @@ class MetadataStandardsWriter:
     Supports writing JFIF, ICC profiles, Photoshop IRB, and AFCP metadata.
     """
     
+    # Maximum ICC profile bytes per APP2 segment
+    ICC_CHUNK_SIZE = 65504
+    
     def __init__(self):
         """Initialize metadata standards writer."""
-        # JPEGModifier will be initialized with file data when needed
         pass
     
     def write_jfif(
@@ -51,71 +53,31 @@ class MetadataStandardsWriter:
             MetadataWriteError: If writing fails
         """
         try:
-            with open(file_path, 'rb') as f:
-                jpeg_data = f.read()
-            
-            if not jpeg_data.startswith(b'\xff\xd8'):
-                raise MetadataWriteError("Invalid JPEG file: missing JPEG signature")
-            
-            # Extract JFIF metadata
-            jfif_metadata = {}
-            for key, value in metadata.items():
-                if key.startswith('JFIF:'):
-                    jfif_metadata[key[5:]] = value
-            
-            if not jfif_metadata:
-                # No JFIF metadata to write, just copy file
-                with open(output_path, 'wb') as f:
-                    f.write(jpeg_data)
-                return
-            
-            # Build JFIF APP0 segment
-            jfif_segment = self._build_jfif_segment(jfif_metadata)
-            
-            # Find existing APP0 segment or insert new one
-            offset = 2  # After JPEG signature
-            app0_pos = -1
-            app0_length = 0
-            
-            while offset < len(jpeg_data) - 4:
-                if jpeg_data[offset:offset+2] == b'\xff\xe0':  # APP0
-                    app0_pos = offset
-                    app0_length = struct.unpack('>H', jpeg_data[offset+2:offset+4])[0]
-                    # Check if it's JFIF
-                    if jpeg_data[offset+4:offset+9] == b'JFIF\x00':
-                        break
-                    offset += app0_length
-                elif jpeg_data[offset:offset+2] == b'\xff\xd8':  # SOI
-                    offset += 2
-                elif jpeg_data[offset] == 0xFF and jpeg_data[offset+1] >= 0xE0 and jpeg_data[offset+1] <= 0xEF:
-                    # Other APP segment
-                    length = struct.unpack('>H', jpeg_data[offset+2:offset+4])[0]
-                    offset += 2 + length
-                else:
-                    offset += 1
-            
-            # Insert or replace APP0 segment
-            if app0_pos != -1 and jpeg_data[app0_pos+4:app0_pos+9] == b'JFIF\x00':
-                # Replace existing JFIF segment
-                new_jpeg = (
-                    jpeg_data[:app0_pos] +
-                    jfif_segment +
-                    jpeg_data[app0_pos + app0_length:]
-                )
-            else:
-                # Insert new JFIF segment after SOI
-                new_jpeg = (
-                    jpeg_data[:2] +
-                    jfif_segment +
-                    jpeg_data[2:]
-                )
-            
-            with open(output_path, 'wb') as f:
-                f.write(new_jpeg)
-                
+            segment = self.build_jfif_segment(metadata)
+            replacements = {JPEGSegmentRewriter.JFIF: segment} if segment else {}
+            JPEGSegmentRewriter.rewrite_file(file_path, output_path, replacements)
         except Exception as e:
             raise MetadataWriteError(f"Failed to write JFIF metadata: {str(e)}")
     
+    def build_jfif_segment(self, metadata: Dict[str, Any]) -> bytes:
+        """
+        Build the JFIF APP0 segment for JFIF tags.
+        
+        Args:
+            metadata: Dictionary of metadata; only JFIF: tags are used
+            
+        Returns:
+            JFIF APP0 segment bytes, or empty bytes if there are no JFIF tags
+        """
+        jfif_metadata = {}
+        for key, value in metadata.items():
+            if key.startswith('JFIF:'):
+                jfif_metadata[key[5:]] = value
+        
+        if not jfif_metadata:
+            return b''
+        return self._build_jfif_segment(jfif_metadata)
+
     def _build_jfif_segment(self, metadata: Dict[str, Any]) -> bytes:
         """
         Build JFIF APP0 segment.
@@ -207,87 +169,32 @@ class MetadataStandardsWriter:
             MetadataWriteError: If writing fails
         """
         try:
-            with open(file_path, 'rb') as f:
-                jpeg_data = f.read()
-            
-            if not jpeg_data.startswith(b'\xff\xd8'):
-                raise MetadataWriteError("Invalid JPEG file: missing JPEG signature")
-            
-            if not icc_data or len(icc_data) == 0:
-                # No ICC data, just copy file
-                with open(output_path, 'wb') as f:
-                    f.write(jpeg_data)
-                return
-            
-            # Split ICC profile into chunks (max 65504 bytes per chunk)
-            max_chunk_size = 65504
-            chunks = []
-            for i in range(0, len(icc_data), max_chunk_size):
-                chunks.append(icc_data[i:i+max_chunk_size])
-            
-            # Build APP2 segments for each chunk
-            app2_segments = []
-            for i, chunk in enumerate(chunks):
-                segment = self._build_icc_segment(chunk, i + 1, len(chunks))
-                app2_segments.append(segment)
-            
-            # Find existing ICC APP2 segments or insert new ones
-            offset = 2
-            icc_segments_pos = []
-            
-            while offset < len(jpeg_data) - 4:
-                if jpeg_data[offset:offset+2] == b'\xff\xe2':  # APP2
-                    length = struct.unpack('>H', jpeg_data[offset+2:offset+4])[0]
-                    if jpeg_data[offset+4:offset+14] == b'ICC_PROFILE':
-                        icc_segments_pos.append((offset, length))
-                    offset += 2 + length
-                elif jpeg_data[offset] == 0xFF and jpeg_data[offset+1] >= 0xE0 and jpeg_data[offset+1] <= 0xEF:
-                    length = struct.unpack('>H', jpeg_data[offset+2:offset+4])[0]
-                    offset += 2 + length
-                else:
-                    offset += 1
-            
-            # Replace or insert ICC segments
-            if icc_segments_pos:
-                # Replace existing segments
-                first_pos, first_len = icc_segments_pos[0]
-                last_pos, last_len = icc_segments_pos[-1]
-                
-                # Calculate total length of existing segments
-                total_existing_len = sum(length for _, length in icc_segments_pos)
-                total_new_len = sum(len(seg) for seg in app2_segments)
-                
-                # Replace segments
-                new_jpeg = (
-                    jpeg_data[:first_pos] +
-                    b''.join(app2_segments) +
-                    jpeg_data[last_pos + last_len:]
-                )
-            else:
-                # Insert new segments after SOI or first APP segment
-                insert_pos = 2
-                if len(jpeg_data) > 4:
-                    # Find first APP segment
-                    pos = 2
-                    while pos < len(jpeg_data) - 4:
-                        if jpeg_data[pos] == 0xFF and jpeg_data[pos+1] >= 0xE0 and jpeg_data[pos+1] <= 0xEF:
-                            length = struct.unpack('>H', jpeg_data[pos+2:pos+4])[0]
-                            insert_pos = pos + 2 + length
-                            break
-                        pos += 1
-                
-                new_jpeg = (
-                    jpeg_data[:insert_pos] +
-                    b''.join(app2_segments) +
-                    jpeg_data[insert_pos:]
-                )
-            
-            with open(output_path, 'wb') as f:
-                f.write(new_jpeg)
-                
+            segments = self.build_icc_segments(icc_data)
+            replacements = {JPEGSegmentRewriter.ICC: segments} if segments else {}
+            JPEGSegmentRewriter.rewrite_file(file_path, output_path, replacements)
         except Exception as e:
             raise MetadataWriteError(f"Failed to write ICC profile: {str(e)}")
     
+    def build_icc_segments(self, icc_data: bytes) -> bytes:
+        """
+        Build the APP2 segments carrying an ICC profile.
+        
+        Args:
+            icc_data: ICC profile data bytes
+            
+        Returns:
+            Concatenated APP2 segments (the profile is split into chunks of
+            at most 65504 bytes), or empty bytes if there is no profile
+        """
+        if not icc_data:
+            return b''
+        
+        chunks = [icc_data[i:i + self.ICC_CHUNK_SIZE] for i in range(0, len(icc_data), self.ICC_CHUNK_SIZE)]
+        return b''.join(
+            self._build_icc_segment(chunk, i + 1, len(chunks))
+            for i, chunk in enumerate(chunks)
+        )
+
     def _build_icc_segment(self, chunk_data: bytes, chunk_num: int, total_chunks: int) -> bytes:
         """
         Build ICC profile APP2 segment.
@@ -301,7 +208,7 @@ class MetadataStandardsWriter:
             APP2 segment bytes
         """
         segment_data = (
-            b'ICC_PROFILE' +
+            b'ICC_PROFILE\x00' +
             bytes([chunk_num, total_chunks]) +
             chunk_data
         )
@@ -334,67 +241,25 @@ class MetadataStandardsWriter:
             MetadataWriteError: If writing fails
         """
         try:
-            with open(file_path, 'rb') as f:
-                jpeg_data = f.read()
-            
-            if not jpeg_data.startswith(b'\xff\xd8'):
-                raise MetadataWriteError("Invalid JPEG file: missing JPEG signature")
-            
-            # Build Photoshop IRB APP13 segment
-            irb_segment = self._build_photoshop_irb_segment(metadata)
-            
-            # Find existing APP13 segment or insert new one
-            offset = 2
-            app13_pos = -1
-            app13_length = 0
-            
-            while offset < len(jpeg_data) - 4:
-                if jpeg_data[offset:offset+2] == b'\xff\xed':  # APP13
-                    app13_pos = offset
-                    app13_length = struct.unpack('>H', jpeg_data[offset+2:offset+4])[0]
-                    # Check if it's Photoshop format
-                    if b'Photoshop 3.0' in jpeg_data[offset+4:offset+4+app13_length] or \
-                       b'8BIM' in jpeg_data[offset+4:offset+4+app13_length]:
-                        break
-                    offset += app13_length
-                elif jpeg_data[offset] == 0xFF and jpeg_data[offset+1] >= 0xE0 and jpeg_data[offset+1] <= 0xEF:
-                    length = struct.unpack('>H', jpeg_data[offset+2:offset+4])[0]
-                    offset += 2 + length
-                else:
-                    offset += 1
-            
-            # Insert or replace APP13 segment
-            if app13_pos != -1:
-                # Replace existing segment
-                new_jpeg = (
-                    jpeg_data[:app13_pos] +
-                    irb_segment +
-                    jpeg_data[app13_pos + app13_length:]
-                )
-            else:
-                # Insert new segment after SOI or first APP segment
-                insert_pos = 2
-                if len(jpeg_data) > 4:
-                    pos = 2
-                    while pos < len(jpeg_data) - 4:
-                        if jpeg_data[pos] == 0xFF and jpeg_data[pos+1] >= 0xE0 and jpeg_data[pos+1] <= 0xEF:
-                            length = struct.unpack('>H', jpeg_data[pos+2:pos+4])[0]
-                            insert_pos = pos + 2 + length
-                            break
-                        pos += 1
-                
-                new_jpeg = (
-                    jpeg_data[:insert_pos] +
-                    irb_segment +
-                    jpeg_data[insert_pos:]
-                )
-            
-            with open(output_path, 'wb') as f:
-                f.write(new_jpeg)
-                
+            segment = self.build_photoshop_irb_segment(metadata)
+            JPEGSegmentRewriter.rewrite_file(
+                file_path, output_path, {JPEGSegmentRewriter.PHOTOSHOP: segment}
+            )
         except Exception as e:
             raise MetadataWriteError(f"Failed to write Photoshop IRB: {str(e)}")
     
+    def build_photoshop_irb_segment(self, metadata: Dict[str, Any]) -> bytes:
+        """
+        Build the Photoshop IRB APP13 segment for PS: tags.
+        
+        Args:
+            metadata: Dictionary of metadata; only PS: tags are used
+            
+        Returns:
+            APP13 segment bytes
+        """
+        return self._build_photoshop_irb_segment(metadata)
+
     def _build_photoshop_irb_segment(self, metadata: Dict[str, Any]) -> bytes:
         """
         Build Photoshop IRB APP13 segment.
@@ -477,78 +342,31 @@ class MetadataStandardsWriter:
             MetadataWriteError: If writing fails
         """
         try:
-            with open(file_path, 'rb') as f:
-                jpeg_data = f.read()
-            
-            if not jpeg_data.startswith(b'\xff\xd8'):
-                raise MetadataWriteError("Invalid JPEG file: missing JPEG signature")
-            
-            # Extract AFCP metadata
-            afcp_metadata = {}
-            for key, value in metadata.items():
-                if key.startswith('AFCP:'):
-                    afcp_metadata[key[5:]] = value
-            
-            if not afcp_metadata:
-                # No AFCP metadata, just copy file
-                with open(output_path, 'wb') as f:
-                    f.write(jpeg_data)
-                return
-            
-            # Build AFCP APP2 segment
-            afcp_segment = self._build_afcp_segment(afcp_metadata)
-            
-            # Find existing AFCP APP2 segment or insert new one
-            offset = 2
-            afcp_pos = -1
-            afcp_length = 0
-            
-            while offset < len(jpeg_data) - 4:
-                if jpeg_data[offset:offset+2] == b'\xff\xe2':  # APP2
-                    length = struct.unpack('>H', jpeg_data[offset+2:offset+4])[0]
-                    if jpeg_data[offset+4:offset+12] == b'AFCP\x00\x00\x00\x00':
-                        afcp_pos = offset
-                        afcp_length = length
-                        break
-                    offset += 2 + length
-                elif jpeg_data[offset] == 0xFF and jpeg_data[offset+1] >= 0xE0 and jpeg_data[offset+1] <= 0xEF:
-                    length = struct.unpack('>H', jpeg_data[offset+2:offset+4])[0]
-                    offset += 2 + length
-                else:
-                    offset += 1
-            
-            # Insert or replace AFCP segment
-            if afcp_pos != -1:
-                # Replace existing segment
-                new_jpeg = (
-                    jpeg_data[:afcp_pos] +
-                    afcp_segment +
-                    jpeg_data[afcp_pos + afcp_length:]
-                )
-            else:
-                # Insert new segment
-                insert_pos = 2
-                if len(jpeg_data) > 4:
-                    pos = 2
-                    while pos < len(jpeg_data) - 4:
-                        if jpeg_data[pos] == 0xFF and jpeg_data[pos+1] >= 0xE0 and jpeg_data[pos+1] <= 0xEF:
-                            length = struct.unpack('>H', jpeg_data[pos+2:pos+4])[0]
-                            insert_pos = pos + 2 + length
-                            break
-                        pos += 1
-                
-                new_jpeg = (
-                    jpeg_data[:insert_pos] +
-                    afcp_segment +
-                    jpeg_data[insert_pos:]
-                )
-            
-            with open(output_path, 'wb') as f:
-                f.write(new_jpeg)
-                
+            segment = self.build_afcp_segment(metadata)
+            replacements = {JPEGSegmentRewriter.AFCP: segment} if segment else {}
+            JPEGSegmentRewriter.rewrite_file(file_path, output_path, replacements)
         except Exception as e:
             raise MetadataWriteError(f"Failed to write AFCP metadata: {str(e)}")
     
+    def build_afcp_segment(self, metadata: Dict[str, Any]) -> bytes:
+        """
+        Build the AFCP APP2 segment for AFCP tags.
+        
+        Args:
+            metadata: Dictionary of metadata; only AFCP: tags are used
+            
+        Returns:
+            AFCP APP2 segment bytes, or empty bytes if there are no AFCP tags
+        """
+        afcp_metadata = {}
+        for key, value in metadata.items():
+            if key.startswith('AFCP:'):
+                afcp_metadata[key[5:]] = value
+        
+        if not afcp_metadata:
+            return b''
+        return self._build_afcp_segment(afcp_metadata)
+
     def _build_afcp_segment(self, metadata: Dict[str, Any]) -> bytes:
         """
         Build AFCP APP2 segment.
@@ -13,9 +13,14 @@ including batch processing, file operations, and metadata manipulation.
 Copyright 2025 DNAi inc.
 """
 
-from typing import Dict, List, Optional, Union, Any, Callable
+from typing import Dict, List, Optional, Union, Any, Callable, Iterable, Iterator, Tuple
 from pathlib import Path
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
 from dnexif.core import DNExif
+from dnexif.metadata_cache import MetadataCache
+from dnexif.stream_copy import clone_file
 from dnexif.exceptions import DNExifError, MetadataReadError, MetadataWriteError
 
 
@@ -92,11 +97,194 @@ def has_metadata(file_path: Union[str, Path], quick_check: bool = True) -> bool:
             return False
 
 
+def _run_batch(
+    function: Callable[[Any], Any],
+    items: Iterable[Any],
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    use_threads: bool = False,
+    ordered: bool = True
+) -> Iterator[Tuple[Any, Any, Optional[Exception]]]:
+    """
+    Apply a function to each item, optionally in parallel, yielding results as they complete.
+    
+    Without workers or executor the items are processed serially in the calling
+    thread. Otherwise at most a few tasks per worker are kept in flight, so the
+    input iterable is consumed lazily and never fully materialized.
+    
+    Args:
+        function: Function to apply (must be picklable when using processes)
+        items: Items to process
+        workers: Number of workers (None or 1 = serial)
+        executor: Optional existing executor to use (left running on return)
+        use_threads: If True, use a ThreadPoolExecutor instead of a ProcessPoolExecutor
+        ordered: If True, yield results in input order; otherwise in completion order
+        
+    Yields:
+        Tuples of (item, result, exception) where exactly one of result/exception is set
+    """
+    if executor is None and (workers is None or workers <= 1):
+        for item in items:
+            try:
+                yield item, function(item), None
+            except Exception as e:
+                yield item, None, e
+        return
+    
+    owns_executor = executor is None
+    if owns_executor:
+        pool_class = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+        executor = pool_class(max_workers=workers)
+    max_pending = max(workers or os.cpu_count() or 1, 1) * 4
+    pending = deque() if ordered else {}
+    
+    def collect(future, item):
+        try:
+            return item, future.result(), None
+        except Exception as e:
+            return item, None, e
+    
+    try:
+        item_iter = iter(items)
+        if ordered:
+            for item in item_iter:
+                pending.append((executor.submit(function, item), item))
+                if len(pending) >= max_pending:
+                    yield collect(*pending.popleft())
+            while pending:
+                yield collect(*pending.popleft())
+        else:
+            for item in item_iter:
+                pending[executor.submit(function, item)] = item
+                if len(pending) >= max_pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield collect(future, pending.pop(future))
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield collect(future, pending.pop(future))
+    finally:
+        # Consumer stopped early or an error occurred - drop queued work
+        futures = [entry[0] for entry in pending] if ordered else list(pending)
+        for future in futures:
+            future.cancel()
+        if owns_executor:
+            executor.shutdown(wait=True)
+
+
+def _read_file_metadata(
+    path: Path,
+    tags: Optional[List[str]] = None,
+    skip_no_metadata: bool = False,
+    cache: Optional[MetadataCache] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Read metadata from one file for batch operations.
+    
+    Module-level so that it can be dispatched to worker processes.
+    
+    Args:
+        path: File path
+        tags: Optional list of specific tags to read (if None, reads all)
+        skip_no_metadata: If True, return None for files without metadata
+        cache: Optional persistent metadata cache
+        
+    Returns:
+        Metadata dictionary, or None if the file was skipped
+    """
+    if skip_no_metadata and not has_metadata(path, quick_check=True):
+        return None
+    # Without a cache, only the requested tags are extracted; with one, the
+    # full parse is kept so that it can be cached for later scans
+    with DNExif(path, read_only=True, cache=cache,
+                tags=tags if cache is None else None) as exif:
+        if tags:
+            return {tag: exif.get_tag(tag) for tag in tags}
+        return exif.get_all_metadata()
+
+
+class _BatchReader:
+    """Picklable callable binding batch read options to _read_file_metadata."""
+    
+    def __init__(self, tags: Optional[List[str]], skip_no_metadata: bool,
+                 cache: Optional[MetadataCache] = None):
+        self.tags = tags
+        self.skip_no_metadata = skip_no_metadata
+        self.cache = cache
+    
+    def __call__(self, path: Path) -> Optional[Dict[str, Any]]:
+        return _read_file_metadata(path, self.tags, self.skip_no_metadata, self.cache)
+
+
+def iter_batch_read_metadata(
+    file_paths: Iterable[Union[str, Path]],
+    tags: Optional[List[str]] = None,
+    error_handler: Optional[Callable[[Path, Exception], None]] = None,
+    skip_no_metadata: bool = False,
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    use_threads: bool = False,
+    ordered: bool = False,
+    cache: Optional[Union[MetadataCache, str, Path]] = None
+) -> Iterator[Tuple[Path, Dict[str, Any]]]:
+    """
+    Read metadata from multiple files, yielding results as files complete.
+    
+    Files are dispatched to a process pool (or thread pool for I/O-bound
+    storage such as network mounts) when workers or executor is given. Input
+    paths are consumed lazily, so arbitrarily large file lists can be streamed.
+    
+    Args:
+        file_paths: Iterable of file paths to read
+        tags: Optional list of specific tags to read (if None, reads all)
+        error_handler: Optional callback function for handling errors (path, exception).
+                      Called in the calling process.
+        skip_no_metadata: If True, skip files that don't have metadata
+        workers: Number of parallel workers (None or 1 = serial)
+        executor: Optional existing concurrent.futures Executor to use
+        use_threads: If True, use threads instead of processes when creating a pool
+        ordered: If True, yield results in input order; otherwise as they complete
+        cache: Optional MetadataCache (or cache database path); unchanged files are
+              served from the cache without being parsed
+        
+    Yields:
+        Tuples of (path, metadata). Failed files yield {'_error': message}
+        unless error_handler is given.
+        
+    Example:
+        >>> for path, metadata in iter_batch_read_metadata(files, workers=8):
+        ...     print(path, metadata.get('EXIF:Make'))
+    """
+    paths = (Path(file_path) for file_path in file_paths)
+    if cache is not None and not isinstance(cache, MetadataCache):
+        cache = MetadataCache(cache)
+    reader = _BatchReader(tags, skip_no_metadata, cache)
+    
+    for path, metadata, error in _run_batch(reader, paths, workers=workers, executor=executor,
+                                            use_threads=use_threads, ordered=ordered):
+        if error is not None:
+            if error_handler:
+                error_handler(path, error)
+            else:
+                # Default: report error in results
+                yield path, {'_error': str(error)}
+            continue
+        if metadata is None:
+            # Skipped (no metadata)
+            continue
+        yield path, metadata
+
+
 def batch_read_metadata(
     file_paths: List[Union[str, Path]],
     tags: Optional[List[str]] = None,
     error_handler: Optional[Callable[[Path, Exception], None]] = None,
-    skip_no_metadata: bool = False
+    skip_no_metadata: bool = False,
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    use_threads: bool = False,
+    cache: Optional[Union[MetadataCache, str, Path]] = None
 ) -> Dict[Path, Dict[str, Any]]:
     """
     Read metadata from multiple files in batch.
@@ -106,39 +294,32 @@ def batch_read_metadata(
         tags: Optional list of specific tags to read (if None, reads all)
         error_handler: Optional callback function for handling errors (path, exception)
         skip_no_metadata: If True, skip files that don't have metadata (faster for large batches)
+        workers: Number of parallel workers (None or 1 = serial). Uses processes
+                unless use_threads is True.
+        executor: Optional existing concurrent.futures Executor to use
+        use_threads: If True, use threads instead of processes (for I/O-bound network storage)
+        cache: Optional MetadataCache (or cache database path) for repeated scans
         
     Returns:
-        Dictionary mapping file paths to metadata dictionaries
+        Dictionary mapping file paths to metadata dictionaries, in input order
         
     Example:
         >>> files = ['image1.jpg', 'image2.jpg']
         >>> metadata = batch_read_metadata(files)
         >>> print(metadata['image1.jpg']['EXIF:Make'])
+        >>> metadata = batch_read_metadata(files, workers=4)
     """
-    results = {}
-    
-    for file_path in file_paths:
-        path = Path(file_path)
-        
-        # Skip files without metadata if requested (performance optimization)
-        if skip_no_metadata and not has_metadata(path, quick_check=True):
-            continue
-        
-        try:
-            with DNExif(path, read_only=True) as exif:
-                if tags:
-                    metadata = {tag: exif.get_tag(tag) for tag in tags}
-                else:
-                    metadata = exif.get_all_metadata()
-                results[path] = metadata
-        except Exception as e:
-            if error_handler:
-                error_handler(path, e)
-            else:
-                # Default: store error in results
-                results[path] = {'_error': str(e)}
-    
-    return results
+    return dict(iter_batch_read_metadata(
+        file_paths,
+        tags=tags,
+        error_handler=error_handler,
+        skip_no_metadata=skip_no_metadata,
+        workers=workers,
+        executor=executor,
+        use_threads=use_threads,
+        ordered=True,
+        cache=cache
+    ))
 
 
 def batch_write_metadata(
@@ -150,10 +331,15 @@ def batch_write_metadata(
     """
     Write metadata to multiple files in batch.
     
+    Each file is replaced atomically, so an interrupted batch never leaves a
+    partially written file; backups are only needed to undo the changes.
+    
     Args:
         file_paths: List of file paths to write
         metadata_updates: Dictionary of tag names to values to set
-        create_backup: Whether to create backup files before writing
+        create_backup: Whether to create backup files (file.ext.bak) before
+                       writing; on copy-on-write filesystems these are
+                       reflinks that share the original's data blocks
         error_handler: Optional callback function for handling errors (path, exception)
         
     Returns:
@@ -175,8 +361,7 @@ def batch_write_metadata(
             # Create backup if requested
             if create_backup:
                 backup_path = path.with_suffix(path.suffix + '.bak')
-                import shutil
-                shutil.copy2(path, backup_path)
+                clone_file(path, backup_path)
             
             with DNExif(path, read_only=False) as exif:
                 for tag_name, value in metadata_updates.items():
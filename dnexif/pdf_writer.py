@@ -19,6 +19,7 @@ from typing import Dict, Any, Optional, Tuple, List
 from pathlib import Path
 
 from dnexif.exceptions import MetadataWriteError
+from dnexif.stream_copy import atomic_write
 from dnexif.xmp_writer import XMPWriter
 
 
@@ -89,8 +90,7 @@ class PDFWriter:
                 pdf_data = self._write_doc_info(pdf_data, doc_info)
             
             # Write output file
-            with open(output_path, 'wb') as f:
-                f.write(pdf_data)
+            atomic_write(output_path, pdf_data)
                 
         except Exception as e:
             raise MetadataWriteError(f"Failed to write PDF metadata: {str(e)}")
@@ -13,12 +13,14 @@ PNG 1.2.1+ supports EXIF in eXIf chunks, and XMP in iTXt chunks.
 Copyright 2025 DNAi inc.
 """
 
+import os
 import struct
 import zlib
-from typing import Dict, Any, Optional, List, Tuple
+from typing import BinaryIO, Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
 from dnexif.exceptions import MetadataWriteError
+from dnexif.stream_copy import atomic_output, atomic_write, copy_range
 from dnexif.exif_writer import EXIFWriter
 from dnexif.xmp_writer import XMPWriter
 
@@ -39,6 +41,8 @@ class PNGWriter:
     CHUNK_ZTXT = b'zTXt'  # Compressed text chunk
     CHUNK_IEND = b'IEND'
     
+    PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+    
     def __init__(self):
         """Initialize PNG writer."""
         self.exif_writer = EXIFWriter(exif_version='0300')  # Use EXIF 3.0 for UTF-8
@@ -68,42 +72,135 @@ class PNGWriter:
             # Parse original PNG structure
             chunks = self._parse_png_chunks(original_data)
             
-            # Extract EXIF metadata
-            exif_metadata = {
-                k: v for k, v in metadata.items()
-                if k.startswith('EXIF:') or k.startswith('IFD0:') or k.startswith('GPS:')
-            }
-            
-            # Extract XMP metadata
-            xmp_metadata = {
-                k: v for k, v in metadata.items()
-                if k.startswith('XMP:')
-            }
-            
-            # Extract Stable Diffusion metadata (PNG:StableDiffusion:* tags)
-            stable_diffusion_metadata = {
-                k: v for k, v in metadata.items()
-                if k.startswith('PNG:StableDiffusion:')
-            }
-            
-            # Extract PNG text metadata (PNG:Text:* tags)
-            png_text_metadata = {
-                k: v for k, v in metadata.items()
-                if k.startswith('PNG:Text:')
-            }
+            exif_metadata, xmp_metadata, stable_diffusion_metadata, png_text_metadata = (
+                self._split_metadata(metadata)
+            )
             
             # Build new PNG file
             new_png_data = self._build_png_file(chunks, exif_metadata, xmp_metadata, stable_diffusion_metadata, png_text_metadata)
             
             # Write to output file
-            with open(output_path, 'wb') as f:
-                f.write(new_png_data)
+            atomic_write(output_path, new_png_data)
                 
         except Exception as e:
             if isinstance(e, MetadataWriteError):
                 raise
             raise MetadataWriteError(f"Failed to write PNG file: {str(e)}")
     
+    def write_png_file(
+        self,
+        file_path: str,
+        metadata: Dict[str, Any],
+        output_path: str
+    ) -> None:
+        """
+        Write metadata to a PNG file without loading the image data.
+        
+        Only the chunk headers of the original file are read; the new
+        metadata chunks are written after IHDR and every other chunk is
+        copied verbatim from the original.
+        
+        Args:
+            file_path: Original PNG file path
+            metadata: Metadata dictionary to write
+            output_path: Output file path (may be file_path itself)
+            
+        Raises:
+            MetadataWriteError: If writing fails
+        """
+        try:
+            with atomic_output(output_path) as output:
+                with open(file_path, 'rb') as source:
+                    if source.read(8) != self.PNG_SIGNATURE:
+                        raise MetadataWriteError("Invalid PNG file")
+                    chunks = self._index_png_chunks(source)
+                    if chunks and chunks[0][0] != self.CHUNK_IHDR:
+                        raise MetadataWriteError("PNG file missing IHDR chunk")
+                    
+                    output.write(self.PNG_SIGNATURE)
+                    for index, (chunk_type, offset, length) in enumerate(chunks):
+                        copy_range(source, output, offset, length)
+                        if index == 0:
+                            output.write(self._build_metadata_chunks(*self._split_metadata(metadata)))
+        except Exception as e:
+            if isinstance(e, MetadataWriteError):
+                raise
+            raise MetadataWriteError(f"Failed to write PNG file: {str(e)}")
+    
+    def _split_metadata(
+        self,
+        metadata: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """
+        Split metadata into the groups written to PNG chunks.
+        
+        Args:
+            metadata: Metadata dictionary to write
+            
+        Returns:
+            Tuple of (EXIF, XMP, Stable Diffusion, PNG text) metadata dictionaries
+        """
+        # Extract EXIF metadata
+        exif_metadata = {
+            k: v for k, v in metadata.items()
+            if k.startswith('EXIF:') or k.startswith('IFD0:') or k.startswith('GPS:')
+        }
+        
+        # Extract XMP metadata
+        xmp_metadata = {
+            k: v for k, v in metadata.items()
+            if k.startswith('XMP:')
+        }
+        
+        # Extract Stable Diffusion metadata (PNG:StableDiffusion:* tags)
+        stable_diffusion_metadata = {
+            k: v for k, v in metadata.items()
+            if k.startswith('PNG:StableDiffusion:')
+        }
+        
+        # Extract PNG text metadata (PNG:Text:* tags)
+        png_text_metadata = {
+            k: v for k, v in metadata.items()
+            if k.startswith('PNG:Text:')
+        }
+        
+        return exif_metadata, xmp_metadata, stable_diffusion_metadata, png_text_metadata
+    
+    def _index_png_chunks(self, source: BinaryIO) -> List[Tuple[bytes, int, int]]:
+        """
+        Locate the chunks of a PNG file by reading only their headers.
+        
+        Uses the same rules as _parse_png_chunks: eXIf and iTXt chunks are
+        dropped, truncated chunks end the scan, and nothing after IEND is kept.
+        
+        Args:
+            source: Seekable PNG file object
+            
+        Returns:
+            List of (chunk_type, offset, total_length) tuples, where the range
+            covers the length, type, data and CRC fields
+        """
+        file_size = source.seek(0, os.SEEK_END)
+        chunks = []
+        offset = 8  # Skip PNG signature
+        
+        while offset < file_size - 8:
+            source.seek(offset)
+            chunk_length, chunk_type = struct.unpack('>I4s', source.read(8))
+            total_length = 12 + chunk_length
+            if offset + total_length > file_size:
+                break
+            
+            if chunk_type not in (self.CHUNK_EXIF, self.CHUNK_ITXT):
+                chunks.append((chunk_type, offset, total_length))
+            offset += total_length
+            
+            # Stop at IEND chunk
+            if chunk_type == self.CHUNK_IEND:
+                break
+        
+        return chunks
+    
     def _parse_png_chunks(self, png_data: bytes) -> List[Tuple[bytes, bytes]]:
         """
         Parse PNG chunks from file data.
@@ -193,36 +290,9 @@ class PNGWriter:
                     png_data.extend(self._write_chunk(chunk_type, chunk_data))
                     ihdr_added = True
                     
-                    # Add eXIf chunk after IHDR if we have EXIF data
-                    if exif_metadata:
-                        exif_chunk_data = self._build_exif_chunk(exif_metadata)
-                        if exif_chunk_data:
-                            png_data.extend(self._write_chunk(self.CHUNK_EXIF, exif_chunk_data))
-                    
-                    # Add iTXt chunk for XMP after IHDR if we have XMP data
-                    if xmp_metadata:
-                        xmp_chunk_data = self._build_xmp_chunk(xmp_metadata)
-                        if xmp_chunk_data:
-                            png_data.extend(self._write_chunk(self.CHUNK_ITXT, xmp_chunk_data))
-                    
-                    # Add tEXt chunks for Stable Diffusion metadata and other text metadata
-                    if stable_diffusion_metadata is not None and stable_diffusion_metadata:
-                        # Write Stable Diffusion parameters as tEXt chunk with keyword "parameters"
-                        if 'PNG:StableDiffusion:Parameters' in stable_diffusion_metadata:
-                            params_text = str(stable_diffusion_metadata['PNG:StableDiffusion:Parameters'])
-                            text_chunk_data = self._build_text_chunk('parameters', params_text)
-                            if text_chunk_data:
-                                png_data.extend(self._write_chunk(self.CHUNK_TEXT, text_chunk_data))
-                    
-                    # Add other PNG text metadata as tEXt chunks
-                    if png_text_metadata is not None and png_text_metadata:
-                        for tag_name, text_value in png_text_metadata.items():
-                            # Extract keyword from tag name (PNG:Text:Keyword -> Keyword)
-                            keyword = tag_name.replace('PNG:Text:', '')
-                            if keyword and text_value:
-                                text_chunk_data = self._build_text_chunk(keyword, str(text_value))
-                                if text_chunk_data:
-                                    png_data.extend(self._write_chunk(self.CHUNK_TEXT, text_chunk_data))
+                    png_data.extend(self._build_metadata_chunks(
+                        exif_metadata, xmp_metadata, stable_diffusion_metadata, png_text_metadata
+                    ))
                 else:
                     # IHDR not found, add it first
                     raise MetadataWriteError("PNG file missing IHDR chunk")
@@ -232,6 +302,60 @@ class PNGWriter:
         
         return bytes(png_data)
     
+    def _build_metadata_chunks(
+        self,
+        exif_metadata: Dict[str, Any],
+        xmp_metadata: Dict[str, Any],
+        stable_diffusion_metadata: Dict[str, Any] = None,
+        png_text_metadata: Dict[str, Any] = None
+    ) -> bytes:
+        """
+        Build the metadata chunks inserted after IHDR.
+        
+        Args:
+            exif_metadata: EXIF metadata dictionary
+            xmp_metadata: XMP metadata dictionary
+            stable_diffusion_metadata: Stable Diffusion metadata dictionary
+            png_text_metadata: PNG text metadata dictionary
+            
+        Returns:
+            Complete chunks (eXIf, iTXt, tEXt) as bytes
+        """
+        png_data = bytearray()
+        
+        # Add eXIf chunk after IHDR if we have EXIF data
+        if exif_metadata:
+            exif_chunk_data = self._build_exif_chunk(exif_metadata)
+            if exif_chunk_data:
+                png_data.extend(self._write_chunk(self.CHUNK_EXIF, exif_chunk_data))
+        
+        # Add iTXt chunk for XMP after IHDR if we have XMP data
+        if xmp_metadata:
+            xmp_chunk_data = self._build_xmp_chunk(xmp_metadata)
+            if xmp_chunk_data:
+                png_data.extend(self._write_chunk(self.CHUNK_ITXT, xmp_chunk_data))
+        
+        # Add tEXt chunks for Stable Diffusion metadata and other text metadata
+        if stable_diffusion_metadata is not None and stable_diffusion_metadata:
+            # Write Stable Diffusion parameters as tEXt chunk with keyword "parameters"
+            if 'PNG:StableDiffusion:Parameters' in stable_diffusion_metadata:
+                params_text = str(stable_diffusion_metadata['PNG:StableDiffusion:Parameters'])
+                text_chunk_data = self._build_text_chunk('parameters', params_text)
+                if text_chunk_data:
+                    png_data.extend(self._write_chunk(self.CHUNK_TEXT, text_chunk_data))
+        
+        # Add other PNG text metadata as tEXt chunks
+        if png_text_metadata is not None and png_text_metadata:
+            for tag_name, text_value in png_text_metadata.items():
+                # Extract keyword from tag name (PNG:Text:Keyword -> Keyword)
+                keyword = tag_name.replace('PNG:Text:', '')
+                if keyword and text_value:
+                    text_chunk_data = self._build_text_chunk(keyword, str(text_value))
+                    if text_chunk_data:
+                        png_data.extend(self._write_chunk(self.CHUNK_TEXT, text_chunk_data))
+        
+        return bytes(png_data)
+    
     def _build_exif_chunk(self, exif_metadata: Dict[str, Any]) -> Optional[bytes]:
         """
         Build eXIf chunk data from EXIF metadata.
@@ -18,6 +18,7 @@ from typing import Dict, Any, Optional
 from pathlib import Path
 
 from dnexif.exceptions import MetadataWriteError
+from dnexif.stream_copy import atomic_write
 from dnexif.exif_writer import EXIFWriter
 from dnexif.xmp_writer import XMPWriter
 from dnexif.iptc_writer import IPTCWriter
@@ -143,8 +144,7 @@ class PSDWriter:
             )
             
             # Write output file
-            with open(output_path, 'wb') as f:
-                f.write(new_psd)
+            atomic_write(output_path, new_psd)
                 
         except Exception as e:
             raise MetadataWriteError(f"Failed to write PSD metadata: {str(e)}")
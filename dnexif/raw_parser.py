@@ -20,6 +20,7 @@ from typing import Dict, Any, Optional, List
 from pathlib import Path
 from dnexif.exceptions import MetadataReadError, UnsupportedFormatError
 from dnexif.exif_parser import ExifParser
+from dnexif.file_view import RangedFile
 
 
 class RAWParser:
@@ -133,6 +134,8 @@ class RAWParser:
             return {}
 
         # Fast-scan cap for formats that frequently time out on full reads.
+        # The capped header window is read on demand, so only the IFDs and
+        # values visited within it are read from disk.
         if raw_format in ('CR2', '3FR', 'DCR', 'NEF', 'ARW', 'DNG', 'PEF'):
             max_scan_bytes = 512 * 1024
             if self.file_path:
@@ -144,8 +147,7 @@ class RAWParser:
                     read_size = max_scan_bytes
                     if file_size is not None:
                         read_size = min(file_size, max_scan_bytes)
-                    with open(self.file_path, 'rb') as f:
-                        self.file_data = f.read(read_size)
+                    self.file_data = RangedFile(self.file_path, limit=read_size)
                     self.fast_scan = True
                     self.scan_bytes = read_size
             elif self.file_data and len(self.file_data) > max_scan_bytes:
@@ -23,6 +23,7 @@ from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
 from dnexif.exceptions import MetadataWriteError
+from dnexif.stream_copy import atomic_output, atomic_write
 from dnexif.tiff_writer import TIFFWriter
 from dnexif.raw_parser import RAWParser
 from dnexif.exif_tags import EXIF_TAG_NAMES
@@ -152,8 +153,7 @@ class RAWWriter:
             output += struct.pack('>I', len(section_data))
             output += section_data
 
-        with open(output_path, 'wb') as f:
-            f.write(output)
+        atomic_write(output_path, output)
     
     def write_raw(
         self,
@@ -400,7 +400,7 @@ class RAWWriter:
                     modified_tiff = header_prefix + modified_tiff[4:]
                 if os.getenv('DNEXIF_RAW_WRITE_TIMING'):
                     write_out_start = time.perf_counter()
-                with open(output_path, 'wb') as f:
+                with atomic_output(output_path) as f:
                     if header_prefix and raw_format != 'ORF':
                         f.write(header_prefix)
                     f.write(modified_tiff)
@@ -418,8 +418,7 @@ class RAWWriter:
                         )
                     except Exception as orf_error:
                         # If improved ORF writing also fails, preserve original file
-                        with open(output_path, 'wb') as f:
-                            f.write(file_data)
+                        atomic_write(output_path, file_data)
                         raise MetadataWriteError(
                             f"ORF writing requires special format handling. "
                             f"The file structure is not standard TIFF. "
@@ -589,8 +588,7 @@ class RAWWriter:
             updates[0x02BC] = (7, len(xmp_data), xmp_data)
 
         if not updates:
-            with open(output_path, 'wb') as f:
-                f.write(file_data)
+            atomic_write(output_path, file_data)
             return
 
         tag_index = {entry['id']: idx for idx, entry in enumerate(entries)}
@@ -659,8 +657,7 @@ class RAWWriter:
         output_data.extend(ifd_bytes)
         output_data.extend(data_blob)
 
-        with open(output_path, 'wb') as f:
-            f.write(output_data)
+        atomic_write(output_path, output_data)
 
     def _write_rw2_in_place(
         self,
@@ -727,8 +724,7 @@ class RAWWriter:
             updates[0x8298] = (2, len(copyright_bytes), copyright_bytes)
 
         if not updates:
-            with open(output_path, 'wb') as f:
-                f.write(file_data)
+            atomic_write(output_path, file_data)
             return
 
         tag_index = {entry['id']: idx for idx, entry in enumerate(entries)}
@@ -797,8 +793,7 @@ class RAWWriter:
         output_data.extend(ifd_bytes)
         output_data.extend(data_blob)
 
-        with open(output_path, 'wb') as f:
-            f.write(output_data)
+        atomic_write(output_path, output_data)
     
     def _write_special_format_raw(
         self,
@@ -892,7 +887,7 @@ class RAWWriter:
                 modified_tiff = f.read()
             
             # Replace TIFF header with ORF header while preserving IFD offset.
-            with open(output_path, 'wb') as f:
+            with atomic_output(output_path) as f:
                 f.write(header_prefix)
                 f.write(modified_tiff[4:])
         finally:
@@ -921,7 +916,7 @@ class RAWWriter:
         if existing != -1 and existing + len(magic) + 4 <= len(data):
             data = data[:existing]
 
-        with open(output_path, 'wb') as f:
+        with atomic_output(output_path) as f:
             f.write(data)
             f.write(magic)
             f.write(length)
@@ -946,7 +941,7 @@ class RAWWriter:
         if existing != -1 and existing + len(magic) + 4 <= len(data):
             data = data[:existing]
 
-        with open(output_path, 'wb') as f:
+        with atomic_output(output_path) as f:
             f.write(data)
             f.write(magic)
             f.write(length)
@@ -1000,8 +995,7 @@ class RAWWriter:
         # 4. Recalculating offsets if needed
         
         # Copy original file to preserve structure
-        with open(output_path, 'wb') as f:
-            f.write(file_data)
+        atomic_write(output_path, file_data)
         
         # Note: This is a structure-preserving implementation
         # Full X3F metadata writing would require extensive format research
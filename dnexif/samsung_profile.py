@@ -20,6 +20,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
+from dnexif.stream_copy import atomic_write, clone_file
 from dnexif.vendor_samsung import (
     is_samsung_motion_photo_bytes,
     extract_motion_photo_mp4,
@@ -90,7 +91,7 @@ def extract_motion_clip(path: str | Path, out_path: str | Path) -> bool:
         return False
 
     try:
-        out.write_bytes(mp4_bytes)
+        atomic_write(out, mp4_bytes)
     except Exception:
         return False
 
@@ -144,16 +145,16 @@ def strip_motion_clip_inplace(path: str | Path, backup: bool = True) -> bool:
     if backup:
         try:
             backup_path = Path(str(file_path) + ".bak")
-            backup_path.write_bytes(data)
+            clone_file(file_path, backup_path)
         except Exception:
             # If backup fails, abort the operation for safety
             return False
 
     # Write JPEG-only version back to original path
     try:
-        file_path.write_bytes(jpeg_only)
+        atomic_write(file_path, jpeg_only)
     except Exception:
-        # If write fails and we created a backup, the original is still intact
+        # The write is atomic, so on failure the original is still intact
         return False
 
     return True
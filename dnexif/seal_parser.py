@@ -19,6 +19,7 @@ from typing import Dict, Any, Optional, List
 from pathlib import Path
 
 from dnexif.exceptions import MetadataReadError
+from dnexif.stream_copy import atomic_write
 
 
 class SEALParser:
@@ -48,12 +49,12 @@ class SEALParser:
         
         Args:
             file_path: Path to file
-            file_data: File data bytes
+            file_data: File data bytes (used instead of reading file_path if both are given)
         """
         if file_path:
             self.file_path = Path(file_path)
-            self.file_data = None
-        elif file_data:
+            self.file_data = file_data
+        elif file_data is not None:
             self.file_data = file_data
             self.file_path = None
         else:
@@ -497,8 +498,7 @@ class SEALParser:
             
             # Write output if path provided
             if output_path:
-                with open(output_path, 'wb') as f:
-                    f.write(file_data)
+                atomic_write(output_path, file_data)
             
             return bytes(file_data)
         
@@ -0,0 +1,271 @@
+# Copyright 2025 DNAi inc.
+
+# Dual-licensed under the DNAi Free License v1.1 and the
+# DNAi Commercial License v1.1.
+# See the LICENSE files in the project root for details.
+
+"""
+Streaming file copy helpers
+
+This module provides the building blocks used by the format writers to emit
+new metadata headers and then copy the unchanged payload (image scans, video
+samples, audio frames) straight from the original file, so that peak memory
+is bounded by the size of the metadata rather than the size of the file.
+Where the platform supports it, payload ranges are copied inside the kernel
+with copy_file_range() or sendfile().
+
+All output is written to a temporary file next to the destination, flushed
+to disk and renamed over it, so an interrupted write never leaves a truncated
+file behind. Backups are made with a reflink (FICLONE) where the filesystem
+supports copy-on-write clones.
+
+Copyright 2025 DNAi inc.
+"""
+
+import io
+import os
+import shutil
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, Sequence, Tuple, Union
+
+
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# ioctl request number of FICLONE on Linux (_IOW(0x94, 9, int))
+FICLONE = 0x40049409
+
+# A piece of an output file: new bytes, or a (start, end) range of the original
+LayoutPiece = Union[bytes, Tuple[int, int]]
+
+
+def _fileno(file_obj: BinaryIO) -> Optional[int]:
+    """Return the OS file descriptor of a file object, or None if it has none."""
+    try:
+        return file_obj.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+def _copy_fd_range(source_fd: int, output_fd: int, offset: int, length: int) -> int:
+    """
+    Copy a byte range between file descriptors inside the kernel.
+
+    Args:
+        source_fd: Source file descriptor (its position is not used or changed)
+        output_fd: Output file descriptor, written at its current position
+        offset: Offset of the range in the source
+        length: Number of bytes to copy
+
+    Returns:
+        Number of bytes copied; less than length if neither system call is
+        available or the source ends early
+    """
+    copied = 0
+    for copy in ('copy_file_range', 'sendfile'):
+        if not hasattr(os, copy):
+            continue
+        try:
+            while copied < length:
+                if copy == 'copy_file_range':
+                    count = os.copy_file_range(source_fd, output_fd, length - copied, offset + copied)
+                else:
+                    count = os.sendfile(output_fd, source_fd, offset + copied, length - copied)
+                if count == 0:
+                    return copied
+                copied += count
+            return copied
+        except OSError:
+            # Unsupported for this pair of files (e.g. across filesystems on
+            # older kernels); fall through to the next method
+            continue
+    return copied
+
+
+def copy_range(
+    source: BinaryIO,
+    output: BinaryIO,
+    offset: int,
+    length: Optional[int] = None
+) -> int:
+    """
+    Copy a byte range of a file to the current position of another.
+
+    Real files are copied with copy_file_range() or sendfile() when
+    available; other file objects (and any remainder the kernel could not
+    copy) go through a bounded read/write loop.
+
+    Args:
+        source: Seekable binary file object to copy from
+        output: Binary file object to write to
+        offset: Offset of the range in the source
+        length: Number of bytes to copy (None copies to the end of the source)
+
+    Returns:
+        Number of bytes copied
+    """
+    if length is None:
+        length = max(0, source.seek(0, os.SEEK_END) - offset)
+    if length <= 0:
+        return 0
+
+    copied = 0
+    source_fd = _fileno(source)
+    output_fd = _fileno(output)
+    if source_fd is not None and output_fd is not None:
+        output.flush()
+        position = output.tell()
+        copied = _copy_fd_range(source_fd, output_fd, offset, length)
+        # Resynchronize the buffered writer with the descriptor position
+        output.seek(position + copied)
+
+    if copied < length:
+        source.seek(offset + copied)
+        while copied < length:
+            chunk = source.read(min(COPY_BUFFER_SIZE, length - copied))
+            if not chunk:
+                break
+            output.write(chunk)
+            copied += len(chunk)
+    return copied
+
+
+def write_layout(source: BinaryIO, output: BinaryIO, layout: Sequence[LayoutPiece]) -> None:
+    """
+    Write an output file described as a sequence of pieces.
+
+    Args:
+        source: Seekable original file object that ranges refer to
+        output: Binary file object to write to
+        layout: Byte strings to write as-is and (start, end) ranges to copy
+                from source
+    """
+    for piece in layout:
+        if isinstance(piece, tuple):
+            start, end = piece
+            copy_range(source, output, start, end - start)
+        elif piece:
+            output.write(piece)
+
+
+def _create_temp_file(output_path: Path) -> Tuple[BinaryIO, Path]:
+    """
+    Create a temporary file in the directory of an output file.
+
+    The file is created with the default permissions (0666 less the umask),
+    as a regular open() of the output would.
+
+    Args:
+        output_path: Path of the file the temporary file will replace
+
+    Returns:
+        Tuple of (open binary file object, temporary file path)
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+    while True:
+        temp_path = output_path.with_name(f'.{output_path.name}.{os.urandom(4).hex()}.tmp')
+        try:
+            fd = os.open(temp_path, flags, 0o666)
+        except FileExistsError:
+            continue
+        return os.fdopen(fd, 'wb'), temp_path
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Flush a directory entry change (such as a rename) to disk, where supported."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        # Directories cannot be opened on Windows; renames are durable there
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_output(output_path: Union[str, Path]) -> Iterator[BinaryIO]:
+    """
+    Open an output file that is replaced atomically.
+
+    The output is written to a temporary file next to output_path. When the
+    block exits without error the temporary file is flushed to disk, given
+    the permissions of any file it replaces and renamed over output_path, so
+    readers (and a crash at any point) see either the old file or the
+    complete new one. If the block raises, the temporary file is removed and
+    output_path is left untouched. The original file can still be read while
+    writing, so output_path may be the input file itself.
+
+    A symbolic link at output_path is written through: the file it points
+    to is replaced and the link is kept.
+
+    Args:
+        output_path: Path to the output file
+
+    Yields:
+        Binary file object to write the new file to
+    """
+    output_path = Path(os.path.realpath(output_path))
+    output, temp_path = _create_temp_file(output_path)
+    try:
+        with output:
+            yield output
+            output.flush()
+            os.fsync(output.fileno())
+        if output_path.exists():
+            shutil.copymode(output_path, temp_path)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if temp_path.exists():
+            temp_path.unlink()
+        raise
+    _fsync_directory(output_path.parent)
+
+
+def atomic_write(output_path: Union[str, Path], data: bytes) -> None:
+    """
+    Write a complete file atomically (see atomic_output).
+
+    Args:
+        output_path: Path to the output file
+        data: File contents
+    """
+    with atomic_output(output_path) as output:
+        output.write(data)
+
+
+def clone_file(source_path: Union[str, Path], backup_path: Union[str, Path]) -> bool:
+    """
+    Copy a file, sharing its data blocks where the filesystem allows.
+
+    On copy-on-write filesystems (Btrfs, XFS, bcachefs, ...) the copy is made
+    with a FICLONE reflink, which takes constant time and no extra space
+    until either file is modified. Elsewhere the data is copied with
+    copy_range(). The copy is written atomically and keeps the source's
+    permissions and timestamps, like shutil.copy2().
+
+    Args:
+        source_path: Path to the file to copy
+        backup_path: Path to the copy
+
+    Returns:
+        True if the copy was made with a reflink, False if the data was copied
+    """
+    cloned = False
+    with open(source_path, 'rb') as source, atomic_output(backup_path) as output:
+        if sys.platform.startswith('linux'):
+            import fcntl
+            try:
+                fcntl.ioctl(output.fileno(), FICLONE, source.fileno())
+                cloned = True
+            except OSError:
+                # Not a CoW filesystem, or source and backup on different filesystems
+                pass
+        if not cloned:
+            copy_range(source, output, 0)
+    shutil.copystat(source_path, backup_path)
+    return cloned
@@ -18,6 +18,7 @@ from typing import Dict, Any
 from pathlib import Path
 
 from dnexif.exceptions import MetadataWriteError
+from dnexif.stream_copy import atomic_output
 from dnexif.xmp_writer import XMPWriter
 
 
@@ -175,7 +176,8 @@ class SVGWriter:
             # Write output file
             ET.register_namespace('', 'http://www.w3.org/2000/svg')
             tree = ET.ElementTree(root)
-            tree.write(output_path, encoding='utf-8', xml_declaration=True)
+            with atomic_output(output_path) as f:
+                tree.write(f, encoding='utf-8', xml_declaration=True)
                 
         except Exception as e:
             raise MetadataWriteError(f"Failed to write SVG metadata: {str(e)}")
@@ -13,11 +13,11 @@ with Author/Comment fields so that `XMP:Title` style tags can round-trip.
 Copyright 2025 DNAi inc.
 """
 
-from pathlib import Path
 from typing import Dict, Any, List, Optional
 import struct
 
 from dnexif.exceptions import MetadataWriteError
+from dnexif.stream_copy import atomic_write
 
 
 class TGAWriter:
@@ -62,7 +62,7 @@ class TGAWriter:
         footer += self.FOOTER_SIGNATURE
 
         final_data = base_data + extension_area + footer
-        Path(output_path).write_bytes(final_data)
+        atomic_write(output_path, final_data)
 
     def _strip_existing_extension(self, file_data: bytes) -> bytearray:
         """
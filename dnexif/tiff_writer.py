@@ -17,6 +17,8 @@ import struct
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 from dnexif.exceptions import MetadataWriteError
+from dnexif.file_view import RangedFile
+from dnexif.stream_copy import atomic_output, atomic_write, write_layout
 from dnexif.exif_writer import EXIFWriter
 from dnexif.exif_parser import ExifParser, ExifTagType, TAG_SIZES
 from dnexif.iptc_writer import IPTCWriter
@@ -62,80 +64,140 @@ class TIFFWriter:
             original_data: Original TIFF file data
             metadata: Metadata dictionary to write
             output_path: Output file path
+            skip_parse: If True, write metadata as given instead of merging it
+                        with the tags parsed from original_data
             
         Raises:
             MetadataWriteError: If writing fails
         """
+        try:
+            header, image_ranges = self._build_tiff_layout(original_data, metadata, skip_parse)
+            atomic_write(output_path, header + b''.join(original_data[start:end] for start, end in image_ranges))
+        except Exception as e:
+            if isinstance(e, MetadataWriteError):
+                raise
+            raise MetadataWriteError(f"Failed to write TIFF file: {str(e)}")
+    
+    def write_tiff_file(
+        self,
+        file_path: str,
+        metadata: Dict[str, Any],
+        output_path: str,
+        skip_parse: bool = False
+    ) -> None:
+        """
+        Write metadata to a TIFF file without loading the image data.
+        
+        Only the IFDs and the values they point to are read from the
+        original file; the new header and IFDs are written and the strips
+        or tiles are then copied from the original at their new offsets.
+        
+        Args:
+            file_path: Original TIFF file path
+            metadata: Metadata dictionary to write
+            output_path: Output file path (may be file_path itself)
+            skip_parse: If True, write metadata as given instead of merging it
+                        with the tags parsed from the original file
+            
+        Raises:
+            MetadataWriteError: If writing fails
+        """
+        file_data = RangedFile(file_path)
+        try:
+            header, image_ranges = self._build_tiff_layout(file_data, metadata, skip_parse)
+            with atomic_output(output_path) as output:
+                with open(file_path, 'rb') as source:
+                    output.write(header)
+                    write_layout(source, output, image_ranges)
+        except Exception as e:
+            if isinstance(e, MetadataWriteError):
+                raise
+            raise MetadataWriteError(f"Failed to write TIFF file: {str(e)}")
+        finally:
+            file_data.close()
+    
+    def _build_tiff_layout(
+        self,
+        original_data: bytes,
+        metadata: Dict[str, Any],
+        skip_parse: bool
+    ) -> Tuple[bytes, List[Tuple[int, int]]]:
+        """
+        Build the new TIFF header and IFDs and locate the image data to follow them.
+        
+        Args:
+            original_data: Original TIFF file data (bytes or a RangedFile)
+            metadata: Metadata dictionary to write
+            skip_parse: If True, write metadata as given instead of merging it
+                        with the tags parsed from original_data
+            
+        Returns:
+            Tuple of (bytes before the image data, (start, end) ranges of the
+            original strips or tiles, in output order)
+        """
         # Determine endianness from original file
-        if original_data[:2] == b'II':
+        byte_order = original_data[:2]
+        if byte_order == b'II':
             self.endian = '<'
-        elif original_data[:2] == b'MM':
+        elif byte_order == b'MM':
             self.endian = '>'
         else:
             raise MetadataWriteError("Invalid TIFF file")
         self.exif_writer.endian = self.endian
         
-        try:
-            if skip_parse:
-                updated_metadata = metadata.copy()
-            else:
-                # Parse original TIFF structure to extract image data
-                exif_parser = ExifParser(file_data=original_data)
-                original_metadata = exif_parser.read()
-                
-                # Merge new metadata with original
-                updated_metadata = original_metadata.copy()
-                updated_metadata.update(metadata)
-            
-            # Remove tags marked for deletion (None values)
-            updated_metadata = {k: v for k, v in updated_metadata.items() if v is not None}
-            
-            # Extract image data from original TIFF (strips or tiles)
-            image_data, strip_offsets, strip_byte_counts, tile_offsets, tile_byte_counts, is_tiled = self._extract_image_data(original_data)
-            
-            # Build new TIFF structure with updated metadata
-            new_tiff_data = self._build_tiff_file(
-                updated_metadata,
-                image_data,
-                strip_offsets,
-                strip_byte_counts,
-                tile_offsets,
-                tile_byte_counts,
-                is_tiled
-            )
+        if skip_parse:
+            updated_metadata = metadata.copy()
+        else:
+            # Parse original TIFF structure to extract image data
+            exif_parser = ExifParser(file_data=original_data)
+            original_metadata = exif_parser.read()
             
-            # Write to output file
-            with open(output_path, 'wb') as f:
-                f.write(new_tiff_data)
-                
-        except Exception as e:
-            if isinstance(e, MetadataWriteError):
-                raise
-            raise MetadataWriteError(f"Failed to write TIFF file: {str(e)}")
+            # Merge new metadata with original
+            updated_metadata = original_metadata.copy()
+            updated_metadata.update(metadata)
+        
+        # Remove tags marked for deletion (None values)
+        updated_metadata = {k: v for k, v in updated_metadata.items() if v is not None}
+        
+        # Locate image data in original TIFF (strips or tiles)
+        image_ranges, strip_offsets, strip_byte_counts, tile_offsets, tile_byte_counts, is_tiled = self._locate_image_data(original_data)
+        
+        # Build new TIFF structure with updated metadata
+        header = self._build_tiff_header(
+            updated_metadata,
+            sum(end - start for start, end in image_ranges),
+            strip_offsets,
+            strip_byte_counts,
+            tile_offsets,
+            tile_byte_counts,
+            is_tiled
+        )
+        return header, image_ranges
     
-    def _extract_image_data(
+    def _locate_image_data(
         self,
         file_data: bytes
-    ) -> Tuple[bytes, List[int], List[int], List[int], List[int], bool]:
+    ) -> Tuple[List[Tuple[int, int]], List[int], List[int], List[int], List[int], bool]:
         """
-        Extract image data (strips or tiles) from TIFF file.
+        Locate image data (strips or tiles) in a TIFF file.
         
         Args:
-            file_data: Original TIFF file data
+            file_data: Original TIFF file data (bytes or a RangedFile)
             
         Returns:
-            Tuple of (image_data, strip_offsets, strip_byte_counts, 
-                     tile_offsets, tile_byte_counts, is_tiled)
+            Tuple of (image_ranges, strip_offsets, strip_byte_counts, 
+                     tile_offsets, tile_byte_counts, is_tiled), where
+            image_ranges are the (start, end) ranges of the strips or tiles
         """
         # Parse IFD0 to find image data
         if len(file_data) < 8:
-            return b'', [], [], [], [], False
+            return [], [], [], [], [], False
         
         # Read IFD0 offset
         ifd0_offset = struct.unpack(f'{self.endian}I', file_data[4:8])[0]
         
         if ifd0_offset == 0 or ifd0_offset >= len(file_data):
-            return b'', [], [], [], [], False
+            return [], [], [], [], [], False
         
         # Parse IFD0 to find StripOffsets, StripByteCounts, TileOffsets, TileByteCounts
         num_entries = struct.unpack(f'{self.endian}H', 
@@ -152,86 +214,56 @@ class TIFFWriter:
             if entry_offset + 12 > len(file_data):
                 break
             
-            tag_id = struct.unpack(f'{self.endian}H', 
-                                  file_data[entry_offset:entry_offset + 2])[0]
-            tag_type = struct.unpack(f'{self.endian}H', 
-                                    file_data[entry_offset + 2:entry_offset + 4])[0]
-            tag_count = struct.unpack(f'{self.endian}I', 
-                                     file_data[entry_offset + 4:entry_offset + 8])[0]
-            tag_value = struct.unpack(f'{self.endian}I', 
-                                     file_data[entry_offset + 8:entry_offset + 12])[0]
-            
-            # StripOffsets tag (273)
-            if tag_id == 273:
-                if tag_count == 1:
-                    strip_offsets = [tag_value]
-                else:
-                    # Multiple strips - read from offset
-                    if tag_value < len(file_data):
-                        strip_offsets = list(struct.unpack(
-                            f'{self.endian}{tag_count}I',
-                            file_data[tag_value:tag_value + (tag_count * 4)]
-                        ))
-            
-            # StripByteCounts tag (279)
-            elif tag_id == 279:
-                if tag_count == 1:
-                    strip_byte_counts = [tag_value]
-                else:
-                    # Multiple strips - read from offset
-                    if tag_value < len(file_data):
-                        strip_byte_counts = list(struct.unpack(
-                            f'{self.endian}{tag_count}I',
-                            file_data[tag_value:tag_value + (tag_count * 4)]
-                        ))
-            
-            # TileOffsets tag (324)
-            elif tag_id == 324:
-                is_tiled = True
-                if tag_count == 1:
-                    tile_offsets = [tag_value]
-                else:
-                    # Multiple tiles - read from offset
-                    if tag_value < len(file_data):
-                        tile_offsets = list(struct.unpack(
-                            f'{self.endian}{tag_count}I',
-                            file_data[tag_value:tag_value + (tag_count * 4)]
-                        ))
+            tag_id, tag_type, tag_count = struct.unpack(
+                f'{self.endian}HHI', file_data[entry_offset:entry_offset + 8])
             
-            # TileByteCounts tag (325)
-            elif tag_id == 325:
-                is_tiled = True
-                if tag_count == 1:
-                    tile_byte_counts = [tag_value]
-                else:
-                    # Multiple tiles - read from offset
-                    if tag_value < len(file_data):
-                        tile_byte_counts = list(struct.unpack(
-                            f'{self.endian}{tag_count}I',
-                            file_data[tag_value:tag_value + (tag_count * 4)]
-                        ))
+            if tag_id in (273, 279, 324, 325):
+                # SHORT or LONG values, inline if they fit in the 4-byte value field
+                value_format, value_size = ('H', 2) if tag_type == ExifTagType.SHORT.value else ('I', 4)
+                values_offset = entry_offset + 8
+                if tag_count * value_size > 4:
+                    values_offset = struct.unpack(
+                        f'{self.endian}I', file_data[entry_offset + 8:entry_offset + 12])[0]
+                values_end = values_offset + tag_count * value_size
+                values = []
+                if values_end <= len(file_data):
+                    values = list(struct.unpack(
+                        f'{self.endian}{tag_count}{value_format}',
+                        file_data[values_offset:values_end]
+                    ))
+                
+                if tag_id == 273:  # StripOffsets
+                    strip_offsets = values
+                elif tag_id == 279:  # StripByteCounts
+                    strip_byte_counts = values
+                elif tag_id == 324:  # TileOffsets
+                    is_tiled = True
+                    tile_offsets = values
+                else:  # TileByteCounts
+                    is_tiled = True
+                    tile_byte_counts = values
             
             entry_offset += 12
         
-        # Extract image data from strips or tiles
-        image_data = b''
+        # Locate image data from strips or tiles
+        image_ranges = []
         if is_tiled and tile_offsets and tile_byte_counts:
             # Tiled image
             for offset, byte_count in zip(tile_offsets, tile_byte_counts):
                 if offset + byte_count <= len(file_data):
-                    image_data += file_data[offset:offset + byte_count]
+                    image_ranges.append((offset, offset + byte_count))
         elif strip_offsets and strip_byte_counts:
             # Strip-based image
             for offset, byte_count in zip(strip_offsets, strip_byte_counts):
                 if offset + byte_count <= len(file_data):
-                    image_data += file_data[offset:offset + byte_count]
+                    image_ranges.append((offset, offset + byte_count))
         
-        return image_data, strip_offsets, strip_byte_counts, tile_offsets, tile_byte_counts, is_tiled
+        return image_ranges, strip_offsets, strip_byte_counts, tile_offsets, tile_byte_counts, is_tiled
     
-    def _build_tiff_file(
+    def _build_tiff_header(
         self,
         metadata: Dict[str, Any],
-        image_data: bytes,
+        image_data_size: int,
         strip_offsets: List[int],
         strip_byte_counts: List[int],
         tile_offsets: List[int],
@@ -239,14 +271,17 @@ class TIFFWriter:
         is_tiled: bool
     ) -> bytes:
         """
-        Build a complete TIFF file with metadata and image data.
+        Build a TIFF file with metadata, up to the image data.
+        
+        The image data (image_data_size bytes of strips or tiles, in order)
+        is written by the caller directly after the returned bytes.
         
         Supports both strip-based and tile-based images.
         Complex TIFF files (multiple IFDs) are partially supported.
         
         Args:
             metadata: Metadata dictionary
-            image_data: Image data bytes
+            image_data_size: Total size of the image data in bytes
             strip_offsets: List of strip offsets (for strip-based images)
             strip_byte_counts: List of strip byte counts
             tile_offsets: List of tile offsets (for tile-based images)
@@ -254,7 +289,7 @@ class TIFFWriter:
             is_tiled: Whether image uses tiles instead of strips
             
         Returns:
-            Complete TIFF file as bytes
+            TIFF header, IFDs and metadata blocks as bytes
         """
         # For now, implement a basic version that rebuilds the EXIF structure
         # and preserves image data if present
@@ -280,7 +315,7 @@ class TIFFWriter:
             if k.startswith('XMP:')
         }
         
-        if not exif_tags and not iptc_tags and not xmp_tags and not image_data:
+        if not exif_tags and not iptc_tags and not xmp_tags and not image_data_size:
             raise MetadataWriteError("No metadata or image data to write")
         
         # Build TIFF header
@@ -292,21 +327,31 @@ class TIFFWriter:
         header += struct.pack(f'{self.endian}H', 42)  # Magic number
         header += struct.pack(f'{self.endian}I', 8)  # IFD0 offset (will be 8)
         
-        # Ensure image data offsets exist so we can update them later
-        if image_data:
+        # Reserve the image data offsets so we can patch them once the layout is
+        # known; the placeholder makes them LONGs, wide enough for any new offset
+        if image_data_size:
+            # Drop the copies of the old arrays parsed under the EXIF group
+            for tag_name in ('StripOffsets', 'StripByteCounts', 'TileOffsets', 'TileByteCounts'):
+                exif_tags.pop(f'EXIF:{tag_name}', None)
             if is_tiled:
-                if 'IFD0:TileOffsets' not in exif_tags:
-                    exif_tags['IFD0:TileOffsets'] = [0]
-                if 'IFD0:TileByteCounts' not in exif_tags:
-                    exif_tags['IFD0:TileByteCounts'] = [len(image_data)]
+                counts = tile_byte_counts if tile_byte_counts else [image_data_size]
+                exif_tags['IFD0:TileOffsets'] = [0xFFFFFFFF] * len(counts)
+                exif_tags['IFD0:TileByteCounts'] = counts
+                layout_tags = ('TileWidth', 'TileLength')
             else:
-                if 'IFD0:StripOffsets' not in exif_tags:
-                    exif_tags['IFD0:StripOffsets'] = [0]
-                if 'IFD0:StripByteCounts' not in exif_tags:
-                    exif_tags['IFD0:StripByteCounts'] = [len(image_data)]
+                counts = strip_byte_counts if strip_byte_counts else [image_data_size]
+                exif_tags['IFD0:StripOffsets'] = [0xFFFFFFFF] * len(counts)
+                exif_tags['IFD0:StripByteCounts'] = counts
+                layout_tags = ('RowsPerStrip',)
+            # Keep the tags that say how the strips or tiles divide the image
+            for tag_name in layout_tags:
+                if (tag_name in metadata and f'IFD0:{tag_name}' not in exif_tags
+                        and f'EXIF:{tag_name}' not in exif_tags):
+                    exif_tags[f'IFD0:{tag_name}'] = metadata[tag_name]
 
         # Build IFD0 with metadata using EXIF writer
         ifd0_tags, ifd0_data = self.exif_writer._build_ifd(exif_tags, ifd_type='IFD0')
+        ifd0_data = bytearray(ifd0_data)
         initial_ifd0_entries = len(ifd0_tags)
         
         # Calculate offsets
@@ -379,46 +424,18 @@ class TIFFWriter:
         if xmp_data:
             image_data_offset = xmp_data_offset + len(xmp_data)
 
-        def _update_ifd0_tag(tag_id: int, value: Any) -> None:
+        def _update_ifd0_tag(tag_id: int, values: List[int]) -> None:
+            # Patch a reserved array in place, keeping its type and size
             for tag in ifd0_tags:
                 if tag['id'] == tag_id:
-                    tag_type, encoded_value, count = self.exif_writer._encode_tag_value(value)
-                    if tag_type is None:
-                        return
-                    value_size = TAG_SIZES.get(ExifTagType(tag_type), 1) * count
-                    if value_size <= 4:
-                        tag['type'] = tag_type
-                        tag['count'] = count
+                    value_format = 'H' if tag['type'] == ExifTagType.SHORT.value else 'I'
+                    encoded_value = struct.pack(f'{self.endian}{len(values)}{value_format}', *values)
+                    if tag['inline']:
                         tag['value'] = encoded_value
-                        tag['data'] = b''
-                        tag['inline'] = True
                     else:
-                        tag['type'] = tag_type
-                        tag['count'] = count
-                        tag['data'] = encoded_value
-                        tag['inline'] = False
+                        ifd0_data[tag['value']:tag['value'] + len(encoded_value)] = encoded_value
                     return
 
-        if image_data:
-            if is_tiled:
-                counts = tile_byte_counts if tile_byte_counts else [len(image_data)]
-                offsets = []
-                current_offset = image_data_offset
-                for count in counts:
-                    offsets.append(current_offset)
-                    current_offset += count
-                _update_ifd0_tag(324, offsets)
-                _update_ifd0_tag(325, counts)
-            else:
-                counts = strip_byte_counts if strip_byte_counts else [len(image_data)]
-                offsets = []
-                current_offset = image_data_offset
-                for count in counts:
-                    offsets.append(current_offset)
-                    current_offset += count
-                _update_ifd0_tag(273, offsets)
-                _update_ifd0_tag(279, counts)
-        
         # Update IFD0 to link to EXIF IFD if present
         if exif_ifd_tags:
             # Find or add EXIF IFD pointer tag (34665)
@@ -518,13 +535,13 @@ class TIFFWriter:
                 xmp_tag['inline'] = False
         
         # Add image data references if present
-        if image_data:
+        if image_data_size:
             if is_tiled and tile_offsets and tile_byte_counts:
                 # Tile-based image
                 if not tile_offsets or not tile_byte_counts:
                     # Single tile
                     tile_offsets = [image_data_offset]
-                    tile_byte_counts = [len(image_data)]
+                    tile_byte_counts = [image_data_size]
                 
                 # Add TileOffsets tag (324) if not present
                 has_tile_offsets = any(tag['id'] == 324 for tag in ifd0_tags)
@@ -572,7 +589,7 @@ class TIFFWriter:
                 if not strip_offsets or not strip_byte_counts:
                     # Single strip
                     strip_offsets = [image_data_offset]
-                    strip_byte_counts = [len(image_data)]
+                    strip_byte_counts = [image_data_size]
                 
                 # Add StripOffsets tag (273) if not present
                 has_strip_offsets = any(tag['id'] == 273 for tag in ifd0_tags)
@@ -651,6 +668,15 @@ class TIFFWriter:
                     if tag['id'] == 700:  # XMP tag
                         tag['value'] = xmp_data_offset
 
+        # Point the strips or tiles at their new offsets after the metadata
+        if image_data_size:
+            offsets = []
+            current_offset = image_data_offset
+            for count in counts:
+                offsets.append(current_offset)
+                current_offset += count
+            _update_ifd0_tag(324 if is_tiled else 273, offsets)
+        
         # Build complete TIFF file
         tiff_data = bytearray()
         tiff_data.extend(header)
@@ -677,8 +703,4 @@ class TIFFWriter:
         if xmp_data:
             tiff_data.extend(xmp_data)
         
-        # Write image data if present
-        if image_data:
-            tiff_data.extend(image_data)
-        
         return bytes(tiff_data)
@@ -12,7 +12,708 @@ This module provides standard value formatting for all EXIF tags.
 Copyright 2025 DNAi inc.
 """
 
-from typing import Any, Optional, Dict
+import math
+import re
+from functools import lru_cache
+from typing import Any, Optional, Dict, Tuple
+
+# Date/time values misread as space-separated byte codes (e.g., "50 48 48 57")
+_BYTE_CODES_PATTERN = re.compile(r'(?:\d{1,3}\s+)*\d{1,3}')
+# EXIF date/time string (YYYY:MM:DD HH:MM:SS)
+_EXIF_DATE_PATTERN = re.compile(r'^\d{4}:\d{2}:\d{2} \d{2}:\d{2}:\d{2}$')
+# First number in a legacy duration string (e.g., "1.50 s")
+_NUMBER_PATTERN = re.compile(r'([\d.]+)')
+
+# Returned by tag formatters that do not handle the value's type, so that
+# formatting falls through to the generic handling
+_NO_MATCH = object()
+
+# Context keys consulted by the formatters; only these take part in the
+# result cache key
+_CONTEXT_KEYS = ('Make', 'FileType', 'FocalPlaneYResolution', 'EXIF:DateTime', 'EXIF:CreateDate')
+_ABSENT_CONTEXT = (_NO_MATCH,) * len(_CONTEXT_KEYS)
+
+# Maximum number of cached formatting results, and the longest str/bytes
+# value that is cached (longer values are typically one-off binary blobs)
+FORMAT_CACHE_SIZE = 4096
+MAX_CACHED_VALUE_LENGTH = 256
+
+_COMPRESSION_MAP = {
+    1: 'Uncompressed',
+    2: 'CCITT 1D',
+    3: 'Group 3 Fax',
+    4: 'Group 4 Fax',
+    5: 'LZW',
+    6: 'JPEG (old-style)',
+    7: 'JPEG',
+    8: 'Deflate',
+    99: 'JPEG',
+    32769: 'Packed RAW',  # Epson ERF format
+    32770: 'Samsung SRW Compressed',  # Samsung SRW format
+    32773: 'PackBits',
+    32946: 'Deflate',
+    34712: 'JPEG2000',
+    34713: 'Nikon NEF Compressed',
+    65535: 'Pentax PEF Compressed',
+}
+
+_PHOTOMETRIC_MAP = {
+    0: 'WhiteIsZero',
+    1: 'BlackIsZero',
+    2: 'RGB',
+    3: 'RGB Palette',
+    4: 'Transparency Mask',
+    5: 'CMYK',
+    6: 'YCbCr',
+    8: 'CIELab',
+    9: 'ICCLab',
+    10: 'ITULab',
+    32803: 'Color Filter Array',
+    32892: 'Pixar LogL',
+    32893: 'Pixar LogLuv',
+    34892: 'Linear Raw',
+}
+
+_ORIENTATION_MAP = {
+    1: 'Horizontal (normal)',
+    2: 'Mirror horizontal',
+    3: 'Rotate 180',
+    4: 'Mirror vertical',
+    5: 'Mirror horizontal and rotate 270 CW',
+    6: 'Rotate 90 CW',
+    7: 'Mirror horizontal and rotate 90 CW',
+    8: 'Rotate 270 CW',
+}
+
+_RESOLUTION_UNIT_MAP = {
+    1: 'None',
+    2: 'inches',
+    3: 'cm',
+}
+
+_YCBCR_MAP = {
+    1: 'Centered',
+    2: 'Co-sited',
+}
+
+_PLANAR_MAP = {
+    1: 'Chunky',
+    2: 'Planar',
+}
+
+_EXPOSURE_PROGRAM_MAP = {
+    0: 'Not Defined',
+    1: 'Manual',
+    2: 'Program AE',
+    3: 'Aperture-priority AE',
+    4: 'Shutter speed priority AE',
+    5: 'Creative (Slow speed)',
+    6: 'Action (High speed)',
+    7: 'Portrait',
+    8: 'Landscape',
+}
+
+_METERING_MAP = {
+    0: 'Unknown',
+    1: 'Average',
+    2: 'Center-weighted average',
+    3: 'Spot',
+    4: 'Multi-spot',
+    5: 'Multi-segment',
+    6: 'Partial',
+    255: 'Other',
+}
+
+_LIGHT_SOURCE_MAP = {
+    0: 'Unknown',
+    1: 'Daylight',
+    2: 'Fluorescent',
+    3: 'Tungsten (Incandescent)',
+    4: 'Flash',
+    9: 'Fine Weather',
+    10: 'Cloudy',
+    11: 'Shade',
+    12: 'Daylight Fluorescent',
+    13: 'Day White Fluorescent',
+    14: 'Cool White Fluorescent',
+    15: 'White Fluorescent',
+    16: 'Warm White Fluorescent',
+    17: 'Standard Light A',
+    18: 'Standard Light B',
+    19: 'Standard Light C',
+    20: 'D55',
+    21: 'D65',
+    22: 'D75',
+    23: 'D50',
+    24: 'ISO Studio Tungsten',
+    255: 'Other',
+}
+
+_EXPOSURE_MODE_MAP = {
+    0: 'Auto',
+    1: 'Manual',
+    2: 'Auto bracket',
+}
+
+_WHITE_BALANCE_MAP = {
+    0: 'Auto',
+    1: 'Manual',
+}
+
+_SCENE_CAPTURE_MAP = {
+    0: 'Standard',
+    1: 'Landscape',
+    2: 'Portrait',
+    3: 'Night',
+}
+
+_SATURATION_MAP = {
+    0: 'Normal',
+    1: 'Low',
+    2: 'High',
+}
+
+_CONTRAST_MAP = {
+    0: 'Normal',
+    1: 'Soft',
+    2: 'High',  # Standard format uses "High" instead of "Hard" for Contrast=2
+}
+
+_SHARPNESS_MAP = {
+    0: 'Normal',
+    1: 'Soft',
+    2: 'Hard',
+}
+
+_CUSTOM_RENDERED_MAP = {
+    0: 'Normal',
+    1: 'Custom',
+}
+
+_GAIN_CONTROL_MAP = {
+    0: 'None',
+    1: 'Low gain up',
+    2: 'High gain up',
+    3: 'Low gain down',
+    4: 'High gain down',
+}
+
+_DISTANCE_RANGE_MAP = {
+    0: 'Unknown',
+    1: 'Macro',
+    2: 'Close',
+    3: 'Distant',
+}
+
+_EXTRA_SAMPLES_MAP = {
+    0: 'Unspecified',
+    1: 'Associated Alpha',
+    2: 'Unassociated Alpha',
+}
+
+_PREDICTOR_MAP = {
+    1: 'None',
+    2: 'Horizontal differencing',
+}
+
+_COLOR_SPACE_MAP = {
+    0: 'Unknown (0)',
+    1: 'sRGB',
+    65535: 'Uncalibrated',
+}
+
+_SENSING_METHOD_MAP = {
+    1: 'Not defined',
+    2: 'One-chip color area',
+    3: 'Two-chip color area',
+    4: 'Three-chip color area',
+    5: 'Color sequential area',
+    7: 'Trilinear',
+    8: 'Color sequential linear',
+}
+
+_ALTITUDE_REF_MAP = {
+    0: 'Above sea level',
+    1: 'Below sea level',
+    2: 'Above WGS84 ellipsoid',  # EXIF 3.0
+    3: 'Below WGS84 ellipsoid',  # EXIF 3.0
+}
+
+_SUBFILE_TYPE_MAP = {
+    0: 'Full-resolution image',
+    1: 'Reduced-resolution image',
+    2: 'Single page of multi-page image',
+    3: 'Single page of multi-page reduced-resolution image',
+}
+
+_FILL_ORDER_MAP = {
+    1: 'Normal',
+    2: 'Reversed',
+}
+
+
+def _enum_formatter(value_map: Dict[int, str]):
+    """
+    Build a formatter for a tag whose integer values map to names.
+
+    Args:
+        value_map: Mapping of integer value to display name
+
+    Returns:
+        Formatter returning the mapped name (or the number itself for unknown
+        values), falling through for non-integer values
+    """
+    def formatter(tag_name, tag_key, value, context, make, file_type):
+        if isinstance(value, int):
+            return value_map.get(value, str(value))
+        return _NO_MATCH
+    return formatter
+
+
+# Compression
+def _format_compression(tag_name, tag_key, value, context, make, file_type):
+    # Check for Sony ARW compression
+    if isinstance(value, int):
+        # Sony ARW uses compression 6, but it's called "Sony ARW Compressed"
+        if value == 6 and (make == 'SONY' or file_type == 'ARW'):
+            return 'Sony ARW Compressed'
+        return _COMPRESSION_MAP.get(value, str(value))
+    return _NO_MATCH
+
+
+# ResolutionUnit and FocalPlaneResolutionUnit - use same enum mapping
+def _format_resolution_unit(tag_name, tag_key, value, context, make, file_type):
+    # Handle RATIONAL type (some files store as RATIONAL instead of SHORT)
+    if isinstance(value, tuple) and len(value) == 2:
+        # Convert RATIONAL (numerator, denominator) to integer
+        num, den = value
+        if den != 0:
+            ratio = num / den
+            int_value = int(round(ratio))
+            # If value is > 10, it's invalid for FocalPlaneResolutionUnit (should be 1, 2, or 3)
+            # This often happens when the tag is misread or stored incorrectly
+            # Default to 2 (inches) which is the most common value
+            if tag_key == 'FocalPlaneResolutionUnit' and int_value > 10:
+                # Check if context has FocalPlaneYResolution to see if this is a misread
+                if context:
+                    focal_y = context.get('FocalPlaneYResolution')
+                    if focal_y:
+                        # If the ratio is close to FocalPlaneYResolution, it's definitely wrong
+                        # Default to 2 (inches) as that's the most common value
+                        return 'inches'
+                # Default to 2 (inches) for invalid values
+                return 'inches'
+            return _RESOLUTION_UNIT_MAP.get(int_value, str(int_value))
+    if isinstance(value, int):
+        return _RESOLUTION_UNIT_MAP.get(value, str(value))
+    return _NO_MATCH
+
+
+# Flash
+def _format_flash(tag_name, tag_key, value, context, make, file_type):
+    if isinstance(value, int):
+        # Flash value 0 means no flash present
+        if value == 0:
+            return 'No Flash'
+
+        # Flash value 32 (0x20) with no other bits means "No flash function"
+        # This indicates the camera doesn't have a flash, not just that it didn't fire
+        if value == 32:
+            return 'No flash function'
+
+        fired = bool(value & 0x01)
+        return_type = (value >> 1) & 0x03
+        mode = (value >> 3) & 0x03
+        red_eye = bool(value & 0x20)
+
+        parts = []
+        if not fired:
+            parts.append('Off, Did not fire')
+        else:
+            parts.append('On, Fired')
+            if return_type == 2:
+                parts.append('Return not detected')
+            elif return_type == 3:
+                parts.append('Return detected')
+            if red_eye:
+                parts.append('Red-eye reduction')
+        return ' | '.join(parts) if parts else str(value)
+    return _NO_MATCH
+
+
+# ExposureMode
+def _format_exposure_mode(tag_name, tag_key, value, context, make, file_type):
+    if isinstance(value, int):
+        # If value is not in map, show as "Unknown (value)" to standard format
+        if value not in _EXPOSURE_MODE_MAP:
+            return f'Unknown ({value})'
+        return _EXPOSURE_MODE_MAP.get(value, str(value))
+    return _NO_MATCH
+
+
+# Saturation
+def _format_saturation(tag_name, tag_key, value, context, make, file_type):
+    # Handle both int and bytes (single byte)
+    if isinstance(value, int):
+        return _SATURATION_MAP.get(value, str(value))
+    elif isinstance(value, bytes) and len(value) >= 1:
+        byte_val = value[0]
+        return _SATURATION_MAP.get(byte_val, str(byte_val))
+    return _NO_MATCH
+
+
+# Contrast
+def _format_contrast(tag_name, tag_key, value, context, make, file_type):
+    # Handle both int and bytes (single byte)
+    if isinstance(value, int):
+        return _CONTRAST_MAP.get(value, str(value))
+    elif isinstance(value, bytes) and len(value) >= 1:
+        byte_val = value[0]
+        return _CONTRAST_MAP.get(byte_val, str(byte_val))
+    return _NO_MATCH
+
+
+# Sharpness
+def _format_sharpness(tag_name, tag_key, value, context, make, file_type):
+    # Handle both int and bytes (single byte)
+    if isinstance(value, int):
+        return _SHARPNESS_MAP.get(value, str(value))
+    elif isinstance(value, bytes) and len(value) >= 1:
+        byte_val = value[0]
+        return _SHARPNESS_MAP.get(byte_val, str(byte_val))
+    return _NO_MATCH
+
+
+# SubjectDistance - format as distance with unit
+def _format_subject_distance(tag_name, tag_key, value, context, make, file_type):
+    # Handle RATIONAL tuple
+    if isinstance(value, tuple) and len(value) == 2:
+        num, den = value
+        if den != 0:
+            result = num / den
+            # If result is 0, show as "0 m" (standard format)
+            if result == 0:
+                return "0 m"
+            # For non-zero values, format with unit
+            if result < 1:
+                # Very close distances - show in meters with precision
+                return f"{result:.2f} m"
+            elif result < 1000:
+                # Distances < 1km - show in meters
+                if result == int(result):
+                    return f"{int(result)} m"
+                return f"{result:.1f} m"
+            else:
+                # Distances >= 1km - show in km
+                km = result / 1000.0
+                if km == int(km):
+                    return f"{int(km)} km"
+                return f"{km:.2f} km"
+    # Handle string like "0 1"
+    if isinstance(value, str) and ' ' in value:
+        try:
+            parts = value.split()
+            if len(parts) == 2:
+                num, den = int(parts[0]), int(parts[1])
+                if den != 0:
+                    result = num / den
+                    if result == 0:
+                        return "0 m"
+                    return f"{result} m"
+        except:
+            pass
+    return str(value)
+
+
+# ExtraSamples
+def _format_extra_samples(tag_name, tag_key, value, context, make, file_type):
+    if isinstance(value, int):
+        return _EXTRA_SAMPLES_MAP.get(value, str(value))
+    elif isinstance(value, list) and len(value) > 0:
+        # If it's a list, format the first value
+        first_val = value[0] if isinstance(value[0], int) else int(value[0])
+        return _EXTRA_SAMPLES_MAP.get(first_val, str(first_val))
+    return _NO_MATCH
+
+
+# Tag-specific formatters tried before the generic value-type handling
+_TAG_FORMATTERS = {
+    'Compression': _format_compression,
+    'PhotometricInterpretation': _enum_formatter(_PHOTOMETRIC_MAP),
+    'Orientation': _enum_formatter(_ORIENTATION_MAP),
+    'ResolutionUnit': _format_resolution_unit,
+    'FocalPlaneResolutionUnit': _format_resolution_unit,
+    'YCbCrPositioning': _enum_formatter(_YCBCR_MAP),
+    'PlanarConfiguration': _enum_formatter(_PLANAR_MAP),
+    'ExposureProgram': _enum_formatter(_EXPOSURE_PROGRAM_MAP),
+    'MeteringMode': _enum_formatter(_METERING_MAP),
+    'Flash': _format_flash,
+    'LightSource': _enum_formatter(_LIGHT_SOURCE_MAP),
+    'ExposureMode': _format_exposure_mode,
+    'WhiteBalance': _enum_formatter(_WHITE_BALANCE_MAP),
+    'SceneCaptureType': _enum_formatter(_SCENE_CAPTURE_MAP),
+    'Saturation': _format_saturation,
+    'Contrast': _format_contrast,
+    'Sharpness': _format_sharpness,
+    'CustomRendered': _enum_formatter(_CUSTOM_RENDERED_MAP),
+    'GainControl': _enum_formatter(_GAIN_CONTROL_MAP),
+    'SubjectDistance': _format_subject_distance,
+    'SubjectDistanceRange': _enum_formatter(_DISTANCE_RANGE_MAP),
+    'ExtraSamples': _format_extra_samples,
+    'Predictor': _enum_formatter(_PREDICTOR_MAP),
+}
+
+
+# ColorSpace
+def _format_color_space(tag_name, tag_key, value, context, make, file_type):
+    if isinstance(value, int):
+        return _COLOR_SPACE_MAP.get(value, str(value))
+    # Handle string "0" or tuple/list formats
+    if isinstance(value, str) and value.isdigit():
+        int_val = int(value)
+        return _COLOR_SPACE_MAP.get(int_val, str(value))
+    if isinstance(value, (tuple, list)) and len(value) > 0:
+        int_val = int(value[0]) if isinstance(value[0], (int, str)) else 0
+        return _COLOR_SPACE_MAP.get(int_val, str(value))
+    return _NO_MATCH
+
+
+# InteroperabilityIndex
+def _format_interoperability_index(tag_name, tag_key, value, context, make, file_type):
+    if isinstance(value, str) and value.startswith('R98'):
+        return 'R98 - DCF basic file (sRGB)'
+    return str(value)
+
+
+# DigitalZoomRatio - show as integer if whole number
+def _format_digital_zoom_ratio(tag_name, tag_key, value, context, make, file_type):
+    if isinstance(value, (int, float)):
+        if value == int(value):
+            return str(int(value))
+        return str(value)
+    elif isinstance(value, tuple) and len(value) == 2:
+        # Rational value
+        num, den = value
+        if den != 0:
+            result = num / den
+            if result == int(result):
+                return str(int(result))
+            return str(result)
+    elif isinstance(value, str) and ' ' in value:
+        # Handle string format like "10 10" (rational as string)
+        try:
+            parts = value.split()
+            if len(parts) == 2:
+                num, den = int(parts[0]), int(parts[1])
+                if den != 0:
+                    result = num / den
+                    if result == int(result):
+                        return str(int(result))
+                    return str(result)
+        except (ValueError, TypeError):
+            pass
+    elif isinstance(value, (list, tuple)) and len(value) == 2:
+        # Handle list/tuple format like [0, 100] or (0, 100)
+        try:
+            num, den = int(value[0]), int(value[1])
+            if den != 0:
+                result = num / den
+                if result == int(result):
+                    return str(int(result))
+                return str(result)
+        except (ValueError, TypeError, IndexError):
+            pass
+    # If we get here and value is a tuple/list, convert to string as fallback
+    # This handles cases where the tuple format isn't recognized
+    if isinstance(value, (tuple, list)) and len(value) == 2:
+        return f"{value[0]} {value[1]}"
+    return _NO_MATCH
+
+
+# GPSAltitudeRef - EXIF 3.0 adds values 2 and 3
+def _format_gps_altitude_ref(tag_name, tag_key, value, context, make, file_type):
+    if isinstance(value, int):
+        return _ALTITUDE_REF_MAP.get(value, str(value))
+    elif isinstance(value, str):
+        try:
+            int_val = int(value)
+            return _ALTITUDE_REF_MAP.get(int_val, str(value))
+        except (ValueError, TypeError):
+            # Handle string values like "Above sea level"
+            value_upper = value.upper()
+            if 'ABOVE' in value_upper and 'SEA' in value_upper:
+                return 'Above sea level'
+            elif 'BELOW' in value_upper and 'SEA' in value_upper:
+                return 'Below sea level'
+            elif 'ABOVE' in value_upper and 'WGS84' in value_upper:
+                return 'Above WGS84 ellipsoid'
+            elif 'BELOW' in value_upper and 'WGS84' in value_upper:
+                return 'Below WGS84 ellipsoid'
+            return str(value)
+    return str(value)
+
+
+# AntiAliasStrength - format as single number (RATIONAL type)
+def _format_anti_alias_strength(tag_name, tag_key, value, context, make, file_type):
+    if isinstance(value, (int, float)):
+        if value == int(value):
+            return str(int(value))
+        return str(value)
+    elif isinstance(value, tuple) and len(value) == 2:
+        # Rational value (num, den)
+        num, den = value
+        if den != 0:
+            result = num / den
+            if result == int(result):
+                return str(int(result))
+            return str(result)
+    elif isinstance(value, (list, tuple)) and len(value) == 2:
+        # Handle list/tuple format like [0, 100] or (0, 100)
+        try:
+            num, den = int(value[0]), int(value[1])
+            if den != 0:
+                result = num / den
+                if result == int(result):
+                    return str(int(result))
+                return str(result)
+        except (ValueError, TypeError, IndexError):
+            pass
+    elif isinstance(value, str) and ' ' in value:
+        # Handle string format like "0 100" (rational as string)
+        try:
+            parts = value.split()
+            if len(parts) == 2:
+                num, den = int(parts[0]), int(parts[1])
+                if den != 0:
+                    result = num / den
+                    if result == int(result):
+                        return str(int(result))
+                    return str(result)
+        except (ValueError, TypeError):
+            pass
+    return _NO_MATCH
+
+
+# FileSize - format with units like standard format
+# Standard format uses decimal (1000) for kB, MB, GB, not binary (1024)
+def _format_file_size(tag_name, tag_key, value, context, make, file_type):
+    if isinstance(value, (int, float)):
+        size_bytes = int(value)
+        if size_bytes < 1000:
+            return f"{size_bytes} bytes"
+        elif size_bytes < 1000 * 1000:
+            size_kb = size_bytes / 1000.0
+            # Standard format shows 1 decimal place for kB values < 10 when not a whole number
+            # Otherwise rounds to nearest integer
+            rounded_kb = round(size_kb)
+            if size_kb < 10 and abs(size_kb - rounded_kb) >= 0.05:
+                return f"{size_kb:.1f} kB"
+            return f"{rounded_kb} kB"
+        elif size_bytes < 2000 * 1000:
+            # standard format prefers kB for values between 1000-2000 kB instead of converting to MB
+            size_kb = size_bytes / 1000.0
+            rounded_kb = round(size_kb)
+            return f"{rounded_kb} kB"
+        elif size_bytes < 1000 * 1000 * 1000:
+            size_mb = size_bytes / (1000.0 * 1000.0)
+            # Standard format shows 1 decimal place for MB values < 10 MB
+            # For values >= 10 MB, Standard rounding to integer when close, otherwise shows 1 decimal
+            # For values >= 50 MB, threshold is ~0.3; for smaller values, threshold is ~0.05
+            # However, for values around 12-13 MB, Standard rounding to integer if within ~0.5
+            # For values around 116 MB, Standard rounding to integer if within ~0.4
+            # Standard rounding up when >= 0.5 (e.g., 16.94 MB rounds to 17 MB)
+            if size_mb < 10:
+                # For values < 10 MB, always show 1 decimal place (e.g., "3.9 MB", "3.8 MB")
+                return f"{size_mb:.1f} MB"
+
+            rounded_mb = round(size_mb)
+            # Use larger threshold for values around 10-15 MB (Standard rounding 12.5 to 12)
+            # Also for values around 20-30 MB (Standard rounding 24.3 to 24)
+            # Also for values around 100-120 MB (Standard rounding 116.4 to 116)
+            # For values around 15-20 MB, use larger threshold (Standard rounding 16.94 to 17)
+            if 10 <= size_mb < 15:
+                threshold = 0.5
+            elif 15 <= size_mb < 20:
+                threshold = 0.1  # Standard rounding 16.94 to 17 MB
+            elif 20 <= size_mb < 30:
+                threshold = 0.4  # Standard rounding 24.3 MB to 24 MB
+            elif 100 <= size_mb < 120:
+                threshold = 0.4
+            elif size_mb >= 50:
+                threshold = 0.3
+            else:
+                threshold = 0.05
+            # Check if we should round to integer (within threshold)
+            if abs(size_mb - rounded_mb) < threshold:
+                return f"{rounded_mb} MB"
+            # Otherwise show 1 decimal place
+            # Standard rounding 16.94 to 17 MB (rounds up when decimal >= 0.5)
+            # But for display with 1 decimal, we show the actual value
+            # However, if the value is very close to an integer (>= 0.5 away), round up
+            decimal_part = size_mb - int(size_mb)
+            if decimal_part >= 0.5:
+                # Round up to next integer for display
+                return f"{int(size_mb) + 1} MB"
+            return f"{size_mb:.1f} MB"
+        else:
+            # For GB values, standard format prefers MB for values < 2000 MB (2 GB)
+            # Convert to MB first to check
+            size_mb = size_bytes / (1000.0 * 1000.0)
+            if size_mb < 2000:
+                # Prefer MB for values < 2 GB
+                rounded_mb = round(size_mb)
+                threshold = 0.5 if size_mb >= 1000 else 0.3
+                if abs(size_mb - rounded_mb) < threshold:
+                    return f"{rounded_mb} MB"
+                return f"{size_mb:.1f} MB"
+            # For >= 2 GB, use GB
+            size_gb = size_bytes / (1000.0 * 1000.0 * 1000.0)
+            rounded_gb = round(size_gb)
+            if abs(size_gb - rounded_gb) < 0.05:
+                return f"{rounded_gb} GB"
+            return f"{size_gb:.1f} GB"
+    return str(value)
+
+
+# FileType - use value from metadata if available
+def _format_file_type(tag_name, tag_key, value, context, make, file_type):
+    # This should come from format detection, not raw value
+    return str(value)
+
+
+# GIF:Duration - format with 2 decimal places and "s" unit
+def _format_gif_duration(tag_name, tag_key, value, context, make, file_type):
+    if 'GIF:' not in tag_name:
+        return _NO_MATCH
+    if isinstance(value, (int, float)):
+        return f"{value:.2f} s"
+    elif isinstance(value, str):
+        # Handle case where value is already a string (legacy format)
+        # Try to extract the number and reformat
+        match = _NUMBER_PATTERN.search(value)
+        if match:
+            try:
+                num_value = float(match.group(1))
+                return f"{num_value:.2f} s"
+            except ValueError:
+                pass
+    return _NO_MATCH
+
+
+# Tag-specific formatters tried after the generic value-type handling
+_FALLBACK_TAG_FORMATTERS = {
+    'ColorSpace': _format_color_space,
+    'InteroperabilityIndex': _format_interoperability_index,
+    'SensingMethod': _enum_formatter(_SENSING_METHOD_MAP),
+    'DigitalZoomRatio': _format_digital_zoom_ratio,
+    'GPSAltitudeRef': _format_gps_altitude_ref,
+    'AntiAliasStrength': _format_anti_alias_strength,
+    'SubfileType': _enum_formatter(_SUBFILE_TYPE_MAP),
+    'FillOrder': _enum_formatter(_FILL_ORDER_MAP),
+    'FileSize': _format_file_size,
+    'FileType': _format_file_type,
+    'Duration': _format_gif_duration,
+}
 
 
 def format_exif_value(tag_name: str, value: Any, context: Optional[Dict[str, Any]] = None) -> str:
@@ -27,6 +728,54 @@ def format_exif_value(tag_name: str, value: Any, context: Optional[Dict[str, Any
     Returns:
         Formatted string value
     """
+    context_key = _format_cache_key(value, context)
+    if context_key is None:
+        return _format_exif_value(tag_name, value, context)
+    try:
+        return _format_exif_value_cached(tag_name, value, context_key)
+    except TypeError:
+        # Unhashable context value; format without caching
+        return _format_exif_value(tag_name, value, context)
+
+
+def _format_cache_key(value: Any, context: Optional[Dict[str, Any]]) -> Optional[Tuple]:
+    """
+    Build the context part of the result cache key.
+
+    Args:
+        value: Raw tag value
+        context: Optional context dictionary
+
+    Returns:
+        Tuple of the relevant context values (_NO_MATCH where absent), or
+        None if the value cannot be cached
+    """
+    value_type = type(value)
+    if value_type is int:
+        pass
+    elif value_type is str or value_type is bytes:
+        if len(value) > MAX_CACHED_VALUE_LENGTH:
+            return None
+    elif value_type is tuple:
+        # Rationals and short integer arrays; floats are excluded because
+        # equal floats (0.0 and -0.0) can format differently
+        if len(value) > MAX_CACHED_VALUE_LENGTH or any(type(v) is not int for v in value):
+            return None
+    else:
+        return None
+    if not context:
+        return ()
+    return tuple(map(context.get, _CONTEXT_KEYS, _ABSENT_CONTEXT))
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _format_exif_value_cached(tag_name: str, value: Any, context_key: Tuple) -> str:
+    context = {key: item for key, item in zip(_CONTEXT_KEYS, context_key) if item is not _NO_MATCH}
+    return _format_exif_value(tag_name, value, context)
+
+
+def _format_exif_value(tag_name: str, value: Any, context: Optional[Dict[str, Any]] = None) -> str:
+    """Format a value without consulting the result cache."""
     if value is None:
         return ""
     
@@ -38,7 +787,6 @@ def format_exif_value(tag_name: str, value: Any, context: Optional[Dict[str, Any
     # This affects DateTimeOriginal / CreateDate / ModifyDate, especially in
     # some RAW/DNG files where the underlying tag was mis-typed.
     if tag_key in ('DateTimeOriginal', 'CreateDate', 'ModifyDate', 'DateTimeDigitized'):
-        import re
         file_type_ctx = (context or {}).get('FileType', '')
         exif_datetime_ctx = (context or {}).get('EXIF:DateTime')
         exif_createdate_ctx = (context or {}).get('EXIF:CreateDate')
@@ -74,7 +822,7 @@ def format_exif_value(tag_name: str, value: Any, context: Optional[Dict[str, Any
             if decoded:
                 return _normalize_decoded_date(decoded)
         # String of space-separated byte codes → ASCII string
-        if isinstance(value, str) and re.fullmatch(r'(?:\d{1,3}\s+)*\d{1,3}', value.strip() or ''):
+        if isinstance(value, str) and _BYTE_CODES_PATTERN.fullmatch(value.strip() or ''):
             try:
                 codes = [int(p) for p in value.strip().split()]
                 if codes and all(0 <= c <= 255 for c in codes):
@@ -90,9 +838,8 @@ def format_exif_value(tag_name: str, value: Any, context: Optional[Dict[str, Any
     # Some cameras (like Panasonic RW2) may store tag 0x9004 as a date instead of CompressedBitsPerPixel
     # In this case, we should check if tag 0x9102 exists, or suppress this value
     if tag_key == 'CompressedBitsPerPixel' and isinstance(value, str):
-        import re
         # Check if it's a date string
-        if re.match(r'^\d{4}:\d{2}:\d{2} \d{2}:\d{2}:\d{2}$', value):
+        if _EXIF_DATE_PATTERN.match(value):
             # It's a date string - this indicates tag 0x9004 is being used as a date tag, not CompressedBitsPerPixel
             # For RW2 and similar formats, tag 0x9102 might be the actual CompressedBitsPerPixel
             # Since we can't know the correct value from a date string, return empty string
@@ -104,377 +851,12 @@ def format_exif_value(tag_name: str, value: Any, context: Optional[Dict[str, Any
     make = context.get('Make', '').upper() if context else ''
     file_type = context.get('FileType', '').upper() if context else ''
     
-    # Compression
-    if tag_key == 'Compression':
-        compression_map = {
-            1: 'Uncompressed',
-            2: 'CCITT 1D',
-            3: 'Group 3 Fax',
-            4: 'Group 4 Fax',
-            5: 'LZW',
-            6: 'JPEG (old-style)',
-            7: 'JPEG',
-            8: 'Deflate',
-            99: 'JPEG',
-            32769: 'Packed RAW',  # Epson ERF format
-            32770: 'Samsung SRW Compressed',  # Samsung SRW format
-            32773: 'PackBits',
-            32946: 'Deflate',
-            34712: 'JPEG2000',
-            34713: 'Nikon NEF Compressed',
-            65535: 'Pentax PEF Compressed',
-        }
-        # Check for Sony ARW compression
-        if isinstance(value, int):
-            # Sony ARW uses compression 6, but it's called "Sony ARW Compressed"
-            if value == 6 and (make == 'SONY' or file_type == 'ARW'):
-                return 'Sony ARW Compressed'
-            return compression_map.get(value, str(value))
-    
-    # PhotometricInterpretation
-    if tag_key == 'PhotometricInterpretation':
-        photometric_map = {
-            0: 'WhiteIsZero',
-            1: 'BlackIsZero',
-            2: 'RGB',
-            3: 'RGB Palette',
-            4: 'Transparency Mask',
-            5: 'CMYK',
-            6: 'YCbCr',
-            8: 'CIELab',
-            9: 'ICCLab',
-            10: 'ITULab',
-            32803: 'Color Filter Array',
-            32892: 'Pixar LogL',
-            32893: 'Pixar LogLuv',
-            34892: 'Linear Raw',
-        }
-        if isinstance(value, int):
-            return photometric_map.get(value, str(value))
-    
-    # Orientation
-    if tag_key == 'Orientation':
-        orientation_map = {
-            1: 'Horizontal (normal)',
-            2: 'Mirror horizontal',
-            3: 'Rotate 180',
-            4: 'Mirror vertical',
-            5: 'Mirror horizontal and rotate 270 CW',
-            6: 'Rotate 90 CW',
-            7: 'Mirror horizontal and rotate 90 CW',
-            8: 'Rotate 270 CW',
-        }
-        if isinstance(value, int):
-            return orientation_map.get(value, str(value))
-    
-    # ResolutionUnit and FocalPlaneResolutionUnit - use same enum mapping
-    if tag_key in ('ResolutionUnit', 'FocalPlaneResolutionUnit'):
-        resolution_unit_map = {
-            1: 'None',
-            2: 'inches',
-            3: 'cm',
-        }
-        # Handle RATIONAL type (some files store as RATIONAL instead of SHORT)
-        if isinstance(value, tuple) and len(value) == 2:
-            # Convert RATIONAL (numerator, denominator) to integer
-            num, den = value
-            if den != 0:
-                ratio = num / den
-                int_value = int(round(ratio))
-                # If value is > 10, it's invalid for FocalPlaneResolutionUnit (should be 1, 2, or 3)
-                # This often happens when the tag is misread or stored incorrectly
-                # Default to 2 (inches) which is the most common value
-                if tag_key == 'FocalPlaneResolutionUnit' and int_value > 10:
-                    # Check if context has FocalPlaneYResolution to see if this is a misread
-                    if context:
-                        focal_y = context.get('FocalPlaneYResolution')
-                        if focal_y:
-                            # If the ratio is close to FocalPlaneYResolution, it's definitely wrong
-                            # Default to 2 (inches) as that's the most common value
-                            return 'inches'
-                    # Default to 2 (inches) for invalid values
-                    return 'inches'
-                return resolution_unit_map.get(int_value, str(int_value))
-        if isinstance(value, int):
-            return resolution_unit_map.get(value, str(value))
-    
-    # YCbCrPositioning
-    if tag_key == 'YCbCrPositioning':
-        ycbcr_map = {
-            1: 'Centered',
-            2: 'Co-sited',
-        }
-        if isinstance(value, int):
-            return ycbcr_map.get(value, str(value))
-    
-    # PlanarConfiguration
-    if tag_key == 'PlanarConfiguration':
-        planar_map = {
-            1: 'Chunky',
-            2: 'Planar',
-        }
-        if isinstance(value, int):
-            return planar_map.get(value, str(value))
-    
-    # ExposureProgram
-    if tag_key == 'ExposureProgram':
-        exposure_program_map = {
-            0: 'Not Defined',
-            1: 'Manual',
-            2: 'Program AE',
-            3: 'Aperture-priority AE',
-            4: 'Shutter speed priority AE',
-            5: 'Creative (Slow speed)',
-            6: 'Action (High speed)',
-            7: 'Portrait',
-            8: 'Landscape',
-        }
-        if isinstance(value, int):
-            return exposure_program_map.get(value, str(value))
-    
-    # MeteringMode
-    if tag_key == 'MeteringMode':
-        metering_map = {
-            0: 'Unknown',
-            1: 'Average',
-            2: 'Center-weighted average',
-            3: 'Spot',
-            4: 'Multi-spot',
-            5: 'Multi-segment',
-            6: 'Partial',
-            255: 'Other',
-        }
-        if isinstance(value, int):
-            return metering_map.get(value, str(value))
-    
-    # Flash
-    if tag_key == 'Flash':
-        if isinstance(value, int):
-            # Flash value 0 means no flash present
-            if value == 0:
-                return 'No Flash'
-            
-            # Flash value 32 (0x20) with no other bits means "No flash function"
-            # This indicates the camera doesn't have a flash, not just that it didn't fire
-            if value == 32:
-                return 'No flash function'
-            
-            fired = bool(value & 0x01)
-            return_type = (value >> 1) & 0x03
-            mode = (value >> 3) & 0x03
-            red_eye = bool(value & 0x20)
-            
-            parts = []
-            if not fired:
-                parts.append('Off, Did not fire')
-            else:
-                parts.append('On, Fired')
-                if return_type == 2:
-                    parts.append('Return not detected')
-                elif return_type == 3:
-                    parts.append('Return detected')
-                if red_eye:
-                    parts.append('Red-eye reduction')
-            return ' | '.join(parts) if parts else str(value)
-    
-    # LightSource
-    if tag_key == 'LightSource':
-        light_source_map = {
-            0: 'Unknown',
-            1: 'Daylight',
-            2: 'Fluorescent',
-            3: 'Tungsten (Incandescent)',
-            4: 'Flash',
-            9: 'Fine Weather',
-            10: 'Cloudy',
-            11: 'Shade',
-            12: 'Daylight Fluorescent',
-            13: 'Day White Fluorescent',
-            14: 'Cool White Fluorescent',
-            15: 'White Fluorescent',
-            16: 'Warm White Fluorescent',
-            17: 'Standard Light A',
-            18: 'Standard Light B',
-            19: 'Standard Light C',
-            20: 'D55',
-            21: 'D65',
-            22: 'D75',
-            23: 'D50',
-            24: 'ISO Studio Tungsten',
-            255: 'Other',
-        }
-        if isinstance(value, int):
-            return light_source_map.get(value, str(value))
-    
-    # ExposureMode
-    if tag_key == 'ExposureMode':
-        exposure_mode_map = {
-            0: 'Auto',
-            1: 'Manual',
-            2: 'Auto bracket',
-        }
-        if isinstance(value, int):
-            # If value is not in map, show as "Unknown (value)" to standard format
-            if value not in exposure_mode_map:
-                return f'Unknown ({value})'
-            return exposure_mode_map.get(value, str(value))
-    
-    # WhiteBalance
-    if tag_key == 'WhiteBalance':
-        white_balance_map = {
-            0: 'Auto',
-            1: 'Manual',
-        }
-        if isinstance(value, int):
-            return white_balance_map.get(value, str(value))
-    
-    # SceneCaptureType
-    if tag_key == 'SceneCaptureType':
-        scene_capture_map = {
-            0: 'Standard',
-            1: 'Landscape',
-            2: 'Portrait',
-            3: 'Night',
-        }
-        if isinstance(value, int):
-            return scene_capture_map.get(value, str(value))
-    
-    # Saturation
-    if tag_key == 'Saturation':
-        saturation_map = {
-            0: 'Normal',
-            1: 'Low',
-            2: 'High',
-        }
-        # Handle both int and bytes (single byte)
-        if isinstance(value, int):
-            return saturation_map.get(value, str(value))
-        elif isinstance(value, bytes) and len(value) >= 1:
-            byte_val = value[0]
-            return saturation_map.get(byte_val, str(byte_val))
-    
-    # Contrast
-    if tag_key == 'Contrast':
-        contrast_map = {
-            0: 'Normal',
-            1: 'Soft',
-            2: 'High',  # Standard format uses "High" instead of "Hard" for Contrast=2
-        }
-        # Handle both int and bytes (single byte)
-        if isinstance(value, int):
-            return contrast_map.get(value, str(value))
-        elif isinstance(value, bytes) and len(value) >= 1:
-            byte_val = value[0]
-            return contrast_map.get(byte_val, str(byte_val))
-    
-    # Sharpness
-    if tag_key == 'Sharpness':
-        sharpness_map = {
-            0: 'Normal',
-            1: 'Soft',
-            2: 'Hard',
-        }
-        # Handle both int and bytes (single byte)
-        if isinstance(value, int):
-            return sharpness_map.get(value, str(value))
-        elif isinstance(value, bytes) and len(value) >= 1:
-            byte_val = value[0]
-            return sharpness_map.get(byte_val, str(byte_val))
-    
-    # CustomRendered
-    if tag_key == 'CustomRendered':
-        custom_rendered_map = {
-            0: 'Normal',
-            1: 'Custom',
-        }
-        if isinstance(value, int):
-            return custom_rendered_map.get(value, str(value))
-    
-    # GainControl
-    if tag_key == 'GainControl':
-        gain_control_map = {
-            0: 'None',
-            1: 'Low gain up',
-            2: 'High gain up',
-            3: 'Low gain down',
-            4: 'High gain down',
-        }
-        if isinstance(value, int):
-            return gain_control_map.get(value, str(value))
-    
-    # SubjectDistance - format as distance with unit
-    if tag_key == 'SubjectDistance':
-        # Handle RATIONAL tuple
-        if isinstance(value, tuple) and len(value) == 2:
-            num, den = value
-            if den != 0:
-                result = num / den
-                # If result is 0, show as "0 m" (standard format)
-                if result == 0:
-                    return "0 m"
-                # For non-zero values, format with unit
-                if result < 1:
-                    # Very close distances - show in meters with precision
-                    return f"{result:.2f} m"
-                elif result < 1000:
-                    # Distances < 1km - show in meters
-                    if result == int(result):
-                        return f"{int(result)} m"
-                    return f"{result:.1f} m"
-                else:
-                    # Distances >= 1km - show in km
-                    km = result / 1000.0
-                    if km == int(km):
-                        return f"{int(km)} km"
-                    return f"{km:.2f} km"
-        # Handle string like "0 1"
-        if isinstance(value, str) and ' ' in value:
-            try:
-                parts = value.split()
-                if len(parts) == 2:
-                    num, den = int(parts[0]), int(parts[1])
-                    if den != 0:
-                        result = num / den
-                        if result == 0:
-                            return "0 m"
-                        return f"{result} m"
-            except:
-                pass
-        return str(value)
-    
-    # SubjectDistanceRange
-    if tag_key == 'SubjectDistanceRange':
-        distance_range_map = {
-            0: 'Unknown',
-            1: 'Macro',
-            2: 'Close',
-            3: 'Distant',
-        }
-        if isinstance(value, int):
-            return distance_range_map.get(value, str(value))
-    
-    # ExtraSamples
-    if tag_key == 'ExtraSamples':
-        extra_samples_map = {
-            0: 'Unspecified',
-            1: 'Associated Alpha',
-            2: 'Unassociated Alpha',
-        }
-        if isinstance(value, int):
-            return extra_samples_map.get(value, str(value))
-        elif isinstance(value, list) and len(value) > 0:
-            # If it's a list, format the first value
-            first_val = value[0] if isinstance(value[0], int) else int(value[0])
-            return extra_samples_map.get(first_val, str(first_val))
-    
-    # Predictor
-    if tag_key == 'Predictor':
-        predictor_map = {
-            1: 'None',
-            2: 'Horizontal differencing',
-        }
-        if isinstance(value, int):
-            return predictor_map.get(value, str(value))
+    # Tag-specific formatting (enumerations, units, bit flags)
+    formatter = _TAG_FORMATTERS.get(tag_key)
+    if formatter is not None:
+        formatted = formatter(tag_name, tag_key, value, context, make, file_type)
+        if formatted is not _NO_MATCH:
+            return formatted
     
     # Handle list of rationals FIRST (e.g., WhitePoint, PrimaryChromaticities, YCbCrCoefficients)
     # This must come before single rational handling
@@ -646,7 +1028,6 @@ def format_exif_value(tag_name: str, value: Any, context: Optional[Dict[str, Any
             result = num / den
             # ShutterSpeedValue is in APEX: value = log2(1/exposure_time)
             # So: exposure_time = 1 / (2^value)
-            import math
             if result != 0:
                 try:
                     exposure_time = 1.0 / (2 ** result)
@@ -670,7 +1051,6 @@ def format_exif_value(tag_name: str, value: Any, context: Optional[Dict[str, Any
             result = num / den
             # ApertureValue is in APEX: value = log2(f_number^2)
             # So: f_number = sqrt(2^value)
-            import math
             if result != 0:
                 try:
                     f_number = math.sqrt(2 ** result)
@@ -731,7 +1111,6 @@ def format_exif_value(tag_name: str, value: Any, context: Optional[Dict[str, Any
                 result = num / den
                 # MaxApertureValue is in APEX: value = log2(f_number^2)
                 # So: f_number = sqrt(2^value)
-                import math
                 if result != 0:
                     f_number = math.sqrt(2 ** result)
                     # Round to 1 decimal place for f-numbers to standard format
@@ -745,7 +1124,6 @@ def format_exif_value(tag_name: str, value: Any, context: Optional[Dict[str, Any
                     num, den = int(parts[0]), int(parts[1])
                     if den != 0:
                         result = num / den
-                        import math
                         if result != 0:
                             f_number = math.sqrt(2 ** result)
                             return f"{f_number:.1f}"
@@ -779,8 +1157,7 @@ def format_exif_value(tag_name: str, value: Any, context: Optional[Dict[str, Any
     # This is a workaround for files where the tag is incorrectly read as ASCII instead of RATIONAL
     if tag_key == 'CompressedBitsPerPixel' and isinstance(value, str):
         # Check if it's a date string (YYYY:MM:DD HH:MM:SS format)
-        import re
-        if re.match(r'^\d{4}:\d{2}:\d{2} \d{2}:\d{2}:\d{2}$', value):
+        if _EXIF_DATE_PATTERN.match(value):
             # It's a date string - this indicates the tag was misread as ASCII
             # Try to extract a number from the date, or return a placeholder
             # For now, return the date string as-is, but this should be fixed in the parser
@@ -1115,274 +1492,12 @@ def format_exif_value(tag_name: str, value: Any, context: Optional[Dict[str, Any
         else:
             return f"(Binary data {len(value)} bytes, use -b option to extract)"
     
-    # ColorSpace
-    if tag_key == 'ColorSpace':
-        color_space_map = {
-            0: 'Unknown (0)',
-            1: 'sRGB',
-            65535: 'Uncalibrated',
-        }
-        if isinstance(value, int):
-            return color_space_map.get(value, str(value))
-        # Handle string "0" or tuple/list formats
-        if isinstance(value, str) and value.isdigit():
-            int_val = int(value)
-            return color_space_map.get(int_val, str(value))
-        if isinstance(value, (tuple, list)) and len(value) > 0:
-            int_val = int(value[0]) if isinstance(value[0], (int, str)) else 0
-            return color_space_map.get(int_val, str(value))
-    
-    # InteroperabilityIndex
-    if tag_key == 'InteroperabilityIndex':
-        if isinstance(value, str) and value.startswith('R98'):
-            return 'R98 - DCF basic file (sRGB)'
-        return str(value)
-    
-    # SensingMethod
-    if tag_key == 'SensingMethod':
-        sensing_method_map = {
-            1: 'Not defined',
-            2: 'One-chip color area',
-            3: 'Two-chip color area',
-            4: 'Three-chip color area',
-            5: 'Color sequential area',
-            7: 'Trilinear',
-            8: 'Color sequential linear',
-        }
-        if isinstance(value, int):
-            return sensing_method_map.get(value, str(value))
-    
-    # DigitalZoomRatio - show as integer if whole number
-    if tag_key == 'DigitalZoomRatio':
-        if isinstance(value, (int, float)):
-            if value == int(value):
-                return str(int(value))
-            return str(value)
-        elif isinstance(value, tuple) and len(value) == 2:
-            # Rational value
-            num, den = value
-            if den != 0:
-                result = num / den
-                if result == int(result):
-                    return str(int(result))
-                return str(result)
-        elif isinstance(value, str) and ' ' in value:
-            # Handle string format like "10 10" (rational as string)
-            try:
-                parts = value.split()
-                if len(parts) == 2:
-                    num, den = int(parts[0]), int(parts[1])
-                    if den != 0:
-                        result = num / den
-                        if result == int(result):
-                            return str(int(result))
-                        return str(result)
-            except (ValueError, TypeError):
-                pass
-        elif isinstance(value, (list, tuple)) and len(value) == 2:
-            # Handle list/tuple format like [0, 100] or (0, 100)
-            try:
-                num, den = int(value[0]), int(value[1])
-                if den != 0:
-                    result = num / den
-                    if result == int(result):
-                        return str(int(result))
-                    return str(result)
-            except (ValueError, TypeError, IndexError):
-                pass
-        # If we get here and value is a tuple/list, convert to string as fallback
-        # This handles cases where the tuple format isn't recognized
-        if isinstance(value, (tuple, list)) and len(value) == 2:
-            return f"{value[0]} {value[1]}"
-    
-    # GPSAltitudeRef - EXIF 3.0 adds values 2 and 3
-    if tag_key == 'GPSAltitudeRef':
-        altitude_ref_map = {
-            0: 'Above sea level',
-            1: 'Below sea level',
-            2: 'Above WGS84 ellipsoid',  # EXIF 3.0
-            3: 'Below WGS84 ellipsoid',  # EXIF 3.0
-        }
-        if isinstance(value, int):
-            return altitude_ref_map.get(value, str(value))
-        elif isinstance(value, str):
-            try:
-                int_val = int(value)
-                return altitude_ref_map.get(int_val, str(value))
-            except (ValueError, TypeError):
-                # Handle string values like "Above sea level"
-                value_upper = value.upper()
-                if 'ABOVE' in value_upper and 'SEA' in value_upper:
-                    return 'Above sea level'
-                elif 'BELOW' in value_upper and 'SEA' in value_upper:
-                    return 'Below sea level'
-                elif 'ABOVE' in value_upper and 'WGS84' in value_upper:
-                    return 'Above WGS84 ellipsoid'
-                elif 'BELOW' in value_upper and 'WGS84' in value_upper:
-                    return 'Below WGS84 ellipsoid'
-                return str(value)
-        return str(value)
-    
-    # AntiAliasStrength - format as single number (RATIONAL type)
-    if tag_key == 'AntiAliasStrength':
-        if isinstance(value, (int, float)):
-            if value == int(value):
-                return str(int(value))
-            return str(value)
-        elif isinstance(value, tuple) and len(value) == 2:
-            # Rational value (num, den)
-            num, den = value
-            if den != 0:
-                result = num / den
-                if result == int(result):
-                    return str(int(result))
-                return str(result)
-        elif isinstance(value, (list, tuple)) and len(value) == 2:
-            # Handle list/tuple format like [0, 100] or (0, 100)
-            try:
-                num, den = int(value[0]), int(value[1])
-                if den != 0:
-                    result = num / den
-                    if result == int(result):
-                        return str(int(result))
-                    return str(result)
-            except (ValueError, TypeError, IndexError):
-                pass
-        elif isinstance(value, str) and ' ' in value:
-            # Handle string format like "0 100" (rational as string)
-            try:
-                parts = value.split()
-                if len(parts) == 2:
-                    num, den = int(parts[0]), int(parts[1])
-                    if den != 0:
-                        result = num / den
-                        if result == int(result):
-                            return str(int(result))
-                        return str(result)
-            except (ValueError, TypeError):
-                pass
-    
-    # SubfileType
-    if tag_key == 'SubfileType':
-        subfile_type_map = {
-            0: 'Full-resolution image',
-            1: 'Reduced-resolution image',
-            2: 'Single page of multi-page image',
-            3: 'Single page of multi-page reduced-resolution image',
-        }
-        if isinstance(value, int):
-            return subfile_type_map.get(value, str(value))
-    
-    # FillOrder
-    if tag_key == 'FillOrder':
-        fill_order_map = {
-            1: 'Normal',
-            2: 'Reversed',
-        }
-        if isinstance(value, int):
-            return fill_order_map.get(value, str(value))
-    
-    # FileSize - format with units like standard format
-    # Standard format uses decimal (1000) for kB, MB, GB, not binary (1024)
-    if tag_key == 'FileSize':
-        if isinstance(value, (int, float)):
-            size_bytes = int(value)
-            if size_bytes < 1000:
-                return f"{size_bytes} bytes"
-            elif size_bytes < 1000 * 1000:
-                size_kb = size_bytes / 1000.0
-                # Standard format shows 1 decimal place for kB values < 10 when not a whole number
-                # Otherwise rounds to nearest integer
-                rounded_kb = round(size_kb)
-                if size_kb < 10 and abs(size_kb - rounded_kb) >= 0.05:
-                    return f"{size_kb:.1f} kB"
-                return f"{rounded_kb} kB"
-            elif size_bytes < 2000 * 1000:
-                # standard format prefers kB for values between 1000-2000 kB instead of converting to MB
-                size_kb = size_bytes / 1000.0
-                rounded_kb = round(size_kb)
-                return f"{rounded_kb} kB"
-            elif size_bytes < 1000 * 1000 * 1000:
-                size_mb = size_bytes / (1000.0 * 1000.0)
-                # Standard format shows 1 decimal place for MB values < 10 MB
-                # For values >= 10 MB, Standard rounding to integer when close, otherwise shows 1 decimal
-                # For values >= 50 MB, threshold is ~0.3; for smaller values, threshold is ~0.05
-                # However, for values around 12-13 MB, Standard rounding to integer if within ~0.5
-                # For values around 116 MB, Standard rounding to integer if within ~0.4
-                # Standard rounding up when >= 0.5 (e.g., 16.94 MB rounds to 17 MB)
-                if size_mb < 10:
-                    # For values < 10 MB, always show 1 decimal place (e.g., "3.9 MB", "3.8 MB")
-                    return f"{size_mb:.1f} MB"
-                
-                rounded_mb = round(size_mb)
-                # Use larger threshold for values around 10-15 MB (Standard rounding 12.5 to 12)
-                # Also for values around 20-30 MB (Standard rounding 24.3 to 24)
-                # Also for values around 100-120 MB (Standard rounding 116.4 to 116)
-                # For values around 15-20 MB, use larger threshold (Standard rounding 16.94 to 17)
-                if 10 <= size_mb < 15:
-                    threshold = 0.5
-                elif 15 <= size_mb < 20:
-                    threshold = 0.1  # Standard rounding 16.94 to 17 MB
-                elif 20 <= size_mb < 30:
-                    threshold = 0.4  # Standard rounding 24.3 MB to 24 MB
-                elif 100 <= size_mb < 120:
-                    threshold = 0.4
-                elif size_mb >= 50:
-                    threshold = 0.3
-                else:
-                    threshold = 0.05
-                # Check if we should round to integer (within threshold)
-                if abs(size_mb - rounded_mb) < threshold:
-                    return f"{rounded_mb} MB"
-                # Otherwise show 1 decimal place
-                # Standard rounding 16.94 to 17 MB (rounds up when decimal >= 0.5)
-                # But for display with 1 decimal, we show the actual value
-                # However, if the value is very close to an integer (>= 0.5 away), round up
-                decimal_part = size_mb - int(size_mb)
-                if decimal_part >= 0.5:
-                    # Round up to next integer for display
-                    return f"{int(size_mb) + 1} MB"
-                return f"{size_mb:.1f} MB"
-            else:
-                # For GB values, standard format prefers MB for values < 2000 MB (2 GB)
-                # Convert to MB first to check
-                size_mb = size_bytes / (1000.0 * 1000.0)
-                if size_mb < 2000:
-                    # Prefer MB for values < 2 GB
-                    rounded_mb = round(size_mb)
-                    threshold = 0.5 if size_mb >= 1000 else 0.3
-                    if abs(size_mb - rounded_mb) < threshold:
-                        return f"{rounded_mb} MB"
-                    return f"{size_mb:.1f} MB"
-                # For >= 2 GB, use GB
-                size_gb = size_bytes / (1000.0 * 1000.0 * 1000.0)
-                rounded_gb = round(size_gb)
-                if abs(size_gb - rounded_gb) < 0.05:
-                    return f"{rounded_gb} GB"
-                return f"{size_gb:.1f} GB"
-        return str(value)
-    
-    # FileType - use value from metadata if available
-    if tag_key == 'FileType':
-        # This should come from format detection, not raw value
-        return str(value)
-    
-    
-    # GIF:Duration - format with 2 decimal places and "s" unit
-    if tag_key == 'Duration' and 'GIF:' in tag_name:
-        if isinstance(value, (int, float)):
-            return f"{value:.2f} s"
-        elif isinstance(value, str):
-            # Handle case where value is already a string (legacy format)
-            # Try to extract the number and reformat
-            import re
-            match = re.search(r'([\d.]+)', value)
-            if match:
-                try:
-                    num_value = float(match.group(1))
-                    return f"{num_value:.2f} s"
-                except ValueError:
-                    pass
+    # Tag-specific formatting for values not handled by type above
+    formatter = _FALLBACK_TAG_FORMATTERS.get(tag_key)
+    if formatter is not None:
+        formatted = formatter(tag_name, tag_key, value, context, make, file_type)
+        if formatted is not _NO_MATCH:
+            return formatted
     
     # Default: convert to string
     return str(value)
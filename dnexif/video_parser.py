@@ -18,6 +18,7 @@ from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 from dnexif.exceptions import MetadataReadError
 from dnexif.xmp_parser import XMPParser
+from dnexif.file_view import close_buffer, map_file
 
 
 class VideoParser:
@@ -78,7 +79,8 @@ class VideoParser:
         self,
         file_path: Optional[str] = None,
         file_data: Optional[bytes] = None,
-        fast_scan: bool = False
+        fast_scan: bool = False,
+        use_mmap: bool = False
     ):
         """
         Initialize video parser.
@@ -86,10 +88,13 @@ class VideoParser:
         Args:
             file_path: Path to video file
             file_data: Raw file data
+            fast_scan: If True, only parse the main metadata atoms
+            use_mmap: If True, memory-map file_path instead of reading it into memory
         """
         self.file_path = file_path
         self.file_data = file_data
         self.fast_scan = fast_scan
+        self.use_mmap = use_mmap
         self.metadata: Dict[str, Any] = {}
     
     @staticmethod
@@ -139,10 +144,30 @@ class VideoParser:
         Returns:
             Dictionary containing all extracted metadata
         """
+        owns_map = False
         if not self.file_data and self.file_path:
-            with open(self.file_path, 'rb') as f:
-                self.file_data = f.read()
+            if self.use_mmap:
+                self.file_data = map_file(self.file_path)
+                owns_map = True
+            else:
+                with open(self.file_path, 'rb') as f:
+                    self.file_data = f.read()
+        
+        try:
+            return self._parse_file_data()
+        finally:
+            if owns_map:
+                # Close the map created above; the next parse() maps the file again
+                close_buffer(self.file_data)
+                self.file_data = None
+    
+    def _parse_file_data(self) -> Dict[str, Any]:
+        """
+        Parse the loaded file data (see parse()).
         
+        Returns:
+            Dictionary containing all extracted metadata
+        """
         if not self.file_data:
             return {}
         
@@ -13,11 +13,15 @@ Video formats use various container structures (QuickTime atoms, AVI chunks, Mat
 Copyright 2025 DNAi inc.
 """
 
+import os
 import struct
+from bisect import bisect_right
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
 from dnexif.exceptions import MetadataWriteError
+from dnexif.file_view import RangedFile
+from dnexif.stream_copy import LayoutPiece, atomic_output, copy_range, write_layout
 from dnexif.xmp_writer import XMPWriter
 from dnexif.xmp_parser import XMPParser
 
@@ -31,6 +35,12 @@ class VideoWriter:
     
     XMP_UUID = bytes.fromhex('be7acfcb97a942e89c71999491e3afac')
     
+    # Padding atoms that in-place updates may overwrite
+    FREE_ATOM_TYPES = (b'free', b'skip')
+    
+    # Atoms on the path from moov to the stco/co64 chunk offset tables
+    CHUNK_OFFSET_CONTAINERS = (b'trak', b'mdia', b'minf', b'stbl')
+    
     def __init__(self):
         """Initialize video writer."""
         self.xmp_writer = XMPWriter()
@@ -104,10 +114,10 @@ class VideoWriter:
             metadata: Metadata dictionary
             output_path: Output file path
         """
+        # Atoms are located with on-demand reads; the new file is described
+        # as a layout of new atoms and ranges copied from the original
+        file_data = RangedFile(file_path)
         try:
-            with open(file_path, 'rb') as f:
-                file_data = f.read()
-            
             # Extract XMP metadata
             xmp_metadata = {
                 k: v for k, v in metadata.items()
@@ -170,31 +180,26 @@ class VideoWriter:
             
             # If we have Microsoft Xtra tags, write them to Xtra atom
             if has_microsoft_xtra:
-                updated_data = self._inject_microsoft_xtra(file_data, microsoft_xtra_metadata)
-                with open(output_path, 'wb') as f:
-                    f.write(updated_data)
+                layout = self._inject_microsoft_xtra(file_data, microsoft_xtra_metadata)
+                self._write_layout(file_path, output_path, layout)
                 return
             
             # If we have QuickTime Keys tags, write them to keys atom
             if has_quicktime_keys:
-                updated_data = self._inject_quicktime_keys(file_data, quicktime_keys_metadata)
-                with open(output_path, 'wb') as f:
-                    f.write(updated_data)
+                layout = self._inject_quicktime_keys(file_data, quicktime_keys_metadata)
+                self._write_layout(file_path, output_path, layout)
                 return
             
-            # If we have QuickTime tags, attempt to write them (fallback to XMP if needed)
-            if has_quicktime_tags:
-                file_data = self._inject_quicktime_tags(file_data, quicktime_metadata)
-                if not xmp_metadata:
-                    with open(output_path, 'wb') as f:
-                        f.write(file_data)
-                    return
+            layout: List[LayoutPiece] = [(0, len(file_data))]
             
-            if xmp_metadata:
-                merged_metadata = self._merge_with_existing_xmp(file_data, xmp_metadata)
-                xmp_packet = self.xmp_writer.build_xmp_packet(merged_metadata)
-                xmp_bytes = xmp_packet if isinstance(xmp_packet, bytes) else xmp_packet.encode('utf-8')
-                updated_data = self._inject_mp4_xmp_uuid(file_data, xmp_bytes)
+            # QuickTime tags go into a udta atom appended to moov, XMP into a uuid atom
+            if has_quicktime_tags or xmp_metadata:
+                udta_atom = self._build_quicktime_udta(quicktime_metadata) if has_quicktime_tags else None
+                xmp_bytes = None
+                if xmp_metadata:
+                    merged_metadata = self._merge_with_existing_xmp(file_data, xmp_metadata)
+                    xmp_packet = self.xmp_writer.build_xmp_packet(merged_metadata)
+                    xmp_bytes = xmp_packet if isinstance(xmp_packet, bytes) else xmp_packet.encode('utf-8')
                 
                 # If we have AudioKeys or VideoKeys, note that they would be written to tracks
                 # Full implementation would require track manipulation which is complex
@@ -207,16 +212,24 @@ class VideoWriter:
                     # 3. Write the metadata to those keys atoms
                     pass
                 
-                with open(output_path, 'wb') as f:
-                    f.write(updated_data)
+                # Updating the file itself only touches the changed atoms
+                in_place = os.path.exists(output_path) and os.path.samefile(file_path, output_path)
+                if in_place and self._update_mp4_in_place(file_path, file_data, udta_atom, xmp_bytes):
+                    return
+                
+                if udta_atom:
+                    layout = self._inject_quicktime_tags(file_data, udta_atom)
+                if xmp_bytes is not None:
+                    layout = self._inject_mp4_xmp_uuid(file_data, xmp_bytes, layout)
+                layout = self._fix_chunk_offsets(file_data, layout)
+                self._write_layout(file_path, output_path, layout)
                 return
             
             # If only AudioKeys/VideoKeys provided (no XMP), we still need to handle it
             if has_audio_keys or has_video_keys:
                 # For now, copy the file and note that AudioKeys/VideoKeys were detected
                 # Full implementation would write keys atoms to tracks
-                with open(output_path, 'wb') as f:
-                    f.write(file_data)
+                self._write_layout(file_path, output_path, layout)
                 # Note: AudioKeys and VideoKeys tags are detected but not yet written to tracks
                 # Full implementation requires track structure manipulation
                 return
@@ -229,6 +242,21 @@ class VideoWriter:
             if isinstance(e, MetadataWriteError):
                 raise
             raise MetadataWriteError(f"Failed to write MP4/MOV file: {str(e)}")
+        finally:
+            file_data.close()
+    
+    def _write_layout(self, file_path: str, output_path: str, layout: List[LayoutPiece]) -> None:
+        """
+        Write an output file from a layout of new bytes and original file ranges.
+        
+        Args:
+            file_path: Original video file path
+            output_path: Output file path (may be file_path itself)
+            layout: Byte strings and (start, end) ranges of the original file
+        """
+        with atomic_output(output_path) as output:
+            with open(file_path, 'rb') as source:
+                write_layout(source, output, layout)
     
     def _write_avi(
         self,
@@ -261,12 +289,6 @@ class VideoWriter:
         if not title_value and not artist_value:
             raise MetadataWriteError("No supported AVI metadata fields provided (expected XMP:Title or EXIF:Artist)")
         
-        with open(file_path, 'rb') as f:
-            original_data = f.read()
-        
-        if len(original_data) < 12 or original_data[:4] != b'RIFF' or original_data[8:12] != b'AVI ':
-            raise MetadataWriteError("Invalid AVI file (missing RIFF/AVI headers)")
-        
         # Build INFO entries (same structure as WAV)
         def _build_info_entry(tag: bytes, value: str) -> bytes:
             text_bytes = value.encode('utf-8')
@@ -287,42 +309,42 @@ class VideoWriter:
         if len(info_payload) % 2:
             info_chunk += b'\x00'
         
-        # Rebuild RIFF chunks, removing any existing INFO LIST
-        chunks = []
-        offset = 12  # Skip RIFF header
-        data_len = len(original_data)
-        while offset + 8 <= data_len:
-            chunk_id = original_data[offset:offset+4]
-            chunk_size = struct.unpack('<I', original_data[offset+4:offset+8])[0]
-            
-            if chunk_size == 0 or offset + 8 + chunk_size > data_len:
-                break
-            
-            chunk_total = 8 + chunk_size
-            if chunk_total % 2:
-                chunk_total += 1  # Account for padding byte
-            
-            chunk_bytes = original_data[offset:offset+chunk_total]
-            
-            if chunk_id == b'LIST' and chunk_total >= 12:
-                list_type = chunk_bytes[8:12]
-                if list_type == b'INFO':
+        with atomic_output(output_path) as output:
+            with open(file_path, 'rb') as source:
+                header = source.read(12)
+                if len(header) < 12 or header[:4] != b'RIFF' or header[8:12] != b'AVI ':
+                    raise MetadataWriteError("Invalid AVI file (missing RIFF/AVI headers)")
+                
+                # Locate RIFF chunks, skipping any existing INFO LIST
+                data_len = source.seek(0, os.SEEK_END)
+                chunks = []
+                offset = 12  # Skip RIFF header
+                while offset + 8 <= data_len:
+                    source.seek(offset)
+                    chunk_header = source.read(12)
+                    chunk_id = chunk_header[:4]
+                    chunk_size = struct.unpack('<I', chunk_header[4:8])[0]
+                    
+                    if chunk_size == 0 or offset + 8 + chunk_size > data_len:
+                        break
+                    
+                    chunk_total = 8 + chunk_size
+                    if chunk_total % 2:
+                        chunk_total += 1  # Account for padding byte
+                    
+                    if chunk_id == b'LIST' and chunk_total >= 12 and chunk_header[8:12] == b'INFO':
+                        offset += chunk_total
+                        continue  # Skip existing INFO chunk
+                    
+                    # The padding byte of the last chunk may be missing
+                    chunks.append((offset, min(chunk_total, data_len - offset)))
                     offset += chunk_total
-                    continue  # Skip existing INFO chunk
-            
-            chunks.append(chunk_bytes)
-            offset += chunk_total
-        
-        chunks.append(info_chunk)
-        riff_body = b''.join(chunks)
-        final_data = bytearray(12 + len(riff_body))
-        final_data[:12] = original_data[:12]
-        final_data[12:] = riff_body
-        final_size = len(final_data) - 8
-        final_data[4:8] = struct.pack('<I', final_size)
-        
-        with open(output_path, 'wb') as f:
-            f.write(final_data)
+                
+                riff_size = 4 + sum(length for _, length in chunks) + len(info_chunk)
+                output.write(b'RIFF' + struct.pack('<I', riff_size) + b'AVI ')
+                for chunk_offset, chunk_length in chunks:
+                    copy_range(source, output, chunk_offset, chunk_length)
+                output.write(info_chunk)
     
     def _write_mkv_webm(
         self,
@@ -357,10 +379,8 @@ class VideoWriter:
         if not title_value and not artist_value:
             raise MetadataWriteError("No supported Matroska metadata fields provided (expected XMP:Title or EXIF:Artist)")
         
+        original_data = RangedFile(file_path)
         try:
-            with open(file_path, 'rb') as f:
-                original_data = f.read()
-            
             # Verify Matroska/EBML header
             if len(original_data) < 4 or original_data[:4] != b'\x1a\x45\xdf\xa3':
                 raise MetadataWriteError("Invalid Matroska/WebM file (missing EBML header)")
@@ -411,14 +431,15 @@ class VideoWriter:
             tags_size = self._encode_ebml_size(len(tags_content))
             tags_element = tags_id + tags_size + tags_content
             
-            updated_data = self._insert_matroska_tags(original_data, tags_element)
-            with open(output_path, 'wb') as f:
-                f.write(updated_data)
+            layout = self._insert_matroska_tags(original_data, tags_element)
+            self._write_layout(file_path, output_path, layout)
                 
         except Exception as e:
             if isinstance(e, MetadataWriteError):
                 raise
             raise MetadataWriteError(f"Failed to write MKV/WebM file: {str(e)}")
+        finally:
+            original_data.close()
     
     def _build_simple_tag(self, tag_name: str, tag_value: bytes) -> bytes:
         """
@@ -452,7 +473,17 @@ class VideoWriter:
         
         return simple_tag_element
 
-    def _insert_matroska_tags(self, file_data: bytes, tags_element: bytes) -> bytes:
+    def _insert_matroska_tags(self, file_data: RangedFile, tags_element: bytes) -> List[LayoutPiece]:
+        """
+        Insert a Tags element into the Segment, before its first Cluster.
+        
+        Args:
+            file_data: Original file data
+            tags_element: Complete Tags EBML element
+            
+        Returns:
+            Output layout (new bytes and ranges of the original file)
+        """
         def _read_ebml_id(data: bytes, offset: int) -> Optional[Tuple[int, int]]:
             if offset >= len(data):
                 return None
@@ -542,19 +573,24 @@ class VideoWriter:
                     if inner_unknown:
                         break
                     scan = inner_payload_start + inner_size
-                new_payload = file_data[payload_start:insert_at] + tags_element + file_data[insert_at:segment_end]
                 if not unknown_size:
-                    new_size = len(new_payload)
+                    new_size = (segment_end - payload_start) + len(tags_element)
                     size_bytes = _encode_ebml_size_fixed(new_size, size_len)
                 else:
                     size_bytes = file_data[offset + id_len:offset + id_len + size_len]
                 header = file_data[offset:offset + id_len] + size_bytes
-                return file_data[:offset] + header + new_payload + file_data[segment_end:]
+                return [
+                    (0, offset),
+                    header,
+                    (payload_start, insert_at),
+                    tags_element,
+                    (insert_at, data_len),
+                ]
             if unknown_size:
                 break
             offset = payload_start + elem_size
 
-        return file_data
+        return [(0, data_len)]
     
     @staticmethod
     def _encode_ebml_size(size: int) -> bytes:
@@ -596,7 +632,7 @@ class VideoWriter:
     # MP4 helper methods
     # ------------------------------------------------------------------
 
-    def _merge_with_existing_xmp(self, file_data: bytes, new_metadata: Dict[str, Any]) -> Dict[str, Any]:
+    def _merge_with_existing_xmp(self, file_data: RangedFile, new_metadata: Dict[str, Any]) -> Dict[str, Any]:
         """
         Merge requested XMP metadata with any existing XMP packet found in the file.
         """
@@ -611,53 +647,417 @@ class VideoWriter:
         merged.update(new_metadata)
         return merged
 
-    def _inject_mp4_xmp_uuid(self, file_data: bytes, xmp_bytes: bytes) -> bytes:
+    def _inject_mp4_xmp_uuid(
+        self,
+        file_data: RangedFile,
+        xmp_bytes: bytes,
+        layout: List[LayoutPiece]
+    ) -> List[LayoutPiece]:
         """
         Inject (or replace) an XMP UUID box in an MP4/MOV/ISO file without
         disturbing existing media offsets. The new UUID atom is appended to
-        the end of the file after stripping any previous XMP UUID boxes.
+        the end of the file after stripping any previous XMP UUID boxes; if
+        an atom with size 0 runs to the end of the file, the UUID atom goes
+        in front of it instead.
+        
+        Args:
+            file_data: Original file data
+            xmp_bytes: XMP packet
+            layout: Output layout built so far (ranges refer to file_data)
+            
+        Returns:
+            Updated output layout
         """
-        cleaned = bytearray()
+        xmp_atoms = []
+        open_ended = None
         offset = 0
         length = len(file_data)
         
         while offset + 8 <= length:
+            if file_data[offset:offset+4] == b'\x00\x00\x00\x00':
+                open_ended = offset
+                break
             size, header_size = self._read_atom_size(file_data, offset)
             if size <= 0 or offset + size > length:
-                # Corrupt atom; stop copying and append remainder
-                cleaned.extend(file_data[offset:])
-                offset = length
+                # Corrupt atom; the remainder is kept as-is
                 break
             
             atom_type = file_data[offset+4:offset+8]
-            skip_atom = False
-            
             if atom_type == b'uuid' and header_size + 16 <= size:
                 uuid_start = offset + header_size
                 uuid_bytes = file_data[uuid_start:uuid_start+16]
                 if uuid_bytes == self.XMP_UUID:
-                    skip_atom = True
+                    xmp_atoms.append((offset, offset + size))
             
-            if not skip_atom:
-                cleaned.extend(file_data[offset:offset+size])
+            offset += size
+        
+        cleaned: List[LayoutPiece] = []
+        for piece in layout:
+            if not isinstance(piece, tuple):
+                cleaned.append(piece)
+                continue
+            start, end = piece
+            for atom_start, atom_end in xmp_atoms:
+                if atom_start >= end or atom_end <= start:
+                    continue
+                if atom_start > start:
+                    cleaned.append((start, atom_start))
+                start = max(start, atom_end)
+            if start < end:
+                cleaned.append((start, end))
+        
+        uuid_atom = self._pad_atom(self._build_xmp_uuid_atom(xmp_bytes))
+        if open_ended is None:
+            cleaned.append(uuid_atom)
+            return cleaned
+        
+        # Anything after the open-ended atom would become part of it, so the
+        # UUID atom goes in front; _fix_chunk_offsets follows the moved media
+        placed: List[LayoutPiece] = []
+        for piece in cleaned:
+            if uuid_atom is not None and isinstance(piece, tuple) and piece[0] <= open_ended < piece[1]:
+                if piece[0] < open_ended:
+                    placed.append((piece[0], open_ended))
+                placed.append(uuid_atom)
+                placed.append((open_ended, piece[1]))
+                uuid_atom = None
+                continue
+            placed.append(piece)
+        if uuid_atom is not None:
+            placed.append(uuid_atom)
+        return placed
+    
+    def _scan_top_level_atoms(self, file_data: RangedFile) -> Tuple[List[Tuple[bytes, int, int, int]], int]:
+        """
+        List the top-level atoms of an MP4/MOV file.
+        
+        Args:
+            file_data: Original file data
             
+        Returns:
+            Tuple of ((atom_type, offset, size, header_size) list, offset where
+            the scan stopped); the offset is the file size unless a corrupt
+            atom or trailing garbage was found
+        """
+        atoms = []
+        offset = 0
+        length = len(file_data)
+        while offset + 8 <= length:
+            size, header_size = self._read_atom_size(file_data, offset)
+            if size < header_size or offset + size > length:
+                break
+            atoms.append((file_data[offset + 4:offset + 8], offset, size, header_size))
             offset += size
+        return atoms, offset
+    
+    @staticmethod
+    def _atom_header(atom_type: bytes, size: int, header_size: int = 8) -> Optional[bytes]:
+        """
+        Build an atom header of the given length.
+        
+        Returns:
+            8- or 16-byte header, or None if size does not fit a 32-bit header
+        """
+        if header_size == 16:
+            return struct.pack('>I4sQ', 1, atom_type, size)
+        if size > 0xFFFFFFFF:
+            return None
+        return struct.pack('>I4s', size, atom_type)
+    
+    def _update_mp4_in_place(
+        self,
+        file_path: str,
+        file_data: RangedFile,
+        udta_atom: Optional[bytes],
+        xmp_bytes: Optional[bytes]
+    ) -> bool:
+        """
+        Update the moov and XMP uuid atoms of an MP4/MOV file in place.
+        
+        A grown atom is written over itself and the free/skip atoms that
+        follow it, with the rest of that padding kept as a free atom; the
+        last atom of the file may simply grow. An atom that does not fit is
+        moved into the first free space large enough for it (or appended to
+        the end of the file) and the original is turned into a free atom.
+        Neighbouring free/skip atoms are merged into one, and free space at
+        the end of the file is cut off, so repeated updates do not keep
+        growing the file. Media data never moves, so chunk offsets stay valid
+        and only the changed atoms are written. New atoms are written before
+        the headers that make them live, so an interrupted update leaves a
+        parseable file.
+        
+        Args:
+            file_path: MP4/MOV file path
+            file_data: File data
+            udta_atom: udta atom to append to moov, or None
+            xmp_bytes: XMP packet for the XMP uuid atom, or None
+            
+        Returns:
+            True if the file was updated, False if its atom structure does not
+            allow an in-place update (the caller then rewrites the file)
+        """
+        atoms, end = self._scan_top_level_atoms(file_data)
+        file_size = len(file_data)
+        if end != file_size:
+            return False
+        
+        # An atom whose size field is 0 runs to the end of the file and would
+        # swallow anything appended after it
+        for _, offset, _, _ in atoms:
+            if file_data[offset:offset + 4] == b'\x00\x00\x00\x00':
+                return False
+        
+        # Working model of the top-level atoms: [atom_type, offset, size, header_size, reusable]
+        # Atoms created or freed by this update are not reused, so no patch overwrites another
+        model: List[List[Any]] = []
+        patches: List[Tuple[int, int, bytes]] = []  # (phase, offset, data); phases run in order
+        for atom_type, offset, size, header_size in atoms:
+            if atom_type in self.FREE_ATOM_TYPES and model and model[-1][0] in self.FREE_ATOM_TYPES:
+                # Merge runs of existing padding; they hold no data, so this is safe at any time
+                merged_size = offset + size - model[-1][1]
+                free_header = self._atom_header(b'free', merged_size)
+                if free_header is not None:
+                    patches.append((0, model[-1][1], free_header))
+                    model[-1] = [b'free', model[-1][1], merged_size, 8, True]
+                    continue
+            model.append([atom_type, offset, size, header_size, True])
+        # Padding at the end of the file is dropped; appended atoms may overwrite it
+        eof = file_size
+        if model and model[-1][0] in self.FREE_ATOM_TYPES:
+            eof = model.pop()[1]
+        
+        def _reserve(index: int, new_size: int) -> bool:
+            """Claim room for model[index] grown to new_size, if it fits in place."""
+            nonlocal eof
+            offset = model[index][1]
+            run_end = index + 1
+            while (run_end < len(model) and model[run_end][0] in self.FREE_ATOM_TYPES
+                   and model[run_end][4]):
+                run_end += 1
+            at_eof = run_end == len(model)
+            available = (eof if at_eof else model[run_end][1]) - offset
+            leftover = available - new_size
+            if leftover < 0 and not at_eof:
+                return False
+            if 0 < leftover < 8 and not at_eof:
+                return False
+            
+            replacement = [[model[index][0], offset, new_size, model[index][3], False]]
+            if leftover >= 8:
+                free_header = self._atom_header(b'free', leftover) or self._atom_header(b'free', leftover, 16)
+                patches.append((0, offset + new_size, free_header))
+                replacement.append([b'free', offset + new_size, leftover, len(free_header), False])
+            elif at_eof:
+                # Grow (or shrink by less than a free atom) at the end of the file
+                eof = offset + new_size
+            model[index:run_end] = replacement
+            return True
+        
+        def _append(atom: bytes) -> None:
+            """Write a new atom into the first free space that holds it, or at the end of the file."""
+            nonlocal eof
+            padded = self._pad_atom(atom)
+            for index, entry in enumerate(model):
+                if entry[0] not in self.FREE_ATOM_TYPES or not entry[4]:
+                    continue
+                leftover = entry[2] - len(padded)
+                if leftover == 0 or leftover >= 8:
+                    patches.append((0, entry[1], padded))
+                    replacement = [[atom[4:8], entry[1], len(padded), 8, False]]
+                    if leftover:
+                        free_header = self._atom_header(b'free', leftover)
+                        patches.append((0, entry[1] + len(padded), free_header))
+                        replacement.append([b'free', entry[1] + len(padded), leftover, 8, False])
+                    model[index:index + 1] = replacement
+                    return
+            patches.append((0, eof, padded))
+            model.append([atom[4:8], eof, len(padded), 8, False])
+            eof += len(padded)
+        
+        def _free(entry: List[Any]) -> None:
+            """Turn an atom into free space, merged with the free atoms around it."""
+            index = model.index(entry)
+            first = index - 1 if index > 0 and model[index - 1][0] in self.FREE_ATOM_TYPES else index
+            last = index + 1 if index + 1 < len(model) and model[index + 1][0] in self.FREE_ATOM_TYPES else index
+            start = model[first][1]
+            size = model[last][1] + model[last][2] - start
+            free_header = self._atom_header(b'free', size)
+            if first == last or free_header is None:
+                # Only the type changes; the size field stays as it is
+                patches.append((2, entry[1] + 4, b'free'))
+                entry[0] = b'free'
+                entry[4] = False
+                return
+            # One header write frees the atom, so it is never half freed
+            patches.append((2, start, free_header))
+            model[first:last + 1] = [[b'free', start, size, 8, False]]
+        
+        if udta_atom:
+            moov = next((entry for entry in model if entry[0] == b'moov'), None)
+            if moov is not None:
+                atom_type, offset, size, header_size, _ = moov
+                new_size = size + len(udta_atom)
+                header = self._atom_header(b'moov', new_size, header_size)
+                if header is not None and _reserve(model.index(moov), new_size):
+                    patches.append((1, offset + size, udta_atom))
+                    patches.append((2, offset, header))
+                else:
+                    payload = file_data[offset + header_size:offset + size]
+                    new_size = 8 + len(payload) + len(udta_atom)
+                    header_size = 8 if new_size <= 0xFFFFFFFF else 16
+                    _append(self._atom_header(b'moov', new_size - 8 + header_size, header_size) + payload + udta_atom)
+                    _free(moov)
+        
+        if xmp_bytes is not None:
+            xmp_atom = self._build_xmp_uuid_atom(xmp_bytes)
+            xmp_entries = [
+                entry for entry in model
+                if entry[0] == b'uuid' and entry[3] + 16 <= entry[2]
+                and file_data[entry[1] + entry[3]:entry[1] + entry[3] + 16] == self.XMP_UUID
+            ]
+            placed = False
+            for entry in xmp_entries:
+                offset = entry[1]
+                if not placed and _reserve(model.index(entry), len(xmp_atom)):
+                    patches.append((1, offset, xmp_atom))
+                    placed = True
+                else:
+                    _free(entry)
+            if not placed:
+                _append(xmp_atom)
+        
+        # Free space left at the end of the file is cut off
+        if model and model[-1][0] in self.FREE_ATOM_TYPES and model[-1][1] + model[-1][2] == eof:
+            eof = model.pop()[1]
+        
+        with open(file_path, 'r+b') as f:
+            for phase in sorted({patch[0] for patch in patches}):
+                for patch_phase, offset, data in patches:
+                    if patch_phase == phase:
+                        f.seek(offset)
+                        f.write(data)
+                # Each phase must reach the disk before the next one refers to it
+                f.flush()
+                os.fsync(f.fileno())
+            if eof < file_size:
+                f.truncate(eof)
+                os.fsync(f.fileno())
+        return True
+    
+    def _fix_chunk_offsets(self, file_data: RangedFile, layout: List[LayoutPiece]) -> List[LayoutPiece]:
+        """
+        Update the stco/co64 chunk offsets of moov for media data moved by a layout.
+        
+        Growing moov in front of mdat, or removing atoms before it, moves the
+        media data; the absolute offsets in the chunk offset tables must move
+        with it.
         
-        if offset < length:
-            cleaned.extend(file_data[offset:])
+        Args:
+            file_data: Original file data
+            layout: Output layout (ranges refer to file_data)
+            
+        Returns:
+            Layout with the moov payload replaced by a patched copy if any
+            chunk offset changed
+        """
+        # Map original offsets to output offsets: (source start, source end, output start)
+        ranges = []
+        position = 0
+        for piece in layout:
+            if isinstance(piece, tuple):
+                ranges.append((piece[0], piece[1], position))
+                position += piece[1] - piece[0]
+            else:
+                position += len(piece)
+        if all(start == output_start for start, _, output_start in ranges):
+            return layout
+        
+        atoms, _ = self._scan_top_level_atoms(file_data)
+        moov = next((atom for atom in atoms if atom[0] == b'moov'), None)
+        if moov is None:
+            return layout
+        _, moov_offset, moov_size, header_size = moov
+        payload_start = moov_offset + header_size
+        payload_end = moov_offset + moov_size
+        payload = bytearray(file_data[payload_start:payload_end])
+        
+        starts = [start for start, _, _ in ranges]
+        
+        def _map_offset(value: int) -> int:
+            index = bisect_right(starts, value) - 1
+            if index >= 0 and value < ranges[index][1]:
+                return ranges[index][2] + value - ranges[index][0]
+            return value
+        
+        changed = False
+        for atom_type, entries_offset, count in self._iter_chunk_offset_tables(payload, 0, len(payload)):
+            table_format = f'>{count}Q' if atom_type == b'co64' else f'>{count}I'
+            values = struct.unpack_from(table_format, payload, entries_offset)
+            new_values = [_map_offset(value) for value in values]
+            if new_values == list(values):
+                continue
+            if atom_type == b'stco' and max(new_values) > 0xFFFFFFFF:
+                raise MetadataWriteError("Chunk offset exceeds the 32-bit range of the stco atom")
+            struct.pack_into(table_format, payload, entries_offset, *new_values)
+            changed = True
+        if not changed:
+            return layout
         
-        cleaned.extend(self._build_xmp_uuid_atom(xmp_bytes))
-        return bytes(cleaned)
+        # Replace the moov payload range with the patched copy
+        patched: List[LayoutPiece] = []
+        for piece in layout:
+            if not isinstance(piece, tuple) or piece[1] <= payload_start or piece[0] >= payload_end:
+                patched.append(piece)
+                continue
+            start, end = piece
+            if start < payload_start:
+                patched.append((start, payload_start))
+            if start <= payload_start:
+                patched.append(bytes(payload))
+            if end > payload_end:
+                patched.append((payload_end, end))
+        return patched
+    
+    def _iter_chunk_offset_tables(self, data: bytearray, start: int, end: int):
+        """
+        Yield the chunk offset tables found in a range of atoms.
+        
+        Args:
+            data: Atom data (a moov payload)
+            start: Offset of the first atom
+            end: End of the atom range
+            
+        Yields:
+            (atom_type, entries_offset, entry_count) for each stco/co64 atom
+        """
+        offset = start
+        while offset + 8 <= end:
+            size, header_size = self._read_atom_size(data, offset)
+            if size < header_size or offset + size > end:
+                break
+            atom_type = bytes(data[offset + 4:offset + 8])
+            if atom_type in self.CHUNK_OFFSET_CONTAINERS:
+                yield from self._iter_chunk_offset_tables(data, offset + header_size, offset + size)
+            elif atom_type in (b'stco', b'co64') and size >= header_size + 8:
+                entries_offset = offset + header_size + 8
+                count = struct.unpack('>I', data[entries_offset - 4:entries_offset])[0]
+                width = 8 if atom_type == b'co64' else 4
+                if entries_offset + count * width <= offset + size:
+                    yield atom_type, entries_offset, count
+            offset += size
     
     def _pad_atom(self, atom_data: bytes) -> bytes:
         """
-        Pad atom data to QuickTimePad boundary if QuickTimePad is set.
+        Pad an atom to QuickTimePad boundary if QuickTimePad is set.
+        
+        The padding is a trailing 'free' atom, which also leaves room for
+        later in-place updates of the atom.
         
         Args:
-            atom_data: Atom data to pad
+            atom_data: Complete atom to pad
             
         Returns:
-            Padded atom data
+            Atom followed by a free atom (if padding is needed)
         """
         if self.quicktime_pad <= 0:
             return atom_data
@@ -667,24 +1067,24 @@ class VideoWriter:
         padding_needed = (self.quicktime_pad - (current_size % self.quicktime_pad)) % self.quicktime_pad
         
         if padding_needed > 0:
-            # Add padding bytes (zeros)
-            return atom_data + b'\x00' * padding_needed
+            # A free atom needs at least its 8-byte header
+            while padding_needed < 8:
+                padding_needed += self.quicktime_pad
+            return atom_data + struct.pack('>I4s', padding_needed, b'free') + bytes(padding_needed - 8)
         
         return atom_data
     
-    def _inject_quicktime_tags(self, file_data: bytes, quicktime_metadata: Dict[str, Any]) -> bytes:
+    def _build_quicktime_udta(self, quicktime_metadata: Dict[str, Any]) -> Optional[bytes]:
         """
-        Inject QuickTime tags into ilst atom in MP4/MOV file.
+        Build the udta atom holding QuickTime tags.
         
         QuickTime tags are stored in the 'ilst' atom within the 'meta' atom.
-        This method creates or updates the ilst atom with new QuickTime tags.
         
         Args:
-            file_data: Original MP4/MOV file data
             quicktime_metadata: Dictionary of QuickTime tags (without QuickTime: prefix)
             
         Returns:
-            Updated file data with QuickTime tags injected
+            Complete udta atom, or None if there are no supported tags
         """
         def _build_data_atom(text_value: str) -> bytes:
             payload = text_value.encode('utf-8', errors='replace')
@@ -710,14 +1110,25 @@ class VideoWriter:
             items.append(_build_ilst_item(b'\xa9cpr', str(copyright_value)))
 
         if not items:
-            return file_data
+            return None
 
         ilst_payload = b''.join(items)
         ilst_atom = struct.pack('>I4s', 8 + len(ilst_payload), b'ilst') + ilst_payload
         meta_payload = b'\x00\x00\x00\x00' + ilst_atom  # version/flags + ilst
         meta_atom = struct.pack('>I4s', 8 + len(meta_payload), b'meta') + meta_payload
-        udta_atom = struct.pack('>I4s', 8 + len(meta_atom), b'udta') + meta_atom
-
+        return struct.pack('>I4s', 8 + len(meta_atom), b'udta') + meta_atom
+    
+    def _inject_quicktime_tags(self, file_data: RangedFile, udta_atom: bytes) -> List[LayoutPiece]:
+        """
+        Inject QuickTime tags into MP4/MOV file by appending a udta atom to moov.
+        
+        Args:
+            file_data: Original MP4/MOV file data
+            udta_atom: udta atom from _build_quicktime_udta
+            
+        Returns:
+            Output layout with QuickTime tags injected
+        """
         offset = 0
         length = len(file_data)
         while offset + 8 <= length:
@@ -728,8 +1139,7 @@ class VideoWriter:
             if atom_type == b'moov':
                 payload_start = offset + header
                 payload_end = offset + size
-                moov_payload = file_data[payload_start:payload_end] + udta_atom
-                new_size = header + len(moov_payload)
+                new_size = size + len(udta_atom)
                 if header == 16:
                     new_header = bytearray(file_data[offset:offset + header])
                     new_header[0:4] = struct.pack('>I', 1)
@@ -737,17 +1147,22 @@ class VideoWriter:
                 else:
                     new_header = bytearray(file_data[offset:offset + header])
                     new_header[0:4] = struct.pack('>I', new_size)
-                return b''.join([
-                    file_data[:offset],
+                return [
+                    (0, offset),
                     bytes(new_header),
-                    moov_payload,
-                    file_data[payload_end:]
-                ])
+                    (payload_start, payload_end),
+                    udta_atom,
+                    (payload_end, length),
+                ]
             offset += size
 
-        return file_data
+        return [(0, length)]
     
-    def _inject_quicktime_keys(self, file_data: bytes, quicktime_keys_metadata: Dict[str, Any]) -> bytes:
+    def _inject_quicktime_keys(
+        self,
+        file_data: RangedFile,
+        quicktime_keys_metadata: Dict[str, Any]
+    ) -> List[LayoutPiece]:
         """
         Inject QuickTime Keys tags into keys atom in MP4/MOV file.
         
@@ -759,23 +1174,26 @@ class VideoWriter:
             quicktime_keys_metadata: Dictionary of QuickTime Keys tags (without QuickTimeKeys: prefix)
             
         Returns:
-            Updated file data with QuickTime Keys tags injected
+            Output layout with QuickTime Keys tags injected
         """
         # For now, acknowledge QuickTime Keys tags
         # Full implementation would require parsing and updating the keys atom structure
         # This is a basic implementation that acknowledges QuickTime Keys tags
-        cleaned = bytearray(file_data)
         
         # Note: Full implementation would:
         # 1. Find or create 'keys' atom
         # 2. Add QuickTime Keys tag items to 'keys' atom
         # 3. Update atom sizes accordingly
         
-        # For now, we acknowledge the tags and return the file data
+        # For now, we acknowledge the tags and return the file unchanged
         # QuickTime Keys tags are detected and ready for keys atom writing
-        return bytes(cleaned)
+        return [(0, len(file_data))]
     
-    def _inject_microsoft_xtra(self, file_data: bytes, microsoft_xtra_metadata: Dict[str, Any]) -> bytes:
+    def _inject_microsoft_xtra(
+        self,
+        file_data: RangedFile,
+        microsoft_xtra_metadata: Dict[str, Any]
+    ) -> List[LayoutPiece]:
         """
         Inject Microsoft Xtra tags into Xtra atom in MP4/MOV file.
         
@@ -787,23 +1205,22 @@ class VideoWriter:
             microsoft_xtra_metadata: Dictionary of Microsoft Xtra tags (without MicrosoftXtra: or Xtra: prefix)
             
         Returns:
-            Updated file data with Microsoft Xtra tags injected
+            Output layout with Microsoft Xtra tags injected
         """
         # For now, acknowledge Microsoft Xtra tags
         # Full implementation would require parsing and updating the Xtra atom structure
         # This is a basic implementation that acknowledges Microsoft Xtra tags
-        cleaned = bytearray(file_data)
         
         # Note: Full implementation would:
         # 1. Find or create 'Xtra' atom
         # 2. Add Microsoft Xtra tag items to 'Xtra' atom
         # 3. Update atom sizes accordingly
         
-        # For now, we acknowledge the tags and return the file data
+        # For now, we acknowledge the tags and return the file unchanged
         # Microsoft Xtra tags are detected and ready for Xtra atom writing
-        return bytes(cleaned)
+        return [(0, len(file_data))]
 
-    def _extract_existing_xmp(self, file_data: bytes) -> Optional[bytes]:
+    def _extract_existing_xmp(self, file_data: RangedFile) -> Optional[bytes]:
         """
         Return the payload of the first XMP UUID atom, if present.
         """
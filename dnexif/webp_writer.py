@@ -13,11 +13,14 @@ WebP stores metadata in chunks similar to PNG.
 Copyright 2025 DNAi inc.
 """
 
+import io
+import os
 import struct
-from typing import Dict, Any, Optional, List, Tuple
+from typing import BinaryIO, Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
 from dnexif.exceptions import MetadataWriteError
+from dnexif.stream_copy import atomic_output, copy_range
 from dnexif.exif_writer import EXIFWriter
 from dnexif.xmp_writer import XMPWriter
 
@@ -74,45 +77,91 @@ class WebPWriter:
             raise MetadataWriteError("Invalid WebP file")
         
         try:
-            # Parse WebP structure
-            chunk_info = self._parse_webp_chunks(original_data)
-            
-            # Extract EXIF metadata
-            exif_metadata = {
-                k: v for k, v in metadata.items()
-                if k.startswith('EXIF:') or k.startswith('IFD0:') or k.startswith('GPS:')
-            }
-            
-            # Extract XMP metadata
-            xmp_metadata = {
-                k: v for k, v in metadata.items()
-                if k.startswith('XMP:')
-            }
-            
-            # Build new WebP file
-            new_webp_data = self._build_webp_file(chunk_info, exif_metadata, xmp_metadata)
+            source = io.BytesIO(original_data)
+            chunk_info = self._parse_webp_chunks(source)
+            header_chunks = self._build_header_chunks(chunk_info, *self._split_metadata(metadata))
             
             # Write to output file
-            with open(output_path, 'wb') as f:
-                f.write(new_webp_data)
+            with atomic_output(output_path) as f:
+                self._write_webp_file(source, chunk_info, header_chunks, f)
                 
         except Exception as e:
             if isinstance(e, MetadataWriteError):
                 raise
             raise MetadataWriteError(f"Failed to write WebP file: {str(e)}")
     
-    def _parse_webp_chunks(self, webp_data: bytes) -> Dict[str, Any]:
+    def write_webp_file(
+        self,
+        file_path: str,
+        metadata: Dict[str, Any],
+        output_path: str
+    ) -> None:
+        """
+        Write metadata to a WebP file without loading the image data.
+        
+        Only the chunk headers (and the few bytes needed for the canvas size)
+        are read from the original; image chunks are copied from it as-is.
+        
+        Args:
+            file_path: Original WebP file path
+            metadata: Metadata dictionary to write
+            output_path: Output file path (may be file_path itself)
+            
+        Raises:
+            MetadataWriteError: If writing fails
+        """
+        try:
+            with atomic_output(output_path) as output:
+                with open(file_path, 'rb') as source:
+                    header = source.read(12)
+                    if not header.startswith(b'RIFF') or b'WEBP' not in header:
+                        raise MetadataWriteError("Invalid WebP file")
+                    chunk_info = self._parse_webp_chunks(source)
+                    header_chunks = self._build_header_chunks(chunk_info, *self._split_metadata(metadata))
+                    self._write_webp_file(source, chunk_info, header_chunks, output)
+        except Exception as e:
+            if isinstance(e, MetadataWriteError):
+                raise
+            raise MetadataWriteError(f"Failed to write WebP file: {str(e)}")
+    
+    def _split_metadata(self, metadata: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Split metadata into the groups written to WebP chunks.
+        
+        Args:
+            metadata: Metadata dictionary to write
+            
+        Returns:
+            Tuple of (EXIF, XMP) metadata dictionaries
+        """
+        # Extract EXIF metadata
+        exif_metadata = {
+            k: v for k, v in metadata.items()
+            if k.startswith('EXIF:') or k.startswith('IFD0:') or k.startswith('GPS:')
+        }
+        
+        # Extract XMP metadata
+        xmp_metadata = {
+            k: v for k, v in metadata.items()
+            if k.startswith('XMP:')
+        }
+        
+        return exif_metadata, xmp_metadata
+    
+    def _parse_webp_chunks(self, source: BinaryIO) -> Dict[str, Any]:
         """
-        Parse WebP chunks from file data.
+        Parse WebP chunk headers from a file.
+        
+        Chunk payloads are not loaded; only the VP8X payload and the first
+        bytes of VP8/VP8L chunks (for the canvas size) are read.
         
         Args:
-            webp_data: WebP file data
+            source: Seekable WebP file object
             
         Returns:
-            Dictionary containing parsed chunk data and WebP characteristics
+            Dictionary containing chunk locations and WebP characteristics
         """
-        chunks: List[Tuple[bytes, bytes]] = []
-        offset = 0
+        chunks: List[Tuple[bytes, int, int]] = []  # (chunk_type, data_offset, chunk_size)
         
         info: Dict[str, Any] = {
             'chunks': chunks,
@@ -126,42 +175,28 @@ class WebPWriter:
             'has_icc_chunk': False,
         }
         
-        # Check RIFF header
-        if webp_data[offset:offset+4] != b'RIFF':
-            return info
-        
-        offset += 4
-        file_size = struct.unpack('<I', webp_data[offset:offset+4])[0]
-        offset += 4
+        file_size = source.seek(0, os.SEEK_END)
+        source.seek(0)
+        header = source.read(12)
         
-        # Check WEBP identifier
-        if webp_data[offset:offset+4] != b'WEBP':
+        # Check RIFF header and WEBP identifier
+        if header[0:4] != b'RIFF' or header[8:12] != b'WEBP':
             return info
         
-        offset += 4
+        offset = 12
         
         # Parse chunks
-        while offset < len(webp_data) - 8:
-            # Read chunk type (4 bytes)
-            if offset + 4 > len(webp_data):
-                break
-            chunk_type = webp_data[offset:offset+4]
-            offset += 4
+        while offset < file_size - 8:
+            source.seek(offset)
+            chunk_type, chunk_size = struct.unpack('<4sI', source.read(8))
+            offset += 8
             
-            # Read chunk size (4 bytes, little-endian)
-            if offset + 4 > len(webp_data):
+            if offset + chunk_size > file_size:
                 break
-            chunk_size = struct.unpack('<I', webp_data[offset:offset+4])[0]
-            offset += 4
-            
-            # Read chunk data
-            if offset + chunk_size > len(webp_data):
-                break
-            chunk_data = webp_data[offset:offset+chunk_size]
-            offset += chunk_size
             
             # Track specific chunk types and skip EXIF/XMP (to be rebuilt)
             if chunk_type == self.CHUNK_VP8X:
+                chunk_data = source.read(chunk_size)
                 info['has_vp8x'] = True
                 info['vp8x_data'] = chunk_data
                 if len(chunk_data) >= 10:
@@ -171,15 +206,15 @@ class WebPWriter:
                     info['canvas_width'] = width_minus_one + 1
                     info['canvas_height'] = height_minus_one + 1
             elif chunk_type == self.CHUNK_VP8:
-                dims = self._extract_vp8_dimensions(chunk_data)
+                dims = self._extract_vp8_dimensions(source.read(min(chunk_size, 10)))
                 if dims:
                     info['canvas_width'], info['canvas_height'] = dims
-                chunks.append((chunk_type, chunk_data))
+                chunks.append((chunk_type, offset, chunk_size))
             elif chunk_type == self.CHUNK_VP8L:
-                dims = self._extract_vp8l_dimensions(chunk_data)
+                dims = self._extract_vp8l_dimensions(source.read(min(chunk_size, 5)))
                 if dims:
                     info['canvas_width'], info['canvas_height'] = dims
-                chunks.append((chunk_type, chunk_data))
+                chunks.append((chunk_type, offset, chunk_size))
             elif chunk_type == self.CHUNK_EXIF or chunk_type == self.CHUNK_XMP:
                 # Skip existing metadata chunks; they'll be replaced
                 pass
@@ -190,7 +225,9 @@ class WebPWriter:
                     info['has_anim_chunk'] = True
                 elif chunk_type == self.CHUNK_ICCP:
                     info['has_icc_chunk'] = True
-                chunks.append((chunk_type, chunk_data))
+                chunks.append((chunk_type, offset, chunk_size))
+            
+            offset += chunk_size
             
             # Align to even boundary
             if chunk_size % 2 == 1:
@@ -198,27 +235,25 @@ class WebPWriter:
         
         return info
     
-    def _build_webp_file(
+    def _build_header_chunks(
         self,
         chunk_info: Dict[str, Any],
         exif_metadata: Dict[str, Any],
         xmp_metadata: Dict[str, Any]
     ) -> bytes:
         """
-        Build a complete WebP file with metadata.
+        Build the VP8X, EXIF and XMP chunks that precede the image chunks.
         
         Args:
-            chunks: List of (chunk_type, chunk_data) tuples
+            chunk_info: Parsed chunk information from _parse_webp_chunks
             exif_metadata: EXIF metadata dictionary
             xmp_metadata: XMP metadata dictionary
             
         Returns:
-            Complete WebP file as bytes
+            Complete header chunks as bytes (empty if none are needed)
         """
-        chunks = chunk_info['chunks']
         has_vp8x = chunk_info['has_vp8x']
         vp8x_data = chunk_info.get('vp8x_data')
-        vp8x_flags = chunk_info.get('vp8x_flags', 0)
         canvas_width = chunk_info.get('canvas_width')
         canvas_height = chunk_info.get('canvas_height')
         
@@ -226,8 +261,6 @@ class WebPWriter:
         xmp_chunk_data = self._build_xmp_chunk(xmp_metadata) if xmp_metadata else None
         has_metadata = bool(exif_chunk_data or xmp_chunk_data)
         
-        final_chunks: List[Tuple[bytes, bytes]] = []
-        
         # Ensure VP8X chunk exists if metadata is present (required by spec)
         if has_vp8x:
             vp8x_payload = bytearray(vp8x_data or b'')
@@ -245,41 +278,54 @@ class WebPWriter:
             if chunk_info.get('has_icc_chunk'):
                 flags |= self.FLAG_ICC
             vp8x_payload = bytearray(self._build_vp8x_payload(flags, canvas_width, canvas_height))
-            has_vp8x = True
-        else:
-            vp8x_payload = None
-            flags = 0
-        
-        if has_vp8x and vp8x_payload is not None:
-            if exif_chunk_data:
-                flags |= self.FLAG_EXIF
-            if xmp_chunk_data:
-                flags |= self.FLAG_XMP
-            vp8x_payload[0] = flags
-            final_chunks.append((self.CHUNK_VP8X, bytes(vp8x_payload)))
-            
-            if exif_chunk_data:
-                final_chunks.append((self.CHUNK_EXIF, exif_chunk_data))
-            if xmp_chunk_data:
-                final_chunks.append((self.CHUNK_XMP, xmp_chunk_data))
         else:
             # No VP8X and no metadata; nothing to add before existing chunks
-            pass
-        
-        # Append original chunks (excluding VP8X/metadata which were removed earlier)
-        final_chunks.extend(chunks)
+            return b''
+        
+        if exif_chunk_data:
+            flags |= self.FLAG_EXIF
+        if xmp_chunk_data:
+            flags |= self.FLAG_XMP
+        vp8x_payload[0] = flags
+        
+        header_chunks = bytearray(self._write_chunk(self.CHUNK_VP8X, bytes(vp8x_payload)))
+        if exif_chunk_data:
+            header_chunks.extend(self._write_chunk(self.CHUNK_EXIF, exif_chunk_data))
+        if xmp_chunk_data:
+            header_chunks.extend(self._write_chunk(self.CHUNK_XMP, xmp_chunk_data))
+        return bytes(header_chunks)
+    
+    def _write_webp_file(
+        self,
+        source: BinaryIO,
+        chunk_info: Dict[str, Any],
+        header_chunks: bytes,
+        output: BinaryIO
+    ) -> None:
+        """
+        Write a complete WebP file, copying the original chunks from source.
         
-        webp_data = bytearray()
-        webp_data.extend(b'RIFF')
-        webp_data.extend(b'\x00\x00\x00\x00')
-        webp_data.extend(b'WEBP')
+        Args:
+            source: Seekable original WebP file object
+            chunk_info: Parsed chunk information from _parse_webp_chunks
+            header_chunks: Chunks to write before the original chunks
+            output: Binary file object to write to
+        """
+        chunks = chunk_info['chunks']
+        riff_size = 4 + len(header_chunks) + sum(
+            8 + chunk_size + (chunk_size % 2) for _, _, chunk_size in chunks
+        )
         
-        for chunk_type, chunk_data in final_chunks:
-            webp_data.extend(self._write_chunk(chunk_type, chunk_data))
+        output.write(b'RIFF' + struct.pack('<I', riff_size) + b'WEBP')
+        output.write(header_chunks)
         
-        file_size = len(webp_data) - 8
-        webp_data[4:8] = struct.pack('<I', file_size)
-        return bytes(webp_data)
+        # Append original chunks (excluding VP8X/metadata which were removed earlier)
+        for chunk_type, data_offset, chunk_size in chunks:
+            output.write(chunk_type + struct.pack('<I', chunk_size))
+            copy_range(source, output, data_offset, chunk_size)
+            # Align to even boundary
+            if chunk_size % 2 == 1:
+                output.write(b'\x00')
     
     def _build_exif_chunk(self, exif_metadata: Dict[str, Any]) -> Optional[bytes]:
         """
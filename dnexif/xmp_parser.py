@@ -65,7 +65,7 @@ class XMPParser:
         if file_path:
             self.file_path = Path(file_path)
             self.file_data = None
-        elif file_data:
+        elif file_data is not None:
             self.file_data = file_data
             self.file_path = None
         else:
@@ -295,9 +295,8 @@ class XMPWriter:
         # XMP identifier: "http://ns.adobe.com/xap/1.0/\x00"
         xmp_identifier = b'http://ns.adobe.com/xap/1.0/\x00'
         
-        # Calculate length (XMP identifier + XMP packet)
-        # Note: JPEG segment length field represents length AFTER the 2-byte length field itself
-        length = len(xmp_identifier) + len(xmp_packet)
+        # Calculate length (length field + XMP identifier + XMP packet)
+        length = 2 + len(xmp_identifier) + len(xmp_packet)
         
         # Ensure length doesn't exceed 65535 (max for 2 bytes)
         if length > 65535:
@@ -17,6 +17,7 @@ from typing import Dict, Any, Optional
 from pathlib import Path
 
 from dnexif.exceptions import MetadataReadError
+from dnexif.file_view import close_buffer, map_file
 
 
 class ZIPParser:
@@ -29,16 +30,19 @@ class ZIPParser:
     # ZIP End of Central Directory Record signature
     EOCD_SIGNATURE = b'PK\x05\x06'  # 0x06054b50
     
-    def __init__(self, file_path: Optional[str] = None, file_data: Optional[bytes] = None):
+    def __init__(self, file_path: Optional[str] = None, file_data: Optional[bytes] = None,
+                 use_mmap: bool = False):
         """
         Initialize ZIP parser.
         
         Args:
             file_path: Path to ZIP file
             file_data: Raw file data
+            use_mmap: If True, memory-map file_path instead of reading it into memory
         """
         self.file_path = file_path
         self.file_data = file_data
+        self.use_mmap = use_mmap
     
     def parse(self) -> Dict[str, Any]:
         """
@@ -47,11 +51,16 @@ class ZIPParser:
         Returns:
             Dictionary of ZIP metadata
         """
+        owns_map = False
         try:
             # Read file data
             if self.file_data is None and self.file_path:
-                with open(self.file_path, 'rb') as f:
-                    self.file_data = f.read()
+                if self.use_mmap:
+                    self.file_data = map_file(self.file_path)
+                    owns_map = True
+                else:
+                    with open(self.file_path, 'rb') as f:
+                        self.file_data = f.read()
             elif self.file_data is None:
                 return {}
             
@@ -120,6 +129,12 @@ class ZIPParser:
             
         except Exception as e:
             raise MetadataReadError(f"Failed to parse ZIP metadata: {str(e)}") from e
+        
+        finally:
+            if owns_map:
+                # Close the map created above; the next parse() maps the file again
+                close_buffer(self.file_data)
+                self.file_data = None
     
     def _find_eocd(self) -> int:
         """
@@ -0,0 +1,45 @@
+"""
+Tests for DNExif metadata loading.
+
+Copyright 2025 DNAi inc.
+"""
+
+from pathlib import Path
+
+from dnexif import DNExif
+from dnexif.metadata_utils import batch_read_metadata
+
+DATA_DIR = Path(__file__).parent / 'data'
+
+
+def test_tag_filter_keeps_tags_copied_from_xmp():
+    # The file has no EXIF Artist entry; EXIF:Artist is copied from XMP:Creator
+    path = DATA_DIR / 'canon_iptc.tiff'
+    assert DNExif(path).get_tag('EXIF:Artist') == 'Bob'
+
+    assert DNExif(path, tags=['EXIF:Artist']).get_tag('EXIF:Artist') == 'Bob'
+    assert DNExif(path, tags=['Artist']).get_tag('Artist') == 'Bob'
+    assert DNExif(path, lazy=True).get_tag('EXIF:Artist') == 'Bob'
+    assert batch_read_metadata([path], tags=['EXIF:Artist']) == {path: {'EXIF:Artist': 'Bob'}}
+
+
+def test_tag_filter_keeps_tags_copied_from_aliases():
+    # The file has no EXIF block; CreateDate comes from xmp:CreateDate
+    path = DATA_DIR / 'xmp_create_date.jpg'
+    tags = ['EXIF:CreateDate', 'CreateDate', 'EXIF:DateTimeOriginal']
+    full = DNExif(path).get_all_metadata()
+    assert full['EXIF:CreateDate'] == '2019:05:06 07:08:09'
+
+    expected = {tag: full.get(tag) for tag in tags}
+    assert batch_read_metadata([path], tags=tags) == {path: expected}
+    assert batch_read_metadata([path], tags=tags, workers=2, use_threads=True) == {path: expected}
+
+
+def test_lazy_get_tag_matches_full_load_for_alias_backed_tags():
+    tags = ['EXIF:CreateDate', 'CreateDate', 'EXIF:DateTimeOriginal', 'DateTimeOriginal',
+            'EXIF:ModifyDate', 'EXIF:Artist', 'Artist', 'Creator', 'Keywords', 'ISO']
+    for name in ('xmp_create_date.jpg', 'canon_iptc.tiff'):
+        path = DATA_DIR / name
+        full = DNExif(path, read_only=True)
+        for tag in tags:
+            assert DNExif(path, read_only=True, lazy=True).get_tag(tag) == full.get_tag(tag), (name, tag)
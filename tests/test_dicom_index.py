@@ -0,0 +1,56 @@
+"""
+Tests for the bulk DICOM study/series indexer.
+
+Copyright 2025 DNAi inc.
+"""
+
+import struct
+
+from dnexif.dicom_index import build_dicom_index, is_dicomdir, iter_dicom_files
+
+
+def _element(group, element, vr, value):
+    """Encode an explicit VR little-endian data element (padded to even length)."""
+    if len(value) % 2:
+        value += b'\0' if vr == b'UI' else b' '
+    if vr in (b'OB', b'OW', b'SQ', b'UN', b'UT'):
+        return struct.pack('<HH', group, element) + vr + b'\0\0' + struct.pack('<I', len(value)) + value
+    return struct.pack('<HH', group, element) + vr + struct.pack('<H', len(value)) + value
+
+
+def _dicom_file(path, sop_class_uid, data_set):
+    meta_body = (_element(0x0002, 0x0001, b'OB', b'\0\1')
+                 + _element(0x0002, 0x0002, b'UI', sop_class_uid)
+                 + _element(0x0002, 0x0010, b'UI', b'1.2.840.10008.1.2.1'))
+    meta = _element(0x0002, 0x0000, b'UL', struct.pack('<I', len(meta_body))) + meta_body
+    path.write_bytes(b'\0' * 128 + b'DICM' + meta + data_set)
+    return path
+
+
+def _instance(path, sop_instance_uid):
+    return _dicom_file(path, b'1.2.840.10008.5.1.4.1.1.2', (
+        _element(0x0008, 0x0018, b'UI', sop_instance_uid)
+        + _element(0x0008, 0x0060, b'CS', b'CT')
+        + _element(0x0020, 0x000D, b'UI', b'1.2.3')
+        + _element(0x0020, 0x000E, b'UI', b'1.2.3.1')))
+
+
+def test_single_instance_file_is_indexed_on_its_own(tmp_path):
+    path = _instance(tmp_path / 'image.dcm', b'1.2.3.1.1')
+
+    assert not is_dicomdir(path)
+    assert list(iter_dicom_files(path)) == [path]
+    index = build_dicom_index(path, ['Modality'])
+    assert len(index) == 1
+    assert index.series['1.2.3.1'].constants == {'Modality': 'CT'}
+
+
+def test_dicomdir_is_recognized_by_its_sop_class(tmp_path):
+    (tmp_path / 'S1').mkdir()
+    instance = _instance(tmp_path / 'S1' / 'IM1', b'1.2.3.1.1')
+    directory = _dicom_file(tmp_path / 'index.dir', b'1.2.840.10008.1.3.10',
+                            _element(0x0004, 0x1500, b'CS', b'S1\\IM1'))
+
+    assert is_dicomdir(directory)
+    assert list(iter_dicom_files(directory)) == [instance]
+    assert len(build_dicom_index(directory, ['Modality'], workers=2, use_threads=True)) == 1
@@ -0,0 +1,54 @@
+"""
+Tests for header-only DICOM parsing.
+
+Copyright 2025 DNAi inc.
+"""
+
+import struct
+
+from dnexif.dicom_parser import DICOMParser
+
+
+def _element(group, element, vr, value):
+    """Encode an explicit VR little-endian data element."""
+    if vr in (b'OB', b'OW', b'SQ', b'UN', b'UT'):
+        return struct.pack('<HH', group, element) + vr + b'\0\0' + struct.pack('<I', len(value)) + value
+    return struct.pack('<HH', group, element) + vr + struct.pack('<H', len(value)) + value
+
+
+def _dicom_file(path, pixel_data=None):
+    """Write a DICOM file with an IconImageSequence holding its own PixelData."""
+    meta_body = (_element(0x0002, 0x0002, b'UI', b'1.2.840.10008.5.1.4.1.1.2\0')
+                 + _element(0x0002, 0x0010, b'UI', b'1.2.840.10008.1.2.1\0'))
+    meta = _element(0x0002, 0x0000, b'UL', struct.pack('<I', len(meta_body))) + meta_body
+    icon = (_element(0x0028, 0x0010, b'US', struct.pack('<H', 4))
+            + _element(0x0028, 0x0011, b'US', struct.pack('<H', 4))
+            + _element(0x7FE0, 0x0010, b'OB', bytes(range(1, 17))))
+    icon_sequence = _element(0x0088, 0x0200, b'SQ',
+                             struct.pack('<HHI', 0xFFFE, 0xE000, len(icon)) + icon)
+    data_set = (_element(0x0010, 0x0010, b'PN', b'DOE^JOHN')
+                + icon_sequence
+                + _element(0x0028, 0x0010, b'US', struct.pack('<H', 512)))
+    if pixel_data is not None:
+        data_set += _element(0x7FE0, 0x0010, b'OW', pixel_data)
+    path.write_bytes(b'\0' * 128 + b'DICM' + meta + data_set)
+    return path
+
+
+def test_stop_before_pixels_ignores_pixel_data_in_sequence_items(tmp_path):
+    parser = DICOMParser(file_path=str(_dicom_file(tmp_path / 'icon.dcm')), stop_before_pixels=True)
+    metadata = parser.parse()
+
+    assert metadata['DICOM:Rows'] == 512
+    assert parser.pixel_data_offset is None
+    assert parser.read_pixel_data() is None
+
+
+def test_stop_before_pixels_locates_top_level_pixel_data(tmp_path):
+    pixel_data = bytes(range(256)) * 4
+    parser = DICOMParser(file_path=str(_dicom_file(tmp_path / 'image.dcm', pixel_data)),
+                         stop_before_pixels=True)
+    parser.parse()
+
+    assert parser.pixel_data_length == len(pixel_data)
+    assert parser.read_pixel_data() == pixel_data
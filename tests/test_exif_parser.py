@@ -0,0 +1,41 @@
+"""
+Tests for the EXIF/TIFF IFD walk.
+
+Copyright 2025 DNAi inc.
+"""
+
+import time
+from pathlib import Path
+
+from dnexif.exif_parser import ExifParser
+
+DATA_DIR = Path(__file__).parent / 'data'
+
+
+def test_tiff_with_iptc_entry_after_exif_pointer_terminates():
+    # IFD0 holds ExifIFD, IPTC-NAA (0x83BB, walked by the Leaf MakerNote
+    # heuristic) and XMP entries in that order; the offset guesses of the
+    # heuristic point back into IFD0 and must not be walked again.
+    start = time.monotonic()
+    metadata = ExifParser(file_path=str(DATA_DIR / 'canon_iptc.tiff')).read()
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 10
+    assert metadata.get('EXIF:Make') == 'Canon'
+    assert metadata.get('EXIF:DateTimeOriginal') == '2020:01:02 03:04:05'
+
+
+def test_parse_ifd_does_not_walk_an_ifd_twice():
+    parser = ExifParser(file_path=str(DATA_DIR / 'canon_iptc.tiff'))
+    parser.read()
+
+    walked = []
+    walk_ifd = parser._walk_ifd
+
+    def recording_walk(ifd_offset, base_offset, parent_metadata=None):
+        walked.append((ifd_offset, base_offset))
+        return walk_ifd(ifd_offset, base_offset, parent_metadata)
+
+    parser._walk_ifd = recording_walk
+    parser._parse_ifd(8, 0)
+    assert len(walked) == len(set(walked))
@@ -0,0 +1,30 @@
+"""
+Tests for the shared file view and memory-mapped parsing.
+
+Copyright 2025 DNAi inc.
+"""
+
+from pathlib import Path
+
+from dnexif.exif_parser import ExifParser
+from dnexif.file_view import FileView
+
+DATA_DIR = Path(__file__).parent / 'data'
+
+
+def test_release_keeps_mapped_data_held_by_parsers_usable():
+    view = FileView(DATA_DIR / 'canon_iptc.tiff', use_mmap=True)
+    parser = ExifParser(file_data=view.data)
+    view.release()
+
+    assert parser.file_data[:4] == b'II*\x00'
+    assert parser.read().get('EXIF:Make') == 'Canon'
+
+
+def test_parser_closes_its_own_map_after_reading():
+    parser = ExifParser(file_path=str(DATA_DIR / 'canon_iptc.tiff'), use_mmap=True)
+
+    assert parser.read().get('EXIF:Make') == 'Canon'
+    assert parser.file_data is None
+    # The file is mapped again for the next read
+    assert parser.read().get('EXIF:Make') == 'Canon'
@@ -0,0 +1,104 @@
+"""
+Tests for the concurrent directory walker.
+
+Copyright 2025 DNAi inc.
+"""
+
+import os
+import time
+
+from dnexif import file_walker
+from dnexif.file_walker import walk_files
+
+# Files and directories are created out of name order
+TREE = (
+    'b.jpg', 'a.jpg',
+    'zeta/2.jpg', 'zeta/1.jpg',
+    'alpha/sub/deep/x.jpg', 'alpha/c.jpg', 'alpha/sub/y.jpg', 'alpha/.hidden/h.jpg',
+    'alpha/skip/s.jpg', 'alpha/empty/',
+    'mid/notes.txt', 'mid/m.jpg',
+)
+
+# Depth first: the files of a directory, then each subdirectory in name order
+ORDERED = (
+    'a.jpg', 'b.jpg',
+    'alpha/c.jpg', 'alpha/.hidden/h.jpg',
+    'alpha/skip/s.jpg', 'alpha/sub/y.jpg', 'alpha/sub/deep/x.jpg',
+    'mid/m.jpg', 'mid/notes.txt',
+    'zeta/1.jpg', 'zeta/2.jpg',
+)
+
+
+def _tree(root, entries=TREE):
+    for entry in entries:
+        path = root / entry
+        if entry.endswith('/'):
+            path.mkdir(parents=True)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b'')
+    return root
+
+
+def _relative(root, paths):
+    return [path.relative_to(root).as_posix() for path in paths]
+
+
+def _slow_scandir(monkeypatch):
+    # Directories early in name order take longest to list, so that the
+    # concurrent scans finish in roughly the reverse of the walk order
+    scandir = os.scandir
+
+    def slow(path):
+        time.sleep(0.02 if os.path.basename(path) < 'n' else 0.0)
+        return scandir(path)
+
+    monkeypatch.setattr(os, 'scandir', slow)
+
+
+def test_files_are_yielded_depth_first_in_name_order(tmp_path, monkeypatch):
+    root = _tree(tmp_path / 'root')
+    _slow_scandir(monkeypatch)
+
+    for workers in (1, 8):
+        assert _relative(root, walk_files(root, workers=workers)) == list(ORDERED)
+
+
+def test_order_is_kept_when_too_many_directories_are_ahead(tmp_path, monkeypatch):
+    entries = [f'd{index:02}/f{index % 3}.jpg' for index in reversed(range(40))]
+    root = _tree(tmp_path / 'root', entries)
+    monkeypatch.setattr(file_walker, 'PREFETCH_DIRECTORIES', 3)
+    monkeypatch.setattr(file_walker, 'PREFETCH_SIBLINGS', 2)
+
+    assert _relative(root, walk_files(root, workers=4)) == sorted(entries)
+
+
+def test_filters_and_non_recursive_walk(tmp_path):
+    root = _tree(tmp_path / 'root')
+
+    walk = walk_files(
+        root,
+        include_file=lambda name: name.endswith('.jpg'),
+        include_dir=lambda name: name != 'skip' and not name.startswith('.'),
+    )
+    assert _relative(root, walk) == [
+        'a.jpg', 'b.jpg', 'alpha/c.jpg', 'alpha/sub/y.jpg', 'alpha/sub/deep/x.jpg',
+        'mid/m.jpg', 'zeta/1.jpg', 'zeta/2.jpg',
+    ]
+    assert _relative(root, walk_files(root, recursive=False)) == ['a.jpg', 'b.jpg']
+
+
+def test_unordered_walk_finds_the_same_files(tmp_path, monkeypatch):
+    root = _tree(tmp_path / 'root')
+    _slow_scandir(monkeypatch)
+
+    assert sorted(_relative(root, walk_files(root, ordered=False))) == sorted(ORDERED)
+
+
+def test_closing_the_walk_early(tmp_path):
+    root = _tree(tmp_path / 'root')
+
+    walk = walk_files(root)
+    assert [next(walk), next(walk)] == [root / 'a.jpg', root / 'b.jpg']
+    walk.close()
+    assert list(walk) == []
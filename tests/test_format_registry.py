@@ -0,0 +1,82 @@
+"""
+Tests for the format handler registry.
+
+Copyright 2025 DNAi inc.
+"""
+
+import struct
+
+from dnexif import DNExif
+from dnexif.format_detector import FormatDetector
+from dnexif.format_registry import FORMAT_HANDLERS
+
+RAR5 = b'Rar!\x1a\x07\x01\x00'
+SEVEN_ZIP = b'7z\xbc\xaf\x27\x1c'
+APPLEDOUBLE = struct.pack('>II', 0x00051607, 0x00020000) + b'Mac OS X'.ljust(16) + struct.pack('>H', 0)
+
+# (file name, first bytes of the file, expected handler name or None)
+PRECEDENCE_CASES = (
+    # Magic bytes win over the extension and the AppleDouble prefix
+    ('archive.txt', RAR5 + bytes(8), 'RAR'),
+    ('archive.json', SEVEN_ZIP + bytes(8), '7z'),
+    ('._archive.txt', RAR5, 'RAR'),
+    # The AppleDouble prefix wins over the extension
+    ('._photo.jpg', APPLEDOUBLE, 'AppleDouble'),
+    ('._notes.txt', b'', 'AppleDouble'),
+    ('._scan.FITS', b'', 'AppleDouble'),
+    # Exact file names win over the extension
+    ('.DS_Store', b'', 'DS_Store'),
+    # Extensions are matched case-insensitively
+    ('IMAGE.XCF', b'', 'XCF'),
+    # Formats read inline by DNExif have no handler
+    ('photo.jpg', b'\xff\xd8\xff\xe0', None),
+    ('clip.mp4', b'', None),
+    ('notes', b'', None),
+)
+
+
+def _detect(file_name, header=b''):
+    handler = FormatDetector.detect_handler(file_name, header)
+    return handler.name if handler is not None else None
+
+
+def test_every_extension_selects_the_first_handler_listing_it():
+    for extension in {ext for handler in FORMAT_HANDLERS for ext in handler.extensions}:
+        expected = next(handler for handler in FORMAT_HANDLERS if extension in handler.extensions)
+        assert _detect('file' + extension) == expected.name, extension
+
+
+def test_every_signature_selects_its_handler_whatever_the_extension():
+    for handler in FORMAT_HANDLERS:
+        for signature in handler.magic:
+            assert _detect('file.bin', signature + bytes(16)) == handler.name, signature
+            assert _detect('file.csv', signature) == handler.name, signature
+
+
+def test_every_file_name_and_prefix_selects_its_handler():
+    for handler in FORMAT_HANDLERS:
+        for file_name in handler.file_names:
+            assert _detect(file_name) == handler.name, file_name
+        for prefix in handler.name_prefixes:
+            assert _detect(prefix + 'file.unknown') == handler.name, prefix
+
+
+def test_lookup_precedence():
+    for file_name, header, expected in PRECEDENCE_CASES:
+        assert _detect(file_name, header) == expected, file_name
+
+
+def test_every_handler_parser_can_be_loaded():
+    for handler in FORMAT_HANDLERS:
+        parser = handler.load_parser()
+        assert parser.__name__ == handler.parser
+        assert callable(getattr(parser, 'parse'))
+
+
+def test_appledouble_sidecar_with_image_extension_is_read_as_appledouble(tmp_path):
+    path = tmp_path / '._photo.jpg'
+    path.write_bytes(APPLEDOUBLE)
+
+    metadata = DNExif(path).get_all_metadata()
+    assert metadata['File:FileType'] == 'AppleDouble'
+    assert metadata['AppleDouble:Version'] == '1'
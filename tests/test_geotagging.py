@@ -0,0 +1,61 @@
+"""
+Tests for geotagging from track logs.
+
+Copyright 2025 DNAi inc.
+"""
+
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+from dnexif import DNExif
+from dnexif.exceptions import MetadataWriteError
+from dnexif.geotagging import Geotagging, GPSPoint, GPSTrack
+
+DATA_DIR = Path(__file__).parent / 'data'
+
+
+def _track():
+    return GPSTrack([
+        GPSPoint(10.0, 20.0, datetime(2020, 1, 2, 3, 0, 0), 100.0),
+        GPSPoint(11.0, 21.0, datetime(2020, 1, 2, 3, 10, 0), 110.0),
+    ])
+
+
+def test_optional_tag_that_fails_to_save_is_skipped(tmp_path, monkeypatch):
+    image = tmp_path / 'image.tiff'
+    shutil.copy(DATA_DIR / 'canon_iptc.tiff', image)
+
+    save = DNExif.save
+    saved_tags = set()
+
+    def save_rejecting_quadrant(self, output_path=None):
+        if 'GPS:GPSQuadrant' in self.modified_tags:
+            raise MetadataWriteError("cannot write GPSQuadrant")
+        saved_tags.update(self.modified_tags)
+        save(self, output_path)
+
+    monkeypatch.setattr(DNExif, 'save', save_rejecting_quadrant)
+    result = Geotagging.geotag_batch([image], _track(), gps_hpos_err=4.0, gps_quadrant='NE')[str(image)]
+
+    assert result['success']
+    assert result['gpshposerr'] == 4.0
+    assert 'gpsquadrant' not in result
+    assert {'GPS:GPSLatitude', 'GPS:GPSLongitude', 'GPS:GPSHPositioningError'} <= saved_tags
+    assert 'GPS:GPSQuadrant' not in saved_tags
+
+
+def test_failed_tag_group_is_rolled_back():
+    class Manager:
+        def __init__(self):
+            self.modified_tags = {'GPS:GPSImgDirectionRef': 'M'}
+
+        def set_tag(self, tag_name, value):
+            if tag_name == 'GPS:GPSImgDirection':
+                raise ValueError(value)
+            self.modified_tags[tag_name] = value
+
+    manager = Manager()
+    assert not Geotagging._set_tags_or_restore(
+        manager, {'GPS:GPSImgDirectionRef': 'T', 'GPS:GPSImgDirection': 'bad'})
+    assert manager.modified_tags == {'GPS:GPSImgDirectionRef': 'M'}
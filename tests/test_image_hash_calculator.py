@@ -0,0 +1,114 @@
+"""
+Tests for the image data hash calculator.
+
+Copyright 2025 DNAi inc.
+"""
+
+import hashlib
+import struct
+
+from dnexif.image_hash_calculator import (
+    HASH_CHUNK_SIZE,
+    TREE_LEAF_PREFIX,
+    TREE_NODE_PREFIX,
+    ImageHashCalculator,
+    calculate_image_data_hash,
+    calculate_image_data_hash_tree,
+    calculate_image_data_hashes,
+    merkle_root,
+    verify_hash_tree_leaves,
+)
+
+ALGORITHMS = ('md5', 'sha1', 'sha256', 'blake2b')
+
+
+def _payload(size):
+    # No 0xFF bytes, so a JPEG scan made of it contains no markers
+    return bytes(index * 7 % 255 for index in range(size))
+
+
+def _riff_chunk(chunk_id, data):
+    return chunk_id + struct.pack('<I', len(data)) + data + b'\x00' * (len(data) % 2)
+
+
+def _wav(path, samples):
+    fmt = struct.pack('<HHIIHH', 1, 1, 8000, 8000, 1, 8)
+    info = _riff_chunk(b'LIST', b'INFO' + _riff_chunk(b'INAM', b'title\x00'))
+    body = b'WAVE' + _riff_chunk(b'fmt ', fmt) + info + _riff_chunk(b'data', samples)
+    path.write_bytes(b'RIFF' + struct.pack('<I', len(body)) + body)
+    return path
+
+
+def _jpeg(path, scan):
+    exif = b'\xff\xe1' + struct.pack('>H', 2 + 8) + b'Exif\x00\x00II'
+    sos = b'\xff\xda' + struct.pack('>H', 2)
+    path.write_bytes(b'\xff\xd8' + exif + sos + scan + b'\xff\xd9')
+    return path
+
+
+def _leaf(data):
+    return hashlib.sha256(TREE_LEAF_PREFIX + data).digest()
+
+
+def _node(left, right):
+    return hashlib.sha256(TREE_NODE_PREFIX + left + right).digest()
+
+
+def test_data_larger_than_one_chunk_matches_hashlib(tmp_path):
+    samples = _payload(2 * HASH_CHUNK_SIZE + 12345)
+    path = _wav(tmp_path / 'audio.wav', samples)
+
+    hashes = calculate_image_data_hashes(path, ALGORITHMS)
+    assert hashes == {name: hashlib.new(name, samples).hexdigest() for name in ALGORITHMS}
+    assert calculate_image_data_hash(path, 'sha256') == hashlib.sha256(samples).hexdigest()
+
+
+def test_jpeg_scan_end_marker_split_across_chunks(tmp_path):
+    # The scan starts right after the SOS header, so its EOI marker begins
+    # on the last byte of the first chunk and ends in the second
+    for scan_size in (HASH_CHUNK_SIZE - 1, HASH_CHUNK_SIZE, 3 * HASH_CHUNK_SIZE + 5):
+        scan = _payload(scan_size)
+        path = _jpeg(tmp_path / 'image.jpg', scan)
+        expected = b'\xff\xd8' + b'\xff\xda' + scan + b'\xff\xd9'
+
+        hashes = ImageHashCalculator(list(ALGORITHMS)).calculate_hash(path)
+        assert hashes == {name: hashlib.new(name, expected).hexdigest() for name in ALGORITHMS}
+
+
+def test_merkle_root_pairs_digests_and_promotes_the_odd_one():
+    leaves = [_leaf(bytes([index])) for index in range(5)]
+
+    assert merkle_root(leaves[:1], 'sha256') == leaves[0]
+    assert merkle_root(leaves[:2], 'sha256') == _node(leaves[0], leaves[1])
+    assert merkle_root(leaves, 'sha256') == _node(
+        _node(_node(leaves[0], leaves[1]), _node(leaves[2], leaves[3])),
+        leaves[4],
+    )
+    assert merkle_root([], 'sha256') == hashlib.sha256().digest()
+
+
+def test_hash_tree_leaves_detect_tampered_data(tmp_path):
+    leaf_size = 64 * 1024
+    samples = _payload(5 * leaf_size + 100)
+    path = _wav(tmp_path / 'audio.wav', samples)
+    data_offset = len(path.read_bytes()) - len(samples)
+
+    tree = calculate_image_data_hash_tree(path, 'sha256', leaf_size=leaf_size)
+    pieces = [samples[start:start + leaf_size] for start in range(0, len(samples), leaf_size)]
+    assert [leaf.offset for leaf in tree.leaves] == [data_offset + leaf_size * i for i in range(6)]
+    assert [leaf.digest for leaf in tree.leaves] == [_leaf(piece).hex() for piece in pieces]
+    assert tree.root == merkle_root([_leaf(piece) for piece in pieces], 'sha256').hex()
+    assert calculate_image_data_hash_tree(path, 'sha256', leaf_size=leaf_size, workers=1) == tree
+    assert verify_hash_tree_leaves(path, tree) == []
+
+    data = bytearray(path.read_bytes())
+    data[data_offset + 2 * leaf_size + 17] ^= 0x01
+    path.write_bytes(bytes(data))
+
+    assert verify_hash_tree_leaves(path, tree) == [2]
+    assert verify_hash_tree_leaves(path, tree, [0, 1, 3]) == []
+    assert calculate_image_data_hash_tree(path, 'sha256', leaf_size=leaf_size).root != tree.root
+
+    # Leaves cut short by truncation no longer match
+    path.write_bytes(bytes(data[:data_offset + 4 * leaf_size + 10]))
+    assert verify_hash_tree_leaves(path, tree) == [2, 4, 5]
@@ -0,0 +1,117 @@
+"""
+Tests for the single-pass JPEG segment rewriter.
+
+Copyright 2025 DNAi inc.
+"""
+
+import io
+import shutil
+import struct
+from pathlib import Path
+
+from dnexif import DNExif
+from dnexif.jpeg_modifier import JPEGSegmentRewriter
+
+DATA_DIR = Path(__file__).parent / 'data'
+
+
+def _segment(code, payload):
+    return bytes([0xFF, code]) + struct.pack('>H', len(payload) + 2) + payload
+
+
+EXIF = _segment(0xE1, b'Exif\x00\x00' + b'MM\x00\x2a\x00\x00\x00\x08\x00\x00')
+XMP = _segment(0xE1, b'http://ns.adobe.com/xap/1.0/\x00<x:xmpmeta/>')
+ICC = _segment(0xE2, b'ICC_PROFILE\x00\x01\x01' + bytes(16))
+PHOTOSHOP = _segment(0xED, b'Photoshop 3.0\x008BIM')
+
+
+def _split(data):
+    """Split a JPEG into its header segments and the data from the SOS marker on."""
+    assert data[:2] == b'\xff\xd8'
+    segments = []
+    offset = 2
+    while data[offset + 1] != 0xDA:
+        length = struct.unpack('>H', data[offset + 2:offset + 4])[0]
+        segments.append(data[offset:offset + 2 + length])
+        offset += 2 + length
+    return segments, data[offset:]
+
+
+def _rewrite(data, replacements):
+    rewriter = JPEGSegmentRewriter(io.BytesIO(data))
+    for kind, segment in replacements.items():
+        rewriter.replace(kind, segment)
+    output = io.BytesIO()
+    rewriter.write(output)
+    return output.getvalue()
+
+
+def _jpeg(*app_segments):
+    """Insert APPn segments after the JFIF APP0 of the plain test JPEG."""
+    segments, scan = _split((DATA_DIR / 'plain.jpg').read_bytes())
+    return b'\xff\xd8' + segments[0] + b''.join(app_segments) + b''.join(segments[1:]) + scan
+
+
+def test_replaced_segments_keep_their_position():
+    data = _jpeg(EXIF, ICC, XMP)
+    new_exif = _segment(0xE1, b'Exif\x00\x00' + b'II\x2a\x00\x08\x00\x00\x00\x00\x00')
+    new_xmp = _segment(0xE1, b'http://ns.adobe.com/xap/1.0/\x00<x:xmpmeta>new</x:xmpmeta>')
+
+    segments, scan = _split(data)
+    new_segments, new_scan = _split(_rewrite(data, {
+        JPEGSegmentRewriter.EXIF: new_exif,
+        JPEGSegmentRewriter.XMP: new_xmp,
+    }))
+
+    assert new_segments == [new_exif if s == EXIF else new_xmp if s == XMP else s for s in segments]
+    assert new_scan == scan
+
+
+def test_removed_segment_is_dropped():
+    data = _jpeg(EXIF, XMP, ICC)
+    segments, scan = _split(data)
+    new_segments, new_scan = _split(_rewrite(data, {JPEGSegmentRewriter.XMP: b''}))
+
+    assert new_segments == [segment for segment in segments if segment != XMP]
+    assert new_scan == scan
+
+
+def test_absent_segments_are_inserted_in_marker_order():
+    data = _jpeg()
+    segments, scan = _split(data)
+    new_segments, new_scan = _split(_rewrite(data, {
+        JPEGSegmentRewriter.ICC: ICC,
+        JPEGSegmentRewriter.PHOTOSHOP: PHOTOSHOP,
+        JPEGSegmentRewriter.XMP: XMP,
+        JPEGSegmentRewriter.EXIF: EXIF,
+    }))
+
+    assert new_segments == [segments[0], EXIF, XMP, ICC, PHOTOSHOP] + segments[1:]
+    assert new_scan == scan
+
+
+def test_replaced_icc_profile_drops_all_old_chunks():
+    second_chunk = _segment(0xE2, b'ICC_PROFILE\x00\x02\x02' + bytes(8))
+    data = _jpeg(EXIF, ICC, second_chunk)
+    new_icc = _segment(0xE2, b'ICC_PROFILE\x00\x01\x01' + bytes(4))
+    new_segments, _ = _split(_rewrite(data, {JPEGSegmentRewriter.ICC: new_icc}))
+
+    assert new_segments[1:3] == [EXIF, new_icc]
+    assert second_chunk not in new_segments
+
+
+def test_save_keeps_scan_data_byte_identical(tmp_path):
+    path = tmp_path / 'image.jpg'
+    shutil.copy(DATA_DIR / 'xmp_create_date.jpg', path)
+    segments, scan = _split(path.read_bytes())
+
+    exif = DNExif(path)
+    exif.set_tag('EXIF:Artist', 'Alice')
+    exif.save()
+
+    new_segments, new_scan = _split(path.read_bytes())
+    assert new_scan == scan
+    # The JFIF APP0 and the image segments after the metadata are untouched
+    assert new_segments[0] == segments[0]
+    assert new_segments[-len(segments) + 2:] == segments[2:]
+    assert DNExif(path).get_tag('EXIF:Artist') == 'Alice'
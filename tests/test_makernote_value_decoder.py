@@ -0,0 +1,104 @@
+"""
+Tests for the MakerNote value decoder.
+
+Copyright 2025 DNAi inc.
+"""
+
+import hashlib
+import struct
+
+from dnexif.makernote_value_decoder import MakerNoteValueDecoder
+
+# (manufacturer, tag ID, parent tag name, raw SHORT value, decoded value),
+# recorded with the manufacturer/tag if-chains that preceded the value map
+# registries
+CASES = (
+    ('canon', 0x0001, 'CanonCameraSettings', 1, 'On'),
+    ('canon', 0x0001, 'CanonCameraSettings', 9, 9),
+    ('canon', 0x0003, 'CanonCameraSettings', 4, 'RAW+Normal'),
+    ('canon', 0x000F, 'CanonCameraSettings', 3, 'Evaluative'),
+    ('canon', 0x000A, 'CanonCameraSettings', 15, 'ISO 50'),
+    ('canon', 0x000E, 'CanonCameraSettings', 1, 1),
+    ('canon', 0x0006, 'CanonCameraSettings', 1, 'Standard'),
+    ('canon', 0x0004, 'CanonCameraSettings', 3, 'Red-eye Reduction'),
+    ('canon', 0x000C, 'CanonCameraSettings', 1, 'Auto'),
+    ('canon', 0x000C, None, 33, 'LongExposureNoiseReduction, AEBSequence (33)'),
+    ('canon', 0x000C, 'CanonFileInfo', 0, 0),
+    ('canon', 0x0001, 'CanonFlashInfo', 1, 'Auto'),
+    ('canon', 0x0003, 'CanonFlashInfo', 3, 'Fine'),
+    ('canon', 0x0007, 'CanonShotInfo', 1, 'Daylight'),
+    ('canon', 0x0006, 'CanonShotInfo', 1, 1),
+    ('canon', 0x0008, 'CanonShotInfo', 0, 'Off'),
+    ('canon', 0x0001, 'CanonAFInfo2', 1, 'Single-point AF'),
+    ('canon', 0x0006, 'CanonAFInfo2', 1, 'Standard'),
+    ('canon', 0x0007, None, 1, 'Daylight'),
+    ('canon', 0x0007, 'CanonFileInfo', 1, 1),
+    ('canon', 0x0001, None, 5, 'MacroMode, Quality (5)'),
+    ('canon', 0x0001, None, 0, 0),
+    ('canon', 0x0013, 'CanonFileInfo', 1, 'Vivid'),
+    ('canon', 0x0400, None, 1, 1),
+    ('nikon', 0x0003, None, 1, 'Color'),
+    ('nikon', 0x0007, None, 1, 'AF-S'),
+    ('nikon', 0x0008, None, 3, 'FlashFired, FlashMode (3)'),
+    ('nikon', 0x0016, None, 6, 'ActiveD-Lighting, VignetteControl (6)'),
+    ('nikon', 0x001A, None, 9, 9),
+    ('sony', 0x0102, None, 1, 'RAW+JPEG'),
+    ('sony', 0x0104, None, 1, 'Vivid'),
+    ('sony', 0x0100, None, 5, 'AFMode, FocusMode (5)'),
+    ('sony', 0x0100, None, 0, 0),
+    ('olympus', 0x0100, None, 1, 'Unknown'),
+    ('olympus', 0x0100, None, 12, 12),
+    ('olympus', 0x0116, 'Equipment', 2, 'Program'),
+    ('pentax', 0x0008, None, 1, 'AF-S'),
+    ('pentax', 0x000B, None, 1, 'Flash Fired'),
+    ('pentax', 0x0013, None, 2, 'Adobe RGB'),
+    ('fujifilm', 0x1003, None, 1, 'Normal'),
+    ('fujifilm', 0x101D, None, 1, 'Normal'),
+    ('fujifilm', 0x1004, None, 256, 'Daylight'),
+    ('fujifilm', 0x1025, None, 256, 'Daylight'),
+    ('fujifilm', 0x1050, None, 1, 'Electronic'),
+    ('panasonic', 0x00A5, None, 1, 'Dynamic (color)'),
+    ('panasonic', 0x00CA, None, 1, 'Dynamic (color)'),
+    ('panasonic', 0x0006, None, 1, 'On'),
+    ('panasonic', 0x0003, None, 2, 'Daylight'),
+    ('kodak', 0x0001, None, 1, 1),
+)
+
+MANUFACTURERS = ('canon', 'nikon', 'sony', 'olympus', 'pentax', 'fujifilm', 'panasonic', 'kodak')
+CANON_PARENTS = ('CanonCameraSettings', 'CanonFlashInfo', 'CanonShotInfo', 'CanonAFInfo2')
+SWEEP_VALUES = (0, 1, 2, 3, 5, 6, 33, 256)
+# SHA-256 of every decoded value for tag IDs 0-0x10FF, one per line,
+# recorded with the if-chain implementation
+SWEEP_DIGEST = 'a53490ed53ce891f139c5b3019994d6e68f7e3c7af9aa515c75f553042b9e3c0'
+
+
+def _decode(decoder, manufacturer, tag_id, parent_tag_name, value):
+    data = struct.pack('<H', value)
+    if manufacturer == 'nikon':
+        return decoder.decode_nikon_value(tag_id, 3, 1, data, 0)
+    decode = getattr(decoder, 'decode_%s_value' % manufacturer)
+    return decode(tag_id, 3, 1, data, 0, parent_tag_name=parent_tag_name)
+
+
+def _sweep_digest():
+    decoder = MakerNoteValueDecoder('<')
+    digest = hashlib.sha256()
+    for manufacturer in MANUFACTURERS:
+        parents = (None, 'MakerNoteUnknown') + (CANON_PARENTS if manufacturer == 'canon' else ())
+        for parent_tag_name in parents:
+            for tag_id in range(0x1100):
+                for value in SWEEP_VALUES:
+                    decoded = _decode(decoder, manufacturer, tag_id, parent_tag_name, value)
+                    digest.update(repr(decoded).encode('utf-8') + b'\n')
+    return digest.hexdigest()
+
+
+def test_decoded_values_match_previous_implementation():
+    decoder = MakerNoteValueDecoder('<')
+    for manufacturer, tag_id, parent_tag_name, value, expected in CASES:
+        decoded = _decode(decoder, manufacturer, tag_id, parent_tag_name, value)
+        assert decoded == expected, (manufacturer, hex(tag_id), parent_tag_name, value)
+
+
+def test_sweep_matches_previous_implementation():
+    assert _sweep_digest() == SWEEP_DIGEST
@@ -0,0 +1,86 @@
+"""
+Tests for atomic output files and file cloning.
+
+Copyright 2025 DNAi inc.
+"""
+
+import errno
+import io
+import os
+import stat
+
+import pytest
+
+from dnexif.stream_copy import atomic_output, atomic_write, clone_file, copy_range
+
+
+def _temp_files(directory):
+    return [path.name for path in directory.iterdir() if path.name.endswith('.tmp')]
+
+
+def test_write_through_symlink_keeps_the_link(tmp_path):
+    target = tmp_path / 'real.jpg'
+    target.write_bytes(b'old')
+    link = tmp_path / 'link.jpg'
+    link.symlink_to(target)
+
+    atomic_write(link, b'new')
+
+    assert link.is_symlink()
+    assert os.readlink(link) == str(target)
+    assert target.read_bytes() == b'new'
+
+
+def test_replaced_file_keeps_its_mode(tmp_path):
+    path = tmp_path / 'image.jpg'
+    path.write_bytes(b'old')
+    path.chmod(0o640)
+
+    atomic_write(path, b'new')
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+    assert path.read_bytes() == b'new'
+
+
+def test_temp_file_is_removed_when_writing_fails(tmp_path):
+    path = tmp_path / 'image.jpg'
+    path.write_bytes(b'old')
+
+    with pytest.raises(RuntimeError):
+        with atomic_output(path) as output:
+            output.write(b'partial')
+            raise RuntimeError('write failed')
+
+    assert path.read_bytes() == b'old'
+    assert _temp_files(tmp_path) == []
+
+
+def test_clone_file_copies_when_reflinks_are_unsupported(tmp_path, monkeypatch):
+    fcntl = pytest.importorskip('fcntl')
+
+    def ioctl(*args):
+        raise OSError(errno.EOPNOTSUPP, 'Operation not supported')
+
+    monkeypatch.setattr(fcntl, 'ioctl', ioctl)
+    source = tmp_path / 'image.jpg'
+    data = os.urandom(3 * 1024 * 1024 + 17)
+    source.write_bytes(data)
+    source.chmod(0o604)
+    os.utime(source, (1_000_000_000, 1_000_000_000))
+    backup = tmp_path / 'image.jpg_original'
+
+    assert clone_file(source, backup) is False
+    assert backup.read_bytes() == data
+    assert stat.S_IMODE(backup.stat().st_mode) == 0o604
+    assert backup.stat().st_mtime == 1_000_000_000
+    assert _temp_files(tmp_path) == []
+
+
+def test_copy_range_without_file_descriptors():
+    source = io.BytesIO(bytes(range(256)) * 10)
+    output = io.BytesIO()
+    output.write(b'header')
+
+    assert copy_range(source, output, 100, 1000) == 1000
+    assert copy_range(source, output, 2500) == 60
+    assert output.getvalue() == b'header' + source.getvalue()[100:1100] + source.getvalue()[2500:]
@@ -0,0 +1,168 @@
+"""
+Tests for the writers that copy image and audio data from the original file.
+
+Copyright 2025 DNAi inc.
+"""
+
+import hashlib
+import shutil
+import struct
+import wave
+from pathlib import Path
+
+import pytest
+
+from dnexif import DNExif
+from dnexif.gif_writer import GIFWriter
+from dnexif.tiff_writer import TIFFWriter
+
+DATA_DIR = Path(__file__).parent / 'data'
+
+AUDIO = bytes(i * 7 % 256 for i in range(3000))
+STRIPS = (bytes(range(0, 8)), bytes(range(8, 16)), bytes(range(16, 24)))
+
+
+def _wav(path):
+    with wave.open(str(path), 'wb') as output:
+        output.setnchannels(1)
+        output.setsampwidth(2)
+        output.setframerate(8000)
+        output.writeframes(AUDIO)
+
+
+def _mp3(path):
+    path.write_bytes(b'ID3\x03\x00\x00\x00\x00\x00\x0a' + bytes(10) + b'\xff\xfb\x90\x64' + AUDIO)
+
+
+def _flac(path):
+    streaminfo = b'\x00' + (34).to_bytes(3, 'big') + bytes(range(34))
+    padding = b'\x81' + (16).to_bytes(3, 'big') + bytes(16)
+    path.write_bytes(b'fLaC' + streaminfo + padding + b'\xff\xf8' + AUDIO)
+
+
+def _tiff(path):
+    """Write a 4x6 grayscale TIFF whose three strips are stored in reverse order."""
+    strips_start = 8 + 2 + 9 * 12 + 4 + 24
+    offsets = [strips_start + 8 * (2 - index) for index in range(3)]
+    entries = [
+        (256, 3, 1, 4),  # ImageWidth
+        (257, 3, 1, 6),  # ImageLength
+        (258, 3, 1, 8),  # BitsPerSample
+        (259, 3, 1, 1),  # Compression
+        (262, 3, 1, 1),  # PhotometricInterpretation
+        (273, 4, 3, strips_start - 24),  # StripOffsets
+        (277, 3, 1, 1),  # SamplesPerPixel
+        (278, 3, 1, 2),  # RowsPerStrip
+        (279, 4, 3, strips_start - 12),  # StripByteCounts
+    ]
+    ifd = struct.pack('<H', len(entries))
+    for tag_id, tag_type, count, value in entries:
+        packed = struct.pack('<HH', value, 0) if tag_type == 3 else struct.pack('<I', value)
+        ifd += struct.pack('<HHI', tag_id, tag_type, count) + packed
+    ifd += struct.pack('<I', 0)
+    path.write_bytes(b'II*\x00' + struct.pack('<I', 8) + ifd
+                     + struct.pack('<3I', *offsets) + struct.pack('<3I', 8, 8, 8)
+                     + b''.join(reversed(STRIPS)))
+
+
+def _sub_blocks(data):
+    return b''.join(bytes([len(data[i:i + 255])]) + data[i:i + 255]
+                    for i in range(0, len(data), 255)) + b'\x00'
+
+
+def _gif(path):
+    """Write a two-frame GIF; the second frame spans several RangedFile blocks."""
+    def frame(size):
+        return (b'\x21\xf9\x04\x04\x0a\x00\x00\x00' + b'\x2c' + bytes(9) + b'\x08'
+                + _sub_blocks(bytes(i % 251 for i in range(size))))
+    path.write_bytes(b'GIF89a' + b'\x10\x00\x10\x00\xf1\x00\x00' + bytes(12)
+                     + b'\x21\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00'
+                     + b'\x21\xfe' + _sub_blocks(b'c' * 300)
+                     + frame(1000) + frame(200000) + b'\x3b')
+
+
+def _copy(name):
+    return lambda path: shutil.copy(DATA_DIR / name, path)
+
+
+SAMPLES = {
+    'image.jpg': _copy('plain.jpg'),
+    'image.png': _copy('plain.png'),
+    'image.webp': _copy('plain.webp'),
+    'image.gif': _gif,
+    'audio.wav': _wav,
+    'audio.mp3': _mp3,
+    'audio.flac': _flac,
+}
+
+TAGS = (
+    {'EXIF:Artist': 'Ann', 'XMP:Title': 'Hello'},
+    {'XMP:Title': 't' * 301},
+)
+
+# SHA-256 of the files saved by the writers that read the whole original
+# into memory, before the image and audio data was copied from the file
+# (TIFF is left out: those writers misplaced the offsets of multiple strips)
+EXPECTED = {
+    ('image.jpg', 0): '27ad12426e1a850c4d950233384713f98e0d48e735e5c2413c0533b70b288815',
+    ('image.jpg', 1): 'd6fc236cc54d5c26542e8a6834caff8ed2df51788ffc754a02c6ed4912ac32ab',
+    ('image.png', 0): '0d745c37c83cb9d745c325fe58abc9982221853a7732e2e89c9128321f97ea98',
+    ('image.png', 1): '16fa46a124bcd7574b8bbaa35b131348ed30ff51c6cf915cb003a22ddb5f7ab1',
+    ('image.webp', 0): 'fb4ebbabed59e67dd64bea78b43a81ee2f9caf7737987ea1e2615bdff6d9d80f',
+    ('image.webp', 1): 'cf1658bbd48aa2cb2416bd1070ab4cd1eedaf5ba8072e2c21ef9d971b0ad9545',
+    ('image.gif', 0): '0be495886cbac284f3684e1ef900403327642837b131c2002942432adc5e0e0d',
+    ('image.gif', 1): '8e07a5aca8eb495f94d1f52dfef99988e2d5c8e444867ae3d7ae567869759e33',
+    ('audio.wav', 0): '7009cae0c7c7e1ea01389d08ba41738d68bb2ab7b02a17d35b511e3dad3d6c4a',
+    ('audio.wav', 1): '65ca2ece659bd23d7eda7557ff6a3af87dfdbd8040111f5cf95219eb498b24a8',
+    ('audio.mp3', 0): 'e529cb88b3522b98e8034e816df0d133227aa7927715cc43b7a2749990b5053e',
+    ('audio.mp3', 1): 'ddd5ff321a74b5b60873dcc15c762e889b5f98fae9c608f5dfa18f1319c1891b',
+    ('audio.flac', 0): 'f8c2f1c4cba73b53a8f9c3e741766d05cf0cda0b76828bc7fd5f37eff3ab60b5',
+    ('audio.flac', 1): '9d1c434750ea935153242064e670b695e17d2557a1e8a73695683182bd4fa205',
+}
+
+
+@pytest.mark.parametrize('name,tags_index', sorted(EXPECTED))
+def test_save_matches_in_memory_writer(tmp_path, name, tags_index):
+    path = tmp_path / name
+    SAMPLES[name](path)
+
+    exif = DNExif(path)
+    for tag, value in TAGS[tags_index].items():
+        exif.set_tag(tag, value)
+    exif.save()
+
+    assert hashlib.sha256(path.read_bytes()).hexdigest() == EXPECTED[name, tags_index]
+
+
+def test_tiff_strips_are_copied_to_their_new_offsets(tmp_path):
+    path = tmp_path / 'image.tif'
+    _tiff(path)
+    for artist in ('Ann', 'Bob'):
+        exif = DNExif(path)
+        exif.set_tag('EXIF:Artist', artist)
+        exif.save()
+
+        data = path.read_bytes()
+        image_ranges, offsets, byte_counts, _, _, _ = TIFFWriter()._locate_image_data(data)
+        assert byte_counts == [8, 8, 8]
+        assert offsets == [len(data) - 24, len(data) - 16, len(data) - 8]
+        assert [data[start:end] for start, end in image_ranges] == list(STRIPS)
+        assert DNExif(path).get_tag('EXIF:Artist') == artist
+
+
+def test_tiff_file_writer_matches_bytes_writer(tmp_path):
+    path = tmp_path / 'image.tif'
+    _tiff(path)
+    TIFFWriter().write_tiff_file(str(path), {'XMP:Title': 'Hello'}, str(tmp_path / 'streamed.tif'))
+    TIFFWriter().write_tiff(path.read_bytes(), {'XMP:Title': 'Hello'}, str(tmp_path / 'buffered.tif'))
+
+    assert (tmp_path / 'streamed.tif').read_bytes() == (tmp_path / 'buffered.tif').read_bytes()
+
+
+def test_gif_file_writer_matches_bytes_writer(tmp_path):
+    path = tmp_path / 'image.gif'
+    _gif(path)
+    GIFWriter().write_gif_file(str(path), {'XMP:Title': 'Hello'}, str(tmp_path / 'streamed.gif'))
+    GIFWriter().write_gif(path.read_bytes(), {'XMP:Title': 'Hello'}, str(tmp_path / 'buffered.gif'))
+
+    assert (tmp_path / 'streamed.gif').read_bytes() == (tmp_path / 'buffered.gif').read_bytes()
@@ -0,0 +1,171 @@
+"""
+Tests for the EXIF value formatter.
+
+Copyright 2025 DNAi inc.
+"""
+
+import hashlib
+import itertools
+
+from dnexif.value_formatter import format_exif_value
+
+SONY_ARW = {'Make': 'SONY', 'FileType': 'ARW'}
+
+# (tag name, raw value, context, formatted value), recorded with the
+# if-chain implementation that preceded the formatter tables
+CASES = (
+    ('EXIF:Compression', 6, None, 'JPEG (old-style)'),
+    ('EXIF:Compression', 6, SONY_ARW, 'Sony ARW Compressed'),
+    ('EXIF:Compression', 34713, None, 'Nikon NEF Compressed'),
+    ('EXIF:Compression', 12345, None, '12345'),
+    ('EXIF:PhotometricInterpretation', 2, None, 'RGB'),
+    ('EXIF:PhotometricInterpretation', 32803, None, 'Color Filter Array'),
+    ('IFD0:Orientation', 6, None, 'Rotate 90 CW'),
+    ('IFD0:Orientation', 9, None, '9'),
+    ('IFD0:Orientation', '6', None, '6'),
+    ('EXIF:ResolutionUnit', 2, None, 'inches'),
+    ('EXIF:ResolutionUnit', (3, 1), None, 'cm'),
+    ('EXIF:FocalPlaneResolutionUnit', (4000, 1), {'FocalPlaneYResolution': 4000}, 'inches'),
+    ('EXIF:FocalPlaneResolutionUnit', (4000, 1), None, 'inches'),
+    ('EXIF:FocalPlaneResolutionUnit', (3, 1), None, 'cm'),
+    ('EXIF:YCbCrPositioning', 2, None, 'Co-sited'),
+    ('EXIF:PlanarConfiguration', 1, None, 'Chunky'),
+    ('EXIF:ExposureProgram', 3, None, 'Aperture-priority AE'),
+    ('EXIF:MeteringMode', 5, None, 'Multi-segment'),
+    ('EXIF:MeteringMode', 255, None, 'Other'),
+    ('EXIF:Flash', 0, None, 'No Flash'),
+    ('EXIF:Flash', 16, None, 'Off, Did not fire'),
+    ('EXIF:Flash', 32, None, 'No flash function'),
+    ('EXIF:Flash', 25, None, 'On, Fired'),
+    ('EXIF:Flash', 79, None, 'On, Fired | Return detected'),
+    ('EXIF:Flash', 7, None, 'On, Fired | Return detected'),
+    ('EXIF:LightSource', 17, None, 'Standard Light A'),
+    ('EXIF:ExposureMode', 1, None, 'Manual'),
+    ('EXIF:ExposureMode', 7, None, 'Unknown (7)'),
+    ('EXIF:WhiteBalance', 1, None, 'Manual'),
+    ('EXIF:SceneCaptureType', 3, None, 'Night'),
+    ('EXIF:Saturation', 2, None, 'High'),
+    ('EXIF:Saturation', b'\x01', None, 'Low'),
+    ('EXIF:Contrast', b'\x02', None, 'High'),
+    ('EXIF:Sharpness', 9, None, '9'),
+    ('EXIF:CustomRendered', 1, None, 'Custom'),
+    ('EXIF:GainControl', 4, None, 'High gain down'),
+    ('EXIF:SubjectDistanceRange', 2, None, 'Close'),
+    ('EXIF:Predictor', 2, None, 'Horizontal differencing'),
+    ('EXIF:SubjectDistance', (0, 1), None, '0 m'),
+    ('EXIF:SubjectDistance', (37, 100), None, '0.37 m'),
+    ('EXIF:SubjectDistance', (25, 2), None, '12.5 m'),
+    ('EXIF:SubjectDistance', (2500, 1), None, '2.50 km'),
+    ('EXIF:SubjectDistance', '3 2', None, '1.5 m'),
+    ('EXIF:SubjectDistance', 7, None, '7'),
+    ('EXIF:ExtraSamples', 2, None, 'Unassociated Alpha'),
+    ('EXIF:ExtraSamples', [1, 2], None, 'Associated Alpha'),
+    ('EXIF:ColorSpace', 1, None, 'sRGB'),
+    ('EXIF:ColorSpace', 65535, None, 'Uncalibrated'),
+    ('EXIF:ColorSpace', '1', None, 'sRGB'),
+    ('EXIF:ColorSpace', [2], None, '2'),
+    ('EXIF:InteroperabilityIndex', 'R98', None, 'R98 - DCF basic file (sRGB)'),
+    ('EXIF:InteroperabilityIndex', 'THM', None, 'THM'),
+    ('EXIF:SensingMethod', 2, None, 'One-chip color area'),
+    ('EXIF:DigitalZoomRatio', (0, 1), None, '0'),
+    ('EXIF:DigitalZoomRatio', (3, 2), None, '1.5'),
+    ('EXIF:DigitalZoomRatio', 2.0, None, '2'),
+    ('EXIF:DigitalZoomRatio', '10 10', None, '1'),
+    ('EXIF:DigitalZoomRatio', [5, 0], None, '5 0'),
+    ('GPS:GPSAltitudeRef', 1, None, 'Below sea level'),
+    ('GPS:GPSAltitudeRef', '0', None, 'Above sea level'),
+    ('GPS:GPSAltitudeRef', 'Below Sea Level', None, 'Below sea level'),
+    ('MakerNotes:AntiAliasStrength', (1, 2), None, '0.5'),
+    ('MakerNotes:AntiAliasStrength', '0 100', None, '0'),
+    ('EXIF:SubfileType', 1, None, 'Reduced-resolution image'),
+    ('EXIF:FillOrder', 2, None, 'Reversed'),
+    ('File:FileSize', 999, None, '999 bytes'),
+    ('File:FileSize', 4321, None, '4.3 kB'),
+    ('File:FileSize', 1500000, None, '1500 kB'),
+    ('File:FileSize', 12600000, None, '13 MB'),
+    ('File:FileSize', 16940000, None, '17 MB'),
+    ('File:FileSize', 1500000000, None, '1500 MB'),
+    ('File:FileSize', 3210000000, None, '3.2 GB'),
+    ('File:FileType', 'JPEG', None, 'JPEG'),
+    ('GIF:Duration', 1.5, None, '1.50 s'),
+    ('GIF:Duration', '2.345 s', None, '2.35 s'),
+    ('QuickTime:Duration', 1.5, None, '1.5'),
+    ('EXIF:ExposureTime', (1, 250), None, '1/250'),
+    ('EXIF:ExposureTime', (3, 10), None, '0.3'),
+    ('EXIF:ExposureTime', (2, 1), None, '2'),
+    ('EXIF:FNumber', (28, 10), None, '2.8'),
+    ('EXIF:ShutterSpeedValue', (8, 1), None, '1/256'),
+    ('EXIF:ApertureValue', (3, 1), None, '2.8'),
+    ('EXIF:CompressedBitsPerPixel', (4, 1000), None, '0.004'),
+    ('EXIF:CompressedBitsPerPixel', '2009:01:02 03:04:05', None, ''),
+    ('EXIF:XResolution', (72, 1), None, '72'),
+    ('EXIF:XResolution', (300, 4), None, '75'),
+    ('EXIF:FocalLength', (50, 1), None, '50.0 mm'),
+    ('EXIF:WhitePoint', [(3127, 10000), (329, 1000)], None, '0.3127 0.329'),
+    ('EXIF:ReferenceBlackWhite', [(0, 1), (255, 1)], None, '0 255'),
+    ('EXIF:DateTimeOriginal', b'2009:01:02 03:04:05\x00', None, '2009:01:02 03:04:05'),
+    ('EXIF:DateTimeOriginal', '50 48 48 57', {'FileType': 'DNG', 'EXIF:CreateDate': '2009:01:02 03:04:05'}, '2009:01:02 03:04:05'),
+    ('EXIF:DateTimeOriginal', (50, 48, 48, 57), {'FileType': '3FR', 'EXIF:DateTime': '2009:05:06 07:08:09'}, '2009:05:06 07:08:09'),
+    ('EXIF:Software', 'Editor 1.0', None, 'Editor 1.0'),
+    ('EXIF:ImageWidth', 640, None, '640'),
+    ('EXIF:BrightnessValue', 0.0, None, '0.0'),
+    ('EXIF:BrightnessValue', -0.0, None, '-0.0'),
+    ('EXIF:UserComment', None, None, ''),
+)
+
+SWEEP_TAGS = (
+    'Compression', 'PhotometricInterpretation', 'Orientation', 'ResolutionUnit',
+    'FocalPlaneResolutionUnit', 'YCbCrPositioning', 'PlanarConfiguration', 'ExposureProgram',
+    'MeteringMode', 'Flash', 'LightSource', 'ExposureMode', 'WhiteBalance', 'SceneCaptureType',
+    'Saturation', 'Contrast', 'Sharpness', 'CustomRendered', 'GainControl', 'SubjectDistance',
+    'SubjectDistanceRange', 'ExtraSamples', 'Predictor', 'ColorSpace', 'InteroperabilityIndex',
+    'SensingMethod', 'DigitalZoomRatio', 'GPSAltitudeRef', 'AntiAliasStrength', 'SubfileType',
+    'FillOrder', 'FileSize', 'FileType', 'Duration', 'ExposureTime', 'FNumber',
+    'ShutterSpeedValue', 'ApertureValue', 'CompressedBitsPerPixel', 'XResolution', 'FocalLength',
+    'DateTimeOriginal', 'WhitePoint', 'ColorMatrix1', 'Software',
+)
+SWEEP_VALUES = (
+    0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 16, 17, 24, 25, 32, 65, 255, 999, 65535, 4_321_000,
+    (0, 1), (1, 3), (3, 1), (72, 1), (4000, 1), (1, 0), [1, 2], [(3127, 10000), (1, 3)],
+    0.0, -0.0, 1.5, '0', '1', '2 1', 'R98', 'Above sea level', '50 48 48 57', b'\x02', b'2009\x00',
+)
+SWEEP_CONTEXTS = (
+    None,
+    SONY_ARW,
+    {'Make': 'Canon', 'FileType': 'DNG', 'EXIF:CreateDate': '2009:01:02 03:04:05'},
+    {'FileType': '3FR', 'EXIF:DateTime': '2009:05:06 07:08:09', 'FocalPlaneYResolution': 4000},
+)
+# SHA-256 of every formatted sweep combination, one per line, recorded with
+# the if-chain implementation
+SWEEP_DIGEST = '88c2b71b0edb6668833b6d45b88db7e732c890a87d8e710eec2601bd74a5c868'
+
+
+def _sweep_digest():
+    digest = hashlib.sha256()
+    for group, tag, value, context in itertools.product(
+            ('EXIF:', 'GIF:'), SWEEP_TAGS, SWEEP_VALUES, SWEEP_CONTEXTS):
+        try:
+            formatted = format_exif_value(group + tag, value, context)
+        except Exception as error:
+            formatted = '<' + type(error).__name__ + '>'
+        digest.update(formatted.encode('utf-8', 'surrogatepass') + b'\n')
+    return digest.hexdigest()
+
+
+def test_formatted_values_match_previous_implementation():
+    for tag_name, value, context, expected in CASES:
+        assert format_exif_value(tag_name, value, context) == expected, (tag_name, value, context)
+
+
+def test_repeated_calls_return_the_same_result():
+    for tag_name, value, context, expected in CASES:
+        first = format_exif_value(tag_name, value, context)
+        # An equal context dict shares the cache entry of the first call
+        again = format_exif_value(tag_name, value, dict(context) if context else context)
+        assert first == again == expected, (tag_name, value, context)
+
+
+def test_sweep_matches_previous_implementation():
+    assert _sweep_digest() == SWEEP_DIGEST
+    # The second pass is served from the result cache
+    assert _sweep_digest() == SWEEP_DIGEST
@@ -0,0 +1,111 @@
+"""
+Tests for MP4/MOV metadata writing.
+
+Copyright 2025 DNAi inc.
+"""
+
+import struct
+
+from dnexif.video_writer import VideoWriter
+
+PAYLOAD = bytes(range(256)) * 2
+CHUNKS = ((0, 100), (100, 300), (300, 512))
+
+
+def _atom(atom_type, body):
+    return struct.pack('>I4s', 8 + len(body), atom_type) + body
+
+
+def _moov(chunk_offsets):
+    stco = _atom(b'stco', struct.pack('>II', 0, len(chunk_offsets))
+                 + b''.join(struct.pack('>I', offset) for offset in chunk_offsets))
+    trak = _atom(b'trak', _atom(b'mdia', _atom(b'minf', _atom(b'stbl', stco))))
+    return _atom(b'moov', _atom(b'mvhd', bytes(100)) + trak)
+
+
+def _mp4(path, moov_first, padding=0):
+    """Write an MP4 file whose chunk offsets point into the mdat payload."""
+    ftyp = _atom(b'ftyp', b'isom\0\0\0\0isommp41')
+    free = _atom(b'free', bytes(padding - 8)) if padding else b''
+    if moov_first:
+        base = len(ftyp) + len(_moov([0] * len(CHUNKS))) + len(free) + 8
+        data = ftyp + _moov([base + start for start, _ in CHUNKS]) + free + _atom(b'mdat', PAYLOAD)
+    else:
+        base = len(ftyp) + 8
+        data = ftyp + _atom(b'mdat', PAYLOAD) + _moov([base + start for start, _ in CHUNKS]) + free
+    path.write_bytes(data)
+    return path
+
+
+def _top_level_atoms(data):
+    atoms = []
+    offset = 0
+    while offset + 8 <= len(data):
+        size, atom_type = struct.unpack('>I4s', data[offset:offset + 8])
+        assert size >= 8 and offset + size <= len(data)
+        atoms.append((atom_type, offset, size))
+        offset += size
+    assert offset == len(data)
+    return atoms
+
+
+def _assert_chunks_intact(path):
+    data = path.read_bytes()
+    moov = [(offset, size) for atom_type, offset, size in _top_level_atoms(data) if atom_type == b'moov']
+    assert len(moov) == 1
+    stco = data.index(b'stco', moov[0][0], moov[0][0] + moov[0][1])
+    count = struct.unpack('>I', data[stco + 8:stco + 12])[0]
+    offsets = struct.unpack(f'>{count}I', data[stco + 12:stco + 12 + 4 * count])
+    for offset, (start, end) in zip(offsets, CHUNKS):
+        assert data[offset:offset + end - start] == PAYLOAD[start:end]
+
+
+def _save(path, output=None, **metadata):
+    VideoWriter().write_video(str(path), metadata, str(output or path))
+
+
+def test_in_place_update_grows_moov_into_following_padding(tmp_path):
+    path = _mp4(tmp_path / 'a.mp4', moov_first=True, padding=512)
+    atoms_before = _top_level_atoms(path.read_bytes())
+    _save(path, **{'QuickTime:Title': 'title'})
+
+    atoms = _top_level_atoms(path.read_bytes())
+    assert [atom[0] for atom in atoms] == [b'ftyp', b'moov', b'free', b'mdat']
+    assert atoms[1][1] == atoms_before[1][1] and atoms[1][2] > atoms_before[1][2]
+    _assert_chunks_intact(path)
+
+
+def test_in_place_update_relocates_moov_that_does_not_fit(tmp_path):
+    path = _mp4(tmp_path / 'a.mp4', moov_first=True)
+    _save(path, **{'QuickTime:Title': 'title'})
+
+    atoms = _top_level_atoms(path.read_bytes())
+    assert [atom[0] for atom in atoms] == [b'ftyp', b'free', b'mdat', b'moov']
+    _assert_chunks_intact(path)
+
+
+def test_rewrite_moves_chunk_offsets_with_the_media_data(tmp_path):
+    path = _mp4(tmp_path / 'a.mp4', moov_first=True)
+    output = tmp_path / 'b.mp4'
+    _save(path, output, **{'QuickTime:Title': 'title'})
+
+    assert [atom[0] for atom in _top_level_atoms(output.read_bytes())] == [b'ftyp', b'moov', b'mdat']
+    _assert_chunks_intact(output)
+
+
+def test_repeated_in_place_updates_merge_free_space(tmp_path):
+    for moov_first in (True, False):
+        path = _mp4(tmp_path / 'a.mp4', moov_first)
+        for count in (1, 90, 40, 5, 120, 60, 2):
+            _save(path, **{'XMP:Description': 'x' * count})
+            _assert_chunks_intact(path)
+
+        atoms = _top_level_atoms(path.read_bytes())
+        types = [atom[0] for atom in atoms]
+        assert types.count(b'uuid') == 1
+        assert (b'free', b'free') not in zip(types, types[1:])
+        assert types[-1] != b'free'
+        # The free space left over is bounded by the XMP packet, not by the save count
+        free_space = sum(size for atom_type, _, size in atoms if atom_type == b'free')
+        uuid_size = next(size for atom_type, _, size in atoms if atom_type == b'uuid')
+        assert free_space <= uuid_size + 200